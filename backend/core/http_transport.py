@@ -0,0 +1,226 @@
+"""
+🌐 통합 비동기 HTTP 전송 계층 (curl_cffi 단일 스택)
+
+- 이벤트 루프마다 하나의 AsyncSession 을 공유 → 스크래퍼/검증기/이미지 프록시/외부 API 가 같은 커넥션 풀 사용
+- curl DNS 캐시(5분), 브라우저 지문(impersonate) 기반 TLS ALPN 으로 가능한 곳은 HTTP/2 사용
+- 지문은 세션이 아닌 요청 단위로 지정 (안티봇 로테이션 시 세션 재생성 불필요)
+- 공통 기본 타임아웃, 429/5xx·네트워크 오류 지수 백오프 재시도
+- 요청 완료마다 호스트별 통계 누적 + add_listener() 로 등록한 메트릭 훅 호출
+"""
+
+import asyncio
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from curl_cffi import CurlOpt
+from curl_cffi.requests import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_IMPERSONATE = "chrome124"
+# 동시에 열어둘 curl 핸들 수 (전 서브시스템 합산)
+MAX_CLIENTS = 64
+DNS_CACHE_SECONDS = 300
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class HttpStatusError(Exception):
+    """raise_for_status=True 요청이 4xx/5xx 로 끝났을 때"""
+
+    def __init__(self, response):
+        self.response = response
+        self.status_code = response.status_code
+        super().__init__(f"HTTP {response.status_code} - {response.url}")
+
+
+@dataclass
+class RequestEvent:
+    """메트릭 훅에 전달되는 요청 1건(재시도 포함)의 결과"""
+    method: str
+    url: str
+    host: str
+    status: Optional[int]
+    elapsed: float
+    attempts: int
+    error: Optional[str] = None
+    tag: str = ""
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    total_time: float = 0.0
+
+    @property
+    def avg_time(self) -> float:
+        return self.total_time / self.requests if self.requests else 0.0
+
+
+class HttpTransport:
+    """
+    🚚 프로세스 공용 HTTP 클라이언트
+    - 루프별 세션은 첫 요청 시 지연 생성, 닫힌 루프의 세션은 자동 폐기
+    - stream() 은 AsyncSession.stream 과 같은 모양이라 og:image 스트리밍 등에 세션 대신 그대로 전달 가능
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, impersonate: str = DEFAULT_IMPERSONATE,
+                 max_clients: int = MAX_CLIENTS):
+        self.timeout = timeout
+        self.impersonate = impersonate
+        self.max_clients = max_clients
+        self._sessions: Dict[int, tuple] = {}
+        self._listeners: List[Callable[[RequestEvent], None]] = []
+        self.host_stats: Dict[str, HostStats] = {}
+
+    # ---------------------------------------------------------------- session
+    def session(self) -> AsyncSession:
+        """현재 이벤트 루프에 묶인 공용 세션"""
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(id(loop))
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+
+        # id 재사용/닫힌 루프에 남은 세션 정리
+        for key, (old_loop, _) in list(self._sessions.items()):
+            if old_loop.is_closed() or key == id(loop):
+                self._sessions.pop(key, None)
+
+        session = AsyncSession(
+            loop=loop,
+            max_clients=self.max_clients,
+            impersonate=self.impersonate,
+            timeout=self.timeout,
+            curl_options={CurlOpt.DNS_CACHE_TIMEOUT: DNS_CACHE_SECONDS},
+        )
+        self._sessions[id(loop)] = (loop, session)
+        return session
+
+    async def aclose(self):
+        """현재 루프의 세션 종료 (FastAPI shutdown / 스케줄러 종료 시)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        entry = self._sessions.pop(id(loop), None)
+        if entry is not None:
+            await entry[1].close()
+
+    def reset_cookies(self, url: str):
+        """해당 호스트(및 상위 도메인)의 쿠키만 비움 — 지문 로테이션 시 차단 세션 쿠키 폐기용"""
+        try:
+            jar = self.session().cookies.jar
+        except RuntimeError:
+            return
+        host = urlsplit(url).hostname or ""
+        for domain in {c.domain for c in jar if host.endswith(c.domain.lstrip("."))}:
+            try:
+                jar.clear(domain)
+            except KeyError:
+                pass
+
+    # ---------------------------------------------------------------- metrics
+    def add_listener(self, listener: Callable[[RequestEvent], None]):
+        """요청 완료 훅 등록 (예외는 로그만 남기고 요청 흐름에는 영향 없음)"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[RequestEvent], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _emit(self, event: RequestEvent):
+        stats = self.host_stats.setdefault(event.host, HostStats())
+        stats.requests += 1
+        stats.retries += event.attempts - 1
+        stats.total_time += event.elapsed
+        if event.error or (event.status is not None and event.status >= 400):
+            stats.errors += 1
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(f"⚠️ [HTTP] 메트릭 훅 실패: {e}")
+
+    # ---------------------------------------------------------------- requests
+    async def request(self, method: str, url: str, *, retries: int = 0, backoff: float = 0.5,
+                      raise_for_status: bool = False, tag: str = "", **kwargs):
+        """
+        공용 세션으로 요청 1건 수행
+        - retries: 네트워크 오류 / 429·5xx 응답 시 추가 시도 횟수 (기본 0)
+        - 그 외 인자(timeout, headers, params, json, impersonate, allow_redirects, verify ...)는 curl_cffi 로 그대로 전달
+        """
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).hostname or ""
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self.session().request(method, url, **kwargs)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if attempt <= retries:
+                    await self._backoff(backoff, attempt)
+                    continue
+                self._emit(RequestEvent(method, url, host, None, time.perf_counter() - started, attempt,
+                                        error=type(e).__name__, tag=tag))
+                raise
+
+            if response.status_code in RETRY_STATUSES and attempt <= retries:
+                await self._backoff(backoff, attempt, response.headers.get("Retry-After"))
+                continue
+
+            self._emit(RequestEvent(method, url, host, response.status_code, time.perf_counter() - started,
+                                    attempt, tag=tag))
+            if raise_for_status and response.status_code >= 400:
+                raise HttpStatusError(response)
+            return response
+
+    @staticmethod
+    async def _backoff(base: float, attempt: int, retry_after: Optional[str] = None):
+        delay = base * (2 ** (attempt - 1)) * random.uniform(0.8, 1.2)
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), 30.0))
+        await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def head(self, url: str, **kwargs):
+        return await self.request("HEAD", url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, *, tag: str = "", **kwargs):
+        """본문을 청크 단위로 받는 요청 (재시도 없음, 상태 코드만 메트릭에 기록)"""
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).hostname or ""
+        started = time.perf_counter()
+        status, error = None, None
+        try:
+            async with self.session().stream(method, url, **kwargs) as response:
+                status = response.status_code
+                yield response
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self._emit(RequestEvent(method, url, host, status, time.perf_counter() - started, 1,
+                                    error=error, tag=tag))
+
+
+# 프로세스 전역 공용 인스턴스
+http_transport = HttpTransport()
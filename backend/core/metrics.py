@@ -0,0 +1,333 @@
+"""
+📊 수집 파이프라인 단계별 메트릭 (프로세스 내 레지스트리 + 공유 롤링 저장소)
+
+- 레지스트리: 커뮤니티별 카운터/히스토그램을 메모리에 누적 (fetch/parse/큐 대기/AI/DB 시간, 신규/갱신/스킵, 차단 횟수)
+- 현재 커뮤니티는 ContextVar 로 전달 → HTTP 전송 계층 훅, SQLAlchemy 실행 훅, AggregatorService 의 AI 호출이
+  인자 전달 없이 자기 커뮤니티로 집계됨 (asyncio 태스크마다 컨텍스트가 복사되므로 동시 수집 간 섞이지 않음)
+- flush(): 누적분(delta)을 SQLite 롤링 저장소에 가산 UPSERT → 워커 프로세스 여러 개가 동시에 써도 덮어쓰기 경합 없음
+  (scraper_stats.json 을 읽고-고치고-다시 쓰던 방식 대체)
+- 저장소: 1분 버킷(최근 24시간, 관리자 대시보드용) + 누적 합계(/metrics 용, Prometheus 텍스트 포맷) + 커뮤니티별 마지막 실행 상태
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "pipeline_metrics.db")
+
+# 히스토그램 버킷 상한(초). 마지막 +Inf 는 count 로 대체
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 1분 버킷 보관 기간
+RETENTION_SECONDS = 24 * 3600
+# 차단으로 보는 응답 코드 (안티봇 430, 403, 레이트리밋 429)
+BLOCK_STATUSES = frozenset({403, 429, 430})
+# 이 시간 넘게 running 으로 남은 실행은 비정상 종료로 표시
+STALE_RUN_SECONDS = 30 * 60
+
+# 지금 실행 중인 수집의 커뮤니티 (라벨 미지정 메트릭의 기본값)
+current_community: ContextVar[str] = ContextVar("current_community", default="")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metric_buckets (
+    minute INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    community TEXT NOT NULL,
+    label TEXT NOT NULL DEFAULT '',
+    count REAL NOT NULL,
+    total REAL NOT NULL,
+    PRIMARY KEY (minute, name, community, label)
+);
+CREATE TABLE IF NOT EXISTS metric_totals (
+    name TEXT NOT NULL,
+    community TEXT NOT NULL,
+    label TEXT NOT NULL DEFAULT '',
+    kind TEXT NOT NULL,
+    count REAL NOT NULL,
+    total REAL NOT NULL,
+    buckets TEXT,
+    PRIMARY KEY (name, community, label)
+);
+CREATE TABLE IF NOT EXISTS community_runs (
+    community TEXT PRIMARY KEY,
+    display_name TEXT,
+    status TEXT NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    new_count INTEGER NOT NULL DEFAULT 0,
+    updated_count INTEGER NOT NULL DEFAULT 0,
+    duration REAL
+);
+"""
+
+# (이름, 커뮤니티, 보조 라벨)
+MetricKey = Tuple[str, str, str]
+
+
+class _Histogram:
+    __slots__ = ("count", "total", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                self.buckets[index] += 1
+                break
+
+
+class MetricsStore:
+    """SQLite 롤링 저장소 (프로세스/스레드마다 연결을 따로 열어 사용)"""
+
+    def __init__(self, path: str = METRICS_DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.conn.close()
+
+    # ------------------------------------------------------------ write
+    def add(self, counters: Dict[MetricKey, float], histograms: Dict[MetricKey, _Histogram], now: Optional[float] = None):
+        """레지스트리 누적분을 가산 (같은 키는 더해지므로 여러 프로세스가 동시에 flush 해도 안전)"""
+        now = time.time() if now is None else now
+        minute = int(now // 60) * 60
+        bucket_rows, total_rows = [], []
+        for (name, community, label), value in counters.items():
+            bucket_rows.append((minute, name, community, label, value, value))
+            total_rows.append((name, community, label, "counter", value, value, None))
+        for (name, community, label), hist in histograms.items():
+            bucket_rows.append((minute, name, community, label, hist.count, hist.total))
+            total_rows.append((name, community, label, "histogram", hist.count, hist.total, json.dumps(hist.buckets)))
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany(
+                    "INSERT INTO metric_buckets (minute, name, community, label, count, total) VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(minute, name, community, label) DO UPDATE SET "
+                    "count = count + excluded.count, total = total + excluded.total",
+                    bucket_rows,
+                )
+                for row in total_rows:
+                    existing = self.conn.execute(
+                        "SELECT buckets FROM metric_totals WHERE name = ? AND community = ? AND label = ?", row[:3]
+                    ).fetchone()
+                    buckets = row[6]
+                    if existing is not None and existing["buckets"] and buckets:
+                        buckets = json.dumps([a + b for a, b in zip(json.loads(existing["buckets"]), json.loads(buckets))])
+                    self.conn.execute(
+                        "INSERT INTO metric_totals (name, community, label, kind, count, total, buckets) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT(name, community, label) DO UPDATE SET "
+                        "count = count + excluded.count, total = total + excluded.total, buckets = excluded.buckets",
+                        (*row[:6], buckets),
+                    )
+                self.conn.execute("DELETE FROM metric_buckets WHERE minute < ?", (minute - RETENTION_SECONDS,))
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def run_started(self, community: str, display_name: str, now: Optional[float] = None):
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO community_runs (community, display_name, status, started_at) VALUES (?, ?, 'running', ?) "
+                "ON CONFLICT(community) DO UPDATE SET display_name = excluded.display_name, status = 'running', "
+                "started_at = excluded.started_at",
+                (community, display_name, time.time() if now is None else now),
+            )
+
+    def run_finished(self, community: str, status: str, new_count: int, updated_count: int, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        with self._lock:
+            self.conn.execute(
+                "UPDATE community_runs SET status = ?, finished_at = ?, new_count = ?, updated_count = ?, "
+                "duration = ? - started_at WHERE community = ?",
+                (status, now, new_count, updated_count, now, community),
+            )
+
+    # ------------------------------------------------------------ read
+    def runs(self, now: Optional[float] = None) -> List[dict]:
+        """커뮤니티별 마지막 실행 상태 (오래 running 으로 남은 실행은 'stale')"""
+        now = time.time() if now is None else now
+        rows = self.conn.execute("SELECT * FROM community_runs ORDER BY community").fetchall()
+        runs = []
+        for row in rows:
+            run = dict(row)
+            if run["status"] == "running" and now - (run["started_at"] or 0) > STALE_RUN_SECONDS:
+                run["status"] = "stale"
+            runs.append(run)
+        return runs
+
+    def summary(self, window_seconds: float = 3600, now: Optional[float] = None) -> Dict[str, Dict[str, dict]]:
+        """최근 window 동안 커뮤니티 → 메트릭 → {count, total, avg} (관리자 대시보드용)"""
+        now = time.time() if now is None else now
+        rows = self.conn.execute(
+            "SELECT name, community, label, SUM(count) AS count, SUM(total) AS total FROM metric_buckets "
+            "WHERE minute >= ? GROUP BY name, community, label",
+            (int((now - window_seconds) // 60) * 60,),
+        ).fetchall()
+        summary: Dict[str, Dict[str, dict]] = {}
+        for row in rows:
+            key = f"{row['name']}:{row['label']}" if row["label"] else row["name"]
+            summary.setdefault(row["community"] or "-", {})[key] = {
+                "count": row["count"],
+                "total": round(row["total"], 3),
+                "avg": round(row["total"] / row["count"], 3) if row["count"] else 0.0,
+            }
+        return summary
+
+    def render_prometheus(self) -> str:
+        """누적 합계를 Prometheus 텍스트 포맷으로"""
+        rows = self.conn.execute("SELECT * FROM metric_totals ORDER BY name, community, label").fetchall()
+        lines, typed = [], set()
+        for row in rows:
+            name, kind = row["name"], row["kind"]
+            if name not in typed:
+                lines.append(f"# TYPE {name} {kind}")
+                typed.add(name)
+            labels = {"community": row["community"]}
+            if row["label"]:
+                labels["kind"] = row["label"]
+            if kind == "counter":
+                lines.append(f"{name}{_labels(labels)} {_number(row['total'])}")
+                continue
+            cumulative = 0
+            for bound, hits in zip(LATENCY_BUCKETS, json.loads(row["buckets"] or "[]")):
+                cumulative += hits
+                lines.append(f"{name}_bucket{_labels({**labels, 'le': str(bound)})} {cumulative}")
+            lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {_number(row['count'])}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(row['total'])}")
+            lines.append(f"{name}_count{_labels(labels)} {_number(row['count'])}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:.6f}"
+
+
+class MetricsRegistry:
+    """
+    🧮 프로세스 내 메트릭 레지스트리
+    - inc()/observe()/timer(): community 를 생략하면 current_community 사용
+    - flush(): 마지막 flush 이후 누적분을 저장소에 넘기고 비움
+    """
+
+    def __init__(self, path: str = METRICS_DB_PATH):
+        self.path = path
+        self.counters: Dict[MetricKey, float] = {}
+        self.histograms: Dict[MetricKey, _Histogram] = {}
+        self._lock = threading.Lock()
+        self._store: Optional[MetricsStore] = None
+        self._store_pid: Optional[int] = None
+
+    @property
+    def store(self) -> MetricsStore:
+        # spawn/fork 된 워커 프로세스는 자기 연결을 새로 엶
+        if self._store is None or self._store_pid != os.getpid():
+            self._store = MetricsStore(self.path)
+            self._store_pid = os.getpid()
+        return self._store
+
+    def inc(self, name: str, value: float = 1, community: Optional[str] = None, label: str = ""):
+        key = (name, current_community.get() if community is None else community, label)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, community: Optional[str] = None, label: str = ""):
+        key = (name, current_community.get() if community is None else community, label)
+        with self._lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = _Histogram()
+            hist.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str, community: Optional[str] = None, label: str = ""):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, community, label)
+
+    @contextmanager
+    def community_scope(self, community: str):
+        """이 블록(과 여기서 만든 태스크)에서 기록되는 메트릭의 기본 커뮤니티 지정"""
+        token = current_community.set(community)
+        try:
+            yield
+        finally:
+            current_community.reset(token)
+
+    def flush(self, now: Optional[float] = None):
+        with self._lock:
+            counters, histograms = self.counters, self.histograms
+            self.counters, self.histograms = {}, {}
+        if not counters and not histograms:
+            return
+        try:
+            self.store.add(counters, histograms, now)
+        except Exception as e:
+            logger.warning(f"⚠️ [Metrics] 저장소 기록 실패: {e}")
+
+    def run_started(self, community: str, display_name: str):
+        """커뮤니티 실행 상태 기록 (저장소 장애가 수집을 막지 않도록 실패는 로그만)"""
+        try:
+            self.store.run_started(community, display_name)
+        except Exception as e:
+            logger.warning(f"⚠️ [Metrics] 실행 상태 기록 실패: {e}")
+
+    def run_finished(self, community: str, status: str, new_count: int = 0, updated_count: int = 0):
+        try:
+            self.store.run_finished(community, status, new_count, updated_count)
+        except Exception as e:
+            logger.warning(f"⚠️ [Metrics] 실행 상태 기록 실패: {e}")
+
+    # ------------------------------------------------------------ hooks
+    def on_http_request(self, event):
+        """http_transport.add_listener 훅: 요청 지연, 상태 코드별 건수, 차단 횟수"""
+        self.observe("crawl_fetch_seconds", event.elapsed)
+        self.inc("crawl_requests_total", label=str(event.status or event.error or "error"))
+        if event.status in BLOCK_STATUSES:
+            self.inc("crawl_blocks_total", label=str(event.status))
+
+    def instrument_engine(self, engine):
+        """SQLAlchemy 엔진의 쿼리 실행 시간을 crawl_db_seconds 로 집계"""
+        from sqlalchemy import event
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            stack = conn.info.get("metrics_started")
+            if stack:
+                self.observe("crawl_db_seconds", time.perf_counter() - stack.pop())
+
+
+# 프로세스 전역 공용 인스턴스
+pipeline_metrics = MetricsRegistry()
@@ -0,0 +1,153 @@
+"""
+💰 제목/가격 문자열 → (가격, 통화) 공용 추출기 (사전 컴파일 + 규칙 테이블)
+
+- 수집(AggregatorService), 피드 응답(routers/community), 규칙 파서, 배치 AI 워커가 같은 규칙으로 가격을 읽고 씀
+- 제목 가격 규칙은 우선순위 순서의 테이블 (괄호 "(가격/배송비)" → 만 → 원 → 달러 → 유로)
+  · 규칙마다 트리거 문자(예: '원', '$')가 제목에 없으면 정규식을 돌리지 않음 → 대부분 제목은 정규식 1~2회
+- 외화(USD/EUR)는 센트 단위 정수로 저장 (예: $12.99 → 1299)
+- 회귀 기준: tests/fixtures/prices/title_prices.tsv (scratch/decimal_cases.txt, examples.txt 실제 제목)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Pattern, Tuple
+
+# 센트 단위로 저장하는 통화 → 배수
+MINOR_UNIT_CURRENCIES = {"USD": 100, "EUR": 100}
+CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€"}
+
+FREE_SHIPPING_WORDS = ('무료', '무배', '무료배송', '臾대즺', '臾대같')
+# 제목 괄호 속 배송비 표기 중 무료배송으로 보는 단어 (소문자 비교)
+_FREE_SHIPPING_TAGS = ('무료', '무배', 'fs', 'free')
+# 이 금액 이상은 크롤링 오류로 보고 0(정보 없음) 처리
+MAX_LISTED_PRICE = 10000000
+
+# 만/원 뒤에 이어지면 가격이 아니라 할인/적립 금액
+_NOT_PRICE_SUFFIX = r'(?!\s*(원\s*)?(할인|적립|쿠폰|캐시백|이상|권))'
+
+_BRACKET_RE = re.compile(r'\(\s*\$?\s*((?:[\d,]+|[\d,]*\.[\d]+)(?:원|달러|유로|€)?)(?:\s*/\s*([^\)]*))?\)')
+_DIGITS_RE = re.compile(r'\d+')
+
+
+class TitlePrice(NamedTuple):
+    price: int
+    currency: str
+    free_shipping: bool
+
+
+@dataclass(frozen=True)
+class PriceRule:
+    """제목 가격 규칙 1개: triggers 중 하나가 제목에 있을 때만 pattern 실행, 첫 번째 비어 있지 않은 그룹이 금액"""
+    name: str
+    triggers: Tuple[str, ...]
+    pattern: Pattern
+    currency: str = "KRW"
+    scale: int = 1  # 원화 배수 (만 → 10000)
+
+
+# 괄호 표기가 없을 때 위에서부터 순서대로 (먼저 맞은 규칙이 제목 내 위치와 무관하게 우선)
+TITLE_PRICE_RULES: Tuple[PriceRule, ...] = (
+    PriceRule("man", ("만",), re.compile(r'([\d,]*\.[\d]+|[\d,]+)만' + _NOT_PRICE_SUFFIX), scale=10000),
+    PriceRule("won", ("원",), re.compile(r'(?<![+\-])(?<!\d\s~\s)(?<!~\s)([0-9,]{3,})\s*원' + _NOT_PRICE_SUFFIX)),
+    PriceRule("usd", ("$", "달러"), re.compile(r'\$\s*([0-9,]+(?:\.[0-9]+)?)|([0-9,]+(?:\.[0-9]+)?)\s*달러'), currency="USD"),
+    PriceRule("eur", ("€", "유로"), re.compile(r'€\s*([0-9,]+(?:\.[0-9]+)?)|([0-9,]+(?:\.[0-9]+)?)\s*유로'), currency="EUR"),
+)
+
+
+def to_minor_units(amount: float, currency: str) -> int:
+    """표기 금액 → 저장 단위 정수 (외화는 센트)"""
+    return round(amount * MINOR_UNIT_CURRENCIES[currency]) if currency in MINOR_UNIT_CURRENCIES else int(amount)
+
+
+def format_price(price, currency: str = "KRW") -> str:
+    """저장 단위 가격 → 표시 문자열 (1299, USD → $12.99 / 15900 → 15,900원)"""
+    value = float(price)
+    if currency in MINOR_UNIT_CURRENCIES:
+        return f"{CURRENCY_SYMBOLS[currency]}{value / MINOR_UNIT_CURRENCIES[currency]:.2f}"
+    return f"{int(value):,}원"
+
+
+def _amount(text: str) -> Optional[float]:
+    text = text.replace(',', '')
+    try:
+        return float(text) if text else None
+    except ValueError:
+        return None
+
+
+def _bracket_price(title: str) -> Tuple[int, str, bool]:
+    """괄호 속 "(가격/배송비)" 표기: 달러/유로/원"""
+    match = _BRACKET_RE.search(title)
+    if not match:
+        return 0, "KRW", False
+    raw = match.group(1).replace(',', '')
+    price, currency = 0, "KRW"
+    if '달러' in raw or '.' in raw or '$' in match.group(0):
+        currency = "USD"
+        raw = raw.replace('달러', '').replace('$', '').strip()
+        if raw.replace('.', '', 1).isdigit():
+            price = to_minor_units(float(raw), currency)
+    elif '유로' in raw or '€' in match.group(0):
+        currency = "EUR"
+        raw = raw.replace('유로', '').replace('€', '').strip()
+        if raw.replace('.', '', 1).isdigit():
+            price = to_minor_units(float(raw), currency)
+    else:
+        raw = raw.replace('원', '')
+        if raw.isdigit():
+            price = int(raw)
+    free_shipping = bool(match.group(2)) and any(tag in match.group(2).lower() for tag in _FREE_SHIPPING_TAGS)
+    return price, currency, free_shipping
+
+
+def _rule_price(title: str, rules: Tuple[PriceRule, ...]) -> Tuple[int, str]:
+    for rule in rules:
+        if not any(trigger in title for trigger in rule.triggers):
+            continue
+        match = rule.pattern.search(title)
+        if not match:
+            continue
+        amount = _amount(next(group for group in match.groups() if group is not None))
+        if amount is None:
+            return 0, "KRW"
+        if rule.currency in MINOR_UNIT_CURRENCIES:
+            return to_minor_units(amount, rule.currency), rule.currency
+        return int(amount * rule.scale), rule.currency
+    return 0, "KRW"
+
+
+def extract_title_price(title: str, rules: Tuple[PriceRule, ...] = TITLE_PRICE_RULES) -> TitlePrice:
+    """
+    제목에서 가격 추출 → (가격, 통화, 무료배송 여부)
+    괄호 속 "(가격/배송비)" 표기를 우선하고, 없으면 규칙 테이블 순서로 탐색 (외화는 센트 단위)
+    """
+    price, currency, free_shipping = _bracket_price(title) if '(' in title else (0, "KRW", False)
+    if price == 0:
+        price, currency = _rule_price(title, rules)
+    return TitlePrice(price, currency, free_shipping)
+
+
+def parse_amount(value) -> int:
+    """저장된 가격 문자열/숫자 → 정수 (URL·상품번호 오인식과 천만 원 이상 비현실적 값은 0)"""
+    if not value:
+        return 0
+    text = str(value)
+    # 제휴 링크나 URL 내의 상품번호 숫자가 가격으로 오역되는 현상 영구 차단
+    if "http://" in text or "https://" in text or "products/" in text:
+        return 0
+    digits = ''.join(_DIGITS_RE.findall(text))
+    if not digits:
+        return 0
+    parsed = int(digits)
+    return 0 if parsed >= MAX_LISTED_PRICE else parsed
+
+
+def parse_shipping_fee(value) -> int:
+    """배송비 문자열 → 정수 (무료/무배 표기는 0)"""
+    if not value:
+        return 0
+    text = str(value)
+    if any(word in text for word in FREE_SHIPPING_WORDS):
+        return 0
+    digits = ''.join(_DIGITS_RE.findall(text))
+    return int(digits) if digits else 0
@@ -2,6 +2,8 @@ import re
 import logging
 from urllib.parse import urlparse
 
+from backend.core.price_extractor import extract_title_price, format_price
+
 logger = logging.getLogger(__name__)
 
 class RuleBasedParser:
@@ -43,28 +45,11 @@ class RuleBasedParser:
     @staticmethod
     def extract_price(text: str) -> str:
         """
-        텍스트에서 가격 정보 추출 (정규표현식)
-        예: 15,000원, 15000원, 10달러, $10.99
+        텍스트에서 가격 정보 추출 (공용 가격 추출기 규칙)
+        예: 15,000원, 3만원, 10달러, $10.99 → 표시 문자열 ("15,000원", "$10.99")
         """
-        # 1. 원화 (1,000원 또는 1000원)
-        won_pattern = r'(\d{1,3}(?:,\d{3})*|\d+)원'
-        match = re.search(won_pattern, text)
-        if match:
-            return match.group(0) # 15,000원
-
-        # 2. 달러 ($10.99 또는 10.99달러)
-        dollar_pattern_1 = r'\$(\d+(?:\.\d{1,2})?)'
-        dollar_pattern_2 = r'(\d+(?:\.\d{1,2})?)달러'
-        
-        match = re.search(dollar_pattern_1, text)
-        if match:
-            return f"${match.group(1)}"
-            
-        match = re.search(dollar_pattern_2, text)
-        if match:
-            return f"${match.group(1)}"
-
-        return "정보 없음"
+        price, currency, _ = extract_title_price(text)
+        return format_price(price, currency) if price > 0 else "정보 없음"
 
     @staticmethod
     def clean_product_title(title: str) -> str:
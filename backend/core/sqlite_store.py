@@ -0,0 +1,97 @@
+"""
+🗄️ 로컬 SQLite 저장소 공통 (잡 큐 / 캐시 / 검증 기록)
+
+- SqliteStore: 연결 설정(WAL, synchronous=NORMAL, autocommit, 잠금 대기 30초)과 스키마 생성
+  · 프로세스(및 스레드)마다 각자 인스턴스를 만들어 사용 (sqlite 연결은 공유하지 않음)
+- RetryingJobTable: queued → running → done/failed 로 흐르는 작업 테이블 (푸시 발송, 지연 보강)
+  · claim(등록 순/우선순위 순 일괄 running 전환), 지수 백오프 재시도, 멈춘 작업 재대기, 완료 이력 정리
+  · 하위 클래스는 테이블 이름/스키마/재시도 설정과 행 ↔ 작업 매핑만 정의
+"""
+
+import os
+import sqlite3
+import time
+from typing import List, Optional, Sequence
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+class SqliteStore:
+    """schema 를 가진 SQLite 파일 하나에 대한 연결"""
+
+    schema = ""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.schema)
+
+    def close(self):
+        self.conn.close()
+
+
+class RetryingJobTable(SqliteStore):
+    """
+    재시도 가능한 작업 테이블
+    - 테이블에는 status, attempts, available_at, claimed_at, finished_at, error 컬럼이 있어야 함
+    """
+
+    table = ""
+    max_attempts = 3
+    retry_base_seconds = 30.0
+    # 실행 중 표시 후 이 시간이 지나도 끝나지 않은 작업(처리 프로세스 사망)은 다시 대기열로
+    stale_seconds = 5 * 60.0
+    # 완료/실패 작업 보관 기간
+    history_seconds = 24 * 3600.0
+
+    def _claim_rows(self, limit: int, now: Optional[float] = None, where: str = "", params: Sequence = (),
+                    order_by: str = "id") -> List[sqlite3.Row]:
+        """대기 작업을 order_by 순으로 최대 limit 개 running 전환 (where 는 추가 조건)"""
+        now = time.time() if now is None else now
+        return self.conn.execute(
+            f"UPDATE {self.table} SET status = ?, claimed_at = ? WHERE id IN ("
+            f"SELECT id FROM {self.table} WHERE status = ? AND available_at <= ? {where} "
+            f"ORDER BY {order_by} LIMIT ?) RETURNING *",
+            (RUNNING, now, QUEUED, now, *params, limit),
+        ).fetchall()
+
+    def complete(self, job_id: int, now: Optional[float] = None):
+        self.conn.execute(
+            f"UPDATE {self.table} SET status = ?, finished_at = ? WHERE id = ? AND status = ?",
+            (DONE, time.time() if now is None else now, job_id, RUNNING),
+        )
+
+    def retry(self, job_id: int, error: str, now: Optional[float] = None) -> bool:
+        """지수 백오프로 재시도 예약. max_attempts 초과 시 failed 처리 후 False"""
+        now = time.time() if now is None else now
+        row = self.conn.execute(
+            f"UPDATE {self.table} SET attempts = attempts + 1, error = ?, "
+            "status = CASE WHEN attempts + 1 >= ? THEN ? ELSE ? END, "
+            "finished_at = CASE WHEN attempts + 1 >= ? THEN ? ELSE NULL END, "
+            "available_at = ? + ? * (1 << attempts) "
+            "WHERE id = ? AND status = ? RETURNING status",
+            (error, self.max_attempts, FAILED, QUEUED, self.max_attempts, now, now, self.retry_base_seconds,
+             job_id, RUNNING),
+        ).fetchone()
+        return bool(row) and row["status"] == QUEUED
+
+    def requeue_stale(self, timeout: Optional[float] = None, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        timeout = self.stale_seconds if timeout is None else timeout
+        cursor = self.conn.execute(
+            f"UPDATE {self.table} SET status = ?, available_at = ? WHERE status = ? AND claimed_at < ?",
+            (QUEUED, now, RUNNING, now - timeout),
+        )
+        return cursor.rowcount
+
+    def prune(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        cursor = self.conn.execute(
+            f"DELETE FROM {self.table} WHERE status IN (?, ?) AND finished_at < ?",
+            (DONE, FAILED, now - self.history_seconds),
+        )
+        return cursor.rowcount
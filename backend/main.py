@@ -6,7 +6,6 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import logging
-import httpx
 from routers import wishlist, product, community, health, push, admin, auth, users, coupang
 
 import firebase_admin
@@ -66,16 +65,23 @@ app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 def read_root():
     return {"message": "Welcome to InsightDeal API"}
 
-# 전역 HTTP 클라이언트를 생성하여 연결 대기(Connection Pooling) 사용
+# 프로세스 공용 HTTP 전송 계층 (스크래퍼/검증 데몬과 커넥션 풀·DNS 캐시 공유)
 # 이미지 로딩 시 SSL 핸드셰이크 오버헤드를 대폭 줄이고 속도를 높임
-proxy_client = httpx.AsyncClient(
-    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
-    follow_redirects=True
-)
+from backend.core.http_transport import HttpStatusError, http_transport
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    await proxy_client.aclose()
+    await http_transport.aclose()
+
+# 파이프라인 단계별 메트릭 (스케줄러 워커 프로세스들이 기록한 롤링 저장소 누적값, Prometheus 텍스트 포맷)
+from backend.core.metrics import pipeline_metrics
+
+http_transport.add_listener(pipeline_metrics.on_http_request)
+
+@app.get("/metrics")
+def metrics():
+    pipeline_metrics.flush()
+    return Response(content=pipeline_metrics.store.render_prometheus(), media_type="text/plain; version=0.0.4")
 
 @app.get("/api/proxy-image")
 async def proxy_image(url: str):
@@ -110,12 +116,13 @@ async def proxy_image(url: str):
         else:
             headers["Referer"] = url
 
-        resp = await proxy_client.get(
+        resp = await http_transport.get(
             url, 
             timeout=3.0,
-            headers=headers
+            headers=headers,
+            raise_for_status=True,
+            tag="proxy-image"
         )
-        resp.raise_for_status()
         content_type = resp.headers.get("Content-Type", "image/jpeg")
         
         # 3. 디스크 캐시에 영구 기록
@@ -127,7 +134,7 @@ async def proxy_image(url: str):
             media_type=content_type,
             headers={"Cache-Control": "public, max-age=604800, immutable"}
         )
-    except httpx.HTTPStatusError as e:
+    except HttpStatusError as e:
         logger.warning(f"Proxy Image 404/Error: {url} - {e}")
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Image not found or blocked")
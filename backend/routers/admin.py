@@ -2,7 +2,6 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 import os
 import json
-import re
 
 router = APIRouter()
 
@@ -36,6 +35,12 @@ HTML_TEMPLATE = """
         @keyframes pulse { 0% { opacity: 0.6; } 50% { opacity: 1; } 100% { opacity: 0.6; } }
         .progress-info { font-size: 13px; color: #666; width: 280px; text-align: right; }
         
+        .load-chart { display: flex; align-items: flex-end; gap: 6px; height: 140px; border: 1px solid #e0e0e0; border-radius: 8px; padding: 15px 15px 0; background-color: #fafafa; margin-bottom: 6px; }
+        .load-col { flex: 1; display: flex; flex-direction: column; justify-content: flex-end; align-items: center; height: 100%; }
+        .load-bar { width: 100%; background-color: #17a2b8; border-radius: 4px 4px 0 0; min-height: 2px; transition: height 0.5s ease; }
+        .load-axis { display: flex; gap: 6px; padding: 0 15px; font-size: 11px; color: #888; margin-bottom: 20px; }
+        .load-axis div { flex: 1; text-align: center; }
+
         .log-container { background-color: #1e1e1e; color: #00ff00; padding: 15px; border-radius: 8px; font-family: 'Courier New', Courier, monospace; font-size: 13px; height: 250px; overflow-y: auto; margin-top: 10px; white-space: pre-wrap; word-wrap: break-word; }
     </style>
 </head>
@@ -58,6 +63,10 @@ HTML_TEMPLATE = """
             <div style="text-align:center; color:#999; font-size:14px;">데이터를 불러오는 중...</div>
         </div>
 
+        <div class="status-title" style="margin-bottom: 10px;">수집 부하 분포 (최근 1시간, 틱 구간 슬롯별 점유 시간) <span id="load-mode" style="font-weight:normal;"></span></div>
+        <div class="load-chart" id="load-chart"></div>
+        <div class="load-axis" id="load-axis"></div>
+
         <div class="status-title" style="margin-bottom: 10px;">상세 실시간 로그 (터미널)</div>
         <div class="log-container" id="log-box">로그를 불러오는 중...</div>
     </div>
@@ -76,7 +85,7 @@ HTML_TEMPLATE = """
                 let statusText = data.status;
                 if (data.status === '업데이트 완료 ✅') {
                     barClass = 'done';
-                    statusText = `${data.time} 완료 (${data.count})`;
+                    statusText = `${data.time} 완료 (${data.count})` + (data.stages ? `<br><small>${data.stages}</small>` : '');
                 } else if (data.status === '진행 중 ⏳') {
                     barClass = 'running';
                     statusText = `수집 중... (시작: ${data.time})`;
@@ -155,9 +164,29 @@ HTML_TEMPLATE = """
             }
         }
 
-        // 초기 한 번 실행하고 2초마다 갱신
+        async function fetchLoad() {
+            try {
+                const response = await fetch('/admin/ingest-load?t=' + Date.now());
+                if (!response.ok) return;
+                const data = await response.json();
+                const peak = Math.max(1, ...data.buckets.map(b => b.busy_seconds));
+                document.getElementById('load-mode').innerText = `(${data.mode}, ${data.slots}슬롯 × ${data.slot_seconds}s, 최대/평균 ${data.peak_to_mean})`;
+                document.getElementById('load-chart').innerHTML = data.buckets.map(b => {
+                    const names = Object.entries(b.communities).map(([name, n]) => `${name} ${n}회`).join(', ');
+                    return `<div class="load-col" title="${b.label}: 시작 ${b.starts}회, 점유 ${b.busy_seconds}s\n${names}">
+                        <div class="load-bar" style="height:${Math.round(100 * b.busy_seconds / peak)}%"></div></div>`;
+                }).join('');
+                document.getElementById('load-axis').innerHTML = data.buckets.map(b => `<div>${b.label}<br>${b.starts}회</div>`).join('');
+            } catch (e) {
+                console.error("부하 분포 가져오기 실패", e);
+            }
+        }
+
+        // 초기 한 번 실행하고 2초마다 갱신 (부하 분포는 10초)
         fetchLogs();
         setInterval(fetchLogs, 2000);
+        fetchLoad();
+        setInterval(fetchLoad, 10000);
     </script>
 </body>
 </html>
@@ -177,6 +206,109 @@ async def get_admin_dashboard():
             
     return HTMLResponse(content=HTML_TEMPLATE.replace("{last_updated}", last_updated))
 
+STATUS_LABELS = {
+    "running": "진행 중 ⏳",
+    "success": "업데이트 완료 ✅",
+    "failed": "차단/실패 ⚠️",
+    "error": "비정상 종료 ❌",
+    "stale": "비정상 종료 ❌",
+}
+STAGE_LABELS = {
+    "crawl_fetch_seconds": "fetch",
+    "crawl_parse_seconds": "parse",
+    "crawl_queue_wait_seconds": "대기",
+    "crawl_ai_seconds": "AI",
+    "crawl_db_seconds": "DB",
+}
+
+
+def pipeline_community_status() -> dict:
+    """메트릭 저장소의 커뮤니티별 마지막 실행 상태 → 대시보드 표시용 (표시 이름 기준)"""
+    from backend.core.metrics import pipeline_metrics
+    from datetime import datetime
+
+    status = {}
+    try:
+        runs = pipeline_metrics.store.runs()
+        summary = pipeline_metrics.store.summary(3600)
+    except Exception:
+        return status
+    for run in runs:
+        stages = summary.get(run["community"], {})
+        stamp = run["finished_at"] if run["status"] != "running" and run["finished_at"] else run["started_at"]
+        count = "" if run["status"] == "running" else f"신규: {run['new_count']}건, 갱신: {run['updated_count']}건"
+        status[run["display_name"] or run["community"]] = {
+            "status": STATUS_LABELS.get(run["status"], run["status"]),
+            "time": datetime.fromtimestamp(stamp).strftime("%Y-%m-%d %H:%M:%S") if stamp else "",
+            "count": count,
+            # 최근 1시간 단계별 평균 소요 시간
+            "stages": " · ".join(
+                f"{label} {stages[name]['avg']:.2f}s" for name, label in STAGE_LABELS.items() if name in stages
+            ),
+        }
+    return status
+
+
+@router.get("/pipeline-stats")
+def get_pipeline_stats(window_minutes: int = 60):
+    """최근 window 동안 커뮤니티별 단계 시간(fetch/parse/큐 대기/AI/DB)·건수·차단 요약"""
+    from backend.core.metrics import pipeline_metrics
+
+    return JSONResponse(content={
+        "window_minutes": window_minutes,
+        "communities": pipeline_metrics.store.summary(window_minutes * 60),
+        "runs": pipeline_metrics.store.runs(),
+    })
+
+
+def ingest_load(window_minutes: int = 60) -> dict:
+    """
+    최근 window 동안 수집 실행을 틱 구간 슬롯별로 접은 부하 분포
+    (슬롯별 시작 횟수, 점유 시간 합, 커뮤니티별 시작 횟수) → 시작 시각 분산(stagger) 효과 확인용
+    """
+    from backend.core.metrics import pipeline_metrics
+    from backend.scheduler.stagger import START_MODE, STAGGER_SLOTS, STAGGER_WINDOW_SECONDS
+
+    slot_seconds = STAGGER_WINDOW_SECONDS / STAGGER_SLOTS
+    buckets = [
+        {"slot": slot, "label": f"{slot * slot_seconds:.0f}s", "starts": 0, "busy_seconds": 0.0, "communities": {}}
+        for slot in range(STAGGER_SLOTS)
+    ]
+    try:
+        summary = pipeline_metrics.store.summary(window_minutes * 60)
+    except Exception:
+        summary = {}
+    for community, metrics in summary.items():
+        for key, value in metrics.items():
+            name, _, label = key.partition(":")
+            if not label.isdigit() or int(label) >= STAGGER_SLOTS:
+                continue
+            bucket = buckets[int(label)]
+            if name == "crawl_phase_starts_total":
+                bucket["starts"] += int(value["total"])
+                bucket["communities"][community] = int(value["total"])
+            elif name == "crawl_phase_busy_seconds":
+                bucket["busy_seconds"] += value["total"]
+    busy = [bucket["busy_seconds"] for bucket in buckets]
+    for bucket in buckets:
+        bucket["busy_seconds"] = round(bucket["busy_seconds"], 1)
+    mean = sum(busy) / len(busy)
+    return {
+        "mode": START_MODE,
+        "slots": STAGGER_SLOTS,
+        "slot_seconds": round(slot_seconds, 1),
+        "window_minutes": window_minutes,
+        # 1.0 이면 완전히 고른 분포, 슬롯 수와 같으면 한 슬롯에 전부 몰림
+        "peak_to_mean": round(max(busy) / mean, 2) if mean else None,
+        "buckets": buckets,
+    }
+
+
+@router.get("/ingest-load")
+def get_ingest_load(window_minutes: int = 60):
+    return JSONResponse(content=ingest_load(window_minutes))
+
+
 @router.get("/logs")
 def get_logs():
     log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
@@ -184,40 +316,13 @@ def get_logs():
     last_update_json = os.path.join(log_dir, "last_update.json")
     
     logs = ""
-    community_status = {}
+    community_status = pipeline_community_status()
     
     if os.path.exists(scraper_log):
         try:
             with open(scraper_log, "r", encoding="utf-8") as f:
                 all_lines = f.readlines()
                 
-                # 전체 로그를 파싱하여 커뮤니티별 상태 추출
-                for line in all_lines:
-                    # 시작 감지: 2026-05-09 18:43:34,704 - backend.scheduler.main - INFO - ▶ [퀘이사존] 큐 기반 스크래핑 워커 가동
-                    match_start = re.search(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?▶ \[([^\]]+)\] 큐 기반 스크래핑', line)
-                    if match_start:
-                        time_str = match_start.group(1)
-                        comm = match_start.group(2)
-                        community_status[comm] = {"status": "진행 중 ⏳", "time": time_str, "count": ""}
-                    
-                    # 완료 감지: 2026-05-09 18:43:34,704 - backend.scheduler.main - INFO - ✅ [퀘이사존] 스크래핑 성공 (총 수집/갱신건수: 90건)
-                    match_succ = re.search(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?✅ \[([^\]]+)\] 스크래핑 성공 \((.*)\)', line)
-                    if match_succ:
-                        time_str = match_succ.group(1)
-                        comm = match_succ.group(2)
-                        count_str = match_succ.group(3) # "총 수집/갱신건수: 90건"
-                        community_status[comm] = {"status": "업데이트 완료 ✅", "time": time_str, "count": count_str}
-                
-                import time
-                try:
-                    mtime = os.path.getmtime(scraper_log)
-                    if time.time() - mtime >= 300:
-                        for c in community_status:
-                            if community_status[c]["status"] == "진행 중 ⏳":
-                                community_status[c]["status"] = "비정상 종료 ❌"
-                except:
-                    pass
-                
                 # 로그 전송량 최적화 (마지막 200줄만)
                 logs = "".join(all_lines[-200:])
         except Exception:
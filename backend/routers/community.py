@@ -2,12 +2,12 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from backend.database.session import get_db_session
 from fastapi.responses import StreamingResponse
-import httpx
+from backend.core.http_transport import http_transport
+from backend.core.price_extractor import parse_amount, parse_shipping_fee
 from backend.database import models
 import logging
 import os
 import re
-import requests
 from datetime import datetime, timedelta, timezone
 
 import json
@@ -99,15 +99,22 @@ BASE_URL = os.getenv("BASE_URL", "http://10.0.2.2:8080")
 
 @router.get("/scraper-stats")
 def get_scraper_stats():
-    import os
-    stats_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scraper_stats.json")
-    if os.path.exists(stats_file):
-        try:
-            with open(stats_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
+    """커뮤니티별 마지막 수집 결과 (파이프라인 메트릭 저장소 기준)"""
+    from backend.core.metrics import pipeline_metrics
+    from datetime import datetime
+    try:
+        runs = pipeline_metrics.store.runs()
+    except Exception:
+        return {}
+    return {
+        run["display_name"] or run["community"]: {
+            "last_count": run["new_count"],
+            "last_run": datetime.fromtimestamp(run["finished_at"] or run["started_at"]).strftime("%Y-%m-%d %H:%M:%S"),
+            "status": "Success" if run["status"] == "success" and run["new_count"] > 0 else "Blocked/Failed",
+        }
+        for run in runs
+        if run["status"] != "running"
+    }
 
 @router.get("/proxy-image")
 async def proxy_image(url: str):
@@ -145,19 +152,17 @@ async def proxy_image(url: str):
         elif 'ruliweb.com' in url:
             headers['Referer'] = 'https://bbs.ruliweb.com/'
             
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
+        resp = await http_transport.get(url, headers=headers, timeout=5.0, raise_for_status=True, tag="proxy-image")
+        
+        # 3. 디스크 캐시에 영구 기록
+        with open(cache_file_path, "wb") as f:
+            f.write(resp.content)
             
-            # 3. 디스크 캐시에 영구 기록
-            with open(cache_file_path, "wb") as f:
-                f.write(resp.content)
-                
-            return Response(
-                content=resp.content, 
-                media_type=resp.headers.get('Content-Type', 'image/jpeg'),
-                headers={"Cache-Control": "public, max-age=604800, immutable"}
-            )
+        return Response(
+            content=resp.content, 
+            media_type=resp.headers.get('Content-Type', 'image/jpeg'),
+            headers={"Cache-Control": "public, max-age=604800, immutable"}
+        )
     except Exception as e:
         logger.error(f"Image proxy failed: {e}")
         return Response(status_code=404)
@@ -338,28 +343,9 @@ def get_clean_ecommerce_url(url: str, content_html: str = "", deal_id: int = Non
     return url_str
 
 
-def extract_price(price_str):
-    if not price_str: return 0
-    price_str_str = str(price_str)
-    # 제휴 링크나 URL 내의 상품번호 숫자가 가격으로 오역되는 현상 영구 차단
-    if "http://" in price_str_str or "https://" in price_str_str or "products/" in price_str_str:
-        return 0
-    nums = re.findall(r'\d+', price_str_str)
-    if nums:
-        parsed_val = int(''.join(nums))
-        # 천만 원(10,000,000원) 이상의 비현실적 가격은 크롤링 오류이므로 0(정보 없음 / 본문 참조)으로 강제 정화
-        if parsed_val >= 10000000:
-            return 0
-        return parsed_val
-    return 0
-
-def extract_shipping_fee(fee_str):
-    if not fee_str: return 0
-    fee_str_str = str(fee_str)
-    if any(x in fee_str_str for x in ['무료', '무배', '무료배송', '臾대즺', '臾대같']): return 0
-    nums = re.findall(r'\d+', fee_str_str)
-    if nums: return int(''.join(nums))
-    return 0
+# 피드 가격/배송비 파싱은 수집·배치 AI 워커와 같은 공용 추출기 사용
+extract_price = parse_amount
+extract_shipping_fee = parse_shipping_fee
 
 
 def normalize_units(text: str) -> str:
@@ -2,11 +2,11 @@ import os
 import time
 import hmac
 import hashlib
-import requests
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from datetime import datetime
+from backend.core.http_transport import http_transport
 
 # 로깅 설정
 logger = logging.getLogger("coupang_partners")
@@ -51,7 +51,7 @@ class CoupangPartnersService:
         authorization = f"CEA algorithm=HMAC-SHA256, access-key={self.access_key}, signed-date={signed_date}, signature={signature}"
         return authorization, signed_date
 
-    def search_products(self, keyword: str, limit: int = 10) -> dict:
+    async def search_products(self, keyword: str, limit: int = 10) -> dict:
         """
         쿠팡 파트너스 상품 검색 API 프록시 (서버 대행으로 크레덴셜 비공개 보장)
         """
@@ -77,11 +77,12 @@ class CoupangPartnersService:
         }
         
         try:
-            response = requests.post(
+            response = await http_transport.post(
                 f"{self.base_url}{path}",
                 json=payload,
                 headers=headers,
-                timeout=5
+                timeout=5.0,
+                tag="coupang-partners"
             )
             
             if response.status_code == 200:
@@ -132,12 +133,12 @@ class CoupangPartnersService:
 coupang_service = CoupangPartnersService()
 
 @router.get("/search")
-def search_coupang_products(
+async def search_coupang_products(
     keyword: str = Query(..., description="검색할 상품 키워드"),
     limit: int = Query(10, description="최대 노출 개수")
 ):
     try:
-        return coupang_service.search_products(keyword, limit)
+        return await coupang_service.search_products(keyword, limit)
     except Exception as e:
         logger.error(f"Router error: {e}")
         return {"status": "error", "message": str(e), "items": []}
@@ -38,6 +38,9 @@ async def health_check():
         "engine_scheduler": {
             "status": SCHEDULER_STATE.get("last_status"),
             "last_pipeline_run_time": last_run_str,
-            "total_cycle_count": SCHEDULER_STATE.get("total_run_count")
+            "total_cycle_count": SCHEDULER_STATE.get("total_run_count"),
+            "crawl_plan": SCHEDULER_STATE.get("crawl_plan"),
+            "request_budget": SCHEDULER_STATE.get("request_budget"),
+            "backfill": SCHEDULER_STATE.get("backfill")
         }
     }
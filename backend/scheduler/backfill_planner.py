@@ -0,0 +1,220 @@
+"""
+🩹 자가치유 백필 플래너 (수집 공백 복구를 여러 사이클에 나눠 진행)
+
+- 공백 감지 시 전 커뮤니티를 한 번에 25페이지씩 긁는 대신, 커뮤니티별 워터마크(도달한 가장 오래된 글 시각)와
+  다음 페이지를 기록하고 매 틱 요청 예산(토큰 버킷) 안에서 몇 페이지씩만 이어서 수집
+- 공백 시작 시각 이전 글에 도달하거나, 기존 수집 구간에 연결되거나, 목록 끝/페이지 상한에 닿으면 해당 커뮤니티 완료
+- 재개 시에는 그 사이 새로 올라온 글만큼 페이지가 밀렸을 것이므로 유입률로 시작 페이지를 보정
+- 상태는 JSON 체크포인트로 저장 → 스케줄러가 재시작되어도 멈춘 페이지부터 재개
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from backend.scheduler.crawl_planner import CrawlOutcome, CrawlProfile
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_STATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "backfill_state.json")
+
+# 마지막 수집 딜로부터 이 시간 이상 공백이면 백필 시작
+BACKFILL_TRIGGER_HOURS = 2.0
+MAX_BACKFILL_PAGES = 25
+# 커뮤니티당 한 번에 이어서 긁는 페이지 수
+PAGES_PER_CHUNK = 3
+# 평시 수집이 1페이지를 담당하므로 백필은 2페이지부터
+FIRST_BACKFILL_PAGE = 2
+# 실패한 커뮤니티는 이 시간 동안 백필을 쉬었다가 재시도
+FAILURE_COOLDOWN_SECONDS = 5 * 60
+
+
+def backfill_depth(gap_hours: float) -> int:
+    """공백 시간에 비례한 탐색 깊이 (기존 자가치유 공식: 최소 3, 최대 25페이지)"""
+    return min(MAX_BACKFILL_PAGES, max(3, int(gap_hours * 1.5)))
+
+
+@dataclass
+class BackfillState:
+    community: str
+    target_at: float                       # 공백 시작 시각 (이 시각 이전 글에 닿으면 복구 완료)
+    max_pages: int
+    next_page: int = FIRST_BACKFILL_PAGE
+    oldest_reached: Optional[float] = None  # 워터마크: 지금까지 도달한 가장 오래된 글 작성 시각
+    pages_done: int = 0
+    last_run_at: Optional[float] = None
+    retry_after: float = 0.0
+    done: bool = False
+    reason: str = ""
+
+
+class BackfillPlanner:
+    """
+    📦 커뮤니티별 백필 진행 상태 + 요청 예산
+    - start(): 공백 감지 시 1회 (이미 진행 중이면 유지)
+    - next_chunks(): 이번 틱에 긁을 (커뮤니티 → 시작 페이지, 페이지 수). 예산 소진 시 일부만 반환
+    - record(): 청크 결과로 워터마크/다음 페이지/완료 여부 갱신
+    """
+
+    def __init__(self, budget_pages_per_hour: float, path: str = BACKFILL_STATE_PATH,
+                 pages_per_chunk: int = PAGES_PER_CHUNK):
+        self.budget_pages_per_hour = budget_pages_per_hour
+        self.path = path
+        self.pages_per_chunk = pages_per_chunk
+        self.states: Dict[str, BackfillState] = {}
+        # 토큰 버킷: 시간당 예산만큼 분당 충전, 최대 한 틱에 전 커뮤니티 1청크씩까지만 누적
+        self.tokens = 0.0
+        self.last_refill: Optional[float] = None
+        self.load()
+
+    # ------------------------------------------------------------ persistence
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.states = {row["community"]: BackfillState(**row) for row in data.get("states", [])}
+        except Exception as e:
+            logger.warning(f"⚠️ [Backfill] 상태 로드 실패, 새로 시작: {e}")
+            self.states = {}
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"states": [asdict(state) for state in self.states.values()]}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️ [Backfill] 상태 저장 실패: {e}")
+
+    # ------------------------------------------------------------ lifecycle
+    @property
+    def active(self) -> bool:
+        return any(not state.done for state in self.states.values())
+
+    def start(self, gap_start: float, gap_hours: float, profiles: Iterable[CrawlProfile]) -> bool:
+        """공백 복구 시작 (진행 중인 백필이 있으면 그대로 이어감). 새로 시작했으면 True"""
+        if self.active:
+            return False
+        depth = backfill_depth(gap_hours)
+        self.states = {}
+        for profile in profiles:
+            max_pages = min(depth, profile.backfill_cap) if profile.backfill_cap else depth
+            state = BackfillState(profile.name, target_at=gap_start, max_pages=max_pages)
+            if max_pages < FIRST_BACKFILL_PAGE:
+                state.done, state.reason = True, "평시 수집 범위 내"
+            self.states[profile.name] = state
+        self.tokens = 0.0
+        self.last_refill = None
+        self.save()
+        logger.info(f"🩹 [Backfill] 공백 {gap_hours:.1f}시간 복구 시작 (최대 {depth}페이지, 예산 {self.budget_pages_per_hour:.0f}p/h)")
+        return True
+
+    def _refill(self, now: float):
+        cap = self.pages_per_chunk * max(1, len(self.states))
+        if self.last_refill is None:
+            # 시작 직후에도 한 번에 몰리지 않도록 한 틱 분량(1분)만 충전
+            self.tokens = min(cap, max(self.tokens, self.budget_pages_per_hour / 60.0))
+        else:
+            self.tokens = min(cap, self.tokens + (now - self.last_refill) * self.budget_pages_per_hour / 3600.0)
+        self.last_refill = now
+
+    # ------------------------------------------------------------ dispatch
+    def next_chunks(self, now: float, available: Iterable[str],
+                    arrival_per_minute: Optional[Dict[str, float]] = None,
+                    rows_per_page: Optional[Dict[str, int]] = None) -> Dict[str, Tuple[int, int]]:
+        """
+        이번 틱에 긁을 백필 청크 (커뮤니티 → (시작 페이지, 페이지 수))
+        - available: 지금 수집 중이 아닌 커뮤니티 (평시 수집과 같은 커뮤니티를 동시에 돌리지 않음)
+        - 가장 오래 쉰 커뮤니티부터 예산(토큰)이 허락하는 만큼
+        """
+        self._refill(now)
+        arrival_per_minute = arrival_per_minute or {}
+        rows_per_page = rows_per_page or {}
+        candidates = [
+            self.states[name] for name in available
+            if name in self.states and not self.states[name].done and self.states[name].retry_after <= now
+        ]
+        candidates.sort(key=lambda state: state.last_run_at or 0.0)
+
+        chunks = {}
+        for state in candidates:
+            if state.last_run_at is not None:
+                # 쉬는 동안 새 글이 올라와 목록이 밀린 만큼 시작 페이지 보정 (보수적으로 내림)
+                shifted = arrival_per_minute.get(state.community, 0.0) * (now - state.last_run_at) / 60.0
+                state.next_page += int(shifted // rows_per_page.get(state.community, 20))
+            if state.next_page > state.max_pages:
+                state.done, state.reason = True, f"페이지 상한 {state.max_pages} 도달"
+                continue
+            pages = min(self.pages_per_chunk, state.max_pages - state.next_page + 1)
+            if self.tokens < pages:
+                break
+            self.tokens -= pages
+            state.last_run_at = now
+            chunks[state.community] = (state.next_page, pages)
+        if chunks:
+            self.save()
+        return chunks
+
+    def record(self, community: str, outcome: CrawlOutcome, now: Optional[float] = None):
+        state = self.states.get(community)
+        if state is None or state.done:
+            return
+        now = time.time() if now is None else now
+        state.last_run_at = now
+        if outcome.failed:
+            state.retry_after = now + FAILURE_COOLDOWN_SECONDS
+            self.save()
+            return
+
+        if outcome.last_page >= state.next_page:
+            state.pages_done += outcome.last_page - state.next_page + 1
+            state.next_page = outcome.last_page + 1
+        if outcome.oldest_post_at is not None:
+            state.oldest_reached = min(state.oldest_reached or outcome.oldest_post_at, outcome.oldest_post_at)
+
+        if outcome.reached_known:
+            state.done, state.reason = True, "기존 수집 구간에 연결"
+        elif state.oldest_reached is not None and state.oldest_reached <= state.target_at:
+            state.done, state.reason = True, "공백 시작 시각 도달"
+        elif outcome.list_ended:
+            state.done, state.reason = True, "목록 끝 도달"
+        elif state.next_page > state.max_pages:
+            state.done, state.reason = True, f"페이지 상한 {state.max_pages} 도달"
+        if state.done:
+            logger.info(f"✅ [Backfill] {community} 복구 완료 ({state.reason}, {state.pages_done}페이지)")
+        self.save()
+
+    # ------------------------------------------------------------ reporting
+    def snapshot(self) -> Dict[str, dict]:
+        return {
+            name: {
+                "next_page": state.next_page,
+                "max_pages": state.max_pages,
+                "pages_done": state.pages_done,
+                "oldest_reached": state.oldest_reached,
+                "target_at": state.target_at,
+                "done": state.done,
+                "reason": state.reason,
+            }
+            for name, state in self.states.items()
+        }
+
+
+def posted_epoch(posted_at: Optional[str]) -> Optional[float]:
+    """스크래퍼 posted_at(ISO 8601, naive 는 UTC) → epoch"""
+    if not posted_at:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(posted_at).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
@@ -16,6 +16,7 @@ load_dotenv(os.path.join(root_dir, ".env"))
 
 from backend.database.session import SessionLocal
 from backend.database.models import Deal
+from backend.core.price_extractor import format_price
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -44,8 +45,7 @@ def process_ai_batch():
         input_data = []
         for d in deals_to_process:
             try:
-                price_val = float(d.price)
-                formatted_price = f"${price_val / 100:.2f}" if d.currency == "USD" else f"€{price_val / 100:.2f}" if d.currency == "EUR" else f"{int(price_val):,}원"
+                formatted_price = format_price(d.price, d.currency)
             except:
                 formatted_price = "가격미상"
 
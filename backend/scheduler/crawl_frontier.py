@@ -0,0 +1,246 @@
+"""
+🗺️ 커뮤니티별 영속 크롤 프런티어 (URL → 마지막 관측/갱신 시각, 리스트 행 해시, 다음 갱신 시각)
+
+- 프로듀서/컨슈머가 dict 조회(O(1))만으로 "이번 사이클에 이미 본 글인가", "지금 갱신할 차례인가"를 판단
+  → 기존 DB 타임스탬프 기반 가드(12시간/3시간/20분)를 DB 왕복 없이 동일하게 적용
+- 프런티어에 없는 URL 만 DB 에서 일괄 조회(deal_lookup)하여 시드
+- 리스트 행의 핵심 필드(제목/가격/종료/핫딜/추천/댓글) 해시가 바뀌면 쿨다운 중이라도 즉시 갱신
+- 반응 지표(조회/추천/댓글)를 뺀 핵심 해시가 그대로면 반응 지표만 바뀐 재수집 → 워커가 쓰기 지연 버퍼로 처리
+- 사이클 종료 시 JSON 체크포인트(임시 파일 → os.replace)로 재시작 후에도 상태 유지
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FRONTIER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "crawl_frontier")
+FRONTIER_VERSION = 1
+
+# 기존 델타 스킵 가드와 동일한 기준
+HOT_WINDOW_SECONDS = 3 * 3600          # 작성 3시간 이내: 볼 때마다 갱신
+REFRESH_WINDOW_SECONDS = 12 * 3600     # 작성 12시간 경과: 더 이상 갱신하지 않음
+STABLE_COOLDOWN_SECONDS = 20 * 60      # 3~12시간: 마지막 갱신 후 20분 쿨다운
+# 마지막 관측 후 이 기간이 지난 URL 은 체크포인트에서 제거 (다시 보이면 DB 에서 재시드)
+PRUNE_AFTER_SECONDS = 2 * 24 * 3600
+
+# 리스트 행 변화 감지용 필드 (조회수는 매번 바뀌므로 제외)
+HASH_FIELDS = ("title", "price", "is_closed", "is_super_hotdeal", "like_count", "comment_count")
+# 반응 지표를 제외한 핵심 필드 (이게 바뀌면 전체 병합 경로로 즉시 기록)
+CORE_HASH_FIELDS = ("title", "price", "is_closed", "is_super_hotdeal")
+
+
+def row_hash(item: dict, fields: Tuple[str, ...] = HASH_FIELDS) -> str:
+    raw = "\x1f".join(str(item.get(key, "")) for key in fields)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@dataclass
+class FrontierEntry:
+    indexed_at: float                      # 딜 최초 수집(작성) 시각 — 갱신 윈도우 기준
+    last_seen: float = 0.0                 # 리스트에서 마지막으로 관측된 시각
+    last_refresh: float = 0.0              # 마지막으로 DB 에 반영(upsert)한 시각
+    content_hash: str = ""
+    next_due: float = 0.0                  # 쿨다운 종료 시각 (inf: 갱신 윈도우 종료)
+    deal_id: Optional[int] = None
+    has_content: bool = False
+    is_super_hotdeal: bool = False
+    core_hash: str = ""                    # 반응 지표를 뺀 리스트 행 해시 (이전 체크포인트에는 없음)
+
+    @property
+    def is_known(self) -> bool:
+        """DB 에 저장된 딜인지 (이번 사이클에 처음 본 신규 URL 은 False)"""
+        return self.deal_id is not None or self.last_refresh > 0
+
+    def reactions_only(self, item: dict) -> bool:
+        """마지막 반영 이후 리스트 행에서 반응 지표(조회/추천/댓글)만 바뀌었는지 (딜 ID 를 알 때만)"""
+        return self.deal_id is not None and bool(self.core_hash) and self.core_hash == row_hash(item, CORE_HASH_FIELDS)
+
+    def to_row(self) -> list:
+        return [self.indexed_at, self.last_seen, self.last_refresh, self.content_hash,
+                self.next_due, self.deal_id, self.has_content, self.is_super_hotdeal, self.core_hash]
+
+    @classmethod
+    def from_row(cls, row: list) -> "FrontierEntry":
+        return cls(*row)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict, now: float) -> "FrontierEntry":
+        """deal_lookup 스냅샷 → 엔트리 (반응 갱신 시각을 마지막 갱신 시각으로 간주)"""
+        indexed_at = _epoch(snapshot["indexed_at"]) or now
+        last_refresh = _epoch(snapshot["reaction_updated_at"])
+        return cls(
+            indexed_at=indexed_at,
+            last_seen=now,
+            last_refresh=last_refresh,
+            next_due=_next_due(indexed_at, last_refresh),
+            deal_id=snapshot["id"],
+            has_content=snapshot["has_content"],
+            is_super_hotdeal=snapshot["is_super_hotdeal"],
+        )
+
+
+def _epoch(value: Optional[datetime]) -> float:
+    if value is None:
+        return 0.0
+    if value.tzinfo is None:
+        # DB 의 naive 타임스탬프는 UTC 기준
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _next_due(indexed_at: float, last_refresh: float) -> float:
+    """작성 3시간 이후 구간에서 다음 갱신이 가능해지는 시각 (갱신 윈도우를 넘기면 inf)"""
+    due = last_refresh + STABLE_COOLDOWN_SECONDS
+    return float("inf") if due > indexed_at + REFRESH_WINDOW_SECONDS else due
+
+
+def refresh_due(entry: FrontierEntry, item: dict, now: float) -> bool:
+    """
+    기존 딜의 갱신 여부
+    - 작성 12시간 경과: 갱신 안 함 / 3시간 이내: 항상 갱신 / 그 사이: 20분 쿨다운(next_due) 경과 시
+    - 리스트 행 내용(종료/핫딜/추천 등)이 바뀌었으면 쿨다운과 무관하게 갱신
+    """
+    age = now - entry.indexed_at
+    if age > REFRESH_WINDOW_SECONDS:
+        return False
+    if age <= HOT_WINDOW_SECONDS or now >= entry.next_due:
+        return True
+    return bool(entry.content_hash) and entry.content_hash != row_hash(item)
+
+
+class CrawlFrontier:
+    """단일 커뮤니티의 프런티어 (scrape_community 1회 실행은 한 이벤트 루프 안에서 순차 접근)"""
+
+    def __init__(self, community: str, directory: str = FRONTIER_DIR):
+        self.community = community
+        self.path = os.path.join(directory, f"{community}.json")
+        self.entries: Dict[str, FrontierEntry] = {}
+        self.dirty = False
+        # 마지막으로 읽거나 쓴 체크포인트의 mtime (다른 워커 프로세스가 갱신했는지 판단)
+        self.synced_mtime: Optional[float] = None
+
+    # ------------------------------------------------------------ persistence
+    def load(self) -> "CrawlFrontier":
+        if not os.path.exists(self.path):
+            return self
+        try:
+            self.synced_mtime = os.path.getmtime(self.path)
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == FRONTIER_VERSION:
+                self.entries = {url: FrontierEntry.from_row(row) for url, row in data.get("entries", {}).items()}
+        except Exception as e:
+            logger.warning(f"⚠️ [Frontier:{self.community}] 체크포인트 로드 실패, 빈 상태로 시작: {e}")
+            self.entries = {}
+        return self
+
+    def checkpoint(self, now: Optional[float] = None):
+        """오래된 URL 정리 후 원자적으로 디스크에 기록"""
+        now = time.time() if now is None else now
+        cutoff = now - PRUNE_AFTER_SECONDS
+        stale = [url for url, entry in self.entries.items() if entry.last_seen < cutoff]
+        for url in stale:
+            del self.entries[url]
+        if not (self.dirty or stale):
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": FRONTIER_VERSION,
+                    "entries": {url: entry.to_row() for url, entry in self.entries.items()},
+                }, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self.synced_mtime = os.path.getmtime(self.path)
+            self.dirty = False
+        except OSError as e:
+            logger.warning(f"⚠️ [Frontier:{self.community}] 체크포인트 저장 실패 (다음 사이클에 재시도): {e}")
+
+    # ------------------------------------------------------------ producer
+    def admit(self, items: List[dict], lookup: Callable[[List[str]], Dict[str, dict]], now: float,
+              cycle_started: float) -> Tuple[List[dict], int]:
+        """
+        정규화된 리스트 행 → 이번에 큐에 넣을 행
+        - 이번 사이클(cycle_started 이후)에 이미 본 URL 제외 (페이지 밀림으로 인한 중복)
+        - 프런티어에 없는 URL 만 lookup(urls) 로 DB 에서 일괄 조회하여 시드
+        - 기존 딜 중 갱신 차례가 아닌 행 제외
+        반환: (큐에 넣을 행, 이미 DB 에 있거나 이번 사이클에 이미 본 행 수)
+        """
+        fresh, known = [], 0
+        for item in items:
+            entry = self.entries.get(item['url'])
+            if entry is not None and entry.last_seen >= cycle_started:
+                known += 1
+                continue
+            fresh.append(item)
+
+        misses = [item['url'] for item in fresh if item['url'] not in self.entries]
+        if misses:
+            for url, snapshot in lookup(misses).items():
+                self.entries[url] = FrontierEntry.from_snapshot(snapshot, now)
+
+        admitted = []
+        for item in fresh:
+            url = item['url']
+            entry = self.entries.get(url)
+            if entry is None:
+                # 신규 URL 은 임시 엔트리로 등록해 같은 사이클의 중복 관측을 막음
+                entry = self.entries[url] = FrontierEntry(indexed_at=now)
+            entry.last_seen = now
+            if entry.is_known:
+                known += 1
+                if not refresh_due(entry, item, now):
+                    continue
+            admitted.append(item)
+        self.dirty = True
+        return admitted, known
+
+    def is_stale(self) -> bool:
+        """다른 프로세스(스케줄러 워커)가 이 커뮤니티를 수집하며 체크포인트를 갱신했는지"""
+        try:
+            return os.path.getmtime(self.path) != self.synced_mtime
+        except OSError:
+            return False
+
+    def get(self, url: str) -> Optional[FrontierEntry]:
+        return self.entries.get(url)
+
+    # ------------------------------------------------------------ consumer
+    def mark_refreshed(self, url: str, item: dict, now: float, deal_id: Optional[int] = None):
+        """DB 반영 완료 기록 (신규 딜이면 첫 반영 시각을 작성 기준 시각으로 등록)"""
+        entry = self.entries.get(url)
+        if entry is None:
+            entry = self.entries[url] = FrontierEntry(indexed_at=now, last_seen=now)
+        elif not entry.is_known:
+            entry.indexed_at = now
+        entry.last_refresh = now
+        entry.content_hash = row_hash(item)
+        entry.core_hash = row_hash(item, CORE_HASH_FIELDS)
+        if deal_id is not None:
+            entry.deal_id = deal_id
+        entry.next_due = _next_due(entry.indexed_at, now)
+        entry.has_content = entry.has_content or bool(item.get("content_html"))
+        entry.is_super_hotdeal = entry.is_super_hotdeal or bool(item.get("is_super_hotdeal"))
+        self.dirty = True
+
+
+_frontiers: Dict[str, CrawlFrontier] = {}
+
+
+def get_frontier(community: str) -> CrawlFrontier:
+    """
+    커뮤니티별 프런티어 (프로세스 내 최초 접근 시 체크포인트에서 복원)
+    - 워커 풀에서는 같은 커뮤니티가 매번 다른 프로세스에 배정될 수 있으므로, 디스크 쪽이 더 새로우면 다시 읽음
+    """
+    frontier = _frontiers.get(community)
+    if frontier is None or (not frontier.dirty and frontier.is_stale()):
+        frontier = _frontiers[community] = CrawlFrontier(community).load()
+    return frontier
@@ -0,0 +1,225 @@
+"""
+🧭 적응형 크롤 플래너 (커뮤니티별 폴링 주기/페이지 깊이 자동 결정)
+
+- 수집 결과(신규 글 수, 핫딜 승격 수)로 커뮤니티별 글 유입률과 승격률을 EWMA 로 추적
+- 유입률은 KST 시간대(0~23시)별로도 따로 학습 → 뽐뿌 피크 시간엔 자주, 클리앙 새벽엔 드물게
+- 다음 폴링까지 "새 글 TARGET_NEW_PER_POLL 건"이 쌓일 시점으로 주기를 잡고,
+  그 사이 밀려날 글 수로 1페이지 이상 깊이를, 승격이 잦으면 핫딜마크 추적용 심층 스캔을 결정
+- 전체 요청량은 기존 "5분마다 전 커뮤니티 1/3페이지 번갈아" 방식의 시간당 페이지 수를 넘지 않도록 주기를 늘려 맞춤
+"""
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+KST = timezone(timedelta(hours=9))
+
+# 기존 고정 스케줄 (5분 주기, 1페이지/3페이지 번갈아)
+LEGACY_INTERVAL_MINUTES = 5.0
+MIN_INTERVAL_MINUTES = 2.0
+MAX_INTERVAL_MINUTES = 30.0
+# 폴링 1회당 기대하는 신규 글 수 (이 정도가 쌓일 때마다 한 번씩 방문)
+TARGET_NEW_PER_POLL = 4.0
+# 핫딜 승격 1건을 신규 글 몇 건만큼 급하게 볼지
+HOT_WEIGHT = 3.0
+# 다음 주기 동안 기대 승격 수가 이 값 이상이면 심층(최대 깊이) 스캔
+HOT_DEEP_SCAN_THRESHOLD = 0.5
+# 승격이 드문 게시판도 최소 이 간격으로는 심층 스캔하여 핫딜마크/종료 상태를 갱신
+DEEP_SCAN_MAX_AGE_MINUTES = 30.0
+# 페이지 경계에서 글을 놓치지 않도록 기대 유입량에 곱하는 여유 배수
+PAGE_SAFETY = 1.5
+EWMA_ALPHA = 0.3
+# 학습 전(표본 부족)에는 기존 고정 스케줄을 그대로 따름
+WARMUP_SAMPLES = 2
+# 연속 실패(차단/타임아웃) 시 주기를 늘리는 배수
+FAILURE_BACKOFF = 2.0
+
+
+@dataclass(frozen=True)
+class CrawlProfile:
+    """커뮤니티별 고정 특성"""
+    name: str
+    max_pages: int = 3
+    rows_per_page: int = 20
+    # 리스트 페이지 외 매 수집마다 추가로 나가는 요청 수 (예: 펨코 인기글 페이지)
+    extra_requests: int = 0
+    # 자가치유 백필 시에도 넘지 않는 페이지 수 (None 이면 제한 없음)
+    backfill_cap: Optional[int] = None
+
+
+@dataclass
+class CrawlOutcome:
+    """수집 1회의 결과 (scrape_community 가 기록)"""
+    new_posts: int
+    hot_promotions: int = 0
+    pages: int = 1
+    failed: bool = False
+    # 백필 진행 판단용 (backfill_planner)
+    last_page: int = 0                       # 실제로 긁은 마지막 페이지
+    oldest_post_at: Optional[float] = None   # 긁은 글 중 가장 오래된 작성 시각 (epoch)
+    reached_known: bool = False              # 기존 수집 구간에 연결되어 조기 종료
+    list_ended: bool = False                 # 빈 페이지를 만나 목록 끝에 도달
+
+
+@dataclass
+class CrawlPlan:
+    interval_minutes: float
+    pages: int
+    reason: str
+
+
+@dataclass
+class CommunityState:
+    profile: CrawlProfile
+    arrival_rate: Optional[float] = None           # 신규 글 / 분
+    hot_rate: Optional[float] = None               # 핫딜 승격 / 분
+    hourly_arrival: Dict[int, float] = field(default_factory=dict)
+    samples: int = 0
+    crawl_count: int = 0
+    failures: int = 0
+    last_crawl_at: Optional[datetime] = None
+    last_deep_scan_at: Optional[datetime] = None
+    next_due_at: Optional[datetime] = None
+    in_flight: bool = False
+    plan: CrawlPlan = field(default_factory=lambda: CrawlPlan(LEGACY_INTERVAL_MINUTES, 1, "warmup"))
+    last_outcome: Optional[CrawlOutcome] = None
+
+
+def _ewma(previous: Optional[float], value: float) -> float:
+    return value if previous is None else previous + EWMA_ALPHA * (value - previous)
+
+
+class AdaptiveCrawlScheduler:
+    """
+    📅 커뮤니티별 다음 수집 시각과 깊이를 관리
+    - due(now): 지금 수집해야 할 커뮤니티와 페이지 수 (동시에 같은 커뮤니티를 두 번 띄우지 않음)
+    - record(name, outcome, now): 결과 반영 → 유입률 갱신 → 다음 계획 산출 → 전체 예산 재조정
+    """
+
+    def __init__(self, profiles: List[CrawlProfile], budget_pages_per_hour: Optional[float] = None):
+        self.states: Dict[str, CommunityState] = {p.name: CommunityState(profile=p) for p in profiles}
+        self.budget_pages_per_hour = budget_pages_per_hour or self.legacy_budget(profiles)
+
+    @staticmethod
+    def legacy_budget(profiles: List[CrawlProfile]) -> float:
+        """기존 고정 스케줄의 시간당 요청 페이지 수 (1페이지/최대깊이 번갈아, 5분 주기)"""
+        polls_per_hour = 60.0 / LEGACY_INTERVAL_MINUTES
+        return sum(((1 + p.max_pages) / 2 + p.extra_requests) * polls_per_hour for p in profiles)
+
+    # ------------------------------------------------------------ dispatch
+    def due(self, now: datetime, force: bool = False) -> Dict[str, int]:
+        """수집 시각이 된 커뮤니티 → 이번에 긁을 페이지 수 (호출 즉시 in_flight 로 표시, force 면 주기 무시)"""
+        due = {}
+        for name, state in self.states.items():
+            if state.in_flight:
+                continue
+            if force or state.next_due_at is None or state.next_due_at <= now:
+                state.in_flight = True
+                due[name] = state.plan.pages
+        return due
+
+    def release(self, name: str):
+        """결과 기록 없이 끝난 실행의 in_flight 해제 (다음 틱에 다시 시도)"""
+        self.states[name].in_flight = False
+
+    # ------------------------------------------------------------ learning
+    def record(self, name: str, outcome: CrawlOutcome, now: datetime):
+        state = self.states[name]
+        state.in_flight = False
+        state.crawl_count += 1
+        state.last_outcome = outcome
+
+        if outcome.failed:
+            state.failures += 1
+        else:
+            state.failures = 0
+            if state.last_crawl_at is not None:
+                elapsed = max((now - state.last_crawl_at).total_seconds() / 60.0, 0.5)
+                arrival = outcome.new_posts / elapsed
+                state.arrival_rate = _ewma(state.arrival_rate, arrival)
+                state.hot_rate = _ewma(state.hot_rate, outcome.hot_promotions / elapsed)
+                hour = now.astimezone(KST).hour
+                state.hourly_arrival[hour] = _ewma(state.hourly_arrival.get(hour), arrival)
+                state.samples += 1
+            state.last_crawl_at = now
+            if outcome.pages >= state.profile.max_pages:
+                state.last_deep_scan_at = now
+
+        state.plan = self._plan(state, now)
+        self._rebalance()
+        state.next_due_at = now + timedelta(minutes=state.plan.interval_minutes)
+
+    def expected_arrival(self, state: CommunityState, now: datetime) -> float:
+        """현재 시간대의 기대 유입률 (해당 시간대 학습값이 있으면 우선 반영)"""
+        overall = state.arrival_rate or 0.0
+        hourly = state.hourly_arrival.get(now.astimezone(KST).hour)
+        return overall if hourly is None else 0.7 * hourly + 0.3 * overall
+
+    def _plan(self, state: CommunityState, now: datetime) -> CrawlPlan:
+        profile = state.profile
+        if state.failures:
+            interval = min(MAX_INTERVAL_MINUTES, state.plan.interval_minutes * FAILURE_BACKOFF)
+            return CrawlPlan(interval, 1, f"backoff (연속 실패 {state.failures}회)")
+
+        if state.samples < WARMUP_SAMPLES:
+            # 학습 전: 기존처럼 5분마다 1페이지/최대깊이 번갈아 수집
+            pages = profile.max_pages if state.crawl_count % 2 == 0 else 1
+            return CrawlPlan(LEGACY_INTERVAL_MINUTES, pages, "warmup")
+
+        arrival = self.expected_arrival(state, now)
+        hot = state.hot_rate or 0.0
+        demand = arrival + HOT_WEIGHT * hot
+        interval = TARGET_NEW_PER_POLL / demand if demand > 0 else MAX_INTERVAL_MINUTES
+        interval = min(MAX_INTERVAL_MINUTES, max(MIN_INTERVAL_MINUTES, interval))
+
+        pages = max(1, math.ceil(arrival * interval * PAGE_SAFETY / profile.rows_per_page))
+        reason = f"유입 {arrival * 60:.0f}건/h"
+        since_deep = None
+        if state.last_deep_scan_at is not None:
+            since_deep = (now - state.last_deep_scan_at).total_seconds() / 60.0
+        if hot * interval >= HOT_DEEP_SCAN_THRESHOLD:
+            pages = profile.max_pages
+            reason += f", 승격 {hot * 60:.1f}건/h → 심층 스캔"
+        elif since_deep is None or since_deep + interval >= DEEP_SCAN_MAX_AGE_MINUTES:
+            pages = profile.max_pages
+            reason += ", 주기적 심층 스캔"
+        return CrawlPlan(interval, min(pages, profile.max_pages), reason)
+
+    def pages_per_hour(self) -> Dict[str, float]:
+        """커뮤니티별 현재 계획의 시간당 요청 페이지 수 (시작 슬롯 배분 가중치로도 사용)"""
+        return {name: (s.plan.pages + s.profile.extra_requests) * 60.0 / s.plan.interval_minutes
+                for name, s in self.states.items()}
+
+    def planned_pages_per_hour(self) -> float:
+        return sum(self.pages_per_hour().values())
+
+    def _rebalance(self):
+        """계획 전체의 시간당 요청 페이지 수가 예산을 넘으면 모든 주기를 같은 비율로 늘림"""
+        demand = self.planned_pages_per_hour()
+        if demand <= self.budget_pages_per_hour:
+            return
+        factor = demand / self.budget_pages_per_hour
+        for state in self.states.values():
+            if state.plan.reason == "warmup":
+                continue
+            state.plan.interval_minutes = min(MAX_INTERVAL_MINUTES, state.plan.interval_minutes * factor)
+
+    # ------------------------------------------------------------ reporting
+    def snapshot(self) -> Dict[str, dict]:
+        """SCHEDULER_STATE / 헬스체크 노출용 결정 내역"""
+        result = {}
+        for name, state in self.states.items():
+            outcome = state.last_outcome
+            result[name] = {
+                "interval_minutes": round(state.plan.interval_minutes, 1),
+                "pages": state.plan.pages,
+                "reason": state.plan.reason,
+                "arrival_per_hour": round((state.arrival_rate or 0.0) * 60, 1),
+                "hot_per_hour": round((state.hot_rate or 0.0) * 60, 2),
+                "next_due_at": state.next_due_at.isoformat() if state.next_due_at else None,
+                "in_flight": state.in_flight,
+                "last_new_posts": outcome.new_posts if outcome else None,
+                "last_hot_promotions": outcome.hot_promotions if outcome else None,
+            }
+        return result
@@ -0,0 +1,40 @@
+"""
+🔎 수집 파이프라인용 기존 딜 일괄 조회
+
+- 리스트 한 페이지의 URL 전체를 IN 쿼리 1회로 조회하여 딜/반응 스냅샷 반환 (프런티어에 없는 URL 시드용)
+- 델타 스킵 가드(12시간/3시간/20분)는 이 스냅샷으로 만든 프런티어 엔트리만으로 판단하므로 아이템당 추가 쿼리가 없음
+"""
+
+from sqlalchemy import func
+
+from backend.database.models import Deal, DealReaction
+
+
+def existing_deal_snapshots(db, column, values, *criteria) -> dict:
+    """
+    column IN (values) 조건의 기존 딜을 DealReaction 과 함께 쿼리 1회로 조회
+    반환: 값 → {id, indexed_at, has_content, is_super_hotdeal, reaction_updated_at} (같은 값이 여럿이면 첫 행)
+    """
+    values = [v for v in set(values) if v]
+    if not values:
+        return {}
+    rows = (
+        db.query(column, Deal.id, Deal.indexed_at, Deal.is_super_hotdeal,
+                 func.length(Deal.content_html), DealReaction.last_updated)
+        .outerjoin(DealReaction, DealReaction.deal_id == Deal.id)
+        .filter(column.in_(values), *criteria)
+        .order_by(Deal.id, DealReaction.id)
+        .all()
+    )
+    snapshots = {}
+    for key, deal_id, indexed_at, is_hot, content_len, reaction_updated_at in rows:
+        if key not in snapshots:
+            snapshots[key] = {
+                "id": deal_id,
+                "indexed_at": indexed_at,
+                "has_content": bool(content_len),
+                "is_super_hotdeal": bool(is_hot),
+                "reaction_updated_at": reaction_updated_at,
+            }
+    return snapshots
+
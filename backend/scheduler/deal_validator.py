@@ -0,0 +1,418 @@
+"""
+🔍 과거 핫딜 삭제/종료 검증기 (동시 핑 + 호스트별 속도 제한 + 스트리밍 조기 판정)
+
+- 대표 링크와 병합 서브 링크를 모두 동시에 검증하되, 호스트별 동시 요청 수/최소 간격으로 커뮤니티 차단을 방지
+- 본문 전체를 받아 BeautifulSoup 을 만드는 대신 청크 단위로 삭제 시그니처를 검사하고, 발견 즉시 수신 중단
+- 검증 대상은 "마지막 검증 후 경과 시간 / 재검증 주기" 가 큰 순서로 선별 (신규·고득점 딜일수록 자주 재검증)
+- 마지막 검증 시각은 SQLite(ValidationLog)에 저장 → 워커 풀의 어느 프로세스가 검증 잡을 맡아도 우선순위 유지
+"""
+
+import asyncio
+import codecs
+import html
+import logging
+import os
+import re
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from backend.core.http_transport import http_transport
+from backend.core.sqlite_store import SqliteStore
+from backend.database.models import Deal
+
+logger = logging.getLogger(__name__)
+
+VALIDATION_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "deal_validation.db")
+
+# 검증 대상 기간 (작성 3일 이내 미종료 딜)
+VALIDATION_WINDOW_DAYS = 3
+# 1회 실행당 최대 검증 딜 수 (호스트당 초당 ~2.5건 기준 10분 이내 완료)
+MAX_DEALS_PER_RUN = 600
+# 전체 동시 검증 딜 수 / 호스트별 동시 요청 수 / 같은 호스트 요청 간 최소 간격(초)
+DEAL_CONCURRENCY = 16
+PER_HOST_CONCURRENCY = 2
+PER_HOST_INTERVAL = 0.4
+# 삭제 시그니처 탐색 최대 수신 바이트 (시그니처 없이 이만큼 받았으면 살아있는 글로 판정)
+MAX_SCAN_BYTES = 512 * 1024
+
+# 작성 후 경과 시간별 재검증 주기 (경과 시간 상한, 주기)
+REVALIDATE_TIERS = (
+    (timedelta(hours=6), timedelta(minutes=20)),
+    (timedelta(hours=24), timedelta(hours=1)),
+    (timedelta(days=VALIDATION_WINDOW_DAYS), timedelta(hours=3)),
+)
+# 이 점수 이상인 딜은 재검증 주기를 절반으로 (종료 여부가 노출에 큰 영향)
+HIGH_HONEY_SCORE = 70
+
+DELETION_KEYWORDS = (
+    "해당 문서가 존재하지 않습니다",
+    "해당 문서는 존재하지 않습니다",
+    "삭제되었거나 존재하지 않는",
+    "존재하지 않는 게시물",
+    "삭제된 게시글",
+    "삭제된 글",
+)
+TITLE_CLOSED_KEYWORDS = ("종료", "마감", "품절", "블라인드", "삭제")
+LOGIN_REDIRECT_MARKER = "dispMemberLoginForm"
+# 퀘이사존은 삭제 글도 200 OK + 경고창 스크립트로 튕겨냄 (두 시그니처가 모두 있어야 삭제)
+QUASARZONE_SIGNATURES = ("history.back();", "location.href = redirect;")
+
+REFERERS = {
+    "ppomppu": "https://www.ppomppu.co.kr/",
+    "quasarzone": "https://quasarzone.com/",
+    "bbasak": "https://bbasak.com/",
+    "ruliweb": "https://bbs.ruliweb.com/",
+}
+REQUEST_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_CHARSET_RE = re.compile(rb"""charset=["']?([\w-]+)""", re.IGNORECASE)
+# 청크 경계에 걸친 시그니처를 놓치지 않도록 이전 청크 끝부분을 겹쳐서 검사
+_OVERLAP = max(len(kw) for kw in DELETION_KEYWORDS + QUASARZONE_SIGNATURES + (LOGIN_REDIRECT_MARKER,))
+_TITLE_SCAN_LIMIT = 64 * 1024
+
+
+class DeletionScanner:
+    """
+    ✂️ 청크 단위 삭제 시그니처 스캐너
+    - feed(text) 마다 본문 키워드 / 로그인 리다이렉트 / 퀘이사존 경고창 / <title> 종료 키워드를 검사
+    - deleted 가 True 가 되는 즉시 호출 측에서 수신을 중단
+    """
+
+    def __init__(self, url: str):
+        self.quasarzone = "quasarzone" in url
+        self.deleted = False
+        self.title: Optional[str] = None
+        self._tail = ""
+        self._head = ""
+        self._quasar_seen = [False] * len(QUASARZONE_SIGNATURES)
+
+    def feed(self, text: str) -> bool:
+        if self.deleted:
+            return True
+        window = self._tail + text
+        if LOGIN_REDIRECT_MARKER in window or any(kw in window for kw in DELETION_KEYWORDS):
+            self.deleted = True
+        if self.quasarzone:
+            for i, signature in enumerate(QUASARZONE_SIGNATURES):
+                self._quasar_seen[i] = self._quasar_seen[i] or signature in window
+            self.deleted = self.deleted or all(self._quasar_seen)
+        if self.title is None and len(self._head) < _TITLE_SCAN_LIMIT:
+            self._head += text
+            match = _TITLE_RE.search(self._head)
+            if match:
+                self.title = html.unescape(match.group(1)).strip()
+                self._head = ""
+                self.deleted = self.deleted or any(kw in self.title for kw in TITLE_CLOSED_KEYWORDS)
+        self._tail = window[-_OVERLAP:]
+        return self.deleted
+
+
+def _sniff_encoding(content_type: str, first_chunk: bytes) -> str:
+    """Content-Type 헤더 → 첫 청크의 <meta charset> 순으로 인코딩 판별 (뽐뿌 등 EUC-KR 대응)"""
+    for source in (content_type.encode("latin-1", "ignore"), first_chunk[:4096]):
+        match = _CHARSET_RE.search(source)
+        if match:
+            name = match.group(1).decode("ascii", "ignore")
+            try:
+                return codecs.lookup(name).name
+            except LookupError:
+                pass
+    return "utf-8"
+
+
+class HostRateLimiter:
+    """호스트별 동시 요청 수 + 요청 시작 간 최소 간격 제한 (검증 1회 실행 단위로 생성)"""
+
+    def __init__(self, concurrency: int = PER_HOST_CONCURRENCY, min_interval: float = PER_HOST_INTERVAL):
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str):
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.concurrency))
+        async with semaphore:
+            now = time.monotonic()
+            start_at = max(now, self._next_start.get(host, 0.0))
+            self._next_start[host] = start_at + self.min_interval
+            if start_at > now:
+                await asyncio.sleep(start_at - now)
+            yield
+
+
+def revalidate_interval(age: timedelta, honey_score: Optional[float]) -> timedelta:
+    interval = REVALIDATE_TIERS[-1][1]
+    for max_age, tier_interval in REVALIDATE_TIERS:
+        if age <= max_age:
+            interval = tier_interval
+            break
+    if (honey_score or 0) >= HIGH_HONEY_SCORE:
+        interval = interval / 2
+    return interval
+
+
+def prioritize(candidates: List[Tuple[int, datetime, Optional[float]]], last_checked: Dict[int, float],
+               now: datetime, now_ts: Optional[float] = None, limit: int = MAX_DEALS_PER_RUN) -> List[int]:
+    """
+    (deal_id, indexed_at, honey_score) 후보 → 이번에 검증할 deal_id (긴급도 순)
+    - now 는 UTC naive (DB indexed_at 기준), now_ts 는 last_checked 와 같은 time.time() 기준
+    - 긴급도 = 마지막 검증 후 경과 시간 / 재검증 주기 (1 미만이면 아직 차례 아님, 한 번도 안 본 딜은 최우선)
+    - 동률이면 honey_score 높은 순 → 최신 순
+    """
+    now_ts = time.time() if now_ts is None else now_ts
+    scored = []
+    for deal_id, indexed_at, honey_score in candidates:
+        if indexed_at is not None and indexed_at.tzinfo is not None:
+            indexed_at = indexed_at.astimezone(timezone.utc).replace(tzinfo=None)
+        age = now - indexed_at if indexed_at else timedelta(0)
+        checked_at = last_checked.get(deal_id)
+        if checked_at is None:
+            urgency = float("inf")
+        else:
+            urgency = (now_ts - checked_at) / revalidate_interval(age, honey_score).total_seconds()
+            if urgency < 1.0:
+                continue
+        scored.append((-urgency, -(honey_score or 0), age, deal_id))
+    scored.sort()
+    return [deal_id for *_, deal_id in scored[:limit]]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deal_checks (
+    deal_id INTEGER PRIMARY KEY,
+    checked_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS deal_checks_checked ON deal_checks(checked_at);
+"""
+
+
+class ValidationLog(SqliteStore):
+    """
+    deal_id → 마지막 검증 시각 (SQLite, 프로세스 간 공유)
+    - 검증 잡은 워커 풀의 아무 프로세스에서나 실행되므로 메모리에만 두면 매번 "한 번도 안 본 딜" 로 취급됨
+    """
+
+    schema = _SCHEMA
+
+    def __init__(self, path: str = VALIDATION_DB_PATH):
+        super().__init__(path)
+
+    def load(self) -> Dict[int, float]:
+        rows = self.conn.execute("SELECT deal_id, checked_at FROM deal_checks").fetchall()
+        return {row["deal_id"]: row["checked_at"] for row in rows}
+
+    def record(self, checked: Dict[int, float]):
+        self.conn.executemany(
+            "INSERT INTO deal_checks (deal_id, checked_at) VALUES (?, ?) "
+            "ON CONFLICT(deal_id) DO UPDATE SET checked_at = max(checked_at, excluded.checked_at)",
+            list(checked.items()),
+        )
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """검증 대상 기간이 지난 딜의 기록 삭제 (마지막 검증이 기간보다 오래됐으면 이미 대상 밖)"""
+        now = time.time() if now is None else now
+        cutoff = now - timedelta(days=VALIDATION_WINDOW_DAYS).total_seconds()
+        return self.conn.execute("DELETE FROM deal_checks WHERE checked_at < ?", (cutoff,)).rowcount
+
+
+_default_log: Optional[ValidationLog] = None
+
+
+def validation_log() -> ValidationLog:
+    """프로세스별 기본 검증 기록"""
+    global _default_log
+    if _default_log is None:
+        _default_log = ValidationLog()
+        _default_log.prune()
+    return _default_log
+
+
+class DealValidator:
+    """
+    🛰️ 삭제 여부 핑 검증기
+    - check_url(url): 삭제/종료 판정 (같은 실행 내 동일 URL 은 한 번만 요청)
+    - last_checked: deal_id → 마지막 검증 시각 (run_validation 이 ValidationLog 에서 불러오고 실행 후 저장)
+    """
+
+    def __init__(self, max_scan_bytes: int = MAX_SCAN_BYTES):
+        self.max_scan_bytes = max_scan_bytes
+        self.last_checked: Dict[int, float] = {}
+        self._limiter: Optional[HostRateLimiter] = None
+        self._results: Dict[str, asyncio.Task] = {}
+
+    def begin_run(self, limiter: Optional[HostRateLimiter] = None):
+        self._limiter = limiter or HostRateLimiter()
+        self._results = {}
+
+    async def check_url(self, url: str) -> bool:
+        if not url or url == "#":
+            return True
+        if "fmkorea" in url:
+            # fmkorea는 스크래퍼에서 차단을 완벽히 통제하므로 일단 무조건 안전으로 살려둠 (430 차단 방지)
+            return False
+        task = self._results.get(url)
+        if task is None:
+            task = self._results[url] = asyncio.ensure_future(self._ping(url))
+        return await task
+
+    async def _ping(self, url: str) -> bool:
+        headers = dict(REQUEST_HEADERS)
+        for marker, referer in REFERERS.items():
+            if marker in url:
+                headers["Referer"] = referer
+                break
+        if self._limiter is None:
+            self.begin_run()
+        try:
+            async with self._limiter.slot(urlsplit(url).hostname or ""):
+                return await self._scan(url, headers)
+        except Exception as e:
+            logger.error(f"[Validator Ping Error] {url}: {e}")
+            return False  # 핑 전송 에러 시 일단 살아있는 것으로 임시 판정
+
+    async def _scan(self, url: str, headers: dict) -> bool:
+        async with http_transport.stream("GET", url, headers=headers, impersonate="chrome120",
+                                         tag="validator") as response:
+            try:
+                if response.status_code == 404:
+                    return True
+                if response.status_code in (403, 430):
+                    # 안티봇 차단 시 일단 삭제되지 않은 것으로 간주
+                    return False
+                scanner = DeletionScanner(url)
+                if scanner.feed(str(response.url)):
+                    return True
+                decoder, received = None, 0
+                async for chunk in response.aiter_content():
+                    if decoder is None:
+                        encoding = _sniff_encoding(response.headers.get("Content-Type", ""), chunk)
+                        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+                    received += len(chunk)
+                    if scanner.feed(decoder.decode(chunk)) or received >= self.max_scan_bytes:
+                        break
+                return scanner.deleted
+            finally:
+                # 판정이 끝났으면 남은 본문 수신을 즉시 중단
+                quit_now = getattr(response, "quit_now", None)
+                if quit_now is not None:
+                    quit_now.set()
+
+    async def check_deal(self, deal_id: int, post_link: str, merged_communities: Optional[str]):
+        """대표/서브 링크 동시 검증 → (대표 삭제 여부, 삭제된 병합 항목 집합)"""
+        merged_items = [item.strip() for item in (merged_communities or "").split(",") if item.strip()]
+        sub_urls = {item: item.split("::")[1] for item in merged_items if len(item.split("::")) >= 2}
+        results = await asyncio.gather(self.check_url(post_link), *(self.check_url(u) for u in sub_urls.values()))
+        self.last_checked[deal_id] = time.time()
+        deleted_subs = {item for item, deleted in zip(sub_urls, results[1:]) if deleted}
+        return results[0], deleted_subs
+
+
+def apply_validation(db, deal: Deal, is_repr_deleted: bool, deleted_subs: set) -> bool:
+    """검증 결과를 딜에 반영 (서브 링크 정리 / 대표 교체 자가치유 / 최종 종료). 종료 처리 시 True"""
+    merged_changed = False
+    valid_merged = []
+    if deal.merged_communities:
+        for item in (item.strip() for item in deal.merged_communities.split(",")):
+            if not item:
+                continue
+            if item in deleted_subs:
+                merged_changed = True
+                logger.info(f"🗑️ [Validator] 삭제된 병합 딜 링크 감지되어 제거: ID {item.split('::')[0]} -> {item.split('::')[1]}")
+            else:
+                valid_merged.append(item)
+
+    new_merged_str = ",".join(valid_merged) if valid_merged else None
+    if new_merged_str != deal.merged_communities:
+        deal.merged_communities = new_merged_str
+        merged_changed = True
+
+    if is_repr_deleted:
+        chosen_item = next((item for item in valid_merged if len(item.split("::")) >= 2), None)
+        if chosen_item:
+            # 🔄 자가치유 작동: 대표 딜은 삭제되었지만 살아있는 서브 딜이 존재함 -> 서브 딜로 대표 정보 승격
+            parts = chosen_item.split("::")
+            old_url = deal.post_link
+            new_url = parts[1]
+            # ⏰ 승격될 서브 딜의 실제 작성 시간(indexed_at)을 DB에서 조회하여 대표 딜의 시간으로 갱신
+            # (대표 링크를 바꾸기 전에 조회해야 autoflush 로 자기 자신이 조회되지 않음)
+            sub_deal_in_db = db.query(Deal).filter(Deal.post_link == new_url, Deal.id != deal.id).first()
+            deal.source_community_id = int(parts[0])
+            deal.post_link = new_url
+
+            if sub_deal_in_db and sub_deal_in_db.indexed_at:
+                deal.indexed_at = sub_deal_in_db.indexed_at
+                logger.info(f"⏰ [Validator-Healing] 대표 딜의 indexed_at 시간을 서브 딜의 시간({sub_deal_in_db.indexed_at})으로 동기화 완료")
+
+            valid_merged.remove(chosen_item)
+            deal.merged_communities = ",".join(valid_merged) if valid_merged else None
+            logger.info(f"🔄 [Validator-Healing] 대표 딜 삭제 감지 -> 서브 딜로 대표 교체 승격 완료! ({old_url} -> {new_url})")
+            db.commit()
+            return False
+
+        # 대표 및 모든 서브 딜이 전원 삭제됨 -> 핫딜 최종 종료 처리
+        deal.is_closed = True
+        db.commit()
+        logger.info(f"🚫 [Validator-Closed] 대표 및 서브 딜 모두 삭제 감지 -> 핫딜 종료: {deal.title}")
+        return True
+
+    if merged_changed:
+        db.commit()
+        logger.info(f"💾 [Validator-Sync] 서브 딜 링크 일부 삭제로 merged_communities 갱신 완료: {deal.title}")
+    return False
+
+
+async def run_validation(db, validator: "DealValidator", now: Optional[datetime] = None,
+                         log: Optional[ValidationLog] = None) -> Tuple[int, int]:
+    """
+    검증 1회 실행: 후보 선별 → 딜 단위 동시 핑 → 결과를 순차 반영
+    반환: (검증한 딜 수, 종료 처리한 딜 수)
+    """
+    now = now or datetime.utcnow()
+    log = log or validation_log()
+    candidates = db.query(Deal.id, Deal.indexed_at, Deal.honey_score).filter(
+        Deal.is_closed == False,
+        Deal.indexed_at >= now - timedelta(days=VALIDATION_WINDOW_DAYS),
+    ).all()
+    alive_ids = {row[0] for row in candidates}
+    # 다른 프로세스가 마지막으로 검증한 시각까지 반영 (대상 기간 밖/종료된 딜은 버림)
+    validator.last_checked = {deal_id: checked_at for deal_id, checked_at in log.load().items() if deal_id in alive_ids}
+
+    selected = prioritize([tuple(row) for row in candidates], validator.last_checked, now)
+    if not selected:
+        return 0, 0
+    deals = db.query(Deal).filter(Deal.id.in_(selected)).all()
+
+    validator.begin_run()
+    deal_slots = asyncio.Semaphore(DEAL_CONCURRENCY)
+
+    async def check(deal: Deal):
+        async with deal_slots:
+            return await validator.check_deal(deal.id, deal.post_link, deal.merged_communities)
+
+    results = await asyncio.gather(*(check(deal) for deal in deals), return_exceptions=True)
+    log.record({deal.id: validator.last_checked[deal.id] for deal in deals if deal.id in validator.last_checked})
+
+    closed_count = 0
+    for deal, result in zip(deals, results):
+        if isinstance(result, BaseException):
+            logger.error(f"[Validator Deal Error] Deal ID {deal.id}: {result}")
+            continue
+        try:
+            if apply_validation(db, deal, *result):
+                closed_count += 1
+        except Exception as deal_err:
+            db.rollback()
+            logger.error(f"[Validator Deal Error] Deal ID {deal.id}: {deal_err}")
+    return len(deals), closed_count
+
+
+# 프로세스 전역 검증기 (마지막 검증 시각은 ValidationLog 로 프로세스 간 유지)
+deal_validator = DealValidator()
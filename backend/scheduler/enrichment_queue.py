@@ -0,0 +1,267 @@
+"""
+⚡ 2단계 등록(빠른 등록 → 지연 보강)의 보강 큐 (SQLite, 프로세스 간 공유)
+
+- 수집 워커는 신규 글을 목록 행 정보만으로 즉시 INSERT(AggregatorService.insert_listing)하고 여기에 보강 잡을 등록
+  → 글이 올라온 뒤 피드에 보이기까지의 시간이 상세 페이지/og:image/정규화/Gemini 중 가장 느린 단계에 묶이지 않음
+- 보강은 두 단계로 행을 덮어씀
+  1) detail: 상세 페이지(본문, 아웃링크, 고화질 이미지, 작성 시각) → 행에 바로 반영
+  2) enrich: 정규화/쇼핑몰 메타 가격/AI 분할/평균가 점수/롤링 윈도우 병합 (process_scraped_deal(placeholder=...))
+     기존 딜로 병합되면 빠른 등록 행은 종료된 리다이렉트로 남고, 크롤 프런티어는 흡수한 딜을 가리키도록 갱신
+- 잡은 우선순위(커뮤니티 인증 핫딜 → 앞 페이지 → 반응 많은 글) 순으로 처리, 실패 시 지수 백오프 재시도
+- 같은 딜의 보강 잡은 대기/실행 중 하나만 존재 (부분 유니크 인덱스)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from backend.core.metrics import pipeline_metrics
+from backend.core.sqlite_store import DONE, FAILED, QUEUED, RUNNING, RetryingJobTable
+from backend.scheduler import shutdown
+from backend.scheduler.crawl_frontier import get_frontier
+
+logger = logging.getLogger(__name__)
+
+ENRICH_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "enrichment_queue.db")
+
+DETAIL, ENRICH = "detail", "enrich"
+MAX_ATTEMPTS = 4
+RETRY_BASE_SECONDS = 60
+# 실행 중 표시 후 이 시간이 지나도 끝나지 않은 잡(워커 사망)은 다시 대기열로
+STALE_SECONDS = 10 * 60
+# 완료/실패 잡 보관 기간
+HISTORY_SECONDS = 24 * 3600
+# 한 번의 보강 실행이 쓰는 최대 시간과 단계별 동시 처리 수 (AI 단계는 Gemini 레이트리밋 고려)
+ENRICH_TIME_BUDGET = 240.0
+DETAIL_CONCURRENCY = 4
+ENRICH_CONCURRENCY = 2
+# 기존 정책과 동일: 상세 페이지는 1~3페이지 글만
+DETAIL_MAX_PAGE = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS enrich_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    deal_id INTEGER NOT NULL,
+    community TEXT NOT NULL,
+    community_id INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    priority REAL NOT NULL,
+    item TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    enqueued_at REAL NOT NULL,
+    claimed_at REAL,
+    finished_at REAL,
+    error TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS enrich_jobs_active_deal ON enrich_jobs(deal_id) WHERE status IN ('queued', 'running');
+CREATE INDEX IF NOT EXISTS enrich_jobs_pending ON enrich_jobs(status, stage, priority, id);
+"""
+
+
+def enrichment_priority(item: dict) -> float:
+    """작을수록 먼저: 커뮤니티 인증 핫딜 → 앞 페이지 → 추천/댓글 많은 글"""
+    reactions = int(item.get("like_count") or 0) * 10 + int(item.get("comment_count") or 0) * 5
+    return (0 if item.get("is_super_hotdeal") else 1000) + int(item.get("page") or 1) * 100 - min(99, reactions)
+
+
+@dataclass
+class EnrichJob:
+    id: int
+    deal_id: int
+    community: str
+    community_id: int
+    stage: str
+    priority: float
+    item: Dict[str, Any]
+    status: str
+    attempts: int
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "EnrichJob":
+        return cls(
+            id=row["id"], deal_id=row["deal_id"], community=row["community"], community_id=row["community_id"],
+            stage=row["stage"], priority=row["priority"], item=json.loads(row["item"]), status=row["status"],
+            attempts=row["attempts"],
+        )
+
+
+class EnrichmentQueue(RetryingJobTable):
+    """빠른 등록 딜의 보강 잡 (detail → enrich 단계 전환)"""
+
+    schema = _SCHEMA
+    table = "enrich_jobs"
+    max_attempts = MAX_ATTEMPTS
+    retry_base_seconds = RETRY_BASE_SECONDS
+    stale_seconds = STALE_SECONDS
+    history_seconds = HISTORY_SECONDS
+
+    def __init__(self, path: str = ENRICH_DB_PATH):
+        super().__init__(path)
+
+    def enqueue(self, deal_id: int, community: str, community_id: int, item: dict,
+                priority: Optional[float] = None, stage: str = DETAIL) -> Optional[int]:
+        """보강 잡 등록. 같은 딜의 잡이 이미 대기/실행 중이면 None"""
+        now = time.time()
+        try:
+            cursor = self.conn.execute(
+                "INSERT INTO enrich_jobs (deal_id, community, community_id, stage, priority, item, status, available_at, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (deal_id, community, community_id, stage,
+                 enrichment_priority(item) if priority is None else priority,
+                 json.dumps(item, ensure_ascii=False, default=str), QUEUED, now, now),
+            )
+        except sqlite3.IntegrityError:
+            return None
+        return cursor.lastrowid
+
+    def claim(self, stage: str, limit: int, now: Optional[float] = None) -> List[EnrichJob]:
+        """해당 단계의 대기 잡을 우선순위 순으로 최대 limit 개 running 전환하여 반환"""
+        rows = self._claim_rows(limit, now, where="AND stage = ?", params=(stage,), order_by="priority, id")
+        return sorted((EnrichJob.from_row(row) for row in rows), key=lambda job: (job.priority, job.id))
+
+    def advance(self, job_id: int, stage: str, item: dict):
+        """다음 단계로 넘김 (상세 단계에서 보강된 item 으로 교체)"""
+        self.conn.execute(
+            "UPDATE enrich_jobs SET stage = ?, item = ?, status = ?, attempts = 0, available_at = ? WHERE id = ? AND status = ?",
+            (stage, json.dumps(item, ensure_ascii=False, default=str), QUEUED, time.time(), job_id, RUNNING),
+        )
+
+    def counts(self) -> Dict[str, int]:
+        rows = self.conn.execute(
+            "SELECT stage, status, COUNT(*) AS n FROM enrich_jobs GROUP BY stage, status"
+        ).fetchall()
+        return {f"{row['stage']}:{row['status']}": row["n"] for row in rows}
+
+
+# ---------------------------------------------------------------- stages
+async def _detail_stage(queue: EnrichmentQueue, job: EnrichJob, scraper):
+    from backend.core.url_utils import normalize_url
+    from backend.database.session import SessionLocal
+    from backend.services.aggregator_service import AggregatorService
+
+    item = job.item
+    if scraper is not None and int(item.get("page") or 1) <= DETAIL_MAX_PAGE:
+        with pipeline_metrics.timer("crawl_detail_seconds"):
+            detail = await scraper.get_detail(item["url"])
+        if detail:
+            if detail.get("ecommerce_link"):
+                detail["ecommerce_link"] = normalize_url(detail["ecommerce_link"])
+            # [Smart Merge Guard] 빈 값은 목록 단 값을 덮어쓰지 않음
+            for key, value in detail.items():
+                if value is not None and value != "":
+                    item[key] = value
+            db = SessionLocal()
+            try:
+                AggregatorService.apply_detail(db, job.deal_id, item)
+            finally:
+                db.close()
+    queue.advance(job.id, ENRICH, item)
+
+
+async def _enrich_stage(queue: EnrichmentQueue, job: EnrichJob, aggregator):
+    """aggregator: 보강 실행 동안 재사용하는 AggregatorService (잡마다 세션만 bind, 동시에 도는 잡끼리는 공유하지 않음)"""
+    from backend.database.models import Deal
+    from backend.database.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        deal = db.get(Deal, job.deal_id)
+        if deal is not None:
+            survivor = await aggregator.bind(db).process_scraped_deal(job.community_id, job.item, placeholder=deal)
+            if survivor is not None and survivor.id != job.deal_id:
+                # 기존 딜로 흡수됨 → 이후 재수집(반응 지표 버퍼 등)이 흡수한 딜을 가리키도록 프런티어 갱신
+                frontier = get_frontier(job.community)
+                frontier.mark_refreshed(job.item["url"], job.item, time.time(), survivor.id)
+                frontier.checkpoint()
+    finally:
+        db.close()
+    queue.complete(job.id)
+
+
+async def _run_job(queue: EnrichmentQueue, job: EnrichJob, limiter: asyncio.Semaphore, scraper=None,
+                   aggregators: Optional[asyncio.Queue] = None):
+    async with limiter:
+        with pipeline_metrics.community_scope(job.community):
+            try:
+                with pipeline_metrics.timer("crawl_enrich_seconds", label=job.stage):
+                    if job.stage == DETAIL:
+                        await _detail_stage(queue, job, scraper)
+                    else:
+                        # 동시 처리 한도만큼 만들어 둔 인스턴스 중 하나를 빌려 씀
+                        aggregator = aggregators.get_nowait()
+                        try:
+                            await _enrich_stage(queue, job, aggregator)
+                        finally:
+                            aggregators.put_nowait(aggregator)
+                return True
+            except Exception as e:
+                retried = queue.retry(job.id, f"{type(e).__name__}: {e}")
+                logger.error(f"❌ [Enrich] {job.community} deal#{job.deal_id} {job.stage} 실패"
+                             f"{' (재시도 예약)' if retried else ' (포기)'}: {e}")
+                return False
+
+
+async def run_enrichment(scraper_classes: Dict[str, type], queue: Optional[EnrichmentQueue] = None,
+                         time_budget: float = ENRICH_TIME_BUDGET) -> Dict[str, int]:
+    """
+    보강 큐를 시간 예산 안에서 비움 (상세 단계와 AI 단계를 각자 동시 처리 한도로 병행)
+    상세 단계용 스크래퍼는 커뮤니티별로 실행 동안 한 번만 열어 세션/쿠키를 재사용
+    AI 단계의 AggregatorService 도 실행 동안 동시 처리 한도만큼만 만들어 재사용 (잡마다 세션만 bind)
+    """
+    from backend.services.aggregator_service import AggregatorService
+
+    own_queue = queue is None
+    queue = queue or EnrichmentQueue()
+    started = time.monotonic()
+    stats = {DETAIL: 0, ENRICH: 0, "failed": 0}
+    detail_limiter = asyncio.Semaphore(DETAIL_CONCURRENCY)
+    enrich_limiter = asyncio.Semaphore(ENRICH_CONCURRENCY)
+    aggregators = asyncio.Queue()
+    for _ in range(ENRICH_CONCURRENCY):
+        aggregators.put_nowait(AggregatorService())
+    try:
+        queue.requeue_stale()
+        async with AsyncExitStack() as stack:
+            scrapers = {}
+
+            async def scraper_for(job: EnrichJob):
+                if job.community not in scrapers:
+                    scraper_class = scraper_classes.get(job.community)
+                    scrapers[job.community] = None
+                    if scraper_class is not None:
+                        try:
+                            scrapers[job.community] = await stack.enter_async_context(
+                                scraper_class(community_id=job.community_id)
+                            )
+                        except Exception as e:
+                            # 상세 페이지 없이 AI/정규화 단계로 진행
+                            logger.error(f"❌ [Enrich] {job.community} 스크래퍼 준비 실패: {e}")
+                return scrapers[job.community]
+
+            # 드레인(SIGTERM) 중이면 새 배치를 잡지 않음 (대기 잡은 큐에 남아 다음 실행에서 처리)
+            while time.monotonic() - started < time_budget and not shutdown.draining():
+                detail_jobs = queue.claim(DETAIL, DETAIL_CONCURRENCY * 2)
+                enrich_jobs = queue.claim(ENRICH, ENRICH_CONCURRENCY * 2)
+                if not detail_jobs and not enrich_jobs:
+                    break
+                tasks = [_run_job(queue, job, detail_limiter, await scraper_for(job)) for job in detail_jobs]
+                tasks += [_run_job(queue, job, enrich_limiter, aggregators=aggregators) for job in enrich_jobs]
+                results = await asyncio.gather(*tasks)
+                for job, ok in zip(detail_jobs + enrich_jobs, results):
+                    stats[job.stage if ok else "failed"] += 1
+        queue.prune()
+    finally:
+        if own_queue:
+            queue.close()
+    if any(stats.values()):
+        logger.info(f"⚡ [Enrich] 보강 완료: 상세 {stats[DETAIL]}건, AI/정규화 {stats[ENRICH]}건, 실패 {stats['failed']}건")
+    pipeline_metrics.flush()
+    return stats
@@ -0,0 +1,94 @@
+"""
+📥 수집 아이템 내구성 큐 (SQLite, 커뮤니티별 처리 대기 목록)
+
+- 프로듀서가 목록에서 받은 아이템을 asyncio.Queue 에 넣기 전에 여기 먼저 기록하고, 워커가 처리를 끝내면 ack
+  → 재시작/배포/워커 사망으로 메모리 큐가 사라져도 처리되지 않은 아이템은 다음 수집 때 먼저 이어서 처리
+- 멱등: 커뮤니티 + 정규화 URL 당 대기 중 아이템은 하나만 존재 (부분 유니크 인덱스)
+  → 재개한 아이템이 새 목록에 다시 보여도 두 번 처리하지 않음
+- 처리 실패(예외)도 ack 로 종료 (독성 아이템 무한 재시도 방지, 원인은 error 에 기록)
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+from backend.core.sqlite_store import SqliteStore
+
+INGEST_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "ingest_queue.db")
+
+PENDING, DONE, FAILED = "pending", "done", "failed"
+# 처리 완료 아이템 보관 기간
+HISTORY_SECONDS = 6 * 3600
+# 이 시간보다 오래 대기한 아이템은 재개하지 않음 (목록 갱신 주기상 이미 다른 경로로 반영되었거나 의미 없음)
+MAX_PENDING_AGE = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingest_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    community TEXT NOT NULL,
+    url TEXT NOT NULL,
+    item TEXT NOT NULL,
+    status TEXT NOT NULL,
+    enqueued_at REAL NOT NULL,
+    finished_at REAL,
+    error TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ingest_items_pending_url ON ingest_items(community, url) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS ingest_items_status ON ingest_items(community, status, id);
+"""
+
+
+class IngestQueue(SqliteStore):
+    """커뮤니티별 처리 대기 아이템"""
+
+    schema = _SCHEMA
+
+    def __init__(self, path: str = INGEST_DB_PATH):
+        super().__init__(path)
+
+    def put(self, community: str, item: dict, now: Optional[float] = None) -> Optional[int]:
+        """처리 대기 등록. 같은 URL 이 이미 대기 중이면 None (호출 측은 메모리 큐에 넣지 않음)"""
+        try:
+            cursor = self.conn.execute(
+                "INSERT INTO ingest_items (community, url, item, status, enqueued_at) VALUES (?, ?, ?, ?, ?)",
+                (community, item["url"], json.dumps(item, ensure_ascii=False, default=str), PENDING,
+                 time.time() if now is None else now),
+            )
+        except sqlite3.IntegrityError:
+            return None
+        return cursor.lastrowid
+
+    def pending(self, community: str, now: Optional[float] = None) -> List[Tuple[int, dict]]:
+        """이전 실행이 처리하지 못하고 남긴 아이템 (등록 순). 너무 오래된 아이템은 만료 처리"""
+        now = time.time() if now is None else now
+        self.conn.execute(
+            "UPDATE ingest_items SET status = ?, finished_at = ?, error = 'expired' "
+            "WHERE community = ? AND status = ? AND enqueued_at < ?",
+            (FAILED, now, community, PENDING, now - MAX_PENDING_AGE),
+        )
+        rows = self.conn.execute(
+            "SELECT id, item FROM ingest_items WHERE community = ? AND status = ? ORDER BY id",
+            (community, PENDING),
+        ).fetchall()
+        return [(row["id"], json.loads(row["item"])) for row in rows]
+
+    def ack(self, item_id: int, error: Optional[str] = None, now: Optional[float] = None):
+        self.conn.execute(
+            "UPDATE ingest_items SET status = ?, finished_at = ?, error = ? WHERE id = ? AND status = ?",
+            (FAILED if error else DONE, time.time() if now is None else now, error, item_id, PENDING),
+        )
+
+    def prune(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        cursor = self.conn.execute(
+            "DELETE FROM ingest_items WHERE status IN (?, ?) AND finished_at < ?", (DONE, FAILED, now - HISTORY_SECONDS)
+        )
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        rows = self.conn.execute(
+            "SELECT community, COUNT(*) AS n FROM ingest_items WHERE status = ? GROUP BY community", (PENDING,)
+        ).fetchall()
+        return {row["community"]: row["n"] for row in rows}
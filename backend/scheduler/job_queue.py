@@ -0,0 +1,182 @@
+"""
+🗃️ 스케줄러 로컬 잡 큐 (SQLite, 프로세스 간 공유)
+
+- 디스패처가 enqueue, 워커 프로세스들이 claim → heartbeat → finish
+- dedupe_key 가 같은 잡은 queued/running 상태로 하나만 존재 (부분 유니크 인덱스 → 같은 커뮤니티 수집 중복 실행 원천 차단)
+- 하트비트가 끊긴 잡(워커 사망)은 lost, 제한 시간을 넘긴 잡은 디스패처가 워커를 강제 종료 후 timeout 처리
+- 종료된 잡 결과는 collect() 로 한 번씩만 디스패처에 전달
+"""
+
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from backend.core.sqlite_store import SqliteStore
+
+JOB_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "scheduler_jobs.db")
+
+QUEUED, RUNNING, DONE, FAILED, TIMEOUT, LOST = "queued", "running", "done", "failed", "timeout", "lost"
+TERMINAL_STATUSES = (DONE, FAILED, TIMEOUT, LOST)
+# 종료된 잡 이력 보관 기간
+HISTORY_SECONDS = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    args TEXT NOT NULL DEFAULT '{}',
+    dedupe_key TEXT,
+    status TEXT NOT NULL,
+    timeout REAL NOT NULL,
+    enqueued_at REAL NOT NULL,
+    started_at REAL,
+    heartbeat_at REAL,
+    finished_at REAL,
+    worker TEXT,
+    result TEXT,
+    error TEXT,
+    collected INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_active_dedupe ON jobs(dedupe_key) WHERE status IN ('queued', 'running');
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status, id);
+"""
+
+
+@dataclass
+class Job:
+    id: int
+    name: str
+    args: Dict[str, Any]
+    dedupe_key: Optional[str]
+    status: str
+    timeout: float
+    enqueued_at: float
+    started_at: Optional[float] = None
+    heartbeat_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    worker: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Job":
+        return cls(
+            id=row["id"], name=row["name"], args=json.loads(row["args"]), dedupe_key=row["dedupe_key"],
+            status=row["status"], timeout=row["timeout"], enqueued_at=row["enqueued_at"],
+            started_at=row["started_at"], heartbeat_at=row["heartbeat_at"], finished_at=row["finished_at"],
+            worker=row["worker"], result=json.loads(row["result"]) if row["result"] else None, error=row["error"],
+        )
+
+
+class JobQueue(SqliteStore):
+    """디스패처와 워커 프로세스가 함께 쓰는 잡 테이블"""
+
+    schema = _SCHEMA
+
+    def __init__(self, path: str = JOB_DB_PATH):
+        super().__init__(path)
+
+    # ------------------------------------------------------------ dispatcher
+    def enqueue(self, name: str, args: Optional[dict] = None, timeout: float = 600.0,
+                dedupe_key: Optional[str] = None) -> Optional[int]:
+        """잡 등록. 같은 dedupe_key 의 잡이 대기/실행 중이면 등록하지 않고 None"""
+        try:
+            cursor = self.conn.execute(
+                "INSERT INTO jobs (name, args, dedupe_key, status, timeout, enqueued_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (name, json.dumps(args or {}, ensure_ascii=False), dedupe_key, QUEUED, timeout, time.time()),
+            )
+        except sqlite3.IntegrityError:
+            return None
+        return cursor.lastrowid
+
+    def collect(self) -> List[Job]:
+        """아직 전달하지 않은 종료 잡 목록 (한 번 반환한 잡은 다시 반환하지 않음)"""
+        placeholders = ",".join("?" * len(TERMINAL_STATUSES))
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = self.conn.execute(
+                f"SELECT * FROM jobs WHERE collected = 0 AND status IN ({placeholders}) ORDER BY id",
+                TERMINAL_STATUSES,
+            ).fetchall()
+            if rows:
+                self.conn.execute(
+                    f"UPDATE jobs SET collected = 1 WHERE id IN ({','.join('?' * len(rows))})",
+                    [row["id"] for row in rows],
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return [Job.from_row(row) for row in rows]
+
+    def reap_stale(self, heartbeat_timeout: float, now: Optional[float] = None) -> List[int]:
+        """하트비트가 heartbeat_timeout 초 이상 끊긴 실행 중 잡을 lost 처리"""
+        now = time.time() if now is None else now
+        rows = self.conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, error = 'heartbeat lost' "
+            "WHERE status = ? AND heartbeat_at < ? RETURNING id",
+            (LOST, now, RUNNING, now - heartbeat_timeout),
+        ).fetchall()
+        return [row["id"] for row in rows]
+
+    def overdue(self, grace: float, now: Optional[float] = None) -> List[Job]:
+        """제한 시간 + grace 를 넘겨 실행 중인 잡 (워커가 취소에 응답하지 못한 경우)"""
+        now = time.time() if now is None else now
+        rows = self.conn.execute(
+            "SELECT * FROM jobs WHERE status = ? AND started_at + timeout + ? < ?",
+            (RUNNING, grace, now),
+        ).fetchall()
+        return [Job.from_row(row) for row in rows]
+
+    def fail_worker_jobs(self, worker: Optional[str], status: str, error: str, now: Optional[float] = None) -> List[int]:
+        """사망/강제 종료된 워커가 잡고 있던 실행 중 잡 일괄 종료 (worker=None 이면 모든 실행 중 잡)"""
+        now = time.time() if now is None else now
+        rows = self.conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, error = ? "
+            "WHERE status = ? AND (? IS NULL OR worker = ?) RETURNING id",
+            (status, now, error, RUNNING, worker, worker),
+        ).fetchall()
+        return [row["id"] for row in rows]
+
+    def prune(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        placeholders = ",".join("?" * len(TERMINAL_STATUSES))
+        cursor = self.conn.execute(
+            f"DELETE FROM jobs WHERE collected = 1 AND status IN ({placeholders}) AND finished_at < ?",
+            (*TERMINAL_STATUSES, now - HISTORY_SECONDS),
+        )
+        return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    # ------------------------------------------------------------ worker
+    def claim(self, worker: str) -> Optional[Job]:
+        """가장 오래 대기한 잡 하나를 원자적으로 running 으로 전환하여 반환"""
+        now = time.time()
+        row = self.conn.execute(
+            "UPDATE jobs SET status = ?, worker = ?, started_at = ?, heartbeat_at = ? "
+            "WHERE id = (SELECT id FROM jobs WHERE status = ? ORDER BY id LIMIT 1) RETURNING *",
+            (RUNNING, worker, now, now, QUEUED),
+        ).fetchone()
+        return Job.from_row(row) if row else None
+
+    def heartbeat(self, job_ids: List[int], worker: str, now: Optional[float] = None):
+        if not job_ids:
+            return
+        self.conn.execute(
+            f"UPDATE jobs SET heartbeat_at = ? WHERE status = ? AND worker = ? AND id IN ({','.join('?' * len(job_ids))})",
+            (time.time() if now is None else now, RUNNING, worker, *job_ids),
+        )
+
+    def finish(self, job_id: int, status: str, result: Any = None, error: Optional[str] = None):
+        """실행 결과 기록 (디스패처가 이미 lost/timeout 처리한 잡은 덮어쓰지 않음)"""
+        self.conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, result = ?, error = ? WHERE id = ? AND status = ?",
+            (status, time.time(), json.dumps(result, ensure_ascii=False, default=str) if result is not None else None,
+             error, job_id, RUNNING),
+        )
@@ -2,7 +2,9 @@ import asyncio
 import logging
 import os
 import sys
-from datetime import datetime
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 
 # 모듈 경로 및 환경 변수 로드 (API 서버와 동일한 DB를 바라보게 설정)
@@ -26,14 +28,76 @@ from backend.scrapers.bbasak_overseas_scraper import BbasakOverseasScraper
 from backend.scrapers.bbasak_parenting_scraper import BbasakParentingScraper
 from backend.scrapers.fmkorea_trending_scraper import update_fmkorea_trending_keywords
 from backend.services.aggregator_service import AggregatorService
+from backend.scheduler.backfill_planner import BACKFILL_TRIGGER_HOURS, BackfillPlanner, posted_epoch
+from backend.scheduler.crawl_planner import AdaptiveCrawlScheduler, CrawlOutcome, CrawlProfile
+from backend.scheduler.crawl_frontier import FrontierEntry, get_frontier, refresh_due
+from backend.scheduler.deal_lookup import existing_deal_snapshots
+from backend.scheduler.enrichment_queue import EnrichmentQueue, run_enrichment
+from backend.scheduler.push_queue import run_push_dispatch
+from backend.scheduler.reaction_buffer import ReactionBuffer
+from backend.scheduler.ingest_queue import IngestQueue
+from backend.scheduler import shutdown
+from backend.scheduler.stagger import StaggerPlan, phase_occupancy, phase_slot
+from backend.core.http_transport import http_transport
+from backend.core.metrics import pipeline_metrics
 
 logger = logging.getLogger(__name__)
 
+# 수집 대상 커뮤니티 (키: Community.name)
+COMMUNITY_SCRAPERS = {
+    "ppomppu": PpomppuScraper,
+    "quasarzone": QuasarzoneScraper,
+    "fmkorea": FmkoreaScraper,
+    "ruliweb": RuliwebScraper,
+    "clien": ClienScraper,
+    "ali_ppomppu": AlippomppuScraper,
+    "bbasak_domestic": BbasakDomesticScraper,
+    "bbasak_overseas": BbasakOverseasScraper,
+    "bbasak_parenting": BbasakParentingScraper,
+}
+
+# 커뮤니티별 폴링 주기/깊이 적응형 플래너 (클리앙은 2페이지 제한, 펨코는 인기글 페이지 추가 요청)
+crawl_planner = AdaptiveCrawlScheduler([
+    CrawlProfile("ppomppu"),
+    CrawlProfile("quasarzone"),
+    CrawlProfile("fmkorea", extra_requests=1),
+    CrawlProfile("ruliweb"),
+    CrawlProfile("clien", max_pages=2, rows_per_page=30, backfill_cap=2),
+    CrawlProfile("ali_ppomppu"),
+    CrawlProfile("bbasak_domestic"),
+    CrawlProfile("bbasak_overseas"),
+    CrawlProfile("bbasak_parenting"),
+])
+
+# 같은 틱에 차례가 된 커뮤니티의 시작 시각을 틱 구간 안 슬롯으로 분산 (SCRAPE_START_MODE=burst 면 동시 시작)
+stagger_plan = StaggerPlan()
+
+# 자가치유 백필: 공백 복구를 커뮤니티별로 나눠 평시 요청 예산과 같은 양(시간당 페이지) 안에서 진행
+backfill_planner = BackfillPlanner(crawl_planner.budget_pages_per_hour)
+# ⚡ 2단계 등록: 신규 글은 목록 정보만으로 즉시 등록하고 상세/AI 보강은 보강 큐에서 (FAST_INGEST=0 이면 기존 일괄 처리)
+FAST_INGEST = os.getenv("FAST_INGEST", "1") != "0"
+enrichment_queue = None
+# 수집 아이템 내구성 큐: 재시작/배포 시 처리하지 못한 목록 아이템을 다음 수집에서 이어서 처리
+ingest_queue = None
+
+# 커뮤니티별 마지막 수집 결과 (워커 프로세스는 이 값을 잡 결과로 디스패처에 반환)
+LAST_OUTCOMES = {}
+
 # 스케줄러 전역 상태 (API 헬스체크 및 대시보드 조회용)
 SCHEDULER_STATE = {
     "last_run_time": None,
     "last_status": "Idle",
-    "total_run_count": 0
+    "total_run_count": 0,
+    # 커뮤니티별 현재 수집 계획 (주기/깊이/근거/유입률) 및 시간당 요청 예산
+    "crawl_plan": {},
+    "request_budget": {
+        "pages_per_hour": round(crawl_planner.budget_pages_per_hour, 1),
+        "planned_pages_per_hour": 0.0,
+    },
+    # 커뮤니티별 백필 진행 상태 (다음 페이지/워터마크/완료 사유)
+    "backfill": backfill_planner.snapshot(),
+    # 시작 슬롯 배정 (모드/슬롯 수/커뮤니티 → 슬롯)
+    "stagger": stagger_plan.snapshot(),
 }
 
 # 🚀 메인 API 웹서버와 완전히 동일한 데이터베이스 파이프라인(session.py) 공유
@@ -42,8 +106,53 @@ from backend.database.session import SessionLocal, db_manager
 # 메인 DB 연결 및 테이블 강제 동기화 (최초 1회)
 db_manager.init_database()
 
-async def scrape_community(community_name: str, ScraperClass, pages: int = 1):
-    """지정된 커뮤니티의 비동기 수집 파이프라인 태스크 (Producer-Consumer 큐 방식 적용)"""
+# 단계별 메트릭: HTTP 요청 지연/차단, DB 쿼리 시간을 현재 수집 중인 커뮤니티로 집계 (워커 프로세스도 import 시 설치)
+http_transport.add_listener(pipeline_metrics.on_http_request)
+pipeline_metrics.instrument_engine(db_manager.engine)
+
+def _enrichment_queue() -> EnrichmentQueue:
+    """보강 큐 (프로세스마다 첫 사용 시 연결)"""
+    global enrichment_queue
+    if enrichment_queue is None:
+        enrichment_queue = EnrichmentQueue()
+    return enrichment_queue
+
+
+def _ingest_queue() -> IngestQueue:
+    """수집 아이템 내구성 큐 (프로세스마다 첫 사용 시 연결)"""
+    global ingest_queue
+    if ingest_queue is None:
+        ingest_queue = IngestQueue()
+    return ingest_queue
+
+
+async def run_enrichment_job() -> dict:
+    """보강 큐 처리 잡 (빠른 등록 글의 상세 페이지 → 정규화/AI 순으로 덮어쓰기)"""
+    return await run_enrichment(COMMUNITY_SCRAPERS, _enrichment_queue())
+
+
+async def scrape_community(community_name: str, ScraperClass, pages: int = 1, start_page: int = 1,
+                           backfill: bool = False, record: bool = True):
+    """지정된 커뮤니티의 비동기 수집 파이프라인 태스크 (Producer-Consumer 큐 방식 적용)
+    - start_page ~ start_page + pages - 1 페이지를 수집 (백필 청크는 2페이지 이후 구간)
+    - 결과(CrawlOutcome)는 LAST_OUTCOMES 에 남기고, record=True 면 플래너에 바로 반영 (워커 프로세스는 디스패처가 반영)
+    - 단계별 메트릭(core/metrics.py)은 이 커뮤니티 라벨로 집계되어 실행 종료 시 롤링 저장소에 기록
+    - 실행 구간은 틱 구간 위 슬롯별 시작 수/점유 시간으로도 기록 (관리자 대시보드 부하 분포)
+    """
+    with pipeline_metrics.community_scope(community_name):
+        started = time.time()
+        try:
+            with pipeline_metrics.timer("crawl_run_seconds"):
+                return await _scrape_community(community_name, ScraperClass, pages, start_page, backfill, record)
+        finally:
+            pipeline_metrics.inc("crawl_phase_starts_total", label=str(phase_slot(started)))
+            for slot, seconds in phase_occupancy(started, time.time()).items():
+                pipeline_metrics.inc("crawl_phase_busy_seconds", seconds, label=str(slot))
+            pipeline_metrics.flush()
+
+
+async def _scrape_community(community_name: str, ScraperClass, pages: int, start_page: int,
+                            backfill: bool, record: bool):
     db = SessionLocal()
     try:
         community = db.query(Community).filter(Community.name == community_name).first()
@@ -64,31 +173,95 @@ async def scrape_community(community_name: str, ScraperClass, pages: int = 1):
         community_display_name = community.display_name
     finally:
         db.close() # 메인 트랜잭션 종료 (워커들이 개별 세션 사용)
+    pipeline_metrics.run_started(community_name, community_display_name)
 
     try:
         success_count = 0
         update_count = 0
+        hot_promotions = 0
+        list_failed = False
+        last_page = start_page - 1
+        oldest_post_at = None
+        reached_known = False
+        list_ended = False
         scraper = ScraperClass(community_id=community_id)
         queue = asyncio.Queue()
+        ingest = _ingest_queue()
+
+        # 영속 크롤 프런티어: 사이클 내 중복/갱신 차례 판단을 DB 왕복 없이 처리 (재시작 후에도 유지)
+        frontier = get_frontier(community_name)
+        cycle_started = time.time()
+
+        def lookup_post_links(urls):
+            """프런티어에 없는 URL 만 IN 쿼리 1회로 조회하여 시드"""
+            check_db = SessionLocal()
+            try:
+                return existing_deal_snapshots(check_db, Deal.post_link, urls)
+            finally:
+                check_db.close()
+
+        async def enqueue(items):
+            """내구성 큐에 먼저 기록 후 메모리 큐로 (같은 URL 이 이미 대기 중이면 생략)"""
+            for item in items:
+                item_id = ingest.put(community_name, item)
+                if item_id is not None:
+                    await queue.put((item_id, item, time.perf_counter()))
 
         # [Phase 13] Async Queue 기반 Consumer Worker 정의 (병렬 스크래핑 및 DB 저장)
         async def worker():
-            nonlocal success_count, update_count
+            nonlocal success_count, update_count, hot_promotions
+            # 워커 수명 동안 재사용 (아이템마다 세션만 bind)
+            aggregator = AggregatorService()
+            # 반응 지표만 바뀐 기존 딜은 모아서 일괄 반영 (쓰기 지연)
+            # 프런티어 갱신(해시 전진)은 반영에 성공한 뒤에만 → 실패하면 다음 재수집이 다시 반영
+            def reactions_flushed(items):
+                now = time.time()
+                for flushed in items:
+                    frontier.mark_refreshed(flushed['url'], flushed, now)
+
+            reactions = ReactionBuffer(on_flushed=reactions_flushed)
+
+            def flush_reactions():
+                flush_db = SessionLocal()
+                try:
+                    with pipeline_metrics.timer("crawl_process_seconds", label="reactions"):
+                        reactions.flush(flush_db)
+                finally:
+                    flush_db.close()
+
             while True:
-                item = await queue.get()
-                if item is None:
+                # 어떤 경로의 아이템 뒤든, 다음 아이템을 기다리는 중이든 FLUSH_SECONDS 마다 반영
+                if reactions.due():
+                    flush_reactions()
+                try:
+                    if len(reactions):
+                        entry = await asyncio.wait_for(queue.get(), timeout=reactions.flush_seconds)
+                    else:
+                        entry = await queue.get()
+                except asyncio.TimeoutError:
+                    continue
+                if entry is None:
+                    if len(reactions):
+                        flush_reactions()
                     queue.task_done()
                     break
+                item_id, item, queued_at = entry
+                if shutdown.draining():
+                    # 드레인 중: 아직 시작하지 않은 아이템은 ack 하지 않고 남겨 다음 실행에서 재개
+                    queue.task_done()
+                    continue
+                pipeline_metrics.observe("crawl_queue_wait_seconds", time.perf_counter() - queued_at)
+                error = None
                 
                 # 각 워커별 독립적인 DB 세션 생성 (동시성 데드락 및 세션 오염 완벽 차단)
                 local_db = SessionLocal()
                 try:
                     from backend.core.url_utils import normalize_url
-                    normalized_url = normalize_url(item['url'])
-                    item['url'] = normalized_url  # 큐 내부 아이템의 URL도 정규화된 규격으로 통일
+                    normalized_url = item['url']  # 프로듀서에서 정규화 완료
                     
-                    # 1. Exact Match로 기존 수집 여부 판별
-                    existing_deal = local_db.query(Deal).filter(Deal.post_link == normalized_url).first()
+                    # 1. 기존 수집 여부는 프런티어 엔트리로 판별 (프로듀서가 갱신 차례인 기존 딜만 큐에 넣음)
+                    entry = frontier.get(normalized_url)
+                    existing_deal = entry if entry is not None and entry.is_known else None
                     
                     # 2. 롤링 윈도우 (24시간 내 동일 상품명/쇼핑몰 링크) 사전 검출로 중복상세 원천 차단
                     if not existing_deal:
@@ -97,17 +270,55 @@ async def scrape_community(community_name: str, ScraperClass, pages: int = 1):
                         target_url = item.get("ecommerce_link")
                         if target_url and len(target_url) > 20 and 'coupang' not in target_url:
                             target_url = normalize_url(target_url)
-                            existing_deal = local_db.query(Deal).filter(
-                                Deal.ecommerce_link == target_url,
+                            snapshot = existing_deal_snapshots(
+                                local_db, Deal.ecommerce_link, [target_url],
                                 Deal.indexed_at >= datetime.utcnow() - timedelta(hours=24)
-                            ).first()
+                            ).get(target_url)
+                            if snapshot:
+                                existing_deal = FrontierEntry.from_snapshot(snapshot, time.time())
+                                # 시간 기반 델타 스킵 가드 (12시간 경과 / 3~12시간 구간 20분 쿨다운)
+                                if not refresh_due(existing_deal, item, time.time()):
+                                    pipeline_metrics.inc("crawl_deals_total", label="skipped")
+                                    local_db.close()
+                                    ingest.ack(item_id)
+                                    queue.task_done()
+                                    continue
                     
+                    if existing_deal and existing_deal.has_content and existing_deal.reactions_only(item):
+                        # 👍 제목/가격/종료/핫딜 상태는 그대로이고 조회·추천·댓글 수만 바뀐 재수집 → 버퍼에 모아 일괄 반영
+                        # (핫딜 승격/해제는 핵심 해시가 바뀌므로 여기 오지 않고 아래 전체 경로로 즉시 기록)
+                        reactions.add(existing_deal.deal_id, item)
+                        update_count += 1
+                        pipeline_metrics.inc("crawl_deals_total", label="updated")
+                        local_db.close()
+                        ingest.ack(item_id)
+                        queue.task_done()
+                        continue
+
+                    if not existing_deal and FAST_INGEST:
+                        # ⚡ 빠른 등록: 목록 행만으로 INSERT 후 피드 노출, 상세/정규화/AI 는 보강 큐가 이어서 처리
+                        # (스팸/중복이면 None → 아래 기존 경로에서 병합 판단)
+                        with pipeline_metrics.timer("crawl_process_seconds", label="fast"):
+                            deal = aggregator.bind(local_db).insert_listing(community_id, item)
+                        if deal:
+                            _enrichment_queue().enqueue(deal.id, community_name, community_id, item)
+                            frontier.mark_refreshed(normalized_url, item, time.time(), deal.id)
+                            # 상세 보강은 보강 큐 담당 → 갱신 차례에 상세 페이지를 다시 긁지 않도록
+                            frontier.get(normalized_url).has_content = True
+                            success_count += 1
+                            pipeline_metrics.inc("crawl_deals_total", label="new")
+                            local_db.close()
+                            ingest.ack(item_id)
+                            queue.task_done()
+                            continue
+
                     if not existing_deal:
                         # 1. 완전한 신규 딜인 경우 ➔ 상세 페이지(HTML, AI 등) 파싱
                         # (최적화) 1~3페이지 게시글만 상세 파싱(고화질/컨텐츠 추출) 수행하여 속도 향상
                         detail = {}
                         if item.get("page", 1) <= 3:
-                            detail = await scraper.get_detail(normalized_url)
+                            with pipeline_metrics.timer("crawl_detail_seconds"):
+                                detail = await scraper.get_detail(normalized_url)
                         
                         if detail:
                             # 상세 페이지 내부의 외부 링크가 있다면 그것도 정규화
@@ -118,39 +329,12 @@ async def scrape_community(community_name: str, ScraperClass, pages: int = 1):
                                 if v is not None and v != "":
                                     item[k] = v
                     else:
-                        # 2. 기존 수집된 딜인 경우 ➔ 시간 기반 스마트 델타 스킵 가드 (Time-based Delta Skip Guard) 적용!
-                        from datetime import datetime, timedelta
-                        now = datetime.utcnow()
-                        indexed_time = existing_deal.indexed_at
-                        if indexed_time.tzinfo is not None:
-                            now = datetime.now(indexed_time.tzinfo)
-                        
-                        time_diff = now - indexed_time
-                        
-                        # 가드 1: 이미 작성된 지 12시간이 경과한 노후 핫딜은 핫딜마크 달성 기한이 끝났으므로 갱신 연산 스킵!
-                        if time_diff > timedelta(hours=12):
-                            local_db.close()
-                            queue.task_done()
-                            continue
-                            
-                        # 가드 2: 3~12시간 사이의 안정기 글은 최근 20분 이내에 갱신되었다면 DB 및 I/O 절감을 위해 스킵!
-                        from backend.database.models import DealReaction
-                        reaction = local_db.query(DealReaction).filter(DealReaction.deal_id == existing_deal.id).first()
-                        if reaction and reaction.last_updated:
-                            rx_time = reaction.last_updated
-                            if rx_time.tzinfo is not None:
-                                now = datetime.now(rx_time.tzinfo)
-                            rx_diff = now - rx_time
-                            
-                            if time_diff > timedelta(hours=3) and rx_diff < timedelta(minutes=20):
-                                local_db.close()
-                                queue.task_done()
-                                continue
-                        
+                        # 2. 기존 수집된 딜인 경우 ➔ 시간 기반 델타 스킵 가드는 프로듀서(frontier.admit)에서 이미 적용됨
                         # [Lazy-Loading 최적화 핵심]: 상세 정보(본문 등)가 예외적으로 누락된 경우가 아니라면,
                         # 기존 딜 업데이트 시 상세 페이지(get_detail)를 다시 긁지 않고 목록의 초경량 메타데이터(추천수, 조회수 등)로만 Upsert!
-                        if not existing_deal.content_html:
-                            detail = await scraper.get_detail(normalized_url)
+                        if not existing_deal.has_content:
+                            with pipeline_metrics.timer("crawl_detail_seconds"):
+                                detail = await scraper.get_detail(normalized_url)
                             if detail:
                                 if detail.get("ecommerce_link"):
                                     detail["ecommerce_link"] = normalize_url(detail["ecommerce_link"])
@@ -159,90 +343,109 @@ async def scrape_community(community_name: str, ScraperClass, pages: int = 1):
                                     if v is not None and v != "":
                                         item[k] = v
                     
-                    aggregator = AggregatorService(local_db)
-                    deal = await aggregator.process_scraped_deal(community_id, item)
+                    was_hot = bool(existing_deal and existing_deal.is_super_hotdeal)
+                    with pipeline_metrics.timer("crawl_process_seconds"):
+                        deal = await aggregator.bind(local_db).process_scraped_deal(community_id, item)
                     if deal:
+                        frontier.mark_refreshed(normalized_url, item, time.time(), deal.id)
                         if not existing_deal:
                             success_count += 1
+                            pipeline_metrics.inc("crawl_deals_total", label="new")
                         else:
                             update_count += 1
+                            pipeline_metrics.inc("crawl_deals_total", label="updated")
+                            # 기존 글이 이번 수집에서 핫딜마크를 새로 받았으면 승격으로 집계 (플래너 학습용)
+                            if not was_hot and getattr(deal, "is_super_hotdeal", False):
+                                hot_promotions += 1
                 except Exception as e:
                     local_db.rollback()
+                    error = f"{type(e).__name__}: {e}"
                     logger.error(f"[{community_display_name}] 데이터 처리 중 에러: {e}")
                 local_db.close()
+                ingest.ack(item_id, error)
                 queue.task_done()
 
         async with scraper:
-            logger.info(f"▶ [{community_display_name}] 큐 기반 스크래핑 워커 가동 (pages={pages})")
+            logger.info(f"▶ [{community_display_name}] 큐 기반 스크래핑 워커 가동 (pages={start_page}~{start_page + pages - 1}{', 백필' if backfill else ''})")
             
             # SQLite 사용 시 동시 쓰기로 인한 DB 손상을 방지하기 위해 1개의 워커만 사용
             workers = [asyncio.create_task(worker()) for _ in range(1)]
-            global_seen_urls = set()
 
-            # Producer: 리스트 페이지를 긁어서 Queue에 삽입
-            for page in range(1, pages + 1):
-                if page > 1:
-                    if "clien" in community_name:
-                        sep = "&" if "?" in scraper.list_url else "?"
-                        target_url = f"{scraper.list_url}{sep}po={page-1}"
+            # 이전 실행(재시작/배포/워커 사망)이 처리하지 못하고 남긴 아이템부터 이어서 처리
+            leftovers = ingest.pending(community_name)
+            if leftovers:
+                admitted, _ = frontier.admit([item for _, item in leftovers], lookup_post_links, time.time(), cycle_started)
+                admitted_urls = {item['url'] for item in admitted}
+                for item_id, item in leftovers:
+                    if item['url'] in admitted_urls:
+                        await queue.put((item_id, item, time.perf_counter()))
                     else:
-                        sep = "&" if "?" in scraper.list_url else "?"
-                        target_url = f"{scraper.list_url}{sep}page={page}"
-                else:
-                    target_url = scraper.list_url
+                        ingest.ack(item_id)
+                logger.info(f"♻️ [{community_display_name}] 이전 실행의 미처리 아이템 {len(admitted)}건 재개 (대기 {len(leftovers)}건)")
+
+            # Producer: 리스트 페이지를 긁어서 Queue에 삽입
+            for page in range(start_page, start_page + pages):
+                if shutdown.draining():
+                    break
+                target_url = scraper.page_url(page)
                     
                 try:
                     html = await scraper.fetch_html(target_url)
+                    if not html and page == start_page:
+                        list_failed = True
                     if html:
-                        items = await scraper.parse_list(html)
+                        with pipeline_metrics.timer("crawl_parse_seconds"):
+                            items = await scraper.parse_list(html)
                         
                         if not items:
+                            list_ended = True
                             break
+                        last_page = page
+                        # 백필 워터마크: 이번에 도달한 가장 오래된 글 작성 시각
+                        for item in items:
+                            posted = posted_epoch(item.get("posted_at"))
+                            if posted is not None and (oldest_post_at is None or posted < oldest_post_at):
+                                oldest_post_at = posted
                             
-                        # [최적화] 현재 페이지의 딜이 전부 기존 DB에 있는지 확인 (조기 종료) 및 페이지 내 큐 중복 방지
-                        duplicate_count = 0
-                        check_db = SessionLocal()
-                        unique_items = []
-                        try:
-                            from backend.core.url_utils import normalize_url
-                            for item in items:
-                                norm_url = normalize_url(item['url'])
-                                if norm_url in global_seen_urls:
-                                    continue
-                                global_seen_urls.add(norm_url)
-                                item['url'] = norm_url # 아이템의 url을 정규화된 것으로 미리 치환
-                                unique_items.append(item)
-                                if check_db.query(Deal).filter(Deal.post_link == norm_url).first():
-                                    duplicate_count += 1
-                        finally:
-                            check_db.close()
-                            
-                        for item in unique_items:
+                        # [최적화] URL 정규화 후 프런티어로 사이클 내 중복 제거 + 기존 딜 판별 (미스만 IN 쿼리 1회)
+                        from backend.core.url_utils import normalize_url
+                        for item in items:
+                            item['url'] = normalize_url(item['url'])
                             item['page'] = page
-                            await queue.put(item)
+                        admitted, duplicate_count = frontier.admit(items, lookup_post_links, time.time(), cycle_started)
+                            
+                        # 갱신 차례가 아닌 기존 딜(12시간 경과, 쿨다운 중이며 목록 내용 변화 없음)은 큐에 넣지 않음
+                        pipeline_metrics.inc("crawl_deals_total", len(items) - len(admitted), label="skipped")
+                        await enqueue(admitted)
                             
                         # 핫딜 종료/점수 강등 상태 업데이트를 위해 페이지 조기 종료 스킵 (1~3페이지 모두 스캔 보장)
-                        if unique_items and duplicate_count >= len(unique_items) - 1:
+                        if duplicate_count >= len(items) - 1:
                             if page > 3:
                                 logger.info(f"⏭️ [{community_display_name}] {page}페이지 대부분({duplicate_count}/{len(items)})이 기존 딜입니다. 백필 구간이 연결되었으므로 조기 종료합니다.")
+                                reached_known = True
                                 break
                             else:
                                 logger.info(f"ℹ️ [{community_display_name}] {page}페이지 대부분({duplicate_count}/{len(items)})이 기존 딜이지만, 상태 갱신을 위해 스캔을 계속합니다.")
                 except Exception as e:
+                    list_failed = list_failed or page == start_page
                     logger.error(f"[{community_display_name}] 리스트 페이지 {page} 파싱 에러: {e}")
                     # 타임아웃/차단 등 심각한 에러 발생 시 다음 페이지 조회를 중단하여 파이프라인 지연 방지
                     break
 
             # [Optimization] 포텐/인기글 전용 URL이 있는 경우 추가 1페이지 크롤링 (과거 수집 딜의 핫딜 승격 상태 업데이트용)
-            if hasattr(scraper, 'pop_url') and getattr(scraper, 'pop_url'):
+            if not backfill and not shutdown.draining() and getattr(scraper, 'pop_url', None):
                 try:
                     logger.info(f"▶ [{community_display_name}] 핫딜 승격 감지용 인기글 페이지 스크래핑 추가 실행")
                     scraper.parsing_pop = True
                     raw_html = await scraper.fetch_html(scraper.pop_url)
                     if raw_html:
                         items = await scraper.parse_list(raw_html)
+                        from backend.core.url_utils import normalize_url
                         for item in items:
-                            await queue.put(item)
+                            item['url'] = normalize_url(item['url'])
+                        admitted, _ = frontier.admit(items, lookup_post_links, time.time(), cycle_started)
+                        pipeline_metrics.inc("crawl_deals_total", len(items) - len(admitted), label="skipped")
+                        await enqueue(admitted)
                     scraper.parsing_pop = False
                 except Exception as e:
                     logger.error(f"[{community_display_name}] 인기글 페이지 파싱 에러: {e}")
@@ -251,213 +454,82 @@ async def scrape_community(community_name: str, ScraperClass, pages: int = 1):
             # 모든 아이템이 처리될 때까지 대기
             await queue.join()
             
-            # 워커 종료 신호 전송
-            for _ in range(5):
+            # 워커 종료 신호 전송 (워커 수만큼)
+            for _ in workers:
                 await queue.put(None)
             
             await asyncio.gather(*workers)
+            frontier.checkpoint()
+            ingest.prune()
             
             logger.info(f"✅ [{community_display_name}] 스크래핑 성공 (신규: {success_count}건, 갱신(중복): {update_count}건)")
                 
-            # 통계 JSON 쓰기 (동시성 보호를 위해 try/except 사용)
-            import json
-            stats_file = os.path.join(root_dir, "scraper_stats.json")
-            try:
-                stats = {}
-                if os.path.exists(stats_file):
-                    with open(stats_file, 'r', encoding='utf-8') as f:
-                        stats = json.load(f)
-                stats[community_display_name] = {
-                    "last_count": success_count,
-                    "last_run": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "status": "Success" if success_count > 0 else "Blocked/Failed"
-                }
-                with open(stats_file, 'w', encoding='utf-8') as f:
-                    json.dump(stats, f, ensure_ascii=False, indent=2)
-            except Exception:
-                pass
+            pipeline_metrics.run_finished(
+                community_name, "failed" if list_failed else "success", success_count, update_count
+            )
                 
+            outcome = CrawlOutcome(
+                new_posts=success_count, hot_promotions=hot_promotions, pages=pages, failed=list_failed,
+                last_page=last_page, oldest_post_at=oldest_post_at, reached_known=reached_known, list_ended=list_ended,
+            )
+            LAST_OUTCOMES[community_name] = outcome
+            if record:
+                _record_crawl(community_name, outcome, backfill=backfill)
             return success_count
     except Exception as e:
         logger.error(f"❌ [{community_name}] 파이프라인 크롤링 에러: {e}")
+        get_frontier(community_name).checkpoint()
+        pipeline_metrics.run_finished(community_name, "error", 0, 0)
+        outcome = CrawlOutcome(new_posts=0, pages=pages, failed=True)
+        LAST_OUTCOMES[community_name] = outcome
+        if record:
+            _record_crawl(community_name, outcome, backfill=backfill)
         return 0
 
+
+def _record_crawl(community_name: str, outcome: CrawlOutcome, backfill: bool = False):
+    """수집 결과를 플래너에 반영하고 SCHEDULER_STATE 의 계획 스냅샷 갱신
+    (백필 청크는 과거 페이지라 유입률 학습에서 제외하고 백필 진행 상태에만 반영)"""
+    if community_name not in crawl_planner.states:
+        return
+    if backfill:
+        crawl_planner.release(community_name)
+        backfill_planner.record(community_name, outcome)
+        SCHEDULER_STATE["backfill"] = backfill_planner.snapshot()
+        return
+    crawl_planner.record(community_name, outcome, datetime.now(timezone.utc))
+    SCHEDULER_STATE["crawl_plan"] = crawl_planner.snapshot()
+    SCHEDULER_STATE["request_budget"]["planned_pages_per_hour"] = round(crawl_planner.planned_pages_per_hour(), 1)
+
 async def validate_closed_deals():
-    """과거 핫딜(3일 이내) 품절 상태(Ping) 검증 데몬 (병합 서브 딜 및 삭제 뱃지 실시간 소거 및 자가치유 탑재)"""
-    from datetime import datetime, timedelta
-    from backend.database.models import Deal
-    from curl_cffi.requests import AsyncSession
-    from bs4 import BeautifulSoup
-    import asyncio
+    """과거 핫딜(3일 이내) 품절 상태(Ping) 검증 데몬 (병합 서브 딜 및 삭제 뱃지 실시간 소거 및 자가치유 탑재)
+    - 호스트별 속도 제한 하에 동시 핑, 삭제 시그니처 발견 즉시 수신 중단 (deal_validator)
+    - 신규·고득점 딜일수록 자주 재검증하도록 긴급도 순으로 선별
+    """
+    from backend.scheduler.deal_validator import deal_validator, run_validation
 
     db = SessionLocal()
     try:
         logger.info("🔍 [Background] 과거 핫딜(3일 이내) 품절 상태 검증 데몬 가동")
-        target_date = datetime.utcnow() - timedelta(days=3)
-        deals = db.query(Deal).filter(
-            Deal.is_closed == False, 
-            Deal.indexed_at >= target_date
-        ).order_by(Deal.indexed_at.desc()).limit(150).all()
-        
-        closed_count = 0
-        headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        }
-        
-        async with AsyncSession(impersonate='chrome120', timeout=10.0) as client:
-            for deal in deals:
-                try:
-                    # 1. 핑 테스트 헬퍼 함수
-                    async def check_url_deleted(url: str) -> bool:
-                        if not url or url == "#":
-                            return True
-                        if "fmkorea" in url:
-                            # fmkorea는 스크래퍼에서 차단을 완벽히 통제하므로 일단 무조건 안전으로 살려둠 (430 차단 방지)
-                            return False
-                        try:
-                            await asyncio.sleep(0.4)
-                            req_headers = headers.copy()
-                            if "ppomppu" in url:
-                                req_headers["Referer"] = "https://www.ppomppu.co.kr/"
-                            elif "quasarzone" in url:
-                                req_headers["Referer"] = "https://quasarzone.com/"
-                            elif "bbasak" in url:
-                                req_headers["Referer"] = "https://bbasak.com/"
-                            elif "ruliweb" in url:
-                                req_headers["Referer"] = "https://bbs.ruliweb.com/"
-                                
-                            resp = await client.get(url, headers=req_headers)
-                            if resp.status_code == 404:
-                                return True
-                            elif resp.status_code in [403, 430]:
-                                # 안티봇 차단 시 일단 삭제되지 않은 것으로 간주 (False)
-                                return False
-                                
-                            resp_text = resp.text
-                            
-                            # 퀘이사존 글 삭제 튕김 경고창 스크립트 시그니처 감지 (200 OK 상태 코드 우회 방어)
-                            if "quasarzone" in url:
-                                if "history.back();" in resp_text and "location.href = redirect;" in resp_text:
-                                    return True
-
-                            if "dispMemberLoginForm" in str(resp.url) or "dispMemberLoginForm" in resp_text:
-                                return True
-                            
-                            if any(kw in resp_text for kw in [
-                                "해당 문서가 존재하지 않습니다", 
-                                "해당 문서는 존재하지 않습니다",
-                                "삭제되었거나 존재하지 않는",
-                                "존재하지 않는 게시물",
-                                "삭제된 게시글",
-                                "삭제된 글"
-                            ]):
-                                return True
-                                
-                            soup = BeautifulSoup(resp.content, 'html.parser')
-                            title_tag = soup.title.string if soup.title else ""
-                            if any(kw in title_tag for kw in ["종료", "마감", "품절", "블라인드", "삭제"]):
-                                return True
-                                
-                            return False
-                        except Exception as e:
-                            logger.error(f"[Validator Ping Error] {url}: {e}")
-                            return False # 핑 전송 에러 시 일단 살아있는 것으로 임시 판정
-
-                    # 2. 대표 딜 링크 삭제 감증
-                    is_repr_deleted = await check_url_deleted(deal.post_link)
-
-                    # 3. 병합된 서브 커뮤니티 주소들 순회 검증 및 정제
-                    merged_changed = False
-                    valid_merged = []
-                    
-                    if deal.merged_communities:
-                        merged_items = [item.strip() for item in deal.merged_communities.split(",") if item.strip()]
-                        for item in merged_items:
-                            parts = item.split("::")
-                            if len(parts) < 2:
-                                valid_merged.append(item)
-                                continue
-                            
-                            cid = parts[0]
-                            sub_url = parts[1]
-                            
-                            is_sub_deleted = await check_url_deleted(sub_url)
-                            if is_sub_deleted:
-                                merged_changed = True
-                                logger.info(f"🗑️ [Validator] 삭제된 병합 딜 링크 감지되어 제거: ID {cid} -> {sub_url}")
-                            else:
-                                valid_merged.append(item)
-                                
-                    new_merged_str = ",".join(valid_merged) if valid_merged else None
-                    if new_merged_str != deal.merged_communities:
-                        deal.merged_communities = new_merged_str
-                        merged_changed = True
-
-                    # 4. 분기 및 자가치유 작동
-                    if is_repr_deleted:
-                        if valid_merged:
-                            # 🔄 자가치유 작동: 대표 딜은 삭제되었지만 살아있는 서브 딜이 존재함 -> 서브 딜로 대표 정보 승격
-                            chosen_item = valid_merged[0]
-                            parts = chosen_item.split("::")
-                            new_cid = int(parts[0])
-                            new_url = parts[1]
-                            
-                            # 기존 대표 딜을 백업
-                            old_cid = deal.source_community_id
-                            old_url = deal.post_link
-                            
-                            # 대표 정보 교체
-                            deal.source_community_id = new_cid
-                            deal.post_link = new_url
-                            
-                            # ⏰ 승격될 서브 딜의 실제 작성 시간(indexed_at)을 DB에서 조회하여 대표 딜의 시간으로 갱신
-                            sub_deal_in_db = db.query(Deal).filter(Deal.post_link == new_url).first()
-                            if sub_deal_in_db and sub_deal_in_db.indexed_at:
-                                deal.indexed_at = sub_deal_in_db.indexed_at
-                                logger.info(f"⏰ [Validator-Healing] 대표 딜의 indexed_at 시간을 서브 딜의 시간({sub_deal_in_db.indexed_at})으로 동기화 완료")
-                            
-                            # merged_communities 재정리
-                            valid_merged.remove(chosen_item)
-                            
-                            # 기존 대표 딜이 비록 삭제되었더라도 이력 차원에서 merged_communities로 밀어주거나 혹은 제외 (여기서는 완전 제외 처리)
-                            deal.merged_communities = ",".join(valid_merged) if valid_merged else None
-                            
-                            logger.info(f"🔄 [Validator-Healing] 대표 딜 삭제 감지 -> 서브 딜로 대표 교체 승격 완료! ({old_url} -> {new_url})")
-                            db.commit()
-                        else:
-                            # 대표 및 모든 서브 딜이 전원 삭제됨 -> 핫딜 최종 종료 처리
-                            deal.is_closed = True
-                            closed_count += 1
-                            db.commit()
-                            logger.info(f"🚫 [Validator-Closed] 대표 및 서브 딜 모두 삭제 감지 -> 핫딜 종료: {deal.title}")
-                    else:
-                        if merged_changed:
-                            db.commit()
-                            logger.info(f"💾 [Validator-Sync] 서브 딜 링크 일부 삭제로 merged_communities 갱신 완료: {deal.title}")
-                            
-                except Exception as deal_err:
-                    logger.error(f"[Validator Deal Error] Deal ID {deal.id}: {deal_err}")
-                    
-        logger.info(f"✅ 상태 검증 완료: 총 {len(deals)}개 핑(Ping) 테스트 수행 -> {closed_count}개 품절 처리")
+        checked, closed_count = await run_validation(db, deal_validator)
+        logger.info(f"✅ 상태 검증 완료: 총 {checked}개 핑(Ping) 테스트 수행 -> {closed_count}개 품절 처리")
     except Exception as e:
         logger.error(f"❌ 상태 검증 데몬 에러: {e}")
     finally:
         db.close()
 
 
-async def run_pipeline_job():
+def plan_pipeline_cycle():
     """
-    자가 치유 복구(Self-Healing Backfill)가 내장된 투트랙 오케스트레이션 엔진:
-    - 매 5분 사이클: 단기 수집 (1페이지 초고속 - 신규 글 즉시 반영)
-    - 매 2번째 사이클 (10분): 심층 수집 (1~3페이지 - 핫딜마크 갱신)
-    - [Self-Healing]: 서버 장애 또는 개발 부재로 인한 누락 시간(최대 5일) 자동 감지 시, 복구 완료될 때까지 동적 백필(최대 25페이지) 자동 구동!
+    이번 틱에 수집할 커뮤니티 결정 (반환된 커뮤니티는 플래너에서 in_flight 로 표시됨)
+    - 평시: 적응형 플래너(crawl_planner)가 커뮤니티별 글 유입률/핫딜 승격률로 정한 주기가 돌아온 커뮤니티만,
+      정해진 페이지 깊이로 수집 (피크 시간 뽐뿌는 자주·깊게, 새벽 클리앙은 드물게)
+    - 전체 요청량은 기존 5분 고정 사이클의 시간당 페이지 수 예산 안에서 배분
+    - [Self-Healing]: 서버 장애 또는 개발 부재로 인한 누락 시간(최대 5일) 감지 시 백필 플래너 가동
+      → 전 커뮤니티를 한 번에 25페이지씩 긁지 않고, 커뮤니티별 워터마크를 따라 매 틱 예산 안에서 몇 페이지씩 이어서 복구
+    반환: (planned, backfill, mode_str) — planned: 커뮤니티 → 페이지 수, backfill: 커뮤니티 → (시작 페이지, 페이지 수)
     """
-    logger.info("====================================")
-    
     db = SessionLocal()
-    pages_to_scrape = 1
-    is_backfill_mode = False
     gap_hours = 0.0
     
     try:
@@ -465,33 +537,66 @@ async def run_pipeline_job():
         from backend.database.models import Deal
         last_deal = db.query(Deal).order_by(Deal.indexed_at.desc()).first()
         if last_deal and last_deal.indexed_at:
-            from datetime import datetime, timedelta
-            now = datetime.utcnow()
             last_time = last_deal.indexed_at
-            if last_time.tzinfo is not None:
-                now = datetime.now(last_time.tzinfo)
-            
-            gap_seconds = (now - last_time).total_seconds()
-            gap_hours = gap_seconds / 3600.0
+            if last_time.tzinfo is None:
+                last_time = last_time.replace(tzinfo=timezone.utc)
+            gap_hours = (datetime.now(timezone.utc) - last_time).total_seconds() / 3600.0
             
-            # 수집 공백이 2시간을 초과한 경우 ➔ 자가 치유 복구 백필 모드 가동!
-            if gap_hours > 2.0:
-                is_backfill_mode = True
-                # 누락 시간에 비례하여 탐색할 과거 페이지 깊이를 동적 결정 (최대 25페이지, 약 5일 치 분량 복구)
-                pages_to_scrape = min(25, max(3, int(gap_hours * 1.5)))
+            # 수집 공백이 2시간을 초과한 경우 ➔ 자가 치유 복구 백필 시작 (이미 진행 중이면 이어감)
+            if gap_hours > BACKFILL_TRIGGER_HOURS:
+                backfill_planner.start(
+                    last_time.timestamp(), gap_hours,
+                    [state.profile for state in crawl_planner.states.values()],
+                )
     except Exception as e:
         logger.error(f"[Self-Healing] 수집 공백 분석 실패: {e}")
     finally:
         db.close()
         
-    if not is_backfill_mode:
-        # 평시 모드
-        is_deep_scan = (SCHEDULER_STATE["total_run_count"] % 2 == 0)
-        pages_to_scrape = 3 if is_deep_scan else 1
-        mode_str = "핫딜마크 추적대(1~3페이지)" if is_deep_scan else "신규글 감시조(1페이지)"
-    else:
-        mode_str = f"🔥 자가치유 백필 복구 가동 (공백 {gap_hours:.1f}시간 감지 -> {pages_to_scrape}페이지 자동 추적)"
+    now = datetime.now(timezone.utc)
+    planned = crawl_planner.due(now)
+    backfill = {}
+    if backfill_planner.active:
+        available = [name for name, state in crawl_planner.states.items() if not state.in_flight]
+        backfill = backfill_planner.next_chunks(
+            time.time(), available,
+            arrival_per_minute={name: crawl_planner.expected_arrival(state, now) for name, state in crawl_planner.states.items()},
+            rows_per_page={name: state.profile.rows_per_page for name, state in crawl_planner.states.items()},
+        )
+        for name in backfill:
+            crawl_planner.states[name].in_flight = True
+        SCHEDULER_STATE["backfill"] = backfill_planner.snapshot()
+
+    # 시작 슬롯은 커뮤니티별 예상 부하로 매 틱 재배정 (부하가 바뀌지 않으면 배정도 그대로)
+    stagger_plan.assign(crawl_planner.pages_per_hour())
+    SCHEDULER_STATE["stagger"] = stagger_plan.snapshot()
+
+    mode_str = "적응형 수집 (" + ", ".join(f"{name}:{pages}p" for name, pages in planned.items()) + ")"
+    if backfill:
+        mode_str += " + 🔥 자가치유 백필 (" + ", ".join(
+            f"{name}:{start}~{start + pages - 1}p" for name, (start, pages) in backfill.items()
+        ) + ")"
+    return planned, backfill, mode_str
+
+
+async def _staggered(delay: float, func, *args, **kwargs):
+    """슬롯 오프셋만큼 기다렸다 시작 (기다리는 사이 드레인이 시작되면 시작하지 않음 → in_flight 는 호출 측에서 해제)"""
+    if delay > 0:
+        await asyncio.sleep(delay)
+    if shutdown.draining():
+        return 0
+    return await func(*args, **kwargs)
+
+
+async def run_pipeline_job():
+    """자가 치유 복구(Self-Healing Backfill)가 내장된 적응형 오케스트레이션 엔진 (1분 틱, 단일 프로세스 모드)"""
+    if shutdown.draining():
+        return
+    planned, backfill, mode_str = plan_pipeline_cycle()
+    if not planned and not backfill:
+        return
         
+    logger.info("====================================")
     logger.info(f"🚀 [Background] 정기 핫딜 동시 수집 파이프라인 가동 - 모드: {mode_str}")
     logger.info("====================================")
     
@@ -499,16 +604,15 @@ async def run_pipeline_job():
     
     try:
         # 각 스크래퍼가 독립적인 DB Session을 사용하므로, asyncio.gather 시 데드락 방지 완벽 보장
+        # 시작 시각은 커뮤니티별 슬롯 오프셋 + 지터만큼 늦춰 DB/AI/푸시 부하를 틱 구간에 고르게 분산
+        delays = stagger_plan.delays([*planned, *backfill])
         tasks = [
-            scrape_community("ppomppu", PpomppuScraper, pages_to_scrape),
-            scrape_community("quasarzone", QuasarzoneScraper, pages_to_scrape),
-            scrape_community("fmkorea", FmkoreaScraper, pages_to_scrape),
-            scrape_community("ruliweb", RuliwebScraper, pages_to_scrape),
-            scrape_community("clien", ClienScraper, min(pages_to_scrape, 2)),
-            scrape_community("ali_ppomppu", AlippomppuScraper, pages_to_scrape),
-            scrape_community("bbasak_domestic", BbasakDomesticScraper, pages_to_scrape),
-            scrape_community("bbasak_overseas", BbasakOverseasScraper, pages_to_scrape),
-            scrape_community("bbasak_parenting", BbasakParentingScraper, pages_to_scrape)
+            _staggered(delays[name], scrape_community, name, COMMUNITY_SCRAPERS[name], pages)
+            for name, pages in planned.items()
+        ] + [
+            _staggered(delays[name], scrape_community, name, COMMUNITY_SCRAPERS[name], pages,
+                       start_page=start_page, backfill=True)
+            for name, (start_page, pages) in backfill.items()
         ]
         
         results = await asyncio.gather(*tasks)
@@ -524,13 +628,152 @@ async def run_pipeline_job():
     except Exception as e:
         SCHEDULER_STATE["last_status"] = f"Error: {e}"
         logger.error(f"❌ 전체 파이프라인 사이클 붕괴 에러: {e}")
+    finally:
+        # 결과를 기록하지 못하고 끝난 커뮤니티(예외 전파)는 다음 틱에 다시 잡히도록 해제
+        for name in [*planned, *backfill]:
+            if crawl_planner.states[name].in_flight:
+                crawl_planner.release(name)
+
+# ------------------------------------------------------------------ 워커 풀 모드
+# 워커 프로세스가 실행하는 잡 (이름 → "모듈:함수")
+JOB_HANDLERS = {
+    "scrape_community": "backend.scheduler.main:run_scrape_job",
+    "validate_closed_deals": "backend.scheduler.main:validate_closed_deals",
+    "update_fmkorea_trending_keywords": "backend.scrapers.fmkorea_trending_scraper:update_fmkorea_trending_keywords",
+    "run_naver_price_collection": "backend.scheduler.naver_price_scheduler:run_naver_price_collection",
+    "run_enrichment": "backend.scheduler.main:run_enrichment_job",
+    "run_push_dispatch": "backend.scheduler.push_queue:run_push_dispatch",
+}
+# 잡별 제한 시간(초). 수집 잡은 페이지 수에 비례 (백필 25페이지 대비)
+SCRAPE_JOB_BASE_TIMEOUT = 300
+SCRAPE_JOB_TIMEOUT_PER_PAGE = 60
+SCRAPE_JOB_MAX_TIMEOUT = 1800
+JOB_TIMEOUTS = {
+    "validate_closed_deals": 15 * 60,
+    "update_fmkorea_trending_keywords": 10 * 60,
+    "run_naver_price_collection": 2 * 3600,
+    "run_enrichment": 5 * 60,
+    "run_push_dispatch": 2 * 60,
+}
+
+worker_pool = None
+
+
+async def run_scrape_job(community: str, pages: int, start_page: int = 1, backfill: bool = False) -> dict:
+    """워커 프로세스용 수집 잡: 수집 후 결과(CrawlOutcome)를 디스패처의 플래너로 돌려줌"""
+    collected = await scrape_community(community, COMMUNITY_SCRAPERS[community], pages,
+                                       start_page=start_page, backfill=backfill, record=False)
+    outcome = LAST_OUTCOMES.get(community)
+    return {"community": community, "collected": collected, "outcome": asdict(outcome) if outcome else None}
+
+
+async def dispatch_pipeline_job():
+    """디스패처 1분 틱: 주기가 돌아온 커뮤니티별 수집 잡 등록 (같은 커뮤니티는 대기/실행 중이면 등록 안 됨)
+
+    - 코루틴이라 APScheduler 가 이벤트 루프에서 실행 → 플래너 상태와 JobQueue sqlite 연결을 루프 스레드 하나에서만 사용
+    """
+    if shutdown.draining():
+        return
+    planned, backfill, mode_str = plan_pipeline_cycle()
+    if not planned and not backfill:
+        return
+    logger.info(f"🚀 [Dispatcher] 수집 잡 등록 - 모드: {mode_str}")
+    SCHEDULER_STATE["last_status"] = f"Dispatched ({mode_str})"
+    jobs = [(name, pages, {}) for name, pages in planned.items()] + [
+        (name, pages, {"start_page": start_page, "backfill": True}) for name, (start_page, pages) in backfill.items()
+    ]
+    # 잡 등록 자체를 슬롯 오프셋만큼 늦춤 (워커가 한꺼번에 claim 하지 않도록)
+    # 틱 코루틴은 바로 끝내고, 늦춰진 등록은 루프 위 태스크가 슬롯 시각까지 기다렸다 실행
+    delays = stagger_plan.delays([name for name, _, _ in jobs])
+    for name, pages, extra in jobs:
+        if delays[name] > 0:
+            task = asyncio.create_task(_enqueue_scrape_job(name, pages, extra, delay=delays[name]))
+            _pending_enqueues.add(task)
+            task.add_done_callback(_pending_enqueues.discard)
+        else:
+            await _enqueue_scrape_job(name, pages, extra)
+
+
+# 슬롯 시각을 기다리는 등록 태스크 (루프는 태스크를 약하게만 참조하므로 끝날 때까지 보관)
+_pending_enqueues = set()
+
+
+async def _enqueue_scrape_job(name: str, pages: int, extra: dict, delay: float = 0.0):
+    if delay > 0:
+        await asyncio.sleep(delay)
+    if shutdown.draining():
+        crawl_planner.release(name)
+        return
+    timeout = min(SCRAPE_JOB_MAX_TIMEOUT, SCRAPE_JOB_BASE_TIMEOUT + SCRAPE_JOB_TIMEOUT_PER_PAGE * pages)
+    try:
+        job_id = worker_pool.enqueue("scrape_community", timeout, dedupe_key=f"scrape:{name}",
+                                     community=name, pages=pages, **extra)
+    except Exception as e:
+        logger.error(f"❌ [Dispatcher] {name} 수집 잡 등록 실패: {e}")
+        job_id = None
+    if job_id is None:
+        # 등록되지 않은 커뮤니티는 다음 틱에 다시 잡히도록 해제
+        crawl_planner.release(name)
+
+
+async def dispatch_job(name: str):
+    """수집 외 잡 등록 (잡 이름이 곧 중복 방지 키)"""
+    if shutdown.draining():
+        return
+    worker_pool.enqueue(name, JOB_TIMEOUTS[name], dedupe_key=name)
+
+
+def on_job_finished(job):
+    """워커가 끝낸 잡 결과를 디스패처 상태(플래너, SCHEDULER_STATE)에 반영"""
+    if job.name != "scrape_community":
+        if job.status != "done":
+            logger.error(f"❌ [Dispatcher] {job.name}#{job.id} {job.status}: {job.error}")
+        return
+    name = job.args["community"]
+    backfill = job.args.get("backfill", False)
+    outcome = (job.result or {}).get("outcome")
+    if job.status == "done" and outcome:
+        _record_crawl(name, CrawlOutcome(**outcome), backfill=backfill)
+        SCHEDULER_STATE["last_run_time"] = datetime.now()
+        SCHEDULER_STATE["last_status"] = f"Success ({name}: {job.result.get('collected', 0)} deals process)"
+        SCHEDULER_STATE["total_run_count"] += 1
+    else:
+        logger.error(f"❌ [Dispatcher] {name} 수집 잡 {job.status}: {job.error}")
+        _record_crawl(name, CrawlOutcome(new_posts=0, pages=job.args.get("pages", 1), failed=True), backfill=backfill)
+    if worker_pool is not None:
+        SCHEDULER_STATE["worker_pool"] = worker_pool.stats()
+
+
+def start_dispatcher(workers: int):
+    """경량 디스패처: APScheduler 는 잡 등록만, 실행은 워커 프로세스 풀이 담당"""
+    global worker_pool
+    from backend.scheduler.worker_pool import WorkerPool
+
+    worker_pool = WorkerPool(JOB_HANDLERS, workers=workers, on_result=on_job_finished)
+    worker_pool.start()
+    scheduler = AsyncIOScheduler()
+    scheduler.add_job(dispatch_pipeline_job, 'interval', minutes=1, id='hotdeal_pipeline', next_run_time=datetime.now())
+    scheduler.add_job(dispatch_job, 'interval', minutes=10, id='hotdeal_validator', args=["validate_closed_deals"])
+    scheduler.add_job(dispatch_job, 'interval', seconds=30, id='enrichment', args=["run_enrichment"])
+    scheduler.add_job(dispatch_job, 'interval', seconds=10, id='push_dispatch', args=["run_push_dispatch"])
+    scheduler.add_job(dispatch_job, 'cron', minute=0, id='fmkorea_trending', args=["update_fmkorea_trending_keywords"])
+    scheduler.add_job(dispatch_job, 'cron', hour=4, minute=0, id='naver_price_collection', args=["run_naver_price_collection"])
+    scheduler.start()
+    logger.info(f"⏰ [System] 디스패처 시동 완료 (워커 프로세스 {workers}개)")
+    return scheduler
+
 
 def start_scheduler():
     scheduler = AsyncIOScheduler()
-    # 핫딜 수집 데몬 (5분 주기)
-    scheduler.add_job(run_pipeline_job, 'interval', minutes=5, id='hotdeal_pipeline')
-    # 과거 딜 품절 검증 데몬 (20분 주기)
-    scheduler.add_job(validate_closed_deals, 'interval', minutes=20, id='hotdeal_validator')
+    # 핫딜 수집 데몬 (1분 틱, 커뮤니티별 실제 수집 주기는 crawl_planner 가 결정)
+    # 오래 걸리는 커뮤니티가 다른 커뮤니티의 차례를 막지 않도록 틱 중첩 허용 (중복 수집은 플래너가 차단)
+    scheduler.add_job(run_pipeline_job, 'interval', minutes=1, id='hotdeal_pipeline', max_instances=3, coalesce=True)
+    # 과거 딜 품절 검증 데몬 (10분 틱, 딜별 재검증 주기는 deal_validator 가 작성 경과 시간/점수로 결정)
+    scheduler.add_job(validate_closed_deals, 'interval', minutes=10, id='hotdeal_validator', max_instances=1, coalesce=True)
+    # ⚡ 빠른 등록 글 보강 (상세 페이지/정규화/AI, 30초 틱)
+    scheduler.add_job(run_enrichment_job, 'interval', seconds=30, id='enrichment', max_instances=1, coalesce=True)
+    # 🔔 신규 딜 푸시 발송 큐 디스패처 (10초 틱)
+    scheduler.add_job(run_push_dispatch, 'interval', seconds=10, id='push_dispatch', max_instances=1, coalesce=True)
     # 펨코 실시간 급상승 검색어 수집 (1시간 주기, 정각 실행)
     scheduler.add_job(update_fmkorea_trending_keywords, 'cron', minute=0, id='fmkorea_trending')
     # 📈 네이버 쇼핑 시장 최저가 추적 배치 (매일 새벽 4시 실행)
@@ -541,22 +784,49 @@ def start_scheduler():
 
 if __name__ == "__main__":
     # 이 파일을 직접 실행 시 엔진 즉시 가동용입니다.
+    # - 기본: 디스패처 + 워커 프로세스 풀 (SCHEDULER_WORKERS 또는 --workers=N, 기본 CPU 코어 수)
+    # - --in-process: 기존 단일 이벤트 루프 스케줄러 / --one-shot: 1 사이클 수집 후 종료
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     
-    scheduler = start_scheduler()
-    
     import asyncio
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     
-    # 1. 켜자마자 바로 1회 돌려보기
-    loop.run_until_complete(run_pipeline_job())
-    
     if "--one-shot" in sys.argv:
+        loop.run_until_complete(run_pipeline_job())
+        loop.run_until_complete(run_push_dispatch())
         logger.info("👋 [One-Shot Mode] 1 사이클 수집 완료. 백그라운드 프로세스를 종료합니다.")
         sys.exit(0)
     
+    # SIGTERM(배포/재시작) → 드레인: 새 잡/목록 페이지는 시작하지 않고 진행 중 작업만 마무리 후 종료
+    shutdown.install_signal_handlers(loop, on_drain=loop.stop)
+
+    if "--in-process" in sys.argv:
+        scheduler = start_scheduler()
+        # 1. 켜자마자 바로 1회 돌려보기 (루프 안에서 실행 → 도중 SIGTERM 도 드레인으로 처리)
+        loop.create_task(run_pipeline_job())
+    else:
+        from backend.scheduler.worker_pool import DEFAULT_WORKERS
+        workers = int(os.getenv("SCHEDULER_WORKERS", DEFAULT_WORKERS))
+        for arg in sys.argv:
+            if arg.startswith("--workers="):
+                workers = int(arg.split("=", 1)[1])
+        scheduler = start_dispatcher(workers)
+        supervisor = loop.create_task(worker_pool.supervise_forever())
+    
     try:
-        loop.run_forever()
+        if not shutdown.draining():
+            loop.run_forever()
     except (KeyboardInterrupt, SystemExit):
-        pass
+        shutdown.request_drain("KeyboardInterrupt")
+    finally:
+        scheduler.shutdown(wait=False)
+        if worker_pool is not None:
+            # 워커 프로세스에 SIGTERM → 각 워커가 진행 중 잡을 마무리 (결과는 다음 디스패처가 수거)
+            worker_pool.shutdown(timeout=shutdown.DRAIN_TIMEOUT + 5)
+            supervisor.cancel()
+        else:
+            # 단일 프로세스 모드: 진행 중 수집 태스크 마무리 (미처리 아이템은 ingest_queue 에 남음)
+            loop.run_until_complete(shutdown.wait_tasks())
+        shutdown.run_drain_hooks()
+        logger.info("👋 [System] 스케줄러 종료 완료")
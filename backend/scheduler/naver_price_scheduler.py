@@ -4,7 +4,6 @@ import os
 import sys
 from datetime import datetime, timedelta
 import random
-import httpx
 from sqlalchemy import func
 from typing import Optional
 
@@ -14,6 +13,7 @@ sys.path.append(root_dir)
 
 from backend.database.session import SessionLocal
 from backend.database.models import Deal, NaverPriceHistory
+from backend.core.http_transport import http_transport
 
 logging.basicConfig(
     level=logging.INFO,
@@ -74,36 +74,35 @@ async def fetch_naver_lowest_price(brand: str, model_code: str) -> Optional[int]
     }
 
     try:
-        async with httpx.AsyncClient(timeout=8.0) as client:
-            response = await client.get(url, headers=headers, params=params)
+        response = await http_transport.get(url, headers=headers, params=params, timeout=8.0, retries=1, tag="naver-api")
+        
+        if response.status_code == 200:
+            data = response.json()
+            items = data.get("items", [])
             
-            if response.status_code == 200:
-                data = response.json()
-                items = data.get("items", [])
-                
-                if not items:
-                    logger.info(f"🔍 [Naver API] '{query}' 검색 결과 없음")
-                    return None
-                
-                # 검색 결과 중 실제 가격이 있고 유사 모델명이 대조되는 항목 중 최저가 판별
-                valid_prices = []
-                for item in items:
-                    lprice_str = item.get("lprice")
-                    if lprice_str and lprice_str.isdigit():
-                        price = int(lprice_str)
-                        if price > 0:
-                            valid_prices.append(price)
-                
-                if valid_prices:
-                    lowest = min(valid_prices)
-                    logger.info(f"✨ [Naver API] '{query}' 최저가 조회 완료: {lowest:,}원")
-                    return lowest
-                
-                return None
-            else:
-                logger.error(f"❌ [Naver API] 에러 발생 (Status Code: {response.status_code}): {response.text}")
+            if not items:
+                logger.info(f"🔍 [Naver API] '{query}' 검색 결과 없음")
                 return None
-                
+            
+            # 검색 결과 중 실제 가격이 있고 유사 모델명이 대조되는 항목 중 최저가 판별
+            valid_prices = []
+            for item in items:
+                lprice_str = item.get("lprice")
+                if lprice_str and lprice_str.isdigit():
+                    price = int(lprice_str)
+                    if price > 0:
+                        valid_prices.append(price)
+            
+            if valid_prices:
+                lowest = min(valid_prices)
+                logger.info(f"✨ [Naver API] '{query}' 최저가 조회 완료: {lowest:,}원")
+                return lowest
+            
+            return None
+        else:
+            logger.error(f"❌ [Naver API] 에러 발생 (Status Code: {response.status_code}): {response.text}")
+            return None
+            
     except Exception as e:
         logger.error(f"❌ [Naver API] 호출 실패: {e}")
         return None
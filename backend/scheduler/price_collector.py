@@ -308,7 +308,7 @@ class PriceCollectionScheduler:
         
         from datetime import datetime, timedelta
         from database.models import Deal
-        import httpx
+        from core.http_transport import http_transport
         from bs4 import BeautifulSoup
         
         try:
@@ -326,52 +326,53 @@ class PriceCollectionScheduler:
                 closed_count = 0
                 headers = {"User-Agent": "Mozilla/5.0"}
                 
-                async with httpx.AsyncClient(headers=headers, timeout=5.0) as client:
-                    for deal in deals:
-                        try:
-                            req_headers = headers.copy()
-                            if "ppomppu" in deal.post_link:
-                                req_headers["Referer"] = "https://www.ppomppu.co.kr/"
-                            elif "bbasak" in deal.post_link:
-                                req_headers["Referer"] = "https://bbasak.com/"
-                                
-                            resp = await client.get(deal.post_link, headers=req_headers)
-                            if resp.status_code == 404:
-                                deal.is_closed = True
-                                closed_count += 1
-                                continue
-                                
-                            resp_text = resp.text
-                            if "dispMemberLoginForm" in str(resp.url) or "dispMemberLoginForm" in resp_text:
-                                deal.is_closed = True
-                                closed_count += 1
-                                continue
+                for deal in deals:
+                    try:
+                        req_headers = headers.copy()
+                        if "ppomppu" in deal.post_link:
+                            req_headers["Referer"] = "https://www.ppomppu.co.kr/"
+                        elif "bbasak" in deal.post_link:
+                            req_headers["Referer"] = "https://bbasak.com/"
+                            
+                        # 기존 httpx 동작과 동일하게 리다이렉트는 따라가지 않음
+                        resp = await http_transport.get(deal.post_link, headers=req_headers, timeout=5.0,
+                                                        allow_redirects=False, tag="price-collector")
+                        if resp.status_code == 404:
+                            deal.is_closed = True
+                            closed_count += 1
+                            continue
+                            
+                        resp_text = resp.text
+                        if "dispMemberLoginForm" in str(resp.url) or "dispMemberLoginForm" in resp_text:
+                            deal.is_closed = True
+                            closed_count += 1
+                            continue
 
-                            if any(kw in resp_text for kw in [
-                                "해당 문서가 존재하지 않습니다", 
-                                "해당 문서는 존재하지 않습니다",
-                                "삭제되었거나 존재하지 않는",
-                                "존재하지 않는 게시물",
-                                "삭제된 게시글",
-                                "삭제된 글",
-                                "선택하신 게시물이 존재하지 않습니다",
-                                "선택하신 게시물이 존재하지 않습니다(1)"
-                            ]):
-                                deal.is_closed = True
-                                closed_count += 1
-                                continue
-                                
-                            soup = BeautifulSoup(resp.content, 'html.parser')
-                            title_tag = soup.title.string if soup.title else ""
+                        if any(kw in resp_text for kw in [
+                            "해당 문서가 존재하지 않습니다", 
+                            "해당 문서는 존재하지 않습니다",
+                            "삭제되었거나 존재하지 않는",
+                            "존재하지 않는 게시물",
+                            "삭제된 게시글",
+                            "삭제된 글",
+                            "선택하신 게시물이 존재하지 않습니다",
+                            "선택하신 게시물이 존재하지 않습니다(1)"
+                        ]):
+                            deal.is_closed = True
+                            closed_count += 1
+                            continue
                             
-                            if any(kw in title_tag for kw in ["종료", "마감", "품절", "블라인드", "삭제"]):
-                                deal.is_closed = True
-                                closed_count += 1
-                                continue
-                                
-                        except Exception as e:
-                            logger.error(f"❌ Error checking deal {deal.id}: {e}")
+                        soup = BeautifulSoup(resp.content, 'html.parser')
+                        title_tag = soup.title.string if soup.title else ""
+                        
+                        if any(kw in title_tag for kw in ["종료", "마감", "품절", "블라인드", "삭제"]):
+                            deal.is_closed = True
+                            closed_count += 1
+                            continue
                             
+                    except Exception as e:
+                        logger.error(f"❌ Error checking deal {deal.id}: {e}")
+                        
                     if closed_count > 0:
                         session.commit()
                         
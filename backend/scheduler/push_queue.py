@@ -0,0 +1,200 @@
+"""
+🔔 신규 딜 푸시 알림 발송 큐 (SQLite, 프로세스 간 공유)
+
+- 기존: process_scraped_deal 이 클래스 전역 ThreadPoolExecutor 에 발송 작업을 던지고 결과를 추적하지 않음
+  → 신규 딜이 몰리면 작업마다 SessionLocal 을 열어 DB 연결이 고갈되고, 실패/종료 시 푸시가 조용히 사라짐
+- 집계기는 여기에 등록만 하고(enqueue), 발송은 디스패처(run_push_dispatch, 스케줄러 잡)가 전담
+  · 배치 단위로 꺼내 배치당 DB 세션 1개로 처리 → 동시 DB 연결 수가 신규 딜 수와 무관
+  · 실패 시 지수 백오프 재시도, 재시작/배포에도 대기 중 푸시는 유지
+  · 대기 건수가 BACKLOG_WARN 를 넘으면 경고 (발송 적체 감지)
+- 같은 딜의 푸시는 대기/발송 중 하나만 존재 (부분 유니크 인덱스)
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from backend.core.metrics import pipeline_metrics
+from backend.core.sqlite_store import DONE, FAILED, QUEUED, RUNNING, RetryingJobTable
+from backend.scheduler import shutdown
+
+logger = logging.getLogger(__name__)
+
+PUSH_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "push_queue.db")
+
+MAX_ATTEMPTS = 3
+RETRY_BASE_SECONDS = 30
+# 실행 중 표시 후 이 시간이 지나도 끝나지 않은 작업(디스패처 사망)은 다시 대기열로
+STALE_SECONDS = 5 * 60
+HISTORY_SECONDS = 24 * 3600
+# 한 번에 꺼내는 건수 (배치당 DB 세션 1개)와 한 번의 디스패치 실행 시간 예산
+PUSH_BATCH_SIZE = 20
+PUSH_TIME_BUDGET = 50.0
+# 이 이상 쌓이면 발송이 수집을 따라가지 못하는 것으로 보고 경고
+BACKLOG_WARN = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS push_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    deal_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    price INTEGER NOT NULL,
+    site_name TEXT NOT NULL,
+    deal_url TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    enqueued_at REAL NOT NULL,
+    claimed_at REAL,
+    finished_at REAL,
+    error TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS push_jobs_active_deal ON push_jobs(deal_id) WHERE status IN ('queued', 'running');
+CREATE INDEX IF NOT EXISTS push_jobs_pending ON push_jobs(status, available_at, id);
+"""
+
+
+@dataclass
+class PushJob:
+    id: int
+    deal_id: int
+    title: str
+    price: int
+    site_name: str
+    deal_url: str
+    attempts: int
+    enqueued_at: float
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "PushJob":
+        return cls(
+            id=row["id"], deal_id=row["deal_id"], title=row["title"], price=row["price"], site_name=row["site_name"],
+            deal_url=row["deal_url"], attempts=row["attempts"], enqueued_at=row["enqueued_at"],
+        )
+
+
+class PushQueue(RetryingJobTable):
+    """신규 딜 푸시 발송 작업"""
+
+    schema = _SCHEMA
+    table = "push_jobs"
+    max_attempts = MAX_ATTEMPTS
+    retry_base_seconds = RETRY_BASE_SECONDS
+    stale_seconds = STALE_SECONDS
+    history_seconds = HISTORY_SECONDS
+
+    def __init__(self, path: str = PUSH_DB_PATH):
+        super().__init__(path)
+
+    def enqueue(self, deal_id: int, title: str, price, site_name: Optional[str], deal_url: str,
+                now: Optional[float] = None) -> Optional[int]:
+        """발송 등록. 같은 딜이 이미 대기/발송 중이면 None"""
+        now = time.time() if now is None else now
+        try:
+            cursor = self.conn.execute(
+                "INSERT INTO push_jobs (deal_id, title, price, site_name, deal_url, status, available_at, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (deal_id, title, int(price) if str(price).isdigit() else 0, site_name or "HotDeal", deal_url,
+                 QUEUED, now, now),
+            )
+        except sqlite3.IntegrityError:
+            return None
+        pipeline_metrics.inc("push_jobs_total", label="queued")
+        return cursor.lastrowid
+
+    def claim(self, limit: int = PUSH_BATCH_SIZE, now: Optional[float] = None) -> List[PushJob]:
+        """발송 가능한 대기 작업을 등록 순으로 최대 limit 개 running 전환하여 반환"""
+        rows = self._claim_rows(limit, now)
+        return sorted((PushJob.from_row(row) for row in rows), key=lambda job: job.id)
+
+    def depth(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM push_jobs WHERE status IN (?, ?)", (QUEUED, RUNNING)
+        ).fetchone()[0]
+
+    def counts(self) -> Dict[str, int]:
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM push_jobs GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+
+_default_queue: Optional[PushQueue] = None
+
+
+def push_queue() -> PushQueue:
+    """프로세스별 기본 큐 (집계기에서 등록용)"""
+    global _default_queue
+    if _default_queue is None:
+        _default_queue = PushQueue()
+    return _default_queue
+
+
+def _deliver_batch(jobs: List[PushJob]) -> List[Optional[str]]:
+    """배치 하나를 DB 세션 1개로 발송 (스레드에서 실행). 작업별 에러 메시지(성공은 None) 반환"""
+    from backend.database.session import SessionLocal
+    from backend.services.notification_service import NotificationService
+
+    errors: List[Optional[str]] = []
+    db = SessionLocal()
+    try:
+        for job in jobs:
+            try:
+                NotificationService.process_new_deal(
+                    deal_id=job.deal_id, title=job.title, price=job.price,
+                    site_name=job.site_name, deal_url=job.deal_url, db=db,
+                )
+                errors.append(None)
+            except Exception as e:
+                db.rollback()
+                errors.append(f"{type(e).__name__}: {e}")
+    finally:
+        db.close()
+    return errors
+
+
+async def run_push_dispatch(queue: Optional[PushQueue] = None, time_budget: float = PUSH_TIME_BUDGET,
+                            deliver: Callable[[List[PushJob]], List[Optional[str]]] = _deliver_batch) -> Dict[str, int]:
+    """대기 푸시를 시간 예산 안에서 배치 단위로 발송 (배치는 순차 처리 → 동시 DB 세션 1개)"""
+    own_queue = queue is None
+    queue = queue or PushQueue()
+    started = time.monotonic()
+    stats = {"sent": 0, "retry": 0, "failed": 0}
+    try:
+        queue.requeue_stale()
+        depth = queue.depth()
+        pipeline_metrics.observe("push_queue_depth", depth)
+        if depth >= BACKLOG_WARN:
+            logger.warning(f"⚠️ [Push] 발송 대기 {depth}건 적체 (수집 속도를 발송이 따라가지 못함)")
+        # 드레인(SIGTERM) 중이면 새 배치를 잡지 않음 (대기 푸시는 큐에 남아 다음 실행에서 발송)
+        while time.monotonic() - started < time_budget and not shutdown.draining():
+            jobs = queue.claim(PUSH_BATCH_SIZE)
+            if not jobs:
+                break
+            now = time.time()
+            for job in jobs:
+                pipeline_metrics.observe("push_queue_wait_seconds", max(0.0, now - job.enqueued_at))
+            with pipeline_metrics.timer("push_dispatch_seconds"):
+                errors = await asyncio.to_thread(deliver, jobs)
+            for job, error in zip(jobs, errors):
+                if error is None:
+                    queue.complete(job.id)
+                    stats["sent"] += 1
+                elif queue.retry(job.id, error):
+                    stats["retry"] += 1
+                else:
+                    stats["failed"] += 1
+                    logger.error(f"❌ [Push] deal#{job.deal_id} 푸시 발송 포기 ({MAX_ATTEMPTS}회 실패): {error}")
+        for label, n in stats.items():
+            if n:
+                pipeline_metrics.inc("push_jobs_total", n, label=label)
+        queue.prune()
+    finally:
+        if own_queue:
+            queue.close()
+    if any(stats.values()):
+        logger.info(f"🔔 [Push] 발송 {stats['sent']}건, 재시도 예약 {stats['retry']}건, 포기 {stats['failed']}건")
+    pipeline_metrics.flush()
+    return stats
@@ -0,0 +1,120 @@
+"""
+👍 기존 딜 반응 지표(조회/추천/댓글 수, 꿀딜 점수) 쓰기 지연 버퍼
+
+- 매 사이클 재수집되는 글 대부분은 제목/가격/종료/핫딜 상태는 그대로이고 조회·추천·댓글 수만 바뀜
+  → 아이템마다 process_scraped_deal 전체 경로(정규화, 중복 판별, 병합) + commit 을 탈 필요가 없음
+- 수집 워커는 프런티어가 "반응 지표만 바뀜"으로 판단한 글을 여기에 모으고 (딜별 최대값으로 합침)
+  FLUSH_SECONDS 마다 / MAX_PENDING 건이 쌓이면 / 수집 종료 시 한 번에 반영 (SELECT 1회 + commit 1회)
+  (워커는 아이템을 기다리는 동안에도 FLUSH_SECONDS 마다 due() 를 확인)
+- 반영 규칙은 병합 정책의 반응 규칙(REACTION_RULES) 그대로: 카운터는 최대값 유지, 꿀딜 점수 재계산
+- 핫딜 승격/해제, 종료, 제목/가격 변경은 프런티어 핵심 해시가 달라지므로 버퍼를 거치지 않고 즉시 전체 경로로 기록
+- 프로세스 메모리에만 존재: flush 가 실패하거나 그 전에 프로세스가 죽으면 그 구간의 카운터는 버려짐
+  → 프런티어 갱신(해시/마지막 반영 시각)은 flush 성공 후 on_flushed 에서만 하므로, 다음 재수집 때 바뀐 행으로 보고 다시 반영
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import or_
+
+from backend.core.metrics import pipeline_metrics
+from backend.database.models import Deal
+from backend.services.merge_policy import REACTION_RULES, IncomingDeal, merge_deal
+
+logger = logging.getLogger(__name__)
+
+FLUSH_SECONDS = float(os.getenv("REACTION_FLUSH_SECONDS", "5"))
+# 이만큼 쌓이면 시간과 무관하게 flush (IN 쿼리 크기 상한)
+MAX_PENDING = 200
+
+
+@dataclass
+class PendingReaction:
+    view_count: int = 0
+    like_count: int = 0
+    comment_count: int = 0
+    is_super_hotdeal: bool = False
+    url: str = ""
+
+
+def _count(item: dict, key: str) -> int:
+    try:
+        return int(item.get(key) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class ReactionBuffer:
+    """수집 워커 1개가 소유 (scrape_community 1회 실행 동안, 한 이벤트 루프 안에서 순차 접근)"""
+
+    def __init__(self, flush_seconds: float = FLUSH_SECONDS, max_pending: int = MAX_PENDING, now: Optional[float] = None,
+                 on_flushed: Optional[Callable[[List[dict]], None]] = None):
+        """on_flushed: 반영에 성공한 리스트 행들(add 순서)로 호출 (수집 워커는 여기서 프런티어 갱신 기록)"""
+        self.flush_seconds = flush_seconds
+        self.max_pending = max_pending
+        self.on_flushed = on_flushed
+        self.pending: Dict[int, PendingReaction] = {}
+        self.items: List[dict] = []
+        self.last_flush = time.time() if now is None else now
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def add(self, deal_id: int, item: dict):
+        """리스트 행의 반응 지표 버퍼링 (같은 딜이 여러 번 보이면 최대값)"""
+        pending = self.pending.get(deal_id)
+        if pending is None:
+            pending = self.pending[deal_id] = PendingReaction()
+        pending.view_count = max(pending.view_count, _count(item, "view_count"))
+        pending.like_count = max(pending.like_count, _count(item, "like_count"))
+        pending.comment_count = max(pending.comment_count, _count(item, "comment_count"))
+        pending.is_super_hotdeal = bool(item.get("is_super_hotdeal"))
+        pending.url = item.get("url") or pending.url
+        self.items.append(item)
+
+    def due(self, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return bool(self.pending) and (len(self.pending) >= self.max_pending or now - self.last_flush >= self.flush_seconds)
+
+    def flush(self, db, now: Optional[float] = None) -> int:
+        """버퍼 전체를 DB 에 반영 (실패 시 롤백 후 버리고 on_flushed 도 호출하지 않음). 실제로 바뀐 딜 수 반환"""
+        pending, self.pending = self.pending, {}
+        items, self.items = self.items, []
+        self.last_flush = time.time() if now is None else now
+        if not pending:
+            return 0
+        changed = 0
+        try:
+            # AI 분할 딜은 같은 글(post_link)의 딜이 여러 개 → 전체 경로처럼 모두 갱신
+            by_url = {reaction.url: reaction for reaction in pending.values() if reaction.url}
+            deals = db.query(Deal).filter(or_(Deal.id.in_(list(pending)), Deal.post_link.in_(list(by_url)))).all()
+            with db.no_autoflush:
+                for deal in deals:
+                    reaction = pending.get(deal.id) or by_url[deal.post_link]
+                    incoming = IncomingDeal(
+                        community_id=deal.source_community_id,
+                        url=deal.post_link,
+                        title=deal.title,
+                        price=0,
+                        view_count=reaction.view_count,
+                        like_count=reaction.like_count,
+                        comment_count=reaction.comment_count,
+                        is_super_hotdeal=reaction.is_super_hotdeal,
+                    )
+                    if merge_deal(deal, incoming, REACTION_RULES).changed:
+                        changed += 1
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            pipeline_metrics.inc("crawl_reaction_flush_total", label="error")
+            logger.warning(f"⚠️ [Reaction Buffer] 반응 지표 {len(pending)}건 반영 실패 (다음 재수집 때 다시 반영): {e}")
+            return 0
+        if self.on_flushed is not None:
+            self.on_flushed(items)
+        pipeline_metrics.inc("crawl_reaction_flush_total", label="ok")
+        pipeline_metrics.inc("crawl_reaction_rows_total", changed)
+        logger.debug(f"[Reaction Buffer] {len(pending)}건 중 {changed}건 반응 지표 반영")
+        return changed
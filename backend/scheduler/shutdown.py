@@ -0,0 +1,83 @@
+"""
+🛑 그레이스풀 셧다운 (SIGTERM 시 드레인)
+
+- SIGTERM/SIGINT 를 받으면 드레인 상태로 전환: 새 목록 페이지/새 잡은 시작하지 않고, 처리 중인 아이템만 마무리
+- 처리하지 못한 아이템은 ingest_queue 에 남아 다음 실행에서 이어서 처리 (유실/중복 없음)
+- 수집 루프, 워커 프로세스 루프는 draining() 을 확인하여 스스로 정리
+"""
+
+import asyncio
+import logging
+import signal
+import threading
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 드레인 시작 후 진행 중 작업을 기다리는 최대 시간 (배포 시 컨테이너 stop_grace_period 보다 짧게)
+DRAIN_TIMEOUT = 45.0
+
+_draining = threading.Event()
+# 종료 직전 실행할 정리 함수 (예: 푸시 스레드풀 비우기). 프로세스마다 등록
+_drain_hooks: List[Callable[[float], None]] = []
+
+
+def draining() -> bool:
+    return _draining.is_set()
+
+
+def request_drain(reason: str = "SIGTERM"):
+    if not _draining.is_set():
+        logger.warning(f"🛑 [Shutdown] {reason} 수신 → 드레인 시작 (진행 중 작업만 마무리, 최대 {DRAIN_TIMEOUT:.0f}s)")
+    _draining.set()
+
+
+def reset():
+    """테스트용: 드레인 상태 해제"""
+    _draining.clear()
+
+
+def register_drain_hook(hook: Callable[[float], None]):
+    """hook(timeout) 을 종료 직전 run_drain_hooks() 에서 호출 (중복 등록 무시)"""
+    if hook not in _drain_hooks:
+        _drain_hooks.append(hook)
+
+
+def run_drain_hooks(timeout: float = DRAIN_TIMEOUT):
+    for hook in list(_drain_hooks):
+        try:
+            hook(timeout)
+        except Exception as e:
+            logger.error(f"[Shutdown] 정리 작업 실패 {getattr(hook, '__qualname__', hook)}: {e}")
+
+
+def install_signal_handlers(loop: Optional[asyncio.AbstractEventLoop] = None,
+                            on_drain: Optional[Callable[[], None]] = None):
+    """
+    SIGTERM/SIGINT → 드레인 전환 (+ on_drain 콜백, 예: loop.stop)
+    loop 를 주면 이벤트 루프 안에서 처리, 아니면 signal.signal 로 설치
+    """
+    def handle(signame: str):
+        request_drain(signame)
+        if on_drain is not None:
+            on_drain()
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        if loop is not None:
+            loop.add_signal_handler(sig, handle, sig.name)
+        else:
+            signal.signal(sig, lambda signum, frame: handle(signal.Signals(signum).name))
+
+
+async def wait_tasks(timeout: float = DRAIN_TIMEOUT, exclude: Optional[asyncio.Task] = None) -> int:
+    """현재 루프의 진행 중 태스크가 끝나길 timeout 까지 기다린 뒤 남은 태스크는 취소. 취소한 수 반환"""
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task() and task is not exclude]
+    if not tasks:
+        return 0
+    _, still_running = await asyncio.wait(tasks, timeout=timeout)
+    for task in still_running:
+        task.cancel()
+    if still_running:
+        await asyncio.gather(*still_running, return_exceptions=True)
+        logger.warning(f"⚠️ [Shutdown] 드레인 시간 초과로 {len(still_running)}개 작업 취소 (미처리 아이템은 다음 실행에서 재개)")
+    return len(still_running)
@@ -0,0 +1,94 @@
+"""
+⏱️ 커뮤니티 수집 시작 시각 분산 (슬롯 위상 오프셋 + 지터)
+
+- 같은 틱에 수집 차례가 된 커뮤니티를 한꺼번에 띄우지 않는다. 틱 구간(window)을 slots 개의 슬롯으로 나누고
+  커뮤니티마다 다른 슬롯에서 시작하게 함
+  → DB 쓰기, Gemini 정규화, 푸시 발송이 같은 몇 초에 몰려 생기던 SQLite 락 대기와 429 폭주 완화
+- 슬롯 배정은 커뮤니티별 예상 부하(시간당 요청 페이지)를 큰 것부터 가장 한가한 슬롯에 넣어 슬롯 합을 고르게 (LPT)
+- 슬롯 안에서는 지터를 주어 매 틱 조금씩 다른 시각에 시작 (같은 슬롯 커뮤니티끼리도 겹침 완화)
+- SCRAPE_START_MODE=burst 이면 기존처럼 동시에 시작
+- phase_occupancy(): 실행 구간을 틱 구간 위 슬롯별 점유 시간으로 접어 관리자 대시보드의 부하 분포로 기록
+"""
+
+import math
+import os
+import random
+from typing import Dict, Iterable, Optional
+
+START_MODE = os.getenv("SCRAPE_START_MODE", "stagger")
+STAGGER_SLOTS = int(os.getenv("STAGGER_SLOTS", "6"))
+# 디스패처 틱(1분)과 같게 두면 한 틱 안에서 시작 시각이 고르게 퍼짐
+STAGGER_WINDOW_SECONDS = float(os.getenv("STAGGER_WINDOW_SECONDS", "60"))
+# 슬롯 폭 대비 지터 비율 (1.0 이면 슬롯 전체 구간에서 무작위)
+STAGGER_JITTER = 0.8
+
+
+class StaggerPlan:
+    """커뮤니티 → 슬롯 배정과 이번 틱 시작 지연(초)"""
+
+    def __init__(self, slots: int = STAGGER_SLOTS, window_seconds: float = STAGGER_WINDOW_SECONDS,
+                 jitter: float = STAGGER_JITTER, mode: str = START_MODE, rng: Optional[random.Random] = None):
+        self.slots = max(1, slots)
+        self.window_seconds = window_seconds
+        self.jitter = jitter
+        self.mode = mode
+        self.rng = rng or random.Random()
+        self.assignments: Dict[str, int] = {}
+        self.slot_load = [0.0] * self.slots
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "burst"
+
+    @property
+    def slot_seconds(self) -> float:
+        return self.window_seconds / self.slots
+
+    def assign(self, weights: Dict[str, float]) -> Dict[str, int]:
+        """예상 부하가 큰 커뮤니티부터 누적 부하가 가장 작은 슬롯에 배정 (동률은 이름/슬롯 번호 순 → 결정적)"""
+        load = [0.0] * self.slots
+        assignments = {}
+        for name in sorted(weights, key=lambda n: (-weights[n], n)):
+            slot = min(range(self.slots), key=lambda s: (load[s], s))
+            assignments[name] = slot
+            load[slot] += weights[name]
+        self.assignments, self.slot_load = assignments, load
+        return assignments
+
+    def delay(self, name: str) -> float:
+        if not self.enabled:
+            return 0.0
+        slot = self.assignments.get(name, 0)
+        return slot * self.slot_seconds + self.rng.uniform(0.0, self.jitter * self.slot_seconds)
+
+    def delays(self, names: Iterable[str]) -> Dict[str, float]:
+        return {name: self.delay(name) for name in names}
+
+    def snapshot(self) -> dict:
+        return {
+            "mode": self.mode,
+            "slots": self.slots,
+            "window_seconds": self.window_seconds,
+            "assignments": dict(self.assignments),
+            "slot_pages_per_hour": [round(load, 1) for load in self.slot_load],
+        }
+
+
+def phase_slot(ts: float, window_seconds: float = STAGGER_WINDOW_SECONDS, slots: int = STAGGER_SLOTS) -> int:
+    """시각 ts 가 틱 구간 안에서 속한 슬롯"""
+    return int(math.floor(ts / (window_seconds / slots))) % slots
+
+
+def phase_occupancy(started: float, finished: float, window_seconds: float = STAGGER_WINDOW_SECONDS,
+                    slots: int = STAGGER_SLOTS) -> Dict[int, float]:
+    """[started, finished] 실행 구간을 틱 구간 위 슬롯별 점유 초로 접음 (여러 틱에 걸친 실행은 겹쳐 더해짐)"""
+    width = window_seconds / slots
+    occupancy: Dict[int, float] = {}
+    t = started
+    while t < finished:
+        index = math.floor(t / width)
+        end = min(finished, (index + 1) * width)
+        slot = index % slots
+        occupancy[slot] = occupancy.get(slot, 0.0) + (end - t)
+        t = end
+    return occupancy
@@ -0,0 +1,211 @@
+"""
+🏭 스케줄러 워커 풀 (경량 디스패처 + N 개 워커 프로세스)
+
+- 디스패처(scheduler/main.py 프로세스)는 APScheduler 로 "무엇을 언제" 만 결정하여 job_queue 에 등록
+- 워커 프로세스는 각자 이벤트 루프에서 잡을 claim 하여 실행 → 파싱/AI 등 CPU 작업이 코어별로 분산
+- 잡별 제한 시간: 워커가 asyncio 취소로 먼저 끊고, 루프가 막혀 취소가 안 되면 디스패처가 워커 프로세스를 강제 종료
+- 하트비트는 워커의 별도 스레드가 기록 (CPU 작업으로 루프가 막혀도 "살아있음"과 "멈춤"을 구분)
+- 잡 핸들러는 "모듈:함수" 문자열로 지정하여 워커 프로세스에서 지연 import
+- SIGTERM 시 워커는 새 잡을 claim 하지 않고 진행 중 잡을 DRAIN_TIMEOUT 까지 마무리한 뒤 종료
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from backend.scheduler import shutdown
+from backend.scheduler.job_queue import DONE, FAILED, JOB_DB_PATH, LOST, TIMEOUT, Job, JobQueue
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = max(2, os.cpu_count() or 1)
+# 워커 프로세스 1개가 동시에 실행하는 잡 수 (수집 잡은 대부분 네트워크 대기)
+WORKER_SLOTS = 3
+POLL_INTERVAL = 0.5
+HEARTBEAT_INTERVAL = 10.0
+HEARTBEAT_TIMEOUT = 60.0
+# asyncio 취소 후에도 이 시간이 지나도록 끝나지 않으면 워커 프로세스 강제 종료
+HARD_KILL_GRACE = 30.0
+SUPERVISE_INTERVAL = 5.0
+
+
+def resolve_handler(path: str) -> Callable:
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _heartbeat_loop(db_path: str, worker: str, running: dict, stop: threading.Event):
+    queue = JobQueue(db_path)
+    try:
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            try:
+                queue.heartbeat(list(running), worker)
+            except Exception as e:
+                logger.warning(f"⚠️ [Worker {worker}] 하트비트 기록 실패: {e}")
+    finally:
+        queue.close()
+
+
+async def _run_job(queue: JobQueue, job: Job, handlers: Dict[str, str], worker: str):
+    started = time.monotonic()
+    try:
+        handler = resolve_handler(handlers[job.name])
+        result = await asyncio.wait_for(handler(**job.args), timeout=job.timeout)
+        queue.finish(job.id, DONE, result=result)
+        logger.info(f"✅ [Worker {worker}] {job.name}#{job.id} 완료 ({time.monotonic() - started:.1f}s)")
+    except asyncio.TimeoutError:
+        queue.finish(job.id, TIMEOUT, error=f"timeout after {job.timeout:.0f}s")
+        logger.error(f"⏱️ [Worker {worker}] {job.name}#{job.id} 제한 시간 {job.timeout:.0f}s 초과로 취소")
+    except Exception as e:
+        queue.finish(job.id, FAILED, error=f"{type(e).__name__}: {e}")
+        logger.error(f"❌ [Worker {worker}] {job.name}#{job.id} 실패: {e}")
+
+
+async def _worker_loop(worker: str, db_path: str, handlers: Dict[str, str], slots: int):
+    queue = JobQueue(db_path)
+    running: Dict[int, asyncio.Task] = {}
+    stop = threading.Event()
+    beat = threading.Thread(target=_heartbeat_loop, args=(db_path, worker, running, stop), daemon=True)
+    beat.start()
+    parent = os.getppid()
+    try:
+        while os.getppid() == parent and not shutdown.draining():
+            job = queue.claim(worker) if len(running) < slots else None
+            if job is None:
+                await asyncio.sleep(POLL_INTERVAL)
+                continue
+            task = asyncio.ensure_future(_run_job(queue, job, handlers, worker))
+            running[job.id] = task
+            task.add_done_callback(lambda _, job_id=job.id: running.pop(job_id, None))
+        if shutdown.draining():
+            if running:
+                logger.info(f"🛑 [Worker {worker}] 드레인: 진행 중 잡 {len(running)}개 마무리 대기")
+                await asyncio.wait(list(running.values()), timeout=shutdown.DRAIN_TIMEOUT)
+        else:
+            logger.warning(f"⚠️ [Worker {worker}] 디스패처 종료 감지, 워커 종료")
+    finally:
+        stop.set()
+        for task in list(running.values()):
+            task.cancel()
+        queue.close()
+
+
+def worker_main(worker: str, db_path: str, handlers: Dict[str, str], slots: int = WORKER_SLOTS):
+    """워커 프로세스 진입점"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    logger.info(f"👷 [Worker {worker}] 가동 (pid={os.getpid()}, slots={slots})")
+    shutdown.install_signal_handlers()
+    try:
+        asyncio.run(_worker_loop(worker, db_path, handlers, slots))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # 잡이 격발한 푸시 등 백그라운드 작업 마무리
+        shutdown.run_drain_hooks()
+
+
+class WorkerPool:
+    """
+    🧭 디스패처 측 워커 풀 관리자
+    - enqueue(): 잡 등록 (dedupe_key 로 중복 실행 방지)
+    - supervise(): 죽은 워커 재기동, 하트비트 끊긴 잡 lost 처리, 제한 시간 초과 워커 강제 종료,
+      종료된 잡을 on_result 콜백으로 전달
+    """
+
+    def __init__(self, handlers: Dict[str, str], workers: int = DEFAULT_WORKERS, slots: int = WORKER_SLOTS,
+                 db_path: str = JOB_DB_PATH, on_result: Optional[Callable[[Job], None]] = None):
+        self.handlers = handlers
+        self.size = workers
+        self.slots = slots
+        self.db_path = db_path
+        self.on_result = on_result
+        self.queue = JobQueue(db_path)
+        # 슬롯 이름(w0, w1 ...) → (워커 ID, 프로세스). 재기동 시 워커 ID 에 세대 번호가 붙음
+        self.processes: Dict[str, Tuple[str, multiprocessing.Process]] = {}
+        self._context = multiprocessing.get_context("spawn")
+        self._generation = 0
+
+    def start(self):
+        # 이전 디스패처가 남긴 실행 중 잡은 주인이 없으므로 정리
+        self.queue.fail_worker_jobs(None, LOST, "dispatcher restarted")
+        for index in range(self.size):
+            self._spawn(f"w{index}")
+        logger.info(f"🏭 [WorkerPool] 워커 {self.size}개 x 슬롯 {self.slots}개 가동 (queue={self.db_path})")
+
+    def _spawn(self, slot_name: str):
+        self._generation += 1
+        worker = f"{slot_name}.{self._generation}"
+        process = self._context.Process(
+            target=worker_main, args=(worker, self.db_path, self.handlers, self.slots),
+            name=f"scheduler-{worker}", daemon=True,
+        )
+        process.start()
+        self.processes[slot_name] = (worker, process)
+
+    def enqueue(self, name: str, timeout: float, dedupe_key: Optional[str] = None, **args) -> Optional[int]:
+        if name not in self.handlers:
+            raise KeyError(f"unknown job: {name}")
+        job_id = self.queue.enqueue(name, args, timeout=timeout, dedupe_key=dedupe_key)
+        if job_id is None:
+            logger.info(f"⏭️ [WorkerPool] {dedupe_key} 잡이 이미 대기/실행 중이라 등록 생략")
+        return job_id
+
+    def supervise(self) -> List[Job]:
+        """1회 점검 후 이번에 전달한 종료 잡 목록 반환"""
+        for slot_name, (worker, process) in list(self.processes.items()):
+            if not process.is_alive():
+                lost = self.queue.fail_worker_jobs(worker, LOST, f"worker exited ({process.exitcode})")
+                logger.error(f"💀 [WorkerPool] 워커 {worker} 종료 감지 (exit={process.exitcode}, 잡 {len(lost)}개 lost) → 재기동")
+                self._spawn(slot_name)
+
+        for job in self.queue.overdue(HARD_KILL_GRACE):
+            for slot_name, (worker, process) in list(self.processes.items()):
+                if worker == job.worker:
+                    logger.error(f"🔪 [WorkerPool] {job.name}#{job.id} 이 제한 시간({job.timeout:.0f}s)을 넘겨 워커 {job.worker} 강제 종료")
+                    process.kill()
+                    process.join(5)
+                    self.queue.fail_worker_jobs(job.worker, TIMEOUT, "killed after timeout")
+                    self._spawn(slot_name)
+
+        self.queue.reap_stale(HEARTBEAT_TIMEOUT)
+        finished = self.queue.collect()
+        for job in finished:
+            if self.on_result is not None:
+                try:
+                    self.on_result(job)
+                except Exception as e:
+                    logger.error(f"[WorkerPool] 결과 처리 실패 {job.name}#{job.id}: {e}")
+        return finished
+
+    async def supervise_forever(self, interval: float = SUPERVISE_INTERVAL):
+        last_prune = 0.0
+        while True:
+            self.supervise()
+            if time.time() - last_prune > 3600:
+                self.queue.prune()
+                last_prune = time.time()
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict:
+        return {
+            "workers": {worker: process.is_alive() for worker, process in self.processes.values()},
+            "jobs": self.queue.counts(),
+        }
+
+    def shutdown(self, timeout: float = 10.0):
+        """워커에 SIGTERM(드레인) 후 timeout 초 안에 끝나지 않은 워커는 강제 종료"""
+        for _, process in self.processes.values():
+            process.terminate()
+        deadline = time.monotonic() + timeout
+        for worker, process in self.processes.values():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.error(f"🔪 [WorkerPool] 워커 {worker} 드레인 시간 초과로 강제 종료")
+                process.kill()
+                process.join(5)
+        self.queue.close()
@@ -1,26 +1,26 @@
 import logging
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+import re
+from dataclasses import replace
+from typing import Optional
 from backend.scrapers.ppomppu_scraper import PpomppuScraper
 
 logger = logging.getLogger(__name__)
 
+# 'FS' or 'Free' in title means Free Shipping
+_FREE_SHIPPING_RE = re.compile(r'\b(?:FS|Free|무배|무료배송|무료)\b', re.IGNORECASE)
+
 class AlippomppuScraper(PpomppuScraper):
+    # 해외 게시판: 제목의 $/€ 가격 및 직구 키워드 휴리스틱 적용
+    spec = replace(PpomppuScraper.spec, foreign_currency=True)
+
     def __init__(self, community_id: int):
         super().__init__(community_id)
         self.platform_name = "알리뽐뿌"
         self.list_url = "https://www.ppomppu.co.kr/zboard/zboard.php?id=ppomppu8"
 
-    async def parse_list(self, html: str) -> list[dict]:
+    def finish_row(self, row, title_el, item: dict) -> Optional[dict]:
         """알리뽐뿌 게시판 특화 무료배송 처리 (나머지는 부모 클래스 로직 재사용)"""
-        # PpomppuScraper의 parse_list를 호출하여 기본적인 파싱 및 get_detail 실행
-        deals = await super().parse_list(html)
-        
-        import re
-        for deal in deals:
-            full_title = deal.get("title", "")
-            # 'FS' or 'Free' in title means Free Shipping
-            if re.search(r'\b(?:FS|Free|무배|무료배송|무료)\b', full_title, re.IGNORECASE):
-                deal["shipping_fee"] = "무료배송"
-                
-        return deals
+        item = super().finish_row(row, title_el, item)
+        if item and _FREE_SHIPPING_RE.search(item["title"]):
+            item["shipping_fee"] = "무료배송"
+        return item
@@ -1,35 +1,49 @@
 import asyncio
-import httpx
 import logging
 import random
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional
+from urllib.parse import urljoin, urlparse
 
 logger = logging.getLogger(__name__)
 
-from curl_cffi.requests import AsyncSession
+from bs4 import BeautifulSoup
+from backend.core.http_transport import HttpTransport, http_transport
+from backend.scrapers.og_image import og_image_cache, stream_og_image
+from backend.scrapers.spec import ScraperSpec, SpecEngine
+from backend.scrapers.time_parser import parse_time_str
 
 class AsyncBaseScraper(ABC):
     """
     🏗️ [비동기 v2.0] 통합 스크래퍼 기본 클래스
-    - curl_cffi 기반 완벽한 브라우저(Chrome) 지문 위장 (TLS Fingerprint)
+    - curl_cffi 기반 완벽한 브라우저(Chrome) 지문 위장 (TLS Fingerprint), 프로세스 공용 전송 계층(core/http_transport.py) 사용
     - Semaphore 기반 IP 차단 방지 (동시성 제한)
+    - 리스트 파싱은 선언형 ScraperSpec + 공용 추출 엔진으로 처리 (scrapers/spec.py)
     """
 
+    # 리스트 페이지 추출 규칙 (지정하면 parse_list 를 따로 구현할 필요 없음)
+    spec: Optional[ScraperSpec] = None
+    # 요청 타임아웃(초) — IP 차단 시 응답이 늘어지는 게시판은 자식에서 단축
+    request_timeout: float = 20.0
+    # 안티봇 차단(403/430) 시 순서대로 바꿔 끼우는 브라우저 지문 (첫 번째가 기본)
+    fingerprints = ('chrome124', 'chrome116', 'chrome110', 'edge101')
+
     def __init__(self, platform_name: str, max_concurrent_requests: int = 5):
         self.platform_name = platform_name
         self.semaphore = asyncio.Semaphore(max_concurrent_requests)
-        self.client: Optional[AsyncSession] = None
+        self.client: Optional[HttpTransport] = None
         self.max_retries = 3
+        # 오프라인 녹화/재생 하네스용 전송 계층 (None 이면 실제 네트워크 사용, scrapers/replay.py 참고)
+        self.transport = None
 
     async def __aenter__(self):
-        # chrome124 위장을 통해 Cloudflare 430/403 우회
-        self.client = AsyncSession(impersonate='chrome124', timeout=20.0)
+        # 공용 커넥션 풀을 빌려 쓰므로 별도 세션 생성/종료 없음
+        self.client = http_transport
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.client:
-            await self.client.close()
+        self.client = None
 
     def _get_headers(self) -> dict:
         """User-Agent는 curl_cffi가 자동으로 처리하므로 기본 헤더만 추가"""
@@ -38,6 +52,12 @@ class AsyncBaseScraper(ABC):
             "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
         }
 
+    async def fetch_html(self, url: str, headers: Optional[dict] = None) -> Optional[str]:
+        """HTML 페칭 진입점 (transport 가 지정되면 녹화/재생 계층을 경유)"""
+        if self.transport is not None:
+            return await self.transport.fetch(self, url, headers, self._fetch_html_live)
+        return await self._fetch_html_live(url, headers)
+
     from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
     @retry(
@@ -46,24 +66,22 @@ class AsyncBaseScraper(ABC):
         retry=retry_if_exception_type(Exception),
         reraise=True
     )
-    async def fetch_html(self, url: str, headers: Optional[dict] = None) -> Optional[str]:
+    async def _fetch_html_live(self, url: str, headers: Optional[dict] = None) -> Optional[str]:
         """비동기 네트워크 페칭 (동적 브라우저 지문 로테이션 및 재시도 적용)"""
         if not self.client:
             raise RuntimeError("Scraper must be used within 'async with' context")
 
-        impersonates = ['chrome120', 'chrome116', 'chrome110', 'edge101']
         req_headers = headers if headers is not None else self._get_headers()
         
         async with self.semaphore:
-            for attempt, imp in enumerate(impersonates):
+            for attempt, imp in enumerate(self.fingerprints):
                 try:
                     await asyncio.sleep(random.uniform(0.8, 2.0))
                     
-                    # 430/403 재시도 시 세션 재빌드
+                    # 430/403 재시도 시 지문 교체 + 해당 사이트 쿠키 폐기 (공용 세션은 유지)
                     if attempt > 0:
                         logger.info(f"🔄 [{self.platform_name}] 지문 로테이션 재시도 ({imp}) - {url}")
-                        await self.client.close()
-                        self.client = AsyncSession(impersonate=imp, timeout=20.0)
+                        self.client.reset_cookies(url)
                         
                         # 지문이 Chrome이 아닐 경우 Chrome 특화 Client Hints 헤더 제거하여 지문 불일치(Mismatch) 방지
                         if 'chrome' not in imp:
@@ -75,21 +93,23 @@ class AsyncBaseScraper(ABC):
                         # 펨코의 경우 쿠키 웜업 다시 진행
                         if "fmkorea.com" in url or "fmkorea.org" in url:
                             try:
-                                await self.client.get("https://www.fmkorea.com/", headers=req_headers, timeout=5.0)
+                                await self.client.get("https://www.fmkorea.com/", headers=req_headers, timeout=5.0,
+                                                      impersonate=imp, tag=self.platform_name)
                             except: pass
                             
-                    response = await self.client.get(url, headers=req_headers)
+                    response = await self.client.get(url, headers=req_headers, timeout=self.request_timeout,
+                                                     impersonate=imp, tag=self.platform_name)
                     
                     if response.status_code in [403, 430]:
-                        logger.warning(f"[{self.platform_name}] 안티봇 차단 감지 (HTTP {response.status_code}) [시도 {attempt+1}/{len(impersonates)}] - {url}")
-                        if attempt == len(impersonates) - 1:
+                        logger.warning(f"[{self.platform_name}] 안티봇 차단 감지 (HTTP {response.status_code}) [시도 {attempt+1}/{len(self.fingerprints)}] - {url}")
+                        if attempt == len(self.fingerprints) - 1:
                             raise Exception(f"Anti-bot block detected after all retries: {response.status_code}")
                         continue
                         
                     response.raise_for_status()
                     return response.text
                 except Exception as e:
-                    if attempt == len(impersonates) - 1:
+                    if attempt == len(self.fingerprints) - 1:
                         raise e
                     logger.warning(f"⚠️ [{self.platform_name}] 요청 오류 (시도 {attempt+1}): {e}. 다음 지문으로 재시도합니다.")
                     await asyncio.sleep(2 ** attempt)
@@ -112,33 +132,73 @@ class AsyncBaseScraper(ABC):
         if any(x in url for x in ['ppomppu.co.kr', 'fmkorea.com', 'fmkorea.org', 'quasarzone.com', 'clien.net', 'ruliweb.com', 'bbasak.com']):
             return None
             
-        try:
-            if not self.client:
-                return None
-            
-            logger.info(f"🔍 [og:image] 외부 쇼핑몰 og:image 탐색 시도: {url}")
-            # 외부 링크이므로 딜레이 최소화 및 빠른 타임아웃(3초) 설정
-            response = await self.client.get(url, timeout=3.0, headers={
+        if self.transport is not None:
+            return await self.transport.fetch_og_image(self, url, self._fetch_og_image_live)
+        return await self._fetch_og_image_live(url)
+
+    async def _fetch_og_image_live(self, url: str) -> Optional[str]:
+        if not self.client:
+            return None
+
+        async def fetch(target_url: str) -> Optional[str]:
+            logger.info(f"🔍 [og:image] 외부 쇼핑몰 og:image 탐색 시도: {target_url}")
+            # 외부 링크이므로 딜레이 최소화 및 빠른 타임아웃(3초) 설정, </head> 까지만 스트리밍 수신
+            return await stream_og_image(self.client, target_url, timeout=3.0, headers={
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
             })
-            if response.status_code == 200:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.text, 'html.parser')
-                meta_img = soup.find('meta', property='og:image') or soup.find('meta', attrs={'name': 'twitter:image'}) or soup.find('meta', itemprop='image')
-                if meta_img and meta_img.get('content'):
-                    img_url = meta_img['content'].strip()
-                    if img_url.startswith('//'):
-                        img_url = 'https:' + img_url
-                    return img_url
-        except Exception as e:
-            logger.warning(f"⚠️ [og:image] 외부 쇼핑몰 이미지 파싱 실패 ({url}): {e}")
+
+        # 동일 상품 링크가 여러 커뮤니티에 반복 등장하므로 전 스크래퍼 공용 TTL 캐시 경유
+        return await og_image_cache.get_or_fetch(url, fetch)
+
+    async def resolve_redirect(self, url: str) -> Optional[str]:
+        """중계 링크(link.php 등) → 다른 도메인으로 빠져나간 최종 URL (없으면 None, transport 가 지정되면 녹화/재생 계층 경유)"""
+        if self.transport is not None:
+            return await self.transport.resolve_redirect(self, url, self._resolve_redirect_live)
+        return await self._resolve_redirect_live(url)
+
+    async def _resolve_redirect_live(self, url: str) -> Optional[str]:
+        if not self.client:
+            return None
+        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0'}
+        origin = urlparse(url).netloc
+        # HEAD 로 먼저 추적하고, 리다이렉트가 HEAD 에 반응하지 않는 중계 페이지면 GET 으로 한 번 더
+        for method in (self.client.head, self.client.get):
+            res = await method(url, headers=headers, verify=False, allow_redirects=True, timeout=5.0, tag=self.platform_name)
+            final = str(res.url)
+            if final != url and urlparse(final).netloc != origin:
+                return final
         return None
 
-    @abstractmethod
+    def page_url(self, page: int) -> str:
+        """리스트 N페이지 URL (게시판별 페이징 파라미터가 다르면 자식에서 재정의)"""
+        if page <= 1:
+            return self.list_url
+        sep = "&" if "?" in self.list_url else "?"
+        return f"{self.list_url}{sep}page={page}"
+
     async def parse_list(self, html: str) -> List[dict]:
-        """리스트 페이지 파싱 (자식 구현)"""
-        pass
+        """리스트 페이지 파싱 (기본: spec 기반 동기 추출 엔진, 부가 요청이 필요한 게시판만 자식에서 재정의)"""
+        return self.extract_list(BeautifulSoup(html, 'html.parser'))
+
+    def extract_list(self, soup) -> List[dict]:
+        if self.spec is None:
+            raise NotImplementedError(f"[{self.platform_name}] spec 지정 또는 parse_list 구현이 필요합니다")
+        return SpecEngine.for_spec(self.spec).extract(soup, self)
+
+    def list_rows(self, soup) -> list:
+        """게시글 행 목록 (공지/광고 영역 선제거 등이 필요하면 자식에서 재정의)"""
+        return SpecEngine.for_spec(self.spec).select_rows(soup)
+
+    def build_row_url(self, href: str) -> Optional[str]:
+        """행 링크 href → 게시글 고유 URL (None 이면 행 스킵, 게시판별 URL 정규화는 자식에서 재정의)"""
+        if self.spec.strip_query:
+            href = href.split('?')[0]
+        return urljoin(self.spec.base_url, href)
+
+    def finish_row(self, row, title_el, item: dict) -> Optional[dict]:
+        """셀렉터로 표현되지 않는 사이트 고유 필드 보정 훅 (None 이면 행 스킵)"""
+        return item
 
     @abstractmethod
     async def get_detail(self, url: str) -> Optional[dict]:
@@ -177,108 +237,6 @@ class AsyncBaseScraper(ABC):
             return []
 
     @staticmethod
-    def parse_time_str(time_str: str) -> Optional[str]:
-        """다양한 형식의 시간 문자열을 UTC ISO 8601 형식(시간대 오프셋 제거)으로 변환"""
-        import re
-        from datetime import datetime, timedelta, timezone
-        
-        if not time_str: return None
-        time_str = time_str.strip()
-        kst = timezone(timedelta(hours=9))
-        now_kst = datetime.now(kst)
-        posted_dt_kst = None
-        
-        try:
-            # 분 전, 시간 전, 방금 전 등의 상대 시간 처리
-            if '분 전' in time_str or '분전' in time_str:
-                match = re.search(r'(\d+)\s*분', time_str)
-                if match:
-                    posted_dt_kst = now_kst - timedelta(minutes=int(match.group(1)))
-            elif '시간 전' in time_str or '시간전' in time_str:
-                match = re.search(r'(\d+)\s*시간', time_str)
-                if match:
-                    posted_dt_kst = now_kst - timedelta(hours=int(match.group(1)))
-            elif '방금' in time_str:
-                posted_dt_kst = now_kst
-            elif ':' in time_str and not ('/' in time_str or '-' in time_str or '.' in time_str):
-                # 14:20 or 14:20:10
-                parts = time_str.split(':')
-                if len(parts) >= 2:
-                    h, m = int(parts[0]), int(parts[1])
-                    s = int(parts[2]) if len(parts) > 2 else 0
-                    posted_dt_kst = now_kst.replace(hour=h, minute=m, second=s, microsecond=0)
-                    # 만약 미래 시간이면 작년/어제로 간주
-                    if posted_dt_kst > now_kst + timedelta(hours=1):
-                        posted_dt_kst -= timedelta(days=1)
-            else:
-                # 2024.04.28 or 24/04/28 12:34:56 (세 개의 날짜 세그먼트)
-                date_match_3 = re.search(r'(\d{2,4})[/.-](\d{1,2})[/.-](\d{1,2})(?:\s+(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?', time_str)
-                # 06.02 or 06/02 12:34:56 (두 개의 날짜 세그먼트, 연도 생략)
-                date_match_2 = re.search(r'(?<!\d)(\d{1,2})[/.-](\d{1,2})(?:\s+(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?', time_str)
-                
-                if date_match_3:
-                    y_str = date_match_3.group(1)
-                    y = int(y_str)
-                    if y < 100: y += 2000
-                    # 혹시 파싱 오류로 2012년 등이 되면 2024년으로 자동 교정 (안전망)
-                    if y < 2020: y = now_kst.year
-                    
-                    month, d = int(date_match_3.group(2)), int(date_match_3.group(3))
-                    h = int(date_match_3.group(4)) if date_match_3.group(4) else 0
-                    m_val = int(date_match_3.group(5)) if date_match_3.group(5) else 0
-                    s_val = int(date_match_3.group(6)) if date_match_3.group(6) else 0
-                    
-                    if 1 <= month <= 12 and 1 <= d <= 31:
-                        try:
-                            posted_dt_kst = datetime(y, month, d, h, m_val, s_val, tzinfo=kst)
-                            if posted_dt_kst and posted_dt_kst > now_kst + timedelta(hours=1):
-                                posted_dt_kst = posted_dt_kst.replace(year=posted_dt_kst.year - 1)
-                        except ValueError:
-                            pass
-                elif date_match_2:
-                    y = now_kst.year
-                    month, d = int(date_match_2.group(1)), int(date_match_2.group(2))
-                    h = int(date_match_2.group(3)) if date_match_2.group(3) else 0
-                    m_val = int(date_match_2.group(4)) if date_match_2.group(4) else 0
-                    s_val = int(date_match_2.group(5)) if date_match_2.group(5) else 0
-                    
-                    if 1 <= month <= 12 and 1 <= d <= 31:
-                        try:
-                            posted_dt_kst = datetime(y, month, d, h, m_val, s_val, tzinfo=kst)
-                            if posted_dt_kst and posted_dt_kst > now_kst + timedelta(hours=1):
-                                posted_dt_kst = posted_dt_kst.replace(year=posted_dt_kst.year - 1)
-                        except ValueError:
-                            pass
-                else:
-                    # 한국어 날짜 형식 지원: "6월 1일" 또는 "2024년 6월 1일 15:30"
-                    kor_date_match = re.search(r'(?:(\d{2,4})년\s*)?(\d{1,2})월\s*(\d{1,2})일(?:\s+(\d{1,2})[:시]\s*(\d{1,2})(?:분)?)?', time_str)
-                    if kor_date_match:
-                        y_str = kor_date_match.group(1)
-                        if y_str:
-                            y = int(y_str)
-                            if y < 100: y += 2000
-                        else:
-                            y = now_kst.year
-                        
-                        month = int(kor_date_match.group(2))
-                        d = int(kor_date_match.group(3))
-                        h = int(kor_date_match.group(4)) if kor_date_match.group(4) else 0
-                        m_val = int(kor_date_match.group(5)) if kor_date_match.group(5) else 0
-                        s_val = 0
-                        
-                        if 1 <= month <= 12 and 1 <= d <= 31:
-                            try:
-                                posted_dt_kst = datetime(y, month, d, h, m_val, s_val, tzinfo=kst)
-                                if posted_dt_kst and posted_dt_kst > now_kst + timedelta(hours=1):
-                                    posted_dt_kst = posted_dt_kst.replace(year=posted_dt_kst.year - 1)
-                            except ValueError:
-                                pass
-            
-            if posted_dt_kst:
-                utc_dt = posted_dt_kst.astimezone(timezone.utc)
-                # Android가 완벽히 파싱할 수 있도록 Z 부착
-                return utc_dt.replace(tzinfo=None).isoformat(timespec='seconds') + "Z"
-        except Exception as e:
-            logger.warning(f"시간 파싱 실패 '{time_str}': {e}")
-        
-        return None
\ No newline at end of file
+    def parse_time_str(time_str: str, now: Optional[datetime] = None) -> Optional[str]:
+        """다양한 형식의 시간 문자열을 UTC ISO 8601 형식(시간대 오프셋 제거)으로 변환 (scrapers/time_parser.py)"""
+        return parse_time_str(time_str, now)
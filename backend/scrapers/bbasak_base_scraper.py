@@ -1,156 +1,77 @@
 import logging
 import re
+from dataclasses import replace
+from typing import Optional
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from backend.scrapers.base_scraper import AsyncBaseScraper
+from backend.scrapers.spec import ScraperSpec
 
 logger = logging.getLogger(__name__)
 
+_TITLE_COMMENT_RE = re.compile(r'\s*\[(\d+)\]$')
+_TIME_RE = re.compile(r'^\d{1,2}:\d{1,2}(:\d{1,2})?$')
+_DATE_RE = re.compile(r'^\d{2,4}[/.-]\d{1,2}[/.-]\d{1,2}')
+
 class BbasakBaseScraper(AsyncBaseScraper):
+    spec = ScraperSpec(
+        base_url="https://bbasak.com",
+        row_selector='table.t1 tbody tr',
+        title_selectors=('td.tit a',),
+        title_price=True,
+        foreign_currency=True,
+        mobile_plan_price=True,
+        hot_min_views=2500,
+        category_from_title=True,
+    )
+
     def __init__(self, community_name: str, community_url: str, community_id: int = 0, default_category: str = None):
         super().__init__(community_name, max_concurrent_requests=5)
         self.community_id = community_id
         self.list_url = community_url
         self.default_category = default_category
+        # 제목에 [분류] 가 없을 때 사용할 게시판 기본 카테고리
+        self.spec = replace(self.spec, default_category=default_category)
 
-    async def parse_list(self, html: str) -> list[dict]:
-        """빠삭 게시판 데이터 추출 (비동기 처리)"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
+    def list_rows(self, soup) -> list:
+        # 상단 공지 테이블 다음의 두 번째 table.t1 이 실제 게시글 목록
         tables = soup.select('table.t1')
-        post_rows = []
         if len(tables) >= 2:
-            post_rows = tables[1].select('tbody tr')
-        elif len(tables) == 1:
-             post_rows = tables[0].select('tbody tr')
+            return tables[1].select('tbody tr')
+        if len(tables) == 1:
+            return tables[0].select('tbody tr')
+        return []
 
-        deals = []
-        import asyncio
-        
-        async def process_row(row):
-            title_element = row.select_one('td.tit a')
-            if not title_element: return None
+    def build_row_url(self, href: str) -> Optional[str]:
+        url = urljoin(self.spec.base_url, href)
+        if 'device=pc' not in url:
+            url += "&device=pc" if "?" in url else "?device=pc"
+        return url
 
-            href = title_element.get('href')
-            if not href: return None
+    def finish_row(self, row, title_el, item: dict) -> Optional[dict]:
+        tds = row.select('td')
+        if len(tds) > 4:
+            hit_txt = tds[-1].get_text(strip=True).replace(',', '')
+            item["view_count"] = int(hit_txt) if hit_txt.isdigit() else 0
 
-            url = urljoin("https://bbasak.com", href)
-            if 'device=pc' not in url:
-                url += "&device=pc" if "?" in url else "?device=pc"
-                
-            full_title = title_element.get_text(strip=True)
-            
-            price = 0
-            extracted_currency = "KRW"
-            import re
-            usd_match = re.search(r'(?:\$|USD|달러|유로|€)\s*([0-9,.]+)', full_title, re.IGNORECASE)
-            if not usd_match:
-                usd_match = re.search(r'([0-9,.]+)\s*(?:\$|USD|달러|유로|€)', full_title, re.IGNORECASE)
-                
-            if usd_match:
-                try:
-                    val = float(usd_match.group(1).replace(',', ''))
-                    price = int(val * 100)
-                    if '유로' in full_title or '€' in full_title:
-                        extracted_currency = "EUR"
-                    else:
-                        extracted_currency = "USD"
-                except: pass
-            else:
-                match = re.search(r'([\d,]+)\s*원', full_title)
-                if match:
-                    try:
-                        price = int(match.group(1).replace(',', ''))
-                    except: pass
-                
-                if price == 0:
-                    plan_match = re.search(r'(\d{2,3})\s*요금제', full_title)
-                    if plan_match:
-                        try:
-                            price = int(plan_match.group(1)) * 1000
-                        except: pass
-                
-            is_closed = False
-            if '종료' in full_title or '마감' in full_title or '품절' in full_title:
-                is_closed = True
-            style = title_element.get('style', '')
-            if 'line-through' in style or title_element.select_one('del, s, strike'):
-                is_closed = True
-                
-            is_super_hotdeal = False
-            view_count = 0
-            tds = row.select('td')
-            if len(tds) > 4:
-                hit_txt = tds[-1].get_text(strip=True).replace(',', '')
-                view_count = int(hit_txt) if hit_txt.isdigit() else 0
-                if view_count >= 2500:
-                    is_super_hotdeal = True
-                    
-            # 댓글수 추출 (보통 제목 옆에 [3] 또는 span 태그)
-            comment_count = 0
-            comment_span = title_element.find_next_sibling('span')
-            if comment_span:
-                cmt_txt = comment_span.get_text(strip=True).replace('[', '').replace(']', '')
-                if cmt_txt.isdigit(): comment_count = int(cmt_txt)
-            else:
-                cmt_match = re.search(r'\[(\d+)\]$', full_title)
-                if cmt_match:
-                    comment_count = int(cmt_match.group(1))
-                    full_title = re.sub(r'\s*\[\d+\]$', '', full_title).strip()
-                
-            # 휴리스틱: 제목에 직구 관련 키워드가 있고 가격이 10000 이하면 USD로 간주
-            if extracted_currency == "KRW" and price > 0 and price <= 10000:
-                if any(kw in full_title for kw in ['알리', '코인', '큐텐', '직구', '알익']):
-                    extracted_currency = "USD"
-                    price = int(price * 100)
-                
-            # 실제 게시글 작성 시간 추출
-            posted_at_iso = None
-            time_str = ""
-            for td in tds:
-                txt = td.get_text(strip=True)
-                if ':' in txt or '/' in txt or '-' in txt:
-                    if re.match(r'^\d{1,2}:\d{1,2}(:\d{1,2})?$', txt) or re.match(r'^\d{2,4}[/.-]\d{1,2}[/.-]\d{1,2}', txt):
-                        time_str = txt
-                        break
-
-            if time_str:
-                posted_at_iso = self.parse_time_str(time_str)
-                
-            # 제목 맨 앞의 대괄호 [...] 에서 카테고리 추출
-            category_extracted = None
-            cat_match = re.search(r'^\s*\[([^\]]+)\]', full_title)
-            if cat_match:
-                category_extracted = cat_match.group(1).strip()
-            
-            # 대괄호가 없을 시 default_category 사용
-            if not category_extracted:
-                category_extracted = self.default_category
-
-            return {
-                "title": full_title,
-                "url": url,
-                "price": price,
-                "currency": extracted_currency,
-                "shop_name": "",
-                "image_url": "",
-                "ecommerce_link": "",
-                "is_closed": is_closed,
-                "shipping_fee": "",
-                "is_super_hotdeal": is_super_hotdeal,
-                "posted_at": posted_at_iso,
-                "view_count": view_count,
-                "like_count": 0,
-                "comment_count": comment_count,
-                "category": category_extracted
-            }
+        # 댓글수 추출 (보통 제목 옆에 [3] 또는 span 태그)
+        comment_span = title_el.find_next_sibling('span')
+        if comment_span:
+            cmt_txt = comment_span.get_text(strip=True).replace('[', '').replace(']', '')
+            if cmt_txt.isdigit(): item["comment_count"] = int(cmt_txt)
+        else:
+            cmt_match = _TITLE_COMMENT_RE.search(item["title"])
+            if cmt_match:
+                item["comment_count"] = int(cmt_match.group(1))
+                item["title"] = item["title"][:cmt_match.start()].strip()
 
-        tasks = [process_row(row) for row in post_rows]
-        results = await asyncio.gather(*tasks)
-        for r in results:
-            if r: deals.append(r)
-            
-        return deals
+        # 실제 게시글 작성 시간 추출
+        for td in tds:
+            txt = td.get_text(strip=True)
+            if (':' in txt or '/' in txt or '-' in txt) and (_TIME_RE.match(txt) or _DATE_RE.match(txt)):
+                item["posted_at"] = self.parse_time_str(txt)
+                break
+        return item
 
     async def get_detail(self, url: str) -> dict:
         """상세 페이지 데이터 파싱 로직 (추후 고도화)"""
@@ -205,21 +126,10 @@ class BbasakBaseScraper(AsyncBaseScraper):
                     elif 'link.php' in href:
                         # link.php는 모바일 브라우저에서 막히므로, 파이썬 백엔드에서 미리 최종 리다이렉트 URL을 추적합니다.
                         try:
-                            import httpx
-                            client = httpx.AsyncClient(verify=False, follow_redirects=True, timeout=5.0)
-                            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0'}
-                            res = await client.head(href, headers=headers)
-                            if str(res.url) != href and "bbasak.com" not in str(res.url):
-                                ecommerce_link = str(res.url)
-                                await client.aclose()
+                            final_url = await self.resolve_redirect(href)
+                            if final_url and "bbasak.com" not in final_url:
+                                ecommerce_link = final_url
                                 break
-                            else:
-                                res = await client.get(href, headers=headers)
-                                if str(res.url) != href and "bbasak.com" not in str(res.url):
-                                    ecommerce_link = str(res.url)
-                                    await client.aclose()
-                                    break
-                            await client.aclose()
                         except Exception as e:
                             logger.error(f"[빠삭] 리다이렉트 실패: {e}")
                             
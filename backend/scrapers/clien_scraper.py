@@ -3,96 +3,40 @@ import re
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from backend.scrapers.base_scraper import AsyncBaseScraper
+from backend.scrapers.spec import ScraperSpec
 
 logger = logging.getLogger(__name__)
 
 class ClienScraper(AsyncBaseScraper):
+    spec = ScraperSpec(
+        base_url="https://www.clien.net",
+        row_selector='div.list_item:not(.notice)',
+        # 광고글 제거
+        skip_row_selector='.label_ad',
+        title_selectors=('span.list_subject a', 'a[data-role="list-title-text"]'),
+        strip_query=True,
+        image_selector='div.list_img img',
+        image_blacklist=('noimage',),
+        closed_label_selector='.icon_info',
+        hot_min_likes=10,
+        time_selector='span.timestamp, span.time',
+        time_attr='title',
+        category_from_title=True,
+        view_selector='.list_hit',
+        like_selector='.list_symph',
+    )
+
     def __init__(self, community_id: int):
         super().__init__("클리앙", max_concurrent_requests=5)
         self.community_id = community_id
         self.list_url = "https://www.clien.net/service/board/jirum?od=T31&category=0"
 
-    async def parse_list(self, html: str) -> list[dict]:
-        """클리앙 알뜰구매 게시판 데이터 추출 (비동기 처리)"""
-        soup = BeautifulSoup(html, 'html.parser')
-        post_rows = soup.select('div.list_item:not(.notice)')
-
-        deals = []
-        for item in post_rows:
-            # 광고글 제거
-            if item.select_one('.label_ad'):
-                continue
-
-            is_closed = False
-            sold_out_tag = item.select_one('span.icon_info')
-            if sold_out_tag and '품절' in sold_out_tag.get_text(strip=True):
-                is_closed = True
-            
-            title_element = item.select_one('span.list_subject a')
-            if not title_element:
-                title_element = item.select_one('a[data-role="list-title-text"]')
-            if not title_element:
-                continue
-
-            raw_url = title_element.get('href', '')
-            url = urljoin("https://www.clien.net", raw_url.split('?')[0])
-            full_title = title_element.get_text(strip=True)
-            
-            if '종료' in full_title or '마감' in full_title or '품절' in full_title:
-                is_closed = True
-
-            style = title_element.get('style', '')
-            if 'line-through' in style or title_element.select_one('del, s, strike'):
-                is_closed = True
-                
-            icon_info = item.select_one('.icon_info')
-            if icon_info and ('품절' in icon_info.get_text() or '종료' in icon_info.get_text()):
-                is_closed = True
-            
-            is_super_hotdeal = False
-            symph_el = item.select_one('.list_symph')
-            hit_el = item.select_one('.list_hit')
-            symph = int(symph_el.get_text(strip=True)) if symph_el and symph_el.get_text(strip=True).isdigit() else 0
-            hit_txt = hit_el.get_text(strip=True).replace(',', '') if hit_el else '0'
-            hit = int(hit_txt) if hit_txt.isdigit() else 0
-            if symph >= 10:
-                is_super_hotdeal = True
-
-            image_url = ""
-            img_tag = item.select_one('div.list_img img')
-            if img_tag and img_tag.has_attr('src'):
-                src = img_tag['src']
-                if 'noimage' not in src:
-                    image_url = src if src.startswith('http') else urljoin("https://www.clien.net", src)
-
-            # 실제 게시글 작성 시간 추출
-            posted_at_iso = None
-            time_span = item.select_one('span.timestamp, span.time')
-            if time_span:
-                posted_at_iso = self.parse_time_str(time_span.get('title') or time_span.get_text(strip=True))
-
-            # 제목 맨 앞의 대괄호 [...] 에서 카테고리 추출
-            category_extracted = None
-            cat_match = re.search(r'^\s*\[([^\]]+)\]', full_title)
-            if cat_match:
-                category_extracted = cat_match.group(1).strip()
-
-            deals.append({
-                "title": full_title,
-                "url": url,
-                "price": 0,
-                "shop_name": "",
-                "image_url": image_url,
-                "is_closed": is_closed,
-                "is_super_hotdeal": is_super_hotdeal,
-                "posted_at": posted_at_iso,
-                "view_count": hit,
-                "like_count": symph,
-                "comment_count": 0,
-                "category": category_extracted
-            })
-            
-        return deals
+    def page_url(self, page: int) -> str:
+        # 클리앙은 0부터 시작하는 po 파라미터로 페이징
+        if page <= 1:
+            return self.list_url
+        sep = "&" if "?" in self.list_url else "?"
+        return f"{self.list_url}{sep}po={page-1}"
 
     async def get_detail(self, url: str) -> dict:
         """상세 페이지 데이터 파싱 로직"""
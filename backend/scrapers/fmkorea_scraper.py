@@ -1,12 +1,38 @@
 import logging
 import re
+from typing import Optional
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from backend.scrapers.base_scraper import AsyncBaseScraper
+from backend.scrapers.spec import PLACEHOLDER_IMAGE_KEYWORDS, ScraperSpec
 
 logger = logging.getLogger(__name__)
 
+_DOC_SRL_RE = re.compile(r'document_srl=([0-9]+)')
+_PRICE_RE = re.compile(r'([0-9,]+(?:\.[0-9]+)?)')
+
 class FmkoreaScraper(AsyncBaseScraper):
+    spec = ScraperSpec(
+        base_url="https://www.fmkorea.com/",
+        row_selector='li.li:not(.notice):not(.notice_pop0):not(.notice_pop1), div.list_item:not(.notice):not(.notice_pop0):not(.notice_pop1)',
+        fallback_row_selector='table.bd_lst tbody tr:not(.notice):not(.notice_pop0):not(.notice_pop1)',
+        title_selectors=('td.title a, h3.title a, a.title, a.hotdeal_var8, a.hotdeal_var8Y',),
+        comment_selector='.replyNum, .comment_count, .reply_num',
+        comment_in_title=True,
+        # 🖼️ Lazy Loading 방어 위해 data-original, data-src 우선 조회
+        image_selector='img.thumb, .thumb img, .tmb img, img',
+        image_attrs=('data-original', 'data-src', 'src'),
+        # 'fmkorea'는 도메인 주소에 포함되므로 필터 키워드에서 제외하여 정상적인 이미지 URL이 유실되는 버그를 방지합니다.
+        image_blacklist=PLACEHOLDER_IMAGE_KEYWORDS,
+        foreign_currency=True,
+        # 펨코 전용: 핫딜 종료 시 a 태그(title_element)에 'hotdeal_var8Y' 클래스가 붙음
+        closed_selector='del, s, strike, span[style*="line-through"]',
+        closed_title_classes=('hotdeal_var8Y',),
+        time_selector='td.time, .regdate',
+        view_selector='td.m_no, .m_no_voted, td.hit',
+        like_selector='.pc_voted_count, .m_voted_count',
+    )
+
     def __init__(self, community_id: int):
         # 펨코는 Cloudflare 방어가 강하므로 동시성을 1로 제한하고 딜레이를 대폭 늘립니다.
         super().__init__("펨코", max_concurrent_requests=1)
@@ -23,7 +49,7 @@ class FmkoreaScraper(AsyncBaseScraper):
         return {}
 
     async def parse_list(self, html: str) -> list[dict]:
-        """펨코리아 게시판 리스트에서 타겟 데이터 추출 (비동기 처리)"""
+        """펨코리아 게시판 리스트에서 타겟 데이터 추출 (인기글 목록 1회 조회 후 공용 추출 엔진 실행)"""
         soup = BeautifulSoup(html, 'html.parser')
         
         # 포텐 핫딜 마크를 달기 위해 백그라운드에서 인기글(pop) 목록 조회하여 URL 수집
@@ -55,201 +81,68 @@ class FmkoreaScraper(AsyncBaseScraper):
             except Exception as e:
                 logger.warning(f"[{self.platform_name}] 인기 핫딜 목록 조회 실패: {e}")
 
-        post_rows = soup.select('li.li:not(.notice), div.list_item:not(.notice)')
-        if not post_rows:
-            post_rows = soup.select('table.bd_lst tbody tr')
-
-        import asyncio
-
-        async def process_row(row):
-            row_classes = row.get('class') or []
-            if any(cls in row_classes for cls in ['notice', 'notice_pop0', 'notice_pop1']):
-                return None
-                
-            no_tag = row.select_one('td.no')
-            if no_tag and no_tag.get_text(strip=True) in ['공지', '인기', 'AD', '광고']:
-                return None
-
-            title_element = row.select_one('td.title a, h3.title a, a.title, a.hotdeal_var8, a.hotdeal_var8Y')
-            if not title_element:
-                if row.name == 'a' and ('title' in (row.get('class') or []) or 'hotdeal_var' in str(row.get('class'))):
-                    title_element = row
-                else:
-                    return None
-
-            href = title_element.get('href', '')
-            if not href or href.startswith('javascript'): return None
-            
-            doc_match = re.search(r'document_srl=([0-9]+)', href)
-            if doc_match:
-                url = f"https://www.fmkorea.com/{doc_match.group(1)}"
-            else:
-                clean_href = href.split('?')[0]
-                url = urljoin("https://www.fmkorea.com/", clean_href)
-            
-            # 댓글 카운트 파싱 및 제거
-            comment_count = 0
-            for meta_span in title_element.select('.replyNum, .comment_count, .reply_num'):
-                cmt_txt = meta_span.get_text(strip=True).replace('[', '').replace(']', '').replace(',', '')
-                if cmt_txt.isdigit(): comment_count = int(cmt_txt)
-                meta_span.decompose()
-
-            full_title = title_element.get_text(strip=True)
-
-            # 🖼️ 기본 썸네일 확인 (Lazy Loading 방어 위해 data-original, data-src 우선 조회)
-            image_url = ""
-            img_tag = row.select_one('img.thumb, .thumb img, .tmb img, img')
-            if img_tag:
-                image_url = img_tag.get('data-original') or img_tag.get('data-src') or img_tag.get('src', '')
-                if image_url.startswith('//'):
-                    image_url = "https:" + image_url
-                elif image_url and not image_url.startswith('http'):
-                    image_url = urljoin("https://www.fmkorea.com/", image_url)
-
-            # 만약 썸네일 주소가 펨코리아 아이콘, 투명 기프, 빈 로고 등 유효하지 않은 정보라면 비움 처리
-            if image_url:
-                img_url_lower = image_url.lower()
-                # 'fmkorea'는 도메인 주소에 포함되므로 필터 키워드에서 제외하여 정상적인 이미지 URL이 유실되는 버그를 방지합니다.
-                if any(x in img_url_lower for x in ['transparent', 'blank', 'logo', 'icon', 'empty']) or image_url.startswith('data:') or 'base64' in img_url_lower:
-                    image_url = ""
-
-
-            # 상세 페이지에서 ecommerce_link와 본문 파싱
-            # 가격 및 배송비 파싱 (hotdeal_info)
-            extracted_price = 0
-            extracted_currency = "KRW"
-            shop_name = ""
-            shipping_fee = ""
-            
-            info_div = row.select_one('.hotdeal_info')
-            if info_div:
-                spans = info_div.select('span')
-                for span in spans:
-                    text = span.get_text(strip=True)
-                    if '쇼핑몰' in text:
-                        strong = span.select_one('.strong')
-                        if strong: shop_name = strong.get_text(strip=True)
-                    elif '가격' in text:
-                        strong = span.select_one('.strong')
-                        if strong: 
-                            price_text = strong.get_text(strip=True)
-                            if '$' in price_text or '달러' in price_text or 'USD' in price_text.upper():
-                                extracted_currency = "USD"
-                            elif '€' in price_text or '유로' in price_text or 'EUR' in price_text.upper():
-                                extracted_currency = "EUR"
-                                
-                            p_match = re.search(r'([0-9,]+(?:\.[0-9]+)?)', price_text)
-                            if p_match:
-                                try:
-                                    raw_val = float(p_match.group(1).replace(',', ''))
-                                    if extracted_currency in ["USD", "EUR"]:
-                                        extracted_price = int(raw_val * 100)
-                                    else:
-                                        extracted_price = int(raw_val)
-                                except: pass
-                    elif '배송비' in text:
-                        strong = span.select_one('.strong')
-                        if strong: shipping_fee = strong.get_text(strip=True)
-            
-            if "(0원)" in full_title and extracted_price == 0:
-                extracted_price = 0
-
-            # 휴리스틱: 제목에 직구 관련 키워드가 있고 가격이 10000 이하면 USD로 간주
-            if extracted_currency == "KRW" and extracted_price > 0 and extracted_price <= 10000:
-                if any(kw in full_title for kw in ['알리', '코인', '큐텐', '직구', '알익']):
-                    extracted_currency = "USD"
-                    extracted_price = int(extracted_price * 100)
-
-            # 종료 여부 확인 (취소선이 그어져 있는지 또는 종료 키워드)
-            is_closed = False
-            
-            # 펨코 전용: 핫딜 종료 시 a 태그(title_element)에 'hotdeal_var8Y' 클래스가 붙음
-            a_classes = title_element.get('class', [])
-            if isinstance(a_classes, list) and 'hotdeal_var8Y' in a_classes:
-                is_closed = True
-            elif isinstance(a_classes, str) and 'hotdeal_var8Y' in a_classes:
-                is_closed = True
-
-            style = title_element.get('style', '')
-            if 'line-through' in style or title_element.select_one('del, s, strike'):
-                is_closed = True
-            
-            if '종료' in full_title or '마감' in full_title or '품절' in full_title:
-                is_closed = True
-                
-            for span in title_element.select('span'):
-                if 'line-through' in span.get('style', ''):
-                    is_closed = True
-                    break
-
-            # [엄격한 핫딜 검증]
-            # 핫딜 게시판의 정상적인 핫딜은 반드시 .hotdeal_info 구조를 가집니다.
-            # 만약 이게 없다면 다른 게시판(예: 국내축구, 유머 등)에서 핫딜 게시판에 주입된 인기글(포텐글)이므로 차단합니다.
-            if not info_div:
-                logger.info(f"[펨코] 핫딜 정보(.hotdeal_info)가 없어 스킵 (타 게시판 인기글로 추정): {full_title}")
-                return None
-
-            # 조회수 및 추천수(포텐) 파싱
-            view_count = 0
-            like_count = 0
-            m_no = row.select_one('td.m_no, .m_no_voted, td.hit')
-            if m_no:
-                v_txt = m_no.get_text(strip=True).replace(',', '')
-                if v_txt.isdigit(): view_count = int(v_txt)
-                
-            voted_el = row.select_one('.pc_voted_count, .m_voted_count')
-            if voted_el:
-                l_txt = voted_el.get_text(strip=True).replace('추천', '').replace(',', '').strip()
-                if l_txt.isdigit(): like_count = int(l_txt)
-                
-            # 펨코 핫딜 게시판 목록 자체에 '포텐' 뱃지가 있는 경우 우선 반영 (포텐 뱃지독점)
-            is_poten = False
-            poten_span = row.select_one('span.STAR-BEST')
-            if poten_span and '포텐' in poten_span.get_text(strip=True):
-                is_poten = True
-
-            # 실제 게시글 작성 시간 추출 (KST 기준을 UTC로 변환하여 저장)
-            posted_at_iso = None
-            time_td = row.select_one('td.time, .regdate')
-            if time_td:
-                posted_at_iso = self.parse_time_str(time_td.get_text(strip=True))
-
-            category_span = row.select_one('span.category')
-            cat_text = ""
-            if category_span:
-                cat_text = category_span.get_text(strip=True).replace('/', '').replace(' ', '')
-
-            extracted_category = None
-            if cat_text:
-                # 펨코 카테고리 매핑
-                if '먹거리' in cat_text or '음식' in cat_text: extracted_category = '음식'
-                elif '의류' in cat_text or '패션' in cat_text: extracted_category = '의류'
-                elif '기프티콘' in cat_text or '모바일' in cat_text: extracted_category = '모바일/기프티콘'
-                elif '이용권' in cat_text or '패키지' in cat_text: extracted_category = '패키지/이용권'
-                else: extracted_category = cat_text # PC제품, 가전제품, 생활용품 등은 텍스트가 거의 일치함
-
-            return {
-                "title": full_title,
-                "url": url,
-                "price": extracted_price,
-                "currency": extracted_currency,
-                "shop_name": shop_name,
-                "image_url": image_url,
-                "ecommerce_link": "",
-                "is_closed": is_closed,
-                "shipping_fee": shipping_fee,
-                "is_super_hotdeal": is_poten,
-                "posted_at": posted_at_iso,
-                "view_count": view_count,
-                "like_count": like_count,
-                "comment_count": comment_count,
-                "category": extracted_category,
-                "content_html": ""
-            }
-
-        tasks = [process_row(row) for row in post_rows]
-        results = await asyncio.gather(*tasks)
-        return [r for r in results if r]
+        return self.extract_list(soup)
+
+    def build_row_url(self, href: str) -> Optional[str]:
+        doc_match = _DOC_SRL_RE.search(href)
+        if doc_match:
+            return f"https://www.fmkorea.com/{doc_match.group(1)}"
+        return urljoin(self.spec.base_url, href.split('?')[0])
+
+    def finish_row(self, row, title_el, item: dict) -> Optional[dict]:
+        no_tag = row.select_one('td.no')
+        if no_tag and no_tag.get_text(strip=True) in ['공지', '인기', 'AD', '광고']:
+            return None
+
+        # [엄격한 핫딜 검증]
+        # 핫딜 게시판의 정상적인 핫딜은 반드시 .hotdeal_info 구조를 가집니다.
+        # 만약 이게 없다면 다른 게시판(예: 국내축구, 유머 등)에서 핫딜 게시판에 주입된 인기글(포텐글)이므로 차단합니다.
+        info_div = row.select_one('.hotdeal_info')
+        if not info_div:
+            logger.info(f"[펨코] 핫딜 정보(.hotdeal_info)가 없어 스킵 (타 게시판 인기글로 추정): {item['title']}")
+            return None
+
+        # 가격 및 배송비 파싱 (hotdeal_info)
+        for span in info_div.select('span'):
+            text = span.get_text(strip=True)
+            strong = span.select_one('.strong')
+            if not strong:
+                continue
+            if '쇼핑몰' in text:
+                item["shop_name"] = strong.get_text(strip=True)
+            elif '가격' in text:
+                price_text = strong.get_text(strip=True)
+                currency = "KRW"
+                if '$' in price_text or '달러' in price_text or 'USD' in price_text.upper():
+                    currency = "USD"
+                elif '€' in price_text or '유로' in price_text or 'EUR' in price_text.upper():
+                    currency = "EUR"
+                item["currency"] = currency
+
+                p_match = _PRICE_RE.search(price_text)
+                if p_match:
+                    try:
+                        raw_val = float(p_match.group(1).replace(',', ''))
+                        item["price"] = int(raw_val * 100) if currency in ["USD", "EUR"] else int(raw_val)
+                    except ValueError:
+                        pass
+            elif '배송비' in text:
+                item["shipping_fee"] = strong.get_text(strip=True)
+
+        # 펨코 핫딜 게시판 목록 자체에 '포텐' 뱃지가 있는 경우만 핫딜 마크 (포텐 뱃지독점)
+        poten_span = row.select_one('span.STAR-BEST')
+        item["is_super_hotdeal"] = bool(poten_span and '포텐' in poten_span.get_text(strip=True))
+
+        category_span = row.select_one('span.category')
+        cat_text = category_span.get_text(strip=True).replace('/', '').replace(' ', '') if category_span else ""
+        if cat_text:
+            # 펨코 카테고리 매핑
+            if '먹거리' in cat_text or '음식' in cat_text: item["category"] = '음식'
+            elif '의류' in cat_text or '패션' in cat_text: item["category"] = '의류'
+            elif '기프티콘' in cat_text or '모바일' in cat_text: item["category"] = '모바일/기프티콘'
+            elif '이용권' in cat_text or '패키지' in cat_text: item["category"] = '패키지/이용권'
+            else: item["category"] = cat_text # PC제품, 가전제품, 생활용품 등은 텍스트가 거의 일치함
+        return item
 
     async def get_detail(self, url: str) -> dict:
         """펨코리아 상세 페이지 데이터 파싱 로직"""
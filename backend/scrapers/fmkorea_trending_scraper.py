@@ -1,16 +1,17 @@
+import asyncio
 import os
 import json
 import logging
-from curl_cffi import requests
 from bs4 import BeautifulSoup
+from backend.core.http_transport import http_transport
 
 logger = logging.getLogger(__name__)
 
-def update_fmkorea_trending_keywords():
+async def update_fmkorea_trending_keywords():
     """펨코 메인 페이지에서 실시간 급상승 검색어를 스크래핑하여 로컬 JSON 파일에 저장합니다."""
     try:
         logger.info("펨코리아 실시간 급상승 검색어 수집 시작...")
-        res = requests.get("https://www.fmkorea.com/hotdeal", impersonate="chrome110", timeout=15)
+        res = await http_transport.get("https://www.fmkorea.com/hotdeal", impersonate="chrome110", timeout=15.0, tag="fmkorea-trending")
         
         if res.status_code == 200:
             soup = BeautifulSoup(res.text, "html.parser")
@@ -41,4 +42,4 @@ def update_fmkorea_trending_keywords():
     return False
 
 if __name__ == "__main__":
-    update_fmkorea_trending_keywords()
+    asyncio.run(update_fmkorea_trending_keywords())
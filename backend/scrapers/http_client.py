@@ -1,7 +1,7 @@
 import asyncio
 from typing import Optional, Dict, Any
 
-import aiohttp
+from backend.core.http_transport import http_transport
 
 
 class HttpClient:
@@ -10,6 +10,7 @@ class HttpClient:
     - 기본 한국어 헤더
     - 타임아웃, 지연(랜덤 지연 가능) 설정
     - 재시도 로직 (간단한 지수 백오프)
+    - 실제 전송은 프로세스 공용 전송 계층(core/http_transport.py)의 커넥션 풀을 사용
     """
 
     def __init__(
@@ -24,46 +25,49 @@ class HttpClient:
         accept_language: str = "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
         extra_headers: Optional[Dict[str, str]] = None,
     ) -> None:
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.timeout = float(timeout)
         self.default_delay = default_delay
         self.max_retries = max_retries
         self.headers = {
             "User-Agent": user_agent,
             "Accept-Language": accept_language,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Connection": "keep-alive",
             "Cache-Control": "no-cache",
             "Pragma": "no-cache",
         }
         if extra_headers:
             self.headers.update(extra_headers)
 
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._active = False
 
     async def __aenter__(self):
-        self._session = aiohttp.ClientSession(timeout=self.timeout, headers=self.headers)
+        # 세션은 공용 전송 계층이 관리하므로 컨텍스트 진입 여부만 기록
+        self._active = True
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        if self._session:
-            await self._session.close()
+        self._active = False
 
     async def _sleep(self, delay: Optional[float] = None):
         await asyncio.sleep(delay if delay is not None else self.default_delay)
 
-    async def _request(self, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
-        assert self._session is not None, "HttpClient session is not initialized. Use 'async with'."
+    async def _request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs):
+        assert self._active, "HttpClient session is not initialized. Use 'async with'."
 
+        req_headers = {**self.headers, **(headers or {})}
+        kwargs.setdefault("timeout", self.timeout)
         last_exc: Optional[Exception] = None
         for attempt in range(1, self.max_retries + 1):
             try:
-                resp = await self._session.request(method, url, **kwargs)
-                if resp.status >= 500:
+                resp = await http_transport.request(method, url, headers=req_headers, tag="http-client", **kwargs)
+                if resp.status_code >= 500:
                     # 서버 측 에러는 재시도
-                    last_exc = RuntimeError(f"Server error: {resp.status}")
+                    last_exc = RuntimeError(f"Server error: {resp.status_code}")
                 else:
                     return resp
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
                 last_exc = e
 
             # 다음 재시도 전 지수 백오프
@@ -77,18 +81,18 @@ class HttpClient:
 
     async def get(self, url: str, params: Optional[Dict[str, Any]] = None, delay: Optional[float] = None, **kwargs) -> str:
         await self._sleep(delay)
-        async with (await self._request("GET", url, params=params, **kwargs)) as resp:
-            return await resp.text()
+        resp = await self._request("GET", url, params=params, **kwargs)
+        return resp.text
 
     async def get_bytes(self, url: str, params: Optional[Dict[str, Any]] = None, delay: Optional[float] = None, **kwargs) -> bytes:
         await self._sleep(delay)
-        async with (await self._request("GET", url, params=params, **kwargs)) as resp:
-            return await resp.read()
+        resp = await self._request("GET", url, params=params, **kwargs)
+        return resp.content
 
     async def head(self, url: str, delay: Optional[float] = None, **kwargs) -> Dict[str, str]:
         await self._sleep(delay)
-        async with (await self._request("HEAD", url, **kwargs)) as resp:
-            return dict(resp.headers)
+        resp = await self._request("HEAD", url, **kwargs)
+        return dict(resp.headers)
 
 
 # 사용 예시
@@ -0,0 +1,243 @@
+import asyncio
+import codecs
+import logging
+import re
+import time
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# <head> 가 비정상적으로 긴 쇼핑몰(인라인 스크립트 폭탄)을 대비한 최대 수신 바이트
+OG_HEAD_MAX_BYTES = 128 * 1024
+# 성공 결과는 길게, 실패(None) 결과는 짧게 캐싱하여 일시 장애 쇼핑몰도 곧 재시도되도록 함
+OG_CACHE_TTL_SECONDS = 6 * 3600
+OG_NEGATIVE_TTL_SECONDS = 10 * 60
+OG_CACHE_MAX_ENTRIES = 5000
+# Content-Type 에 charset 이 없을 때 <meta charset> 을 찾아볼 앞부분 바이트 수 (HTML 표준 prescan 과 동일)
+CHARSET_PRESCAN_BYTES = 1024
+
+_HEADER_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?\s*([A-Za-z0-9_\-:.]+)', re.IGNORECASE)
+# 청크 경계에서 잘린 값(charset=euc 까지만 도착)을 잘못 읽지 않도록 값 뒤 구분 문자까지 확인
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+?charset\s*=\s*["\']?\s*([A-Za-z0-9_\-:.]+)(?=[\s"\'/>;])', re.IGNORECASE)
+_HEAD_END_RE = re.compile(rb'</head|<body', re.IGNORECASE)
+# 브라우저처럼 EUC-KR 선언은 상위 집합인 CP949 로 디코딩 (확장 완성형 한글 깨짐 방지)
+_CHARSET_ALIASES = {"euc_kr": "cp949", "windows-949": "cp949", "x-windows-949": "cp949"}
+
+# 우선순위: og:image > twitter:image > itemprop=image (기존 BeautifulSoup 탐색 순서와 동일)
+_META_PRIORITY = {
+    ("property", "og:image"): 0,
+    ("name", "twitter:image"): 1,
+    ("itemprop", "image"): 2,
+}
+
+
+class _OgMetaScanner(HTMLParser):
+    """
+    🔎 토크나이저 레벨 og:image 스캐너
+    - DOM 트리를 만들지 않고 <meta> 시작 태그만 검사
+    - </head> 또는 <body> 를 만나면 즉시 스캔 완료(done) 처리
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self._found: Dict[int, str] = {}
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == "body":
+            self.done = True
+            return
+        if tag != "meta":
+            return
+        attr_map = {k.lower(): (v or "") for k, v in attrs if k}
+        content = attr_map.get("content", "").strip()
+        if not content:
+            return
+        for (key, value), rank in _META_PRIORITY.items():
+            if attr_map.get(key, "").strip().lower() == value and rank not in self._found:
+                self._found[rank] = content
+                if rank == 0:
+                    # 최우선 og:image 확보 시 나머지 토큰은 볼 필요가 없음
+                    self.done = True
+                break
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.done = True
+
+    def best(self) -> Optional[str]:
+        if not self._found:
+            return None
+        img_url = self._found[min(self._found)]
+        if img_url.startswith("//"):
+            img_url = "https:" + img_url
+        return img_url
+
+
+def _codec_name(charset: Optional[str]) -> Optional[str]:
+    if not charset:
+        return None
+    charset = charset.strip().lower()
+    try:
+        name = codecs.lookup(_CHARSET_ALIASES.get(charset, charset)).name
+    except LookupError:
+        return None
+    return _CHARSET_ALIASES.get(name, name)
+
+
+def header_charset(content_type: Optional[str]) -> Optional[str]:
+    """Content-Type 헤더의 charset (없거나 모르는 인코딩이면 None)"""
+    match = _HEADER_CHARSET_RE.search(content_type or "")
+    return _codec_name(match.group(1)) if match else None
+
+
+def meta_charset(head: bytes) -> Optional[str]:
+    """본문 앞부분의 <meta charset> / <meta http-equiv="Content-Type" content="...; charset=..."> 값"""
+    match = _META_CHARSET_RE.search(head)
+    return _codec_name(match.group(1).decode("ascii")) if match else None
+
+
+def extract_og_image(html: str) -> Optional[str]:
+    """HTML 문자열(전체 또는 <head> 조각)에서 대표 이미지 메타 태그 값을 추출"""
+    if not html:
+        return None
+    scanner = _OgMetaScanner()
+    try:
+        scanner.feed(html)
+    except Exception:
+        pass
+    return scanner.best()
+
+
+async def stream_og_image(client, url: str, headers: Optional[dict] = None, timeout: float = 3.0,
+                          max_bytes: int = OG_HEAD_MAX_BYTES) -> Optional[str]:
+    """
+    ⚡ 스트리밍 og:image 추출
+    - 응답 본문을 청크 단위로 받아 즉시 토크나이징
+    - </head> 도달, og:image 확보, 또는 max_bytes 초과 시 나머지 다운로드를 중단
+    - 인코딩: Content-Type 의 charset → 없으면 앞부분 <meta charset> → 기본 utf-8 (EUC-KR/CP949 쇼핑몰 대응)
+    """
+    scanner = _OgMetaScanner()
+    decoder = None
+    pending = b""
+    received = 0
+
+    def make_decoder(charset: Optional[str]):
+        return codecs.getincrementaldecoder(charset or "utf-8")(errors="replace")
+
+    async with client.stream("GET", url, headers=headers, timeout=timeout) as response:
+        try:
+            if response.status_code != 200:
+                return None
+            charset = header_charset(response.headers.get("Content-Type"))
+            if charset:
+                decoder = make_decoder(charset)
+            async for chunk in response.aiter_content():
+                received += len(chunk)
+                if decoder is None:
+                    # 헤더에 charset 이 없으면 <meta charset> 이 보이거나 prescan 구간/</head> 에 닿을 때까지 모아 둠
+                    pending += chunk
+                    charset = meta_charset(pending)
+                    if not charset and len(pending) < CHARSET_PRESCAN_BYTES and not _HEAD_END_RE.search(pending):
+                        continue
+                    decoder = make_decoder(charset)
+                    chunk, pending = pending, b""
+                scanner.feed(decoder.decode(chunk))
+                if scanner.done or received >= max_bytes:
+                    break
+            if pending:
+                # prescan 구간보다 짧은 응답
+                scanner.feed(make_decoder(meta_charset(pending)).decode(pending, final=True))
+        finally:
+            # curl 쓰기 콜백을 중단시켜 남은 본문(수백 KB) 수신을 끊음
+            quit_now = getattr(response, "quit_now", None)
+            if quit_now is not None:
+                quit_now.set()
+    return scanner.best()
+
+
+class OgImageCache:
+    """
+    🗂️ 상품 URL → og:image 결과 TTL 캐시 (프로세스 내 모든 스크래퍼가 공유)
+    - 동일 URL 동시 요청은 하나의 in-flight Future 로 합쳐 중복 다운로드를 방지
+    """
+
+    def __init__(self, ttl: float = OG_CACHE_TTL_SECONDS, negative_ttl: float = OG_NEGATIVE_TTL_SECONDS,
+                 max_entries: int = OG_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        # 프래그먼트(#...)만 제거: 쇼핑몰별 상품 식별 쿼리는 제각각이므로 보존
+        return url.strip().split("#", 1)[0]
+
+    def get(self, key: str) -> Tuple[bool, Optional[str]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: Optional[str]):
+        ttl = self.ttl if value else self.negative_ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(self, url: str, fetcher) -> Optional[str]:
+        """캐시 조회 후 미스일 때만 fetcher(url) 코루틴을 실행"""
+        key = self.make_key(url)
+        found, value = self.get(key)
+        if found:
+            self.hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        value = None
+        try:
+            value = await fetcher(url)
+        except asyncio.CancelledError:
+            self._inflight.pop(key, None)
+            future.cancel()
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️ [og:image] 외부 쇼핑몰 이미지 파싱 실패 ({url}): {e}")
+
+        self.set(key, value)
+        self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# 모든 스크래퍼 인스턴스가 공유하는 전역 캐시
+og_image_cache = OgImageCache()
@@ -1,9 +1,14 @@
 import logging
+from dataclasses import replace
 from backend.scrapers.ppomppu_scraper import PpomppuScraper
 
 logger = logging.getLogger(__name__)
 
 class PpomppuOverseasScraper(PpomppuScraper):
+    # 해외 게시판: 제목의 $/€ 가격 및 직구 키워드 휴리스틱 적용
+    # ('질문'/'문의' 글은 PpomppuScraper 스펙의 skip_title_keywords 에서 이미 제외됨)
+    spec = replace(PpomppuScraper.spec, foreign_currency=True)
+
     def __init__(self, community_id: int):
         super().__init__(community_id)
         self.platform_name = "뽐뿌해외"
@@ -26,19 +31,3 @@ class PpomppuOverseasScraper(PpomppuScraper):
             except Exception as e:
                 logger.error(f"❌ Error scraping {target_url} via super().run: {e}")
         return all_deals
-
-    async def parse_list(self, html: str) -> list[dict]:
-        """뽐뿌 해외 특화 로직 (없으면 부모 클래스 사용)"""
-        deals = await super().parse_list(html)
-        
-        # '질문'/'문의' 등 필터링은 PpomppuScraper와 AggregatorService에서 처리됨
-        # 추가로 해외뽐뿌에서 질문을 걸러냄
-        filtered_deals = []
-        for d in deals:
-            title = d.get('title', '')
-            if '질문' in title or '문의' in title:
-                continue
-            filtered_deals.append(d)
-            
-        return filtered_deals
-
@@ -1,254 +1,135 @@
 import logging
 import re
-from urllib.parse import urljoin
+from datetime import datetime
+from typing import Optional
+from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
 from bs4 import BeautifulSoup
 from backend.scrapers.base_scraper import AsyncBaseScraper
+from backend.scrapers.spec import PLACEHOLDER_IMAGE_KEYWORDS, ScraperSpec, absolute_url, is_placeholder_image
 
 logger = logging.getLogger(__name__)
 
+_DOC_ID_RE = re.compile(r'no=([0-9]+)')
+_VOTE_RE = re.compile(r'\d+\s*-\s*\d+')
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
 class PpomppuScraper(AsyncBaseScraper):
+    spec = ScraperSpec(
+        base_url="https://www.ppomppu.co.kr/zboard/",
+        row_selector='tr.baseList, tr.list1, tr.list0',
+        title_selectors=('a.baseList-title', '.list_title', 'font'),
+        link_fallback_selector='a',
+        skip_title_keywords=('공지', '질문', '문의'),
+        comment_selector='.list_comment2 span, .list_comment2, .comment_count',
+        title_price=True,
+        closed_selector='del, s, strike, font[color="#999999"]',
+        closed_title_classes=('end', 'end2'),
+        closed_row_selector='img[src*="end_icon"]',
+        # [CEO 피드백] 뽐뿌의 핫딜 마크(is_super_hotdeal)는 hot_icon2.jpg 가 있을 때만 True로 설정
+        hot_selector='img[src*="hot_icon2.jpg"]',
+        category_from_title=True,
+    )
+
     def __init__(self, community_id: int):
         super().__init__("뽐뿌", max_concurrent_requests=5)
         self.community_id = community_id
         # CEO 피드백: 뽐뿌 전체 핫딜을 수집하되, 추천수(like_count)로 인기 마크를 판별
         self.list_url = "https://www.ppomppu.co.kr/zboard/zboard.php?id=ppomppu"
 
-    async def parse_list(self, html: str) -> list[dict]:
-        """뽐뿌 게시판 리스트에서 제목과 URL (그리고 가능하면 가격) 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
+    def list_rows(self, soup) -> list:
         # 쇼핑포럼 (관련 없는 게시글/광고) 제거
         forum_header = soup.find(lambda tag: tag.name == 'tr' and '더 많은 쇼핑 정보와' in tag.get_text())
         if forum_header:
             for sibling in forum_header.find_next_siblings():
                 sibling.decompose()
             forum_header.decompose()
+        return super().list_rows(soup)
 
-        # 뽐뿌 핫딜 게시판 리스트 행
-        post_rows = soup.select('tr.baseList, tr.list1, tr.list0')
-        
-        import asyncio
-        async def process_row(row):
-            title_el = row.select_one('a.baseList-title') or row.select_one('.list_title') or row.select_one('font')
-            if not title_el: return None
-            
-            # [CEO 피드백] 뽐뿌의 핫딜 마크(is_super_hotdeal)는 hot_icon2.jpg 가 있을 때만 True로 설정
-            hot_icon = row.select_one('img[src*="hot_icon2.jpg"]')
-                
-            full_title = title_el.get_text(strip=True)
-            if not full_title or "공지" in full_title or "질문" in full_title or "문의" in full_title: return None
-                 
-            link_el = title_el if title_el.has_attr('href') else title_el.find_parent('a')
-            if not link_el or not link_el.get('href'):
-                link_el = row.select_one('a')
-            if not link_el or not link_el.get('href'): return None
-                
-            href = link_el.get('href')
-            if href.startswith('javascript'): return None
-            
-            from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-            parsed_href = urlparse(href)
-            qs = parse_qs(parsed_href.query)
-            
-            # [HOTFIX] 현재 스크래핑 중인 게시판 ID와 일치하는 게시글만 수집하도록 보정 (타 게시판 추천글/광고글 섞임 차단!)
-            allowed_board_ids = []
-            if hasattr(self, 'list_urls') and self.list_urls:
-                for u in self.list_urls:
-                    q = parse_qs(urlparse(u).query)
-                    bid = q.get('id', [None])[0]
-                    if bid: allowed_board_ids.append(bid)
-            if hasattr(self, 'list_url') and self.list_url:
-                q = parse_qs(urlparse(self.list_url).query)
-                bid = q.get('id', [None])[0]
-                if bid and bid not in allowed_board_ids: allowed_board_ids.append(bid)
-                
-            if not allowed_board_ids:
-                allowed_board_ids = ['ppomppu']
-                
-            board_id = qs.get('id', [''])[0]
-            if board_id not in allowed_board_ids:
-                return None
-                
-            qs.pop('page', None)
-            qs.pop('divpage', None)
-            clean_query = urlencode(qs, doseq=True)
-            clean_href = urlunparse(parsed_href._replace(query=clean_query))
-                
-            url = urljoin("https://www.ppomppu.co.kr/zboard/", clean_href)
-            
-            # 🖼️ 썸네일 추출 시도 
-            image_url = ""
-            img_td = None
-            
-            # 리스트 tr 내의 이미지 태그들 중 썸네일 확률이 높은 이미지를 정확하게 우선 스캐닝합니다.
-            img_tags = row.select('img')
-            for img in img_tags:
-                src = img.get('src') or ''
-                if any(x in src.lower() for x in ['_thumb', 'data3', 'noimage', 'data/']):
-                    img_td = img
-                    break
-                    
-            if not img_td:
-                img_td = row.select_one('td img.thumb_border')
-            if not img_td:
-                img_td = row.select_one('img')
-            
-            if img_td and img_td.has_attr('src'):
-                 image_url = img_td['src']
-                 if image_url.startswith('//'): image_url = "https:" + image_url
-                 elif not image_url.startswith('http'): image_url = urljoin("https://www.ppomppu.co.kr", image_url)
-                 
-                 # [E2E 과거 글 차단 2차 철벽 가드]: 썸네일 주소에 과거 년도가 포함된 경우 수집 원천 차단
-                 # ⚠️ 현재 연도와 작년은 허용! (range 상한을 current_year - 1 로 설정하여 올해/작년 이미지 오차단 방지)
-                 if "ppomppu" in image_url:
-                     from datetime import datetime as dt_img
-                     img_current_year = dt_img.now().year
-                     if any(f"/{yr}/" in image_url for yr in [str(y) for y in range(2000, img_current_year - 1)]):
-                         logger.info(f"[뽐뿌] 이미지 내 과거 연도 감지로 수집 스킵: {full_title} ({image_url})")
-                         return None
+    def allowed_board_ids(self) -> list:
+        """현재 스크래핑 중인 게시판 ID 목록 (list_url / list_urls 기준)"""
+        allowed = []
+        for u in (getattr(self, 'list_urls', None) or []) + [getattr(self, 'list_url', None)]:
+            if not u:
+                continue
+            bid = parse_qs(urlparse(u).query).get('id', [None])[0]
+            if bid and bid not in allowed:
+                allowed.append(bid)
+        return allowed or ['ppomppu']
 
-            # 만약 썸네일 주소가 투명 이미지이거나 아이콘, 또는 노이미지 엑스박스면 비움 처리
-            if image_url:
-                img_url_lower = image_url.lower()
-                if any(x in img_url_lower for x in ['transparent', 'blank', 'logo', 'icon', 'empty', 'noimage']) or image_url.startswith('data:') or 'base64' in img_url_lower:
-                    image_url = ""
+    def build_row_url(self, href: str) -> Optional[str]:
+        parsed_href = urlparse(href)
+        qs = parse_qs(parsed_href.query)
 
-            # 제목에서 가격 추출 시도 (예: 15,900원, 3만9천원)
-            import re
-            extracted_price = 0
-            extracted_currency = "KRW"
-            
-            is_overseas = (self.platform_name in ["뽐뿌해외", "알리뽐뿌"])
-            
-            usd_match = None
-            if is_overseas:
-                usd_match = re.search(r'(?:\$|USD|달러|유로|€)\s*([0-9,.]+)', full_title, re.IGNORECASE)
-                if not usd_match:
-                    usd_match = re.search(r'([0-9,.]+)\s*(?:\$|USD|달러|유로|€)', full_title, re.IGNORECASE)
-                
-            price_match = re.search(r'([\d,]+(?:원|만원))', full_title)
-            
-            if is_overseas and usd_match:
-                try:
-                    val = float(usd_match.group(1).replace(',', ''))
-                    extracted_price = round(val * 100)
-                    if '유로' in full_title or '€' in full_title:
-                        extracted_currency = "EUR"
-                    else:
-                        extracted_currency = "USD"
-                except: pass
-            elif price_match:
-                price_str = price_match.group(1).replace(',', '')
-                if '만원' in price_str:
-                    try: extracted_price = int(float(price_str.replace('만원', '')) * 10000)
-                    except: pass
-                else:
-                    nums = re.findall(r'\d+', price_str)
-                    if nums: extracted_price = int(''.join(nums))
+        # [HOTFIX] 현재 스크래핑 중인 게시판 ID와 일치하는 게시글만 수집하도록 보정 (타 게시판 추천글/광고글 섞임 차단!)
+        if qs.get('id', [''])[0] not in self.allowed_board_ids():
+            return None
 
-            # 휴리스틱: 제목에 직구 관련 키워드가 있고 가격이 10000 이하면 USD로 간주
-            if is_overseas and extracted_currency == "KRW" and extracted_price > 0 and extracted_price <= 10000:
-                if any(kw in full_title for kw in ['알리', '코인', '큐텐', '직구', '알익']):
-                    extracted_currency = "USD"
-                    extracted_price = int(extracted_price * 100)
+        qs.pop('page', None)
+        qs.pop('divpage', None)
+        clean_href = urlunparse(parsed_href._replace(query=urlencode(qs, doseq=True)))
+        return urljoin(self.spec.base_url, clean_href)
 
-            is_closed = False
-            if '종료' in full_title or '마감' in full_title or '품절' in full_title:
-                is_closed = True
-            if title_el.select_one('del, s, strike, font[color="#999999"]'):
-                is_closed = True
-            if 'end' in title_el.get('class', []) or 'end2' in title_el.get('class', []):
-                is_closed = True
-            if row.select_one('img[src*="end_icon"]'):
-                is_closed = True
+    def finish_row(self, row, title_el, item: dict) -> Optional[dict]:
+        full_title = item["title"]
 
-            doc_id = ""
-            is_super_hotdeal = False
-            doc_id_match = re.search(r'no=([0-9]+)', href)
-            if doc_id_match:
-                doc_id = doc_id_match.group(1)
-                
-            view_count = 0
-            like_count = 0
-            for td in row.select('td.eng, td.baseList-space'):
-                txt = td.get_text(strip=True).replace(',', '')
-                if txt == doc_id:
-                    continue # 게시글 번호(ID)는 건너뜀
-                
-                if '-' in txt and len(txt) < 10: # 추천수 포맷 (예: 11 - 0)
-                    parts = txt.split('-')
-                    if parts[0].strip().isdigit():
-                        like_count = int(parts[0].strip())
-                elif txt.isdigit(): # 조회수 (게시글 번호를 제외한 숫자)
-                    view_count = int(txt)
+        # 🖼️ 썸네일: 리스트 tr 내의 이미지 태그들 중 썸네일 확률이 높은 이미지를 우선 스캐닝
+        img_td = None
+        for img in row.select('img'):
+            src = (img.get('src') or '').lower()
+            if any(x in src for x in ['_thumb', 'data3', 'noimage', 'data/']):
+                img_td = img
+                break
+        if not img_td:
+            img_td = row.select_one('td img.thumb_border') or row.select_one('img')
 
-            # CEO 지시: 뽐뿌는 hot_icon2.jpg가 있는 경우에만 슈퍼핫딜로 인정
-            if hot_icon:
-                is_super_hotdeal = True
+        if img_td and img_td.has_attr('src'):
+            image_url = absolute_url(img_td['src'], "https://www.ppomppu.co.kr")
+            # [E2E 과거 글 차단 2차 철벽 가드]: 썸네일 주소에 과거 년도가 포함된 경우 수집 원천 차단
+            # ⚠️ 현재 연도와 작년은 허용! (range 상한을 current_year - 1 로 설정하여 올해/작년 이미지 오차단 방지)
+            if "ppomppu" in image_url:
+                if any(f"/{yr}/" in image_url for yr in range(2000, datetime.now().year - 1)):
+                    logger.info(f"[뽐뿌] 이미지 내 과거 연도 감지로 수집 스킵: {full_title} ({image_url})")
+                    return None
+            # 투명 이미지, 아이콘, 노이미지 엑스박스면 비움 처리
+            if not is_placeholder_image(image_url, PLACEHOLDER_IMAGE_KEYWORDS + ('noimage',)):
+                item["image_url"] = image_url
 
-            # 인기/HOT 여부(is_super_hotdeal)는 프론트엔드 UI의 뱃지(마크) 표시용으로 사용됨
-            comment_count = 0
-            cmt_span = row.select_one('.list_comment2 span, .list_comment2, .comment_count')
-            if cmt_span:
-                cmt_txt = cmt_span.get_text(strip=True).replace('[', '').replace(']', '')
-                if cmt_txt.isdigit(): comment_count = int(cmt_txt)
+        # 조회수 / 추천수 (게시글 번호 열은 건너뜀)
+        doc_id_match = _DOC_ID_RE.search(item["url"])
+        doc_id = doc_id_match.group(1) if doc_id_match else ""
+        for td in row.select('td.eng, td.baseList-space'):
+            txt = td.get_text(strip=True).replace(',', '')
+            if txt == doc_id:
+                continue
+            if '-' in txt and len(txt) < 10:  # 추천수 포맷 (예: 11 - 0)
+                like = txt.split('-')[0].strip()
+                if like.isdigit():
+                    item["like_count"] = int(like)
+            elif txt.isdigit():
+                item["view_count"] = int(txt)
 
-            # 실제 게시글 작성 시간 추출
-            posted_at_iso = None
-            time_tds = row.select('nobr.eng, td.eng, td.baseList-time, time.baseList-time')
-            time_str = ""
-            for td in time_tds:
-                txt = td.get_text(strip=True)
-                # [버그 예방] 조회수나 큰 숫자가 든 열을 배제하여 2012년 오역 참사를 방어합니다.
-                if len(txt) > 20 or txt.isdigit():
+        # 실제 게시글 작성 시간 추출
+        for td in row.select('nobr.eng, td.eng, td.baseList-time, time.baseList-time'):
+            txt = td.get_text(strip=True)
+            # [버그 예방] 조회수나 큰 숫자가 든 열을 배제하여 2012년 오역 참사를 방어합니다.
+            if len(txt) > 20 or txt.isdigit():
+                continue
+            if ':' in txt or '/' in txt or '-' in txt:
+                # 추천수(11 - 0) 필터링
+                if _VOTE_RE.search(txt) and not _ISO_DATE_RE.search(txt):
                     continue
-                if ':' in txt or '/' in txt or '-' in txt:
-                    # 추천수(11 - 0) 필터링
-                    if re.search(r'\d+\s*-\s*\d+', txt) and not re.search(r'\d{4}-\d{2}-\d{2}', txt):
-                        continue
-                    time_str = txt
-                    break
+                item["posted_at"] = self.parse_time_str(txt)
+                break
 
-            if time_str:
-                posted_at_iso = self.parse_time_str(time_str)
+        # [과거 글 수집 원천 배제 가드]: 뽐뿌 하단의 아주 과거(2012년 등) 박제글 수집 배제
+        # ⚠️ 현재 연도와 작년은 정상 게시글이므로 차단하면 안 됨! (range 상한을 current_year - 1 로 설정)
+        posted_at_iso = item["posted_at"]
+        if posted_at_iso and any(posted_at_iso.startswith(str(yr)) for yr in range(2000, datetime.now().year - 1)):
+            logger.info(f"[뽐뿌] 아주 과거의 딜 차단 (수집 스킵): {full_title} ({posted_at_iso})")
+            return None
 
-            # [과거 글 수집 원천 배제 가드]: 뽐뿌 하단의 아주 과거(2012년 등) 박제글 수집 배제
-            # ⚠️ 현재 연도와 작년은 정상 게시글이므로 차단하면 안 됨! (range 상한을 current_year - 1 로 설정)
-            if posted_at_iso:
-                from datetime import datetime as dt
-                current_year = dt.now().year
-                if any(posted_at_iso.startswith(str(yr)) for yr in range(2000, current_year - 1)):
-                    logger.info(f"[뽐뿌] 아주 과거의 딜 차단 (수집 스킵): {full_title} ({posted_at_iso})")
-                    return None
-
-            # 제목 앞 대괄호 분류 파싱
-            scraped_category = None
-            category_match = re.match(r'^\[(.*?)\]', full_title)
-            if category_match:
-                scraped_category = category_match.group(1).strip()
-
-            return {
-                "title": full_title,
-                "url": url,
-                "price": extracted_price,
-                "currency": extracted_currency,
-                "shop_name": "",
-                "image_url": image_url,
-                "ecommerce_link": "",
-                "content_html": "",
-                "is_closed": is_closed,
-                "shipping_fee": "",
-                "is_super_hotdeal": is_super_hotdeal,
-                "posted_at": posted_at_iso,
-                "view_count": view_count,
-                "like_count": like_count,
-                "comment_count": comment_count,
-                "category": scraped_category
-            }
-            
-        tasks = [process_row(row) for row in post_rows]
-        results = await asyncio.gather(*tasks)
-        return [r for r in results if r]
+        return item
 
     async def get_detail(self, url: str, full_title: str = "") -> dict:
         """
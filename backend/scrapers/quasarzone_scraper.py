@@ -1,163 +1,101 @@
 import logging
 import re
+from typing import Optional
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from backend.scrapers.base_scraper import AsyncBaseScraper
+from backend.scrapers.spec import CLOSED_KEYWORDS, ScraperSpec
 
 logger = logging.getLogger(__name__)
 
+_USD_RE = re.compile(r'([0-9.]+)')
+_KRW_RE = re.compile(r'([0-9,]+)')
+_BG_IMAGE_RE = re.compile(r'url\((.*?)\)')
+
 class QuasarzoneScraper(AsyncBaseScraper):
+    spec = ScraperSpec(
+        base_url="https://quasarzone.com",
+        row_selector='div.market-info-type-list table tbody tr',
+        title_selectors=('a.subject-link',),
+        title_text_selector='span.ellipsis-with-reply-cnt',
+        skip_title_keywords=('게시판 규정', '이용안내', '블라인드'),
+        closed_keywords=CLOSED_KEYWORDS + ('삭제',),
+        closed_label_selector='span.label',
+        hot_min_likes=20,
+        time_selector='span.date',
+        category_selector='span.category',
+        point_category=True,
+    )
+
     def __init__(self, community_id: int):
         super().__init__("퀘이사존", max_concurrent_requests=5)
         self.community_id = community_id
         self.list_url = "https://quasarzone.com/bbs/qb_saleinfo"
 
-    async def parse_list(self, html: str) -> list[dict]:
-        """퀘이사존 게시판 리스트에서 타겟 데이터 추출"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        post_rows = soup.select('div.market-info-type-list table tbody tr')
-        import asyncio
-        async def process_row(row):
-            is_closed = False
-            label_tag = row.select_one('span.label')
-            if label_tag:
-                label_text = label_tag.get_text()
-                if '공지' in label_text:
-                    return None
-                if '종료' in label_text or '마감' in label_text:
-                    is_closed = True
-
-            title_element = row.select_one('a.subject-link')
-            if not title_element: return None
-
-            href = title_element.get('href', '')
-            if not href or href.startswith('javascript'): return None
-            
-            url = urljoin("https://quasarzone.com", href)
-            
-            title_span = title_element.select_one('span.ellipsis-with-reply-cnt')
-            full_title = title_span.get_text(strip=True) if title_span else title_element.get_text(strip=True)
+    def finish_row(self, row, title_el, item: dict) -> Optional[dict]:
+        label_el = row.select_one('span.label')
+        if label_el and '공지' in label_el.get_text():
+            return None
 
-            if "게시판 규정" in full_title or "이용안내" in full_title or "블라인드" in full_title:
-                return None
-
-            price = 0
-            currency = "KRW"
-            price_tag = row.select_one('span.text-orange')
-            if price_tag:
-                price_str = price_tag.get_text(strip=True)
-                import re
-                if '$' in price_str or 'USD' in price_str.upper() or '달러' in price_str or '불' in price_str:
-                    match = re.search(r'([0-9.]+)', price_str)
-                    if match:
-                        usd_val = float(match.group(1))
-                        price = int(usd_val * 100)
-                        currency = "USD"
-                else:
-                    # 첫 번째로 발견되는 숫자 그룹(쉼표 포함)만 추출하여 파싱하여 병합 버그 방지
-                    match = re.search(r'([0-9,]+)', price_str)
-                    if match:
-                        digits = re.sub(r'[^0-9]', '', match.group(1))
-                        if digits:
-                            price = int(digits)
-
-            image_url = ""
-            span_img = row.select_one('span.img-background-wrap')
-            if span_img and span_img.has_attr('style'):
-                import re
-                match = re.search(r'url\((.*?)\)', span_img['style'])
+        price_tag = row.select_one('span.text-orange')
+        if price_tag:
+            price_str = price_tag.get_text(strip=True)
+            if '$' in price_str or 'USD' in price_str.upper() or '달러' in price_str or '불' in price_str:
+                match = _USD_RE.search(price_str)
                 if match:
-                    image_url = match.group(1).strip()
-            
-            if not image_url:
-                img_tag = row.select_one('img')
-                if img_tag and img_tag.has_attr('src'):
-                    image_url = img_tag['src']
-
-            if image_url and not image_url.startswith('http'):
-                image_url = urljoin("https://quasarzone.com", image_url)
-            
-            if image_url.endswith('?'):
-                image_url = image_url[:-1]
-                
-            if image_url and "thumb_" in image_url:
-                image_url = image_url.replace("thumb_", "")
-                
-            category = None
-            category_span = row.select_one('span.category')
-            if category_span:
-                category = category_span.get_text(strip=True)
-
-            if any(k in full_title for k in ['적립', '출석', '출첵', '포인트']):
-                category = "적립"
-
-            if '종료' in full_title or '마감' in full_title or '품절' in full_title or '삭제' in full_title:
-                is_closed = True
-
-
-
-            # 실제 게시글 작성 시간 추출
-            posted_at_iso = None
-            time_span = row.select_one('span.date')
-            if time_span:
-                posted_at_iso = self.parse_time_str(time_span.get_text(strip=True))
-                
-            # 지표 추출
-            view_count = 0
-            like_count = 0
-            comment_count = 0
-            
-            # 퀘이사존 UI 귤(추천) 아이콘 파싱
-            tangerine_img = row.select_one('img.tangerine_icon')
-            if tangerine_img:
-                next_num = tangerine_img.find_next_sibling('span', class_='num')
-                if next_num:
                     try:
-                        like_count = int(next_num.get_text(strip=True))
-                    except:
+                        item["price"] = int(float(match.group(1)) * 100)
+                        item["currency"] = "USD"
+                    except ValueError:
                         pass
-                        
-            for count_span in row.select('span.count'):
-                try:
-                    icon = count_span.select_one('i')
-                    if icon:
-                        cls = icon.get('class', [])
-                        txt = count_span.get_text(strip=True).replace(',', '')
-                        if 'fa-eye' in cls: view_count = int(txt)
-                        elif 'fa-thumbs-up' in cls and like_count == 0: like_count = int(txt)
-                        elif 'fa-comment' in cls or 'fa-comment-dots' in cls: comment_count = int(txt)
-                except: pass
-
-            is_super_hotdeal = False
-            label_el = row.select_one('.label')
-            if label_el and '인기' in label_el.get_text(strip=True):
-                is_super_hotdeal = True
-            if like_count >= 20:
-                is_super_hotdeal = True
+            else:
+                # 첫 번째로 발견되는 숫자 그룹(쉼표 포함)만 추출하여 파싱하여 병합 버그 방지
+                match = _KRW_RE.search(price_str)
+                if match:
+                    digits = match.group(1).replace(',', '')
+                    if digits:
+                        item["price"] = int(digits)
 
-            return {
-                "category": category,
-                "title": full_title,
-                "url": url,
-                "price": price,
-                "currency": currency,
-                "shop_name": "",
-                "image_url": image_url,
-                "ecommerce_link": "",
-                "is_closed": is_closed,
-                "shipping_fee": "",
-                "is_super_hotdeal": is_super_hotdeal,
-                "posted_at": posted_at_iso,
-                "view_count": view_count,
-                "like_count": like_count,
-                "comment_count": comment_count,
-                "content_html": ""
-            }
-            
-        tasks = [process_row(row) for row in post_rows]
-        results = await asyncio.gather(*tasks)
-        return [r for r in results if r]
+        image_url = ""
+        span_img = row.select_one('span.img-background-wrap')
+        if span_img and span_img.has_attr('style'):
+            match = _BG_IMAGE_RE.search(span_img['style'])
+            if match:
+                image_url = match.group(1).strip()
+        if not image_url:
+            img_tag = row.select_one('img')
+            if img_tag and img_tag.has_attr('src'):
+                image_url = img_tag['src']
+        if image_url and not image_url.startswith('http'):
+            image_url = urljoin(self.spec.base_url, image_url)
+        if image_url.endswith('?'):
+            image_url = image_url[:-1]
+        item["image_url"] = image_url.replace("thumb_", "")
+
+        # 퀘이사존 UI 귤(추천) 아이콘 파싱
+        tangerine_img = row.select_one('img.tangerine_icon')
+        if tangerine_img:
+            next_num = tangerine_img.find_next_sibling('span', class_='num')
+            if next_num and next_num.get_text(strip=True).isdigit():
+                item["like_count"] = int(next_num.get_text(strip=True))
+
+        for count_span in row.select('span.count'):
+            icon = count_span.select_one('i')
+            if not icon:
+                continue
+            cls = icon.get('class', [])
+            txt = count_span.get_text(strip=True).replace(',', '')
+            if not txt.isdigit():
+                continue
+            count = int(txt)
+            if 'fa-eye' in cls: item["view_count"] = count
+            elif 'fa-thumbs-up' in cls and item["like_count"] == 0: item["like_count"] = count
+            elif 'fa-comment' in cls or 'fa-comment-dots' in cls: item["comment_count"] = count
+
+        label_el = row.select_one('.label')
+        if label_el and '인기' in label_el.get_text(strip=True):
+            item["is_super_hotdeal"] = True
+        return item
 
     async def get_detail(self, url: str) -> dict:
         """상세 페이지 데이터 파싱 로직"""
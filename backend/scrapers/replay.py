@@ -0,0 +1,184 @@
+"""
+🎞️ 스크래퍼 오프라인 녹화/재생(Record & Replay) 하네스
+
+- FixtureStore      : 스크래퍼별 list/detail 응답 HTML(gzip)과 og:image / 중계 링크 리다이렉트 결과를 manifest.json 으로 관리
+- RecordingTransport: 실제 네트워크 응답을 그대로 통과시키며 FixtureStore 에 저장
+- ReplayTransport   : AsyncBaseScraper.fetch_html / fetch_og_image / resolve_redirect 를 녹화된 응답으로 대체 (네트워크 접근 0회)
+
+사용법: scraper.transport = ReplayTransport(FixtureStore.for_scraper("ppomppu"))
+녹화는 scripts/record_scraper_fixtures.py 참고
+"""
+
+import gzip
+import importlib
+import json
+import logging
+import os
+import re
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures", "scrapers")
+
+# 스케줄러(scheduler/main.py)에서 사용하는 커뮤니티 키 → 스크래퍼 클래스 경로
+SCRAPER_CLASSES: Dict[str, str] = {
+    "ppomppu": "backend.scrapers.ppomppu_scraper.PpomppuScraper",
+    "quasarzone": "backend.scrapers.quasarzone_scraper.QuasarzoneScraper",
+    "fmkorea": "backend.scrapers.fmkorea_scraper.FmkoreaScraper",
+    "ruliweb": "backend.scrapers.ruliweb_scraper.RuliwebScraper",
+    "clien": "backend.scrapers.clien_scraper.ClienScraper",
+    "ali_ppomppu": "backend.scrapers.alippomppu_scraper.AlippomppuScraper",
+    "bbasak_domestic": "backend.scrapers.bbasak_domestic_scraper.BbasakDomesticScraper",
+    "bbasak_overseas": "backend.scrapers.bbasak_overseas_scraper.BbasakOverseasScraper",
+    "bbasak_parenting": "backend.scrapers.bbasak_parenting_scraper.BbasakParentingScraper",
+}
+
+
+def load_scraper_class(key: str):
+    module_path, class_name = SCRAPER_CLASSES[key].rsplit(".", 1)
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+class ReplayMiss(LookupError):
+    """녹화본에 없는 URL 요청 (재생 중 실제 네트워크로 새어나가는 것을 차단)"""
+
+
+class FixtureStore:
+    """스크래퍼 1개 분량의 녹화본 디렉토리 (manifest.json + *.html.gz)"""
+
+    KINDS = ("list", "detail")
+
+    def __init__(self, directory: str, scraper_key: str):
+        self.directory = directory
+        self.scraper_key = scraper_key
+        self.entries: List[dict] = []
+        self.og_images: Dict[str, Optional[str]] = {}
+        self.redirects: Dict[str, Optional[str]] = {}
+        self._by_url: Dict[str, dict] = {}
+        self._html_cache: Dict[str, str] = {}
+        self.load()
+
+    @classmethod
+    def for_scraper(cls, scraper_key: str, root: str = FIXTURES_ROOT) -> "FixtureStore":
+        return cls(os.path.join(root, scraper_key), scraper_key)
+
+    @staticmethod
+    def available(root: str = FIXTURES_ROOT) -> List[str]:
+        """녹화본(manifest.json)이 존재하는 스크래퍼 키 목록"""
+        if not os.path.isdir(root):
+            return []
+        return sorted(
+            name for name in os.listdir(root)
+            if os.path.exists(os.path.join(root, name, "manifest.json"))
+        )
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.directory, "manifest.json")
+
+    def load(self):
+        if not os.path.exists(self.manifest_path):
+            return
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.entries = manifest.get("entries", [])
+        self.og_images = manifest.get("og_images", {})
+        self.redirects = manifest.get("redirects", {})
+        self._by_url = {entry["url"]: entry for entry in self.entries}
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = {
+            "scraper": self.scraper_key,
+            "recorded_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "entries": self.entries,
+            "og_images": self.og_images,
+            "redirects": self.redirects,
+        }
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    def urls(self, kind: str) -> List[str]:
+        return [entry["url"] for entry in self.entries if entry["kind"] == kind]
+
+    def html(self, url: str) -> str:
+        entry = self._by_url.get(url)
+        if entry is None:
+            raise ReplayMiss(f"[{self.scraper_key}] 녹화되지 않은 URL: {url}")
+        if url not in self._html_cache:
+            with gzip.open(os.path.join(self.directory, entry["file"]), "rt", encoding="utf-8") as f:
+                self._html_cache[url] = f.read()
+        return self._html_cache[url]
+
+    def pages(self, kind: str) -> List[Tuple[str, str]]:
+        return [(url, self.html(url)) for url in self.urls(kind)]
+
+    def put(self, kind: str, url: str, html: str):
+        if kind not in self.KINDS:
+            raise ValueError(f"unknown fixture kind: {kind}")
+        entry = self._by_url.get(url)
+        if entry is None:
+            seq = sum(1 for e in self.entries if e["kind"] == kind) + 1
+            slug = re.sub(r"[^0-9A-Za-z]+", "_", url.split("://", 1)[-1])[-40:].strip("_")
+            entry = {"kind": kind, "url": url, "file": f"{kind}_{seq:03d}_{slug}.html.gz"}
+            self.entries.append(entry)
+            self._by_url[url] = entry
+        os.makedirs(self.directory, exist_ok=True)
+        with gzip.open(os.path.join(self.directory, entry["file"]), "wt", encoding="utf-8") as f:
+            f.write(html)
+        self._html_cache[url] = html
+
+
+class RecordingTransport:
+    """실제 네트워크 응답을 통과시키면서 FixtureStore 에 녹화"""
+
+    def __init__(self, store: FixtureStore):
+        self.store = store
+        self.kind = "list"
+
+    @contextmanager
+    def recording(self, kind: str):
+        previous, self.kind = self.kind, kind
+        try:
+            yield self
+        finally:
+            self.kind = previous
+
+    async def fetch(self, scraper, url: str, headers: Optional[dict], live_fetch) -> Optional[str]:
+        html = await live_fetch(url, headers)
+        if html:
+            self.store.put(self.kind, url, html)
+        return html
+
+    async def fetch_og_image(self, scraper, url: str, live_fetch) -> Optional[str]:
+        value = await live_fetch(url)
+        self.store.og_images[url] = value
+        return value
+
+    async def resolve_redirect(self, scraper, url: str, live_resolve) -> Optional[str]:
+        value = await live_resolve(url)
+        self.store.redirects[url] = value
+        return value
+
+
+class ReplayTransport:
+    """녹화본만으로 fetch_html / fetch_og_image 를 응답 (네트워크 미사용)"""
+
+    def __init__(self, store: FixtureStore):
+        self.store = store
+        self.requests: List[str] = []
+
+    async def fetch(self, scraper, url: str, headers: Optional[dict], live_fetch) -> Optional[str]:
+        self.requests.append(url)
+        return self.store.html(url)
+
+    async def fetch_og_image(self, scraper, url: str, live_fetch) -> Optional[str]:
+        # og:image 는 부가 정보이므로 녹화본이 없으면 조용히 None
+        return self.store.og_images.get(url)
+
+    async def resolve_redirect(self, scraper, url: str, live_resolve) -> Optional[str]:
+        # 중계 링크 추적도 부가 정보 (녹화본이 없으면 None → 스크래퍼는 본문 텍스트 추출로 대체)
+        return self.store.redirects.get(url)
@@ -0,0 +1,327 @@
+"""
+📐 선언형 스크래퍼 스펙(ScraperSpec) + 공용 동기 리스트 추출 엔진(SpecEngine)
+
+커뮤니티별 parse_list 가 반복하던 행 파이프라인
+(제목/링크 → 댓글수 → 썸네일 → 제목 가격 → 종료/핫딜 마크 → 작성시간 → 카테고리 → 조회/추천수)
+을 엔진 하나가 수행하고, 사이트별 차이는 ScraperSpec 의 셀렉터/플래그로만 기술합니다.
+셀렉터로 표현되지 않는 사이트 고유 로직은 스크래퍼의 list_rows / build_row_url / finish_row 훅에서 처리합니다.
+
+- CSS 셀렉터는 스펙당 1회만 soupsieve 로 컴파일하여 재사용 (행마다 셀렉터 파싱 없음)
+- 정규식은 모듈 로드 시 1회 컴파일
+- 행 처리 중 await 가 없으므로 행 단위 코루틴/asyncio.gather 없이 동기 루프로 처리
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin
+
+import soupsieve as sv
+
+from backend.scrapers.time_parser import batch_clock
+
+CLOSED_KEYWORDS = ('종료', '마감', '품절')
+POINT_KEYWORDS = ('적립', '출석', '출첵', '포인트')
+DIRECT_BUY_KEYWORDS = ('알리', '코인', '큐텐', '직구', '알익')
+# 투명 gif, 사이트 로고/아이콘 등 썸네일로 쓸 수 없는 이미지 주소 키워드
+PLACEHOLDER_IMAGE_KEYWORDS = ('transparent', 'blank', 'logo', 'icon', 'empty')
+
+_BRACKET_CATEGORY_RE = re.compile(r'^\s*\[([^\]]+)\]')
+_FOREIGN_PREFIX_RE = re.compile(r'(?:\$|USD|달러|유로|€)\s*([0-9,.]+)', re.IGNORECASE)
+_FOREIGN_SUFFIX_RE = re.compile(r'([0-9,.]+)\s*(?:\$|USD|달러|유로|€)', re.IGNORECASE)
+_KRW_RE = re.compile(r'([\d,]+)\s*(만\s*원|원)')
+_MOBILE_PLAN_RE = re.compile(r'(\d{2,3})\s*요금제')
+_COUNT_NOISE = str.maketrans('', '', ',[]()')
+
+
+@dataclass(frozen=True)
+class ScraperSpec:
+    """커뮤니티 1곳의 리스트 페이지 추출 규칙 (셀렉터는 모두 행(row) 기준 CSS)"""
+
+    base_url: str
+    row_selector: str
+    # row_selector 결과가 없을 때 시도할 구형/모바일 레이아웃 행
+    fallback_row_selector: Optional[str] = None
+    # 행 자신 또는 하위 요소가 일치하면 광고/공지로 보고 건너뜀
+    skip_row_selector: Optional[str] = None
+
+    # 제목: 앞에서부터 순서대로 시도 (우선순위), 링크는 별도 셀렉터가 없으면 제목 요소(또는 부모 a)에서
+    title_selectors: Tuple[str, ...] = ()
+    link_selector: Optional[str] = None
+    link_fallback_selector: Optional[str] = None
+    title_text_selector: Optional[str] = None
+    title_strip_pattern: Optional[str] = None
+    skip_title_keywords: Tuple[str, ...] = ()
+    strip_query: bool = False
+
+    # 댓글수: comment_in_title 이면 제목 요소 안의 배지를 읽은 뒤 제목에서 제거
+    comment_selector: Optional[str] = None
+    comment_in_title: bool = False
+
+    image_selector: Optional[str] = None
+    image_attrs: Tuple[str, ...] = ('src',)
+    image_blacklist: Tuple[str, ...] = ()
+
+    # 제목 가격 파싱 / 외화(USD·EUR) 인식 및 직구 키워드 휴리스틱 / "59요금제" 폴백
+    title_price: bool = False
+    foreign_currency: bool = False
+    mobile_plan_price: bool = False
+
+    closed_keywords: Tuple[str, ...] = CLOSED_KEYWORDS
+    closed_selector: str = 'del, s, strike'
+    closed_title_classes: Tuple[str, ...] = ()
+    closed_row_selector: Optional[str] = None
+    closed_label_selector: Optional[str] = None
+
+    # 핫딜 마크: 행 자신 또는 하위 요소 일치, 또는 추천/조회수 임계값
+    hot_selector: Optional[str] = None
+    hot_min_likes: Optional[int] = None
+    hot_min_views: Optional[int] = None
+
+    time_selector: Optional[str] = None
+    time_attr: Optional[str] = None
+
+    category_selector: Optional[str] = None
+    category_from_title: bool = False
+    point_category: bool = False
+    default_category: Optional[str] = None
+
+    view_selector: Optional[str] = None
+    like_selector: Optional[str] = None
+
+
+def parse_count(text: str) -> int:
+    """'1,234' / '[12]' / '(3)' / '추천 5' 형태의 지표 숫자 파싱 (실패 시 0)"""
+    text = text.translate(_COUNT_NOISE).replace('추천', '').strip()
+    return int(text) if text.isdigit() else 0
+
+
+def absolute_url(src: str, base_url: str) -> str:
+    if src.startswith('//'):
+        return "https:" + src
+    if not src.startswith('http'):
+        return urljoin(base_url, src)
+    return src
+
+
+def is_placeholder_image(url: str, blacklist: Tuple[str, ...] = PLACEHOLDER_IMAGE_KEYWORDS) -> bool:
+    lower = url.lower()
+    return any(x in lower for x in blacklist) or url.startswith('data:') or 'base64' in lower
+
+
+def extract_title_price(title: str, foreign_currency: bool = False, mobile_plan: bool = False) -> Tuple[int, str]:
+    """
+    제목의 가격 표기를 (가격, 통화)로 변환
+    - 외화는 센트 단위 정수 (예: $12.99 -> 1299, USD)
+    - 원화는 '15,900원', '3만원' 형태, mobile_plan 이면 '59요금제' -> 59000
+    """
+    if foreign_currency:
+        match = _FOREIGN_PREFIX_RE.search(title) or _FOREIGN_SUFFIX_RE.search(title)
+        if match:
+            try:
+                price = round(float(match.group(1).replace(',', '')) * 100)
+            except ValueError:
+                return 0, "KRW"
+            return price, ("EUR" if '유로' in title or '€' in title else "USD")
+
+    price = 0
+    match = _KRW_RE.search(title)
+    if match:
+        digits = match.group(1).replace(',', '')
+        if digits:
+            price = int(digits) * (1 if match.group(2) == '원' else 10000)
+
+    if price == 0 and mobile_plan:
+        plan_match = _MOBILE_PLAN_RE.search(title)
+        if plan_match:
+            price = int(plan_match.group(1)) * 1000
+    return price, "KRW"
+
+
+def apply_direct_buy_heuristic(title: str, price: int, currency: str) -> Tuple[int, str]:
+    """휴리스틱: 제목에 직구 관련 키워드가 있고 원화 가격이 10000 이하면 USD(센트)로 간주"""
+    if currency == "KRW" and 0 < price <= 10000 and any(kw in title for kw in DIRECT_BUY_KEYWORDS):
+        return int(price * 100), "USD"
+    return price, currency
+
+
+def _compile(selector: Optional[str]):
+    return sv.compile(selector) if selector else None
+
+
+class SpecEngine:
+    """ScraperSpec 1개에 대해 셀렉터를 미리 컴파일해 둔 동기 추출기 (SpecEngine.for_spec 으로 공유)"""
+
+    def __init__(self, spec: ScraperSpec):
+        self.spec = spec
+        self.row = _compile(spec.row_selector)
+        self.fallback_row = _compile(spec.fallback_row_selector)
+        self.skip_row = _compile(spec.skip_row_selector)
+        self.titles = [sv.compile(sel) for sel in spec.title_selectors]
+        self.link = _compile(spec.link_selector)
+        self.link_fallback = _compile(spec.link_fallback_selector)
+        self.title_text = _compile(spec.title_text_selector)
+        self.title_strip = re.compile(spec.title_strip_pattern) if spec.title_strip_pattern else None
+        self.comment = _compile(spec.comment_selector)
+        self.image = _compile(spec.image_selector)
+        self.closed = _compile(spec.closed_selector)
+        self.closed_row = _compile(spec.closed_row_selector)
+        self.closed_label = _compile(spec.closed_label_selector)
+        self.hot = _compile(spec.hot_selector)
+        self.time = _compile(spec.time_selector)
+        self.category = _compile(spec.category_selector)
+        self.view = _compile(spec.view_selector)
+        self.like = _compile(spec.like_selector)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def for_spec(spec: ScraperSpec) -> "SpecEngine":
+        return SpecEngine(spec)
+
+    @staticmethod
+    def _matches(compiled, row) -> bool:
+        return compiled.match(row) or compiled.select_one(row) is not None
+
+    def select_rows(self, soup) -> list:
+        rows = self.row.select(soup)
+        if not rows and self.fallback_row is not None:
+            rows = self.fallback_row.select(soup)
+        return rows
+
+    def extract(self, soup, scraper) -> List[dict]:
+        deals = []
+        # 한 페이지의 상대 시간("N분 전")은 같은 기준 시각으로 계산
+        with batch_clock():
+            for row in scraper.list_rows(soup):
+                item = self.extract_row(row, scraper)
+                if item:
+                    deals.append(item)
+        return deals
+
+    def extract_row(self, row, scraper) -> Optional[dict]:
+        spec = self.spec
+        if self.skip_row is not None and self._matches(self.skip_row, row):
+            return None
+
+        title_el = None
+        for compiled in self.titles:
+            title_el = compiled.select_one(row)
+            if title_el is not None:
+                break
+        if title_el is None:
+            return None
+
+        if self.link is not None:
+            link_el = self.link.select_one(row)
+        else:
+            link_el = title_el if title_el.has_attr('href') else title_el.find_parent('a')
+        if (link_el is None or not link_el.get('href')) and self.link_fallback is not None:
+            link_el = self.link_fallback.select_one(row)
+        href = link_el.get('href', '') if link_el is not None else ''
+        if not href or href.startswith('javascript'):
+            return None
+
+        comment_count = 0
+        if self.comment is not None:
+            if spec.comment_in_title:
+                for badge in self.comment.select(title_el):
+                    count = parse_count(badge.get_text(strip=True))
+                    if count:
+                        comment_count = count
+                    badge.decompose()
+            else:
+                badge = self.comment.select_one(row)
+                if badge is not None:
+                    comment_count = parse_count(badge.get_text(strip=True))
+
+        text_el = self.title_text.select_one(title_el) if self.title_text is not None else None
+        full_title = (text_el or title_el).get_text(strip=True)
+        if self.title_strip is not None:
+            full_title = self.title_strip.sub('', full_title).strip()
+        if not full_title or any(kw in full_title for kw in spec.skip_title_keywords):
+            return None
+
+        url = scraper.build_row_url(href)
+        if not url:
+            return None
+
+        image_url = ""
+        if self.image is not None:
+            img = self.image.select_one(row)
+            if img is not None:
+                src = next((img.get(attr) for attr in spec.image_attrs if img.get(attr)), "")
+                if src:
+                    image_url = absolute_url(src, spec.base_url)
+                    if is_placeholder_image(image_url, spec.image_blacklist):
+                        image_url = ""
+
+        price, currency = 0, "KRW"
+        if spec.title_price:
+            price, currency = extract_title_price(full_title, spec.foreign_currency, spec.mobile_plan_price)
+
+        is_closed = (
+            any(kw in full_title for kw in spec.closed_keywords)
+            or 'line-through' in title_el.get('style', '')
+            or self.closed.select_one(title_el) is not None
+            or any(cls in (title_el.get('class') or []) for cls in spec.closed_title_classes)
+            or (self.closed_row is not None and self.closed_row.select_one(row) is not None)
+            or (self.closed_label is not None and any(
+                kw in label.get_text() for label in self.closed_label.select(row) for kw in spec.closed_keywords))
+        )
+
+        posted_at = None
+        if self.time is not None:
+            time_el = self.time.select_one(row)
+            if time_el is not None:
+                posted_at = scraper.parse_time_str(
+                    (spec.time_attr and time_el.get(spec.time_attr)) or time_el.get_text(strip=True))
+
+        category = None
+        if self.category is not None:
+            category_el = self.category.select_one(row)
+            if category_el is not None:
+                category = category_el.get_text(strip=True)
+        elif spec.category_from_title:
+            category_match = _BRACKET_CATEGORY_RE.search(full_title)
+            if category_match:
+                category = category_match.group(1).strip()
+        if spec.point_category and any(k in full_title for k in POINT_KEYWORDS):
+            category = "적립"
+        if not category and spec.default_category:
+            category = spec.default_category
+
+        view_el = self.view.select_one(row) if self.view is not None else None
+        like_el = self.like.select_one(row) if self.like is not None else None
+
+        item = {
+            "title": full_title,
+            "url": url,
+            "price": price,
+            "currency": currency,
+            "shop_name": "",
+            "image_url": image_url,
+            "ecommerce_link": "",
+            "content_html": "",
+            "is_closed": bool(is_closed),
+            "shipping_fee": "",
+            "is_super_hotdeal": self.hot is not None and self._matches(self.hot, row),
+            "posted_at": posted_at,
+            "view_count": parse_count(view_el.get_text(strip=True)) if view_el is not None else 0,
+            "like_count": parse_count(like_el.get_text(strip=True)) if like_el is not None else 0,
+            "comment_count": comment_count,
+            "category": category,
+        }
+
+        item = scraper.finish_row(row, title_el, item)
+        if item is None:
+            return None
+
+        # 훅에서 채운 지표/가격까지 반영한 뒤 공통 후처리
+        if spec.hot_min_likes is not None and item["like_count"] >= spec.hot_min_likes:
+            item["is_super_hotdeal"] = True
+        if spec.hot_min_views is not None and item["view_count"] >= spec.hot_min_views:
+            item["is_super_hotdeal"] = True
+        if spec.foreign_currency:
+            item["price"], item["currency"] = apply_direct_buy_heuristic(item["title"], item["price"], item["currency"])
+        return item
@@ -0,0 +1,162 @@
+"""
+⏱️ 게시글 작성 시간 문자열 파서 (AsyncBaseScraper.parse_time_str 의 구현부)
+
+- 정규식은 모듈 로드 시 1회 컴파일, 형식 판별은 규칙 테이블(_RULES)을 위에서부터 한 번만 훑음
+- batch_clock() 블록 안에서는 "분 전"/"시간 전"/"14:20" 등 상대 시간을 하나의 기준 시각(now)으로 계산하고,
+  같은 문자열(예: 한 페이지에 반복되는 "10-17")은 결과를 재사용
+- 결과는 기존과 동일하게 KST 기준 시각을 UTC 로 바꾼 "YYYY-MM-DDTHH:MM:SSZ"
+"""
+
+import logging
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))
+# 미래 시각으로 파싱되면 어제/작년 글로 간주하는 허용 오차
+_FUTURE_TOLERANCE = timedelta(hours=1)
+
+_MINUTES_RE = re.compile(r'(\d+)\s*분')
+_HOURS_RE = re.compile(r'(\d+)\s*시간')
+# 2024.04.28 or 24/04/28 12:34:56 (세 개의 날짜 세그먼트)
+_DATE3_RE = re.compile(r'(\d{2,4})[/.-](\d{1,2})[/.-](\d{1,2})(?:\s+(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?')
+# 06.02 or 06/02 12:34:56 (두 개의 날짜 세그먼트, 연도 생략)
+_DATE2_RE = re.compile(r'(?<!\d)(\d{1,2})[/.-](\d{1,2})(?:\s+(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?')
+# 한국어 날짜 형식: "6월 1일" 또는 "2024년 6월 1일 15:30"
+_KOR_DATE_RE = re.compile(r'(?:(\d{2,4})년\s*)?(\d{1,2})월\s*(\d{1,2})일(?:\s+(\d{1,2})[:시]\s*(\d{1,2})(?:분)?)?')
+
+
+class _Batch:
+    __slots__ = ("now", "results")
+
+    def __init__(self, now: datetime):
+        self.now = now
+        self.results: Dict[str, Optional[str]] = {}
+
+
+_current_batch: ContextVar[Optional[_Batch]] = ContextVar("time_parser_batch", default=None)
+
+
+@contextmanager
+def batch_clock(now: Optional[datetime] = None):
+    """블록 안의 parse_time_str 호출이 같은 기준 시각(KST)과 결과 캐시를 공유하도록 고정"""
+    token = _current_batch.set(_Batch(now.astimezone(KST) if now else datetime.now(KST)))
+    try:
+        yield
+    finally:
+        _current_batch.reset(token)
+
+
+def _int(value: Optional[str]) -> int:
+    return int(value) if value else 0
+
+
+def _calendar(y: int, month: int, d: int, h: int, m_val: int, s_val: int, now: datetime) -> Optional[datetime]:
+    if not (1 <= month <= 12 and 1 <= d <= 31):
+        return None
+    try:
+        posted = datetime(y, month, d, h, m_val, s_val, tzinfo=KST)
+    except ValueError:
+        return None
+    if posted > now + _FUTURE_TOLERANCE:
+        try:
+            posted = posted.replace(year=posted.year - 1)
+        except ValueError:
+            pass  # 작년에 없는 2/29 는 그대로 둠
+    return posted
+
+
+def _minutes_ago(text: str, now: datetime) -> Optional[datetime]:
+    match = _MINUTES_RE.search(text)
+    return now - timedelta(minutes=int(match.group(1))) if match else None
+
+
+def _hours_ago(text: str, now: datetime) -> Optional[datetime]:
+    match = _HOURS_RE.search(text)
+    return now - timedelta(hours=int(match.group(1))) if match else None
+
+
+def _just_now(text: str, now: datetime) -> Optional[datetime]:
+    return now
+
+
+def _clock_time(text: str, now: datetime) -> Optional[datetime]:
+    # 14:20 or 14:20:10 (오늘 날짜, 미래면 어제로 간주)
+    parts = text.split(':')
+    h, m = int(parts[0]), int(parts[1])
+    s = int(parts[2]) if len(parts) > 2 else 0
+    posted = now.replace(hour=h, minute=m, second=s, microsecond=0)
+    if posted > now + _FUTURE_TOLERANCE:
+        posted -= timedelta(days=1)
+    return posted
+
+
+def _date(text: str, now: datetime) -> Optional[datetime]:
+    match = _DATE3_RE.search(text)
+    if match:
+        y = int(match.group(1))
+        if y < 100: y += 2000
+        # 혹시 파싱 오류로 2012년 등이 되면 올해로 자동 교정 (안전망)
+        if y < 2020: y = now.year
+        return _calendar(y, int(match.group(2)), int(match.group(3)),
+                         _int(match.group(4)), _int(match.group(5)), _int(match.group(6)), now)
+
+    match = _DATE2_RE.search(text)
+    if match:
+        return _calendar(now.year, int(match.group(1)), int(match.group(2)),
+                         _int(match.group(3)), _int(match.group(4)), _int(match.group(5)), now)
+
+    match = _KOR_DATE_RE.search(text)
+    if match:
+        y = now.year
+        if match.group(1):
+            y = int(match.group(1))
+            if y < 100: y += 2000
+        return _calendar(y, int(match.group(2)), int(match.group(3)),
+                         _int(match.group(4)), _int(match.group(5)), 0, now)
+    return None
+
+
+# (판별 조건, 변환기) — 위에서부터 처음 조건을 만족하는 규칙 하나만 적용
+_RULES = (
+    (lambda t: '분 전' in t or '분전' in t, _minutes_ago),
+    (lambda t: '시간 전' in t or '시간전' in t, _hours_ago),
+    (lambda t: '방금' in t, _just_now),
+    (lambda t: ':' in t and not ('/' in t or '-' in t or '.' in t), _clock_time),
+    (lambda t: True, _date),
+)
+
+
+def _parse(text: str, now: datetime) -> Optional[str]:
+    try:
+        for matches, convert in _RULES:
+            if matches(text):
+                posted = convert(text, now)
+                break
+        if posted:
+            # Android가 완벽히 파싱할 수 있도록 Z 부착
+            return posted.astimezone(timezone.utc).replace(tzinfo=None).isoformat(timespec='seconds') + "Z"
+    except Exception as e:
+        logger.warning(f"시간 파싱 실패 '{text}': {e}")
+    return None
+
+
+def parse_time_str(time_str: str, now: Optional[datetime] = None) -> Optional[str]:
+    """다양한 형식의 시간 문자열을 UTC ISO 8601 형식(시간대 오프셋 제거)으로 변환"""
+    if not time_str:
+        return None
+    text = time_str.strip()
+
+    if now is not None:
+        return _parse(text, now.astimezone(KST))
+
+    batch = _current_batch.get()
+    if batch is None:
+        return _parse(text, datetime.now(KST))
+    if text not in batch.results:
+        batch.results[text] = _parse(text, batch.now)
+    return batch.results[text]
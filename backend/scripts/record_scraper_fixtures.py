@@ -0,0 +1,62 @@
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+# 환경 셋업
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(root_dir))
+
+from backend.scrapers.replay import SCRAPER_CLASSES, FixtureStore, RecordingTransport, load_scraper_class
+
+logger = logging.getLogger(__name__)
+
+
+async def record_scraper(key: str, pages: int, details: int):
+    """커뮤니티 1곳의 리스트 N페이지 + 상세 M건을 실제 네트워크로 긁으며 녹화"""
+    store = FixtureStore.for_scraper(key)
+    transport = RecordingTransport(store)
+    scraper = load_scraper_class(key)(community_id=0)
+
+    async with scraper:
+        scraper.transport = transport
+        items = []
+        for page in range(1, pages + 1):
+            html = await scraper.fetch_html(scraper.page_url(page))
+            if html:
+                items.extend(await scraper.parse_list(html))
+
+        with transport.recording("detail"):
+            for item in items[:details]:
+                try:
+                    await scraper.get_detail(item["url"])
+                except Exception as e:
+                    logger.warning(f"[{key}] 상세 녹화 실패 ({item['url']}): {e}")
+
+    store.save()
+    logger.info(f"🎞️ [{key}] 녹화 완료: list {len(store.urls('list'))}건, detail {len(store.urls('detail'))}건 -> {store.directory}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="스크래퍼 오프라인 재생용 응답 녹화")
+    parser.add_argument("scrapers", nargs="*", default=list(SCRAPER_CLASSES), help="녹화할 커뮤니티 키 (기본: 전체)")
+    parser.add_argument("--pages", type=int, default=1, help="리스트 페이지 수")
+    parser.add_argument("--details", type=int, default=5, help="녹화할 상세 페이지 수")
+    args = parser.parse_args()
+
+    # 차단 방지를 위해 커뮤니티는 순차 녹화 (한 곳이 실패해도 나머지는 계속)
+    failed = []
+    for key in args.scrapers:
+        try:
+            await record_scraper(key, args.pages, args.details)
+        except Exception as e:
+            failed.append(key)
+            logger.error(f"❌ [{key}] 녹화 실패: {e}")
+    if failed:
+        sys.exit(f"녹화 실패: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    asyncio.run(main())
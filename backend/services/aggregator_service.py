@@ -1,39 +1,261 @@
+import asyncio
 import os
+import threading
 import logging
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 from datetime import datetime, timezone
-from backend.database.models import Deal, PriceHistory, Community
+from backend.database.models import Deal, DealReaction, PriceHistory, Community
 from backend.services.normalizer.llm_normalizer import LlmNormalizer
 from backend.services.ai_product_name_service import AIProductNameService
+from backend.core.metrics import pipeline_metrics
+from backend.core.price_extractor import extract_title_price
+from backend.services.ai_split_cache import ai_split_cache, split_cache_key
+from backend.services.category_price_stats import category_price_stats
+from backend.services.ingest_records import DedupResult, EnrichedDeal, NormalizedDeal, ParsedDeal, PersistResult
+from backend.services.deal_token_index import core_tokens, deal_token_index, title_tokens
+from backend.services.merge_policy import IncomingDeal, merge_deal
+from backend.services.price_history_recorder import PriceHistoryRecorder
 import re
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+def normalize_shipping_fee(shipping_fee, raw_title: str):
+    """제목의 무료배송 표기 반영 + 배송비 문자열 정리 (공백 압축, 0원/무배 → 무료배송)"""
+    if "무배" in raw_title or "무료배송" in raw_title or "무료" in raw_title: 
+        shipping_fee = "무료배송"
+    
+    if shipping_fee:
+        sf_str = str(shipping_fee).strip()
+        # 텍스트 내의 다중 공백, 탭, 줄바꿈 등을 하나의 공백으로 압축하여 프론트엔드 UI 깨짐 방지
+        sf_str = re.sub(r'\s+', ' ', sf_str)
+        if sf_str in ["0", "0원", "무료", "무배", "무료배송", "臾대즺", "臾대같"]:
+            shipping_fee = "무료배송"
+        elif re.match(r'^(0원?|무료|무배|臾대즺|臾대같)\s*(/|\+)', sf_str):
+            shipping_fee = re.sub(r'^(0원?|무료|무배|臾대즺|臾대같)\s*', '무료배송 ', sf_str)
+        else:
+            shipping_fee = sf_str
+    return shipping_fee
+
+
+def sanitize_price(price: int, currency: str) -> int:
+    """원화 기준 비정상 가격(100원 미만 적립금/500만원 초과 상품코드 오인식)은 0 으로 보정"""
+    # 산술/논리 검증: 원화(KRW) 기준 터무니없이 낮은 가격(예: 100원 미만)은 추출 오류나 적립금액(53원 등)일 확률이 높으므로 0으로 보정
+    if currency == "KRW" and price > 0 and price < 100:
+        logger.info(f"[Warning] 가격 비정상 감지 ({price}원). 오류 또는 포인트성 숫자로 간주하여 0원으로 초기화.")
+        return 0
+    # 상한선 검증: 너무 터무니없이 높은 가격(예: 500만원 초과)은 상품 코드가 잘못 파싱된 경우일 확률이 높으므로 0으로 보정
+    if currency == "KRW" and price > 5000000:
+        logger.info(f"[Warning] 가격 비정상 감지 ({price}원). 오류 또는 상품코드로 간주하여 0원으로 초기화.")
+        return 0
+    return price
+
+
+# 🚨 스팸 및 공지사항 / 게시판 뻘글 필터링 키워드
+SPAM_KEYWORDS = ["공지", "질문", "투패", "몰테일", "폐업", "출고", "지연", "지쟈스", "배대지", "안내", "도와주세요", "어떤가요", "입고금지", "수익링크", "바이럴", "금지조치", "활동내역", "제재조치"]
+
+
+def is_spam_title(raw_title: str, price: int) -> bool:
+    return any(keyword in raw_title for keyword in SPAM_KEYWORDS) or (price == 0 and "?" in raw_title)
+
+
+def extract_price_options(content_html: str) -> List[dict]:
+    """[Auto-Skill Swarm Maximum Activated] AI 할당량 소진 대비 본문 가격 줄 정규식 추출 (모음전 옵션 Fallback)"""
+    extracted_options = []
+    if not content_html:
+        return extracted_options
+    try:
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(content_html, 'html.parser')
+        text_lines = soup.get_text(separator='\n').split('\n')
+        seen_prices = set()
+        for line in text_lines:
+            line = line.strip()
+            if '원' in line or '달러' in line or '$' in line or '유로' in line or '€' in line:
+                nums = re.findall(r'\b\d{1,3}(?:,\d{3})+\b|\b\d{4,}\b', line)
+                for num_str in nums:
+                    val = int(num_str.replace(',', ''))
+                    if val > 1000:
+                        if val not in seen_prices:
+                            seen_prices.add(val)
+                            name = line[:40].strip()
+                            extracted_options.append({"name": name, "price": val})
+    except Exception as e:
+        logger.error(f"Regex options extraction failed: {e}")
+    return extracted_options
+
+
+def probe_shop_meta_price(target_url: str) -> int:
+    """[Phase 6] 쇼핑몰 메타태그 직공 (블로킹 HTTP, 실패 시 0)"""
+    import urllib.request
+    from bs4 import BeautifulSoup
+
+    try:
+        logger.info(f"[Spider] 정규식 실패. 쇼핑몰({target_url})에 직접 침투하여 메타태그 스나이핑 시도...")
+        req = urllib.request.Request(target_url, headers={'User-Agent': 'Mozilla/5.0'})
+        with urllib.request.urlopen(req, timeout=3) as res:
+            soup = BeautifulSoup(res.read(), 'html.parser')
+            # og:price:amount, itemprop=price 등 표준 마크업 탐색
+            meta_price = soup.find('meta', property='product:price:amount') or soup.find('meta', property='og:price:amount')
+            if meta_price and meta_price.get('content'):
+                price = int(float(meta_price['content'].replace(',', '')))
+                logger.info(f"[Hit] 쇼핑몰 메타태그에서 가격 적중! {price}원")
+                return price
+    except Exception as e:
+        logger.debug(f"쇼핑몰 메타 스나이핑 실패: {e}")
+    return 0
+
+
+# 다른 딜로 흡수된 빠른 등록 행의 post_link 표시 (뒤에 흡수한 딜 ID) → 중복/병합 판별에서 제외
+MERGED_REDIRECT_MARK = "#merged-into-"
+
+
+# 적립/포인트 강제 보정 (사용자 요청: 적립 탭으로 분리)
+EVENT_KEYWORDS = ["추첨", "설문", "무료배포", "체험단", "선착순", "라이브", "방송", "라방"]
+POINT_KEYWORDS = ["적립", "포인트", "페이백", "앱테크"]
+# 순수 적립이 아닌 구매/조건부 쇼핑을 걸러내기 위한 금지어
+NOT_POINT_KEYWORDS = ["결제", "구매", "이상", "슈퍼적립", "혜택", "사은품", "증정", "할인"]
+
+
+def correct_category(category: str, raw_title: str, price: int, community_id: int) -> str:
+    """루리웹(10), 퀘이사존(8) 글의 적립/이벤트 카테고리 강제 보정"""
+    check_title = raw_title.replace("드라이브", "")
+
+    is_event = any(kw in check_title for kw in EVENT_KEYWORDS)
+    is_point = False
+
+    if any(kw in check_title for kw in POINT_KEYWORDS) and not any(kw in check_title for kw in NOT_POINT_KEYWORDS):
+        # 사용자가 명시한 대로, "적립" 카테고리는 100원 이하(또는 0원)일 때만 순수 적립(앱테크)으로 취급
+        if price <= 100:
+            is_point = True
+
+    # '적립'이나 '페이백'이 있어도 일반적인 라이브 방송 상품 판매 예고면 포인트(적립)가 아니라 이벤트로 처리
+    # 단, 가격이 100원 이하인 소액 적립(라이브 시청 보상 등)은 예외로 '적립' 유지
+    if is_point and any(kw in check_title for kw in ["라이브", "예고", "방송", "라방"]):
+        if price > 100:
+            is_point = False
+            is_event = True
+
+    if not is_event and "예고" in check_title:
+        if price <= 1000:
+            is_event = True
+
+    if "무료" in check_title and "배송" not in check_title and "무배" not in check_title and "택배" not in check_title:
+        if price == 0:
+            is_event = True
+
+    if community_id in [8, 10]:
+        if is_point:
+            return "적립"
+        if is_event:
+            return "이벤트"
+    return category
+
+
+def parse_posted_at(posted_at_iso: Optional[str]) -> Optional[datetime]:
+    """[Phase 12] 실제 게시글 작성 시간 (스크래핑 시점이 아닌 실제 업로드 시점, UTC 보정)"""
+    if not posted_at_iso:
+        return None
+    try:
+        posted_dt = datetime.fromisoformat(posted_at_iso.replace("Z", "+00:00"))
+    except Exception:
+        return None
+    # Ensure datetime has UTC timezone info before storing
+    if posted_dt.tzinfo is None:
+        posted_dt = posted_dt.replace(tzinfo=timezone.utc)
+    return posted_dt
+
+
+# 프로세스 전역 정규화기 (Gemini 클라이언트 구성/정규식 사전 컴파일을 아이템마다 반복하지 않음)
+_shared_normalizer: Optional[LlmNormalizer] = None
+_normalizer_lock = threading.Lock()
+
+
+def shared_normalizer() -> LlmNormalizer:
+    global _shared_normalizer
+    if _shared_normalizer is None:
+        with _normalizer_lock:
+            if _shared_normalizer is None:
+                _shared_normalizer = LlmNormalizer()
+    return _shared_normalizer
+
+
+# 커뮤니티 ID → 이름 캐시 (커뮤니티 메타데이터는 운영 중 사실상 바뀌지 않음)
+_community_names: dict = {}
+
+
+def community_name_for(db: Session, community_id: int) -> str:
+    name = _community_names.get(community_id)
+    if name is None:
+        community = db.query(Community.name).filter(Community.id == community_id).first()
+        if community is None:
+            return ""  # 없는 ID 는 캐시하지 않음 (이후 등록되면 반영)
+        name = _community_names[community_id] = community.name
+    return name
+
+
 class AggregatorService:
     """
     🔗 스크래핑 결과(Deal)를 정규화하여 DB의 Deal과 매칭 및 병합하는 연동 레이어
     지능형 업서트(Upsert)와 가격 역사(Price History) 추적 로직이 포함됩니다.
     """
     
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Optional[Session] = None, normalizer: Optional[LlmNormalizer] = None):
         self.db = db_session
-        self.normalizer = LlmNormalizer()
-
-
-    async def process_scraped_deal(self, community_id: int, scraped_data: dict) -> Deal:
+        self.normalizer = normalizer or shared_normalizer()
+        self.price_history = PriceHistoryRecorder()
+
+    def bind(self, db_session: Session) -> "AggregatorService":
+        """
+        작업 단위(아이템 1건)마다 세션만 교체하여 재사용 (수집 워커당 1개 인스턴스)
+        ⚠️ 같은 인스턴스를 동시에 도는 코루틴끼리 공유하지 말 것 (self.db 가 await 사이에 바뀜)
+        """
+        self.db = db_session
+        return self
+
+
+    async def process_scraped_deal(self, community_id: int, scraped_data: dict, placeholder: Optional[Deal] = None) -> Deal:
+        """
+        수집 글 1건 정규화 + 병합/신규 등록 (parse → normalize → dedup → enrich → persist → notify)
+        - placeholder: 빠른 등록(insert_listing)으로 먼저 피드에 올라간 행. 중복 판별에서 제외하고,
+          다른 딜로 병합되면 종료된 리다이렉트 행으로 남기고, 신규면 그 행을 채워 넣음 (ID/피드 위치 유지)
+        """
+        with pipeline_metrics.timer("ingest_stage_seconds", label="parse"):
+            parsed = await self.parse_stage(community_id, scraped_data)
+        if parsed is None:
+            return None
+        with pipeline_metrics.timer("ingest_stage_seconds", label="normalize"):
+            normalized = await self.normalize_stage(parsed)
+        return await self._process_normalized(normalized, placeholder)
+
+    async def _process_normalized(self, normalized: NormalizedDeal, placeholder: Optional[Deal] = None) -> Optional[Deal]:
+        with pipeline_metrics.timer("ingest_stage_seconds", label="dedup"):
+            dedup = self.dedup_stage(normalized, placeholder)
+        if not dedup.is_new:
+            with pipeline_metrics.timer("ingest_stage_seconds", label="persist"):
+                return self.merge_stage(normalized, dedup, placeholder).primary
+        with pipeline_metrics.timer("ingest_stage_seconds", label="enrich"):
+            enriched = await self.enrich_stage(normalized, dedup)
+        with pipeline_metrics.timer("ingest_stage_seconds", label="persist"):
+            result = self.insert_stage(normalized, dedup, enriched, placeholder)
+        with pipeline_metrics.timer("ingest_stage_seconds", label="notify"):
+            self.notify_stage(result)
+        logger.debug(f"[Merge Complete] Deal analysis and DB merge completed: {len(result.deals)} inserted")
+        return result.primary
+
+    # ------------------------------------------------------------------ parse
+    async def parse_stage(self, community_id: int, scraped_data: dict) -> Optional[ParsedDeal]:
+        """제목 정규식/스크래퍼 값으로 가격·통화·배송비 확정, 스팸이면 None"""
         raw_title = scraped_data.get("title", "")
         provided_price = scraped_data.get("price", 0)
         url = scraped_data.get("url", "")
-        shop_name = scraped_data.get("shop_name", "")
-        image_url = scraped_data.get("image_url", "")
-        
-        community = self.db.query(Community).filter(Community.id == community_id).first()
-        community_name = community.name if community else ""
-        
+
+        community_name = community_name_for(self.db, community_id)
+
         # 0. 정규식 파서를 통한 1차 정보 완전 추출
         is_closed = scraped_data.get("is_closed", False) or "종료" in raw_title or "마감" in raw_title or "품절" in raw_title
-        
+
         # 기본 배송비는 스크래퍼가 제공한 값이나 '정보 없음'
         shipping_fee = scraped_data.get("shipping_fee")
         if not shipping_fee:
@@ -41,60 +263,16 @@ class AggregatorService:
 
         final_price = 0
         currency = "KRW"
-        
-        title_price = 0
-        title_currency = "KRW"
-        
-        # 1. 괄호 속 달러/유로/원 우선 파싱
-        match = re.search(r'\(\s*\$?\s*((?:[\d,]+|[\d,]*\.[\d]+)(?:원|달러|유로|€)?)(?:\s*/\s*([^\)]*))?\)', raw_title)
-        if match:
-            extracted_price = match.group(1).replace(',', '')
-            if '달러' in extracted_price or '.' in extracted_price or '$' in match.group(0):
-                title_currency = "USD"
-                extracted_price = extracted_price.replace('달러', '').replace('$', '').strip()
-                if extracted_price.replace('.', '', 1).isdigit():
-                    title_price = round(float(extracted_price) * 100)
-            elif '유로' in extracted_price or '€' in match.group(0):
-                title_currency = "EUR"
-                extracted_price = extracted_price.replace('유로', '').replace('€', '').strip()
-                if extracted_price.replace('.', '', 1).isdigit():
-                    title_price = round(float(extracted_price) * 100)
-            else:
-                extracted_price = extracted_price.replace('원', '')
-                if extracted_price.isdigit(): title_price = int(extracted_price)
-            if match.group(2):
-                shipping_raw = match.group(2).lower()
-                if '무료' in shipping_raw or '무배' in shipping_raw or 'fs' in shipping_raw or 'free' in shipping_raw:
-                    shipping_fee = "무료배송"
-
-        # 2. 괄호 외 만/원/달러/유로 파싱
-        if title_price == 0:
-            title_currency = "KRW"
-            match_man = re.search(r'([\d,]*\.[\d]+|[\d,]+)만(?!\s*(원\s*)?(할인|적립|쿠폰|캐시백|이상|권))', raw_title)
-            if match_man:
-                title_price = int(float(match_man.group(1).replace(',', '')) * 10000)
-            else:
-                match_won = re.search(r'(?<![+\-])(?<!\d\s~\s)(?<!~\s)([0-9,]{3,})\s*원(?!\s*(할인|적립|쿠폰|캐시백|이상|권))', raw_title)
-                if match_won:
-                    title_price = int(match_won.group(1).replace(',', ''))
-                else:
-                    match_dollar = re.search(r'\$\s*([0-9,]+(?:\.[0-9]+)?)|([0-9,]+(?:\.[0-9]+)?)\s*달러', raw_title)
-                    if match_dollar: 
-                        title_currency = "USD"
-                        val = match_dollar.group(1) or match_dollar.group(2)
-                        title_price = round(float(val.replace(',', '')) * 100)
-                    else:
-                        match_euro = re.search(r'€\s*([0-9,]+(?:\.[0-9]+)?)|([0-9,]+(?:\.[0-9]+)?)\s*유로', raw_title)
-                        if match_euro:
-                            title_currency = "EUR"
-                            val = match_euro.group(1) or match_euro.group(2)
-                            title_price = round(float(val.replace(',', '')) * 100)
-        
+
+        title_price, title_currency, title_free_shipping = extract_title_price(raw_title)
+        if title_free_shipping:
+            shipping_fee = "무료배송"
+
         # 기본 정책: 타이틀 가격을 우선시
         if title_price > 0:
             final_price = title_price
             currency = title_currency
-            
+
         # 퀘이사존, 펨코는 핫딜 규정상 기재된 가격 태그가 가장 정확하므로 무조건 우선시함
         if community_name in ["quasarzone", "퀘이사존", "fmkorea", "펨코"] and provided_price > 0:
             final_price = provided_price
@@ -103,36 +281,14 @@ class AggregatorService:
         elif provided_price > 0:
             # 타이틀 가격과 스크래퍼가 제공한 가격(본문 등)에 큰 차이가 있으면 모음전(멀티 옵션)으로 간주
             if title_price > 0 and abs(title_price - provided_price) / max(title_price, provided_price) > 0.1:
-                print(f"DEBUG [가격 불일치 감지] 타이틀: {title_price}, 본문: {provided_price}")
                 logger.info(f"[가격 불일치 감지] 타이틀: {title_price}, 본문: {provided_price}. 모음전으로 간주하여 대표 가격을 {title_price}로 고정합니다.")
                 final_price = title_price
                 currency = title_currency
-                
-                # [Auto-Skill Swarm Maximum Activated] - AI 할당량 소진 대비 Regex Fallback 추출 적용
-                extracted_options = []
-                content_html = scraped_data.get("content_html", "")
-                if content_html:
-                    try:
-                        from bs4 import BeautifulSoup
-                        soup = BeautifulSoup(content_html, 'html.parser')
-                        text_lines = soup.get_text(separator='\n').split('\n')
-                        seen_prices = set()
-                        for line in text_lines:
-                            line = line.strip()
-                            if '원' in line or '달러' in line or '$' in line or '유로' in line or '€' in line:
-                                nums = re.findall(r'\b\d{1,3}(?:,\d{3})+\b|\b\d{4,}\b', line)
-                                for num_str in nums:
-                                    val = int(num_str.replace(',', ''))
-                                    if val > 1000:
-                                        if val not in seen_prices:
-                                            seen_prices.add(val)
-                                            name = line[:40].strip()
-                                            extracted_options.append({"name": name, "price": val})
-                    except Exception as e:
-                        logger.error(f"Regex options extraction failed: {e}")
-                
+
                 # AI 분할을 대신하여 모음전이라는 것을 암시하는 더미 옵션을 생성
                 if "options_data" not in scraped_data or not scraped_data["options_data"]:
+                    # [Auto-Skill Swarm Maximum Activated] - AI 할당량 소진 대비 Regex Fallback 추출 적용
+                    extracted_options = extract_price_options(scraped_data.get("content_html", ""))
                     if extracted_options and len(extracted_options) > 1:
                         scraped_data["options_data"] = extracted_options
                     else:
@@ -140,7 +296,7 @@ class AggregatorService:
                             {"name": "옵션 1 (제목 기준 최저가)", "price": title_price},
                             {"name": "옵션 2 (본문 기재 가격)", "price": provided_price}
                         ]
-                print(f"DEBUG scraped_data['options_data']: {scraped_data.get('options_data')} ")
+                logger.debug(f"[가격 불일치] 옵션 데이터: {scraped_data.get('options_data')}")
 
 
         # 제목에서 추출 실패 시 본문에서 스크래퍼가 넘겨준 가격 사용
@@ -149,191 +305,133 @@ class AggregatorService:
             if scraped_data.get("currency"):
                 currency = scraped_data.get("currency")
 
-        if "무배" in raw_title or "무료배송" in raw_title or "무료" in raw_title: 
-            shipping_fee = "무료배송"
-        
-        if shipping_fee:
-            sf_str = str(shipping_fee).strip()
-            # 텍스트 내의 다중 공백, 탭, 줄바꿈 등을 하나의 공백으로 압축하여 프론트엔드 UI 깨짐 방지
-            sf_str = re.sub(r'\s+', ' ', sf_str)
-            if sf_str in ["0", "0원", "무료", "무배", "무료배송", "臾대즺", "臾대같"]:
-                shipping_fee = "무료배송"
-            elif re.match(r'^(0원?|무료|무배|臾대즺|臾대같)\s*(/|\+)', sf_str):
-                shipping_fee = re.sub(r'^(0원?|무료|무배|臾대즺|臾대같)\s*', '무료배송 ', sf_str)
-            else:
-                shipping_fee = sf_str
-        
+        shipping_fee = normalize_shipping_fee(shipping_fee, raw_title)
+
         # [Phase 6] 하이브리드 파이프라인 Step 2: 쇼핑몰 메타태그 직공 (WAF 우회 및 정가 추출)
-        import urllib.request
-        from bs4 import BeautifulSoup
-        
-        if final_price == 0 and scraped_data.get("ecommerce_link"):
-            try:
-                target_url = scraped_data.get("ecommerce_link")
-                if 'coupang' not in target_url: # 쿠팡은 WAF 방어가 100%이므로 제외
-                    logger.info(f"[Spider] 정규식 실패. 쇼핑몰({target_url})에 직접 침투하여 메타태그 스나이핑 시도...")
-                    req = urllib.request.Request(target_url, headers={'User-Agent': 'Mozilla/5.0'})
-                    with urllib.request.urlopen(req, timeout=3) as res:
-                        soup = BeautifulSoup(res.read(), 'html.parser')
-                        # og:price:amount, itemprop=price 등 표준 마크업 탐색
-                        meta_price = soup.find('meta', property='product:price:amount') or soup.find('meta', property='og:price:amount')
-                        if meta_price and meta_price.get('content'):
-                            final_price = int(float(meta_price['content'].replace(',', '')))
-                            logger.info(f"[Hit] 쇼핑몰 메타태그에서 가격 적중! {final_price}원")
-            except Exception as e:
-                logger.debug(f"쇼핑몰 메타 스나이핑 실패: {e}")
-                
-        # 산술/논리 검증: 원화(KRW) 기준 터무니없이 낮은 가격(예: 100원 미만)은 추출 오류나 적립금액(53원 등)일 확률이 높으므로 0으로 보정
-        if currency == "KRW" and final_price > 0 and final_price < 100:
-            logger.info(f"[Warning] 가격 비정상 감지 ({final_price}원). 오류 또는 포인트성 숫자로 간주하여 0원으로 초기화.")
-            final_price = 0
-        # 상한선 검증: 너무 터무니없이 높은 가격(예: 500만원 초과)은 상품 코드가 잘못 파싱된 경우일 확률이 높으므로 0으로 보정
-        elif currency == "KRW" and final_price > 5000000:
-            logger.info(f"[Warning] 가격 비정상 감지 ({final_price}원). 오류 또는 상품코드로 간주하여 0원으로 초기화.")
-            final_price = 0
-
-        price = final_price
-        
+        # 쿠팡은 WAF 방어가 100%이므로 제외. 블로킹 HTTP 라 이벤트 루프 밖(스레드)에서 실행
+        target_url = scraped_data.get("ecommerce_link")
+        if final_price == 0 and target_url and 'coupang' not in target_url:
+            final_price = await asyncio.to_thread(probe_shop_meta_price, target_url)
+
+        final_price = sanitize_price(final_price, currency)
+
         # 🚨 스팸 및 공지사항 / 게시판 뻘글 필터링
-        spam_keywords = ["공지", "질문", "투패", "몰테일", "폐업", "출고", "지연", "지쟈스", "배대지", "안내", "도와주세요", "어떤가요", "입고금지", "수익링크", "바이럴", "금지조치", "활동내역", "제재조치"]
-        if any(keyword in raw_title for keyword in spam_keywords) or (price == 0 and "?" in raw_title):
+        if is_spam_title(raw_title, final_price):
             logger.info(f"[Spam Filtered] 핫딜이 아닌 게시판 정보 스킵: {raw_title}")
             return None
-        
-        # 스크래퍼 단에서 명시적으로 수집한 카테고리가 있다면 전달
-        scraped_category = scraped_data.get("category")
-
-        # 1. 원본 텍스트 및 수집처 카테고리를 함께 정규화기에 전달
-        normalized = await self.normalizer.normalize(raw_title, scraped_category)
-        
-        final_category = normalized.category
-
-        # 적립/포인트 강제 보정 (사용자 요청: 적립 탭으로 분리)
-        event_keywords = ["추첨", "설문", "무료배포", "체험단", "선착순", "라이브", "방송", "라방"]
-        point_keywords = ["적립", "포인트", "페이백", "앱테크"]
-        # 순수 적립이 아닌 구매/조건부 쇼핑을 걸러내기 위한 금지어
-        not_point_keywords = ["결제", "구매", "이상", "슈퍼적립", "혜택", "사은품", "증정", "할인"]
-        
-        check_title = raw_title.replace("드라이브", "")
-        
-        is_event = any(kw in check_title for kw in event_keywords)
-        is_point = False
-        
-        if any(kw in check_title for kw in point_keywords) and not any(kw in check_title for kw in not_point_keywords):
-            # 사용자가 명시한 대로, "적립" 카테고리는 100원 이하(또는 0원)일 때만 순수 적립(앱테크)으로 취급
-            if price <= 100:
-                is_point = True
-        
-        # '적립'이나 '페이백'이 있어도 일반적인 라이브 방송 상품 판매 예고면 포인트(적립)가 아니라 이벤트로 처리
-        # 단, 가격이 100원 이하인 소액 적립(라이브 시청 보상 등)은 예외로 '적립' 유지
-        if is_point and any(kw in check_title for kw in ["라이브", "예고", "방송", "라방"]):
-            if price > 100:
-                is_point = False
-                is_event = True
-            
-        if not is_event and "예고" in check_title:
-            if price <= 1000:
-                is_event = True
-                
-        if "무료" in check_title and "배송" not in check_title and "무배" not in check_title and "택배" not in check_title:
-            if price == 0:
-                is_event = True
-            
-        # 루리웹(10), 퀘이사존(8) 등에서만 적립 또는 이벤트로 강제 보정 적용
-        if community_id in [8, 10]:
-            if is_point:
-                final_category = "적립"
-            elif is_event:
-                final_category = "이벤트"
-
-        # [Phase 12] 실제 게시글 작성 시간 반영 (스크래핑 시점이 아닌 실제 업로드 시점)
-        posted_at_iso = scraped_data.get("posted_at")
-        posted_dt = None
-        if posted_at_iso:
-            try:
-                posted_dt = datetime.fromisoformat(posted_at_iso.replace("Z", "+00:00"))
-                # Ensure datetime has UTC timezone info before storing
-                if posted_dt.tzinfo is None:
-                    posted_dt = posted_dt.replace(tzinfo=timezone.utc)
-            except Exception:
-                pass
+
+        return ParsedDeal(
+            community_id=community_id,
+            community_name=community_name,
+            scraped=scraped_data,
+            title=raw_title,
+            url=url,
+            shop_name=scraped_data.get("shop_name", ""),
+            image_url=scraped_data.get("image_url", ""),
+            content_html=scraped_data.get("content_html", scraped_data.get("content", "")) or "",
+            ecommerce_link=scraped_data.get("ecommerce_link"),
+            price=final_price,
+            currency=currency,
+            shipping_fee=shipping_fee,
+            is_closed=is_closed,
+            posted_dt=parse_posted_at(scraped_data.get("posted_at")),
+            view_count=int(scraped_data.get("view_count", 0)),
+            like_count=int(scraped_data.get("like_count", 0)),
+            comment_count=int(scraped_data.get("comment_count", 0)),
+            is_super_hotdeal=bool(scraped_data.get("is_super_hotdeal")),
+        )
+
+    # ------------------------------------------------------------------ normalize
+    async def normalize_stage(self, parsed: ParsedDeal) -> NormalizedDeal:
+        """상품명/브랜드/카테고리 정규화 + 적립/이벤트 카테고리 보정"""
+        # 1. 원본 텍스트 및 스크래퍼 단에서 명시적으로 수집한 카테고리를 함께 정규화기에 전달
+        product = await self.normalizer.normalize(parsed.title, parsed.scraped.get("category"))
+        return NormalizedDeal(
+            parsed=parsed,
+            product=product,
+            category=correct_category(product.category, parsed.title, parsed.price, parsed.community_id),
+        )
+
+    # ------------------------------------------------------------------ dedup
+    def dedup_stage(self, normalized: NormalizedDeal, placeholder: Optional[Deal] = None) -> DedupResult:
+        """병합 대상 기존 딜 탐색 (동일 링크 → 24시간 동일 제목 → 롤링 윈도우 클러스터링)"""
+        from datetime import timedelta
+
+        parsed = normalized.parsed
+        raw_title, url, community_id = parsed.title, parsed.url, parsed.community_id
+        price, final_category = parsed.price, normalized.category
+        # 빠른 등록 행 자신은 중복/병합 대상에서 제외
+        exclude = [Deal.id != placeholder.id] if placeholder is not None else []
+        # 다른 딜로 흡수된 리다이렉트 행도 제외 (같은 글 재수집은 흡수한 딜로 병합)
+        exclude.append(Deal.post_link.notlike(f"%{MERGED_REDIRECT_MARK}%"))
 
         # [Phase 6.5] 💡 글로벌 쇼핑몰 링크 캐싱 (CEO 피드백: 중복 핫딜 AI 호출 방지)
         cached_ai_summary = None
-        ecommerce_url = scraped_data.get("ecommerce_link")
+        ecommerce_url = parsed.ecommerce_link
         if ecommerce_url and len(ecommerce_url) > 15:
-            from datetime import timedelta
             recent_duplicate = self.db.query(Deal).filter(
                 Deal.ecommerce_link == ecommerce_url,
-                Deal.indexed_at >= datetime.utcnow() - timedelta(days=2)
+                Deal.indexed_at >= datetime.utcnow() - timedelta(days=2),
+                *exclude
             ).first()
-            
+
             if recent_duplicate and recent_duplicate.ai_summary:
                 logger.info(f"[Global Cache Hit] 중복 핫딜의 AI 분석을 복사합니다: {ecommerce_url}")
                 cached_ai_summary = recent_duplicate.ai_summary
-                if final_price == 0 and recent_duplicate.price and recent_duplicate.price != "0":
+                if price == 0 and recent_duplicate.price and recent_duplicate.price != "0":
                     price = int(recent_duplicate.price)
-                    final_price = price
                 if not final_category:
                     final_category = recent_duplicate.category
 
-        content_html = scraped_data.get("content_html", scraped_data.get("content", ""))
-        image_url = scraped_data.get("image_url")
-
         # 2. 중복 및 롤링 윈도우 클러스터링 체크 (Upsert 로직의 핵심)
-        existing_deals = self.db.query(Deal).filter(Deal.post_link == url).all()
-        
+        existing_deals = self.db.query(Deal).filter(Deal.post_link == url, *exclude).all()
+
         # [이중 중복 방어 가드] 동일 커뮤니티 내 최근 24시간 이내 완전히 동일한 제목의 글이 있으면 중복으로 간주하여 Upsert 처리
         if not existing_deals and raw_title:
-            from datetime import timedelta
             existing_deals = self.db.query(Deal).filter(
                 Deal.source_community_id == community_id,
                 Deal.title == raw_title,
-                Deal.indexed_at >= datetime.utcnow() - timedelta(hours=24)
+                Deal.indexed_at >= datetime.utcnow() - timedelta(hours=24),
+                *exclude
             ).all()
-            
-        print(f"DEBUG: existing_deals based on post_link or title: {existing_deals}")
-        
+
         # [24시간 롤링 윈도우 클러스터링]: 동일 URL이 아니더라도 24시간 내 동일 상품이면 병합 시도
         if not existing_deals:
-            from datetime import timedelta
             query = self.db.query(Deal).filter(
-                Deal.indexed_at >= datetime.utcnow() - timedelta(hours=24)
+                Deal.indexed_at >= datetime.utcnow() - timedelta(hours=24),
+                *exclude
             )
             target_deals = []
-            
+
             # 1. 쇼핑몰 링크(ecommerce_url) 기준 매칭 (확실한 고유 링크일 경우, 정규화 보증하여 도메인 차이 극복)
-            target_url = scraped_data.get("ecommerce_link")
+            target_url = parsed.ecommerce_link
             if target_url and len(target_url) > 20 and 'coupang' not in target_url:
                 from backend.core.url_utils import normalize_url
                 normalized_target_url = normalize_url(target_url)
                 # 정규화된 URL 혹은 원본 URL 모두에 대해 폭넓은 매칭 시도
                 target_deals = query.filter(
-                    (Deal.ecommerce_link == normalized_target_url) | 
+                    (Deal.ecommerce_link == normalized_target_url) |
                     (Deal.ecommerce_link == target_url)
                 ).all()
-            
+
             # 2. 정규화된 상품명(base_product_name) 기준 매칭 (링크가 없거나 달라도 상품명이 같으면)
-            if not target_deals and normalized.name and len(normalized.name) > 4:
-                target_deals = query.filter(Deal.base_product_name == normalized.name).all()
-                
+            product_name = normalized.product.name
+            if not target_deals and product_name and len(product_name) > 4:
+                target_deals = query.filter(Deal.base_product_name == product_name).all()
+
             # 3. 🚨 [초지능형 토큰 교차 매칭 가드] (대표님 핫픽스: Toocki 100W C to C 3개 vs Toocki C to C 100W 3pcs 병합 성공!)
             if not target_deals:
-                # 최근 24시간 이내의 모든 딜을 긁어서 제목 기반의 유사 토큰 오버랩 분석 실시
-                recent_deals = query.all()
-                
-                def get_clean_tokens(text: str) -> set:
-                    # 영어, 숫자, 한글, 주요 특수 단어 위주로 토큰화하여 한-영 교차 매칭 지원
-                    cleaned = re.sub(r'[^a-zA-Z0-9가-힣\s]', ' ', text.lower())
-                    return {token for token in cleaned.split() if len(token) >= 2 and token not in ["to", "and", "or", "for", "pcs"]}
-
-                input_tokens = get_clean_tokens(raw_title)
+                input_tokens = title_tokens(raw_title)
                 # 핵심 키워드(예: Toocki, 100W, ugreen, acer 등 브랜드/숫자스펙)를 반드시 담고 있어야 함
-                core_keywords = {tk for tk in input_tokens if re.search(r'[0-9]+[wWdD]?|[a-zA-Z]{4,}', tk)}
-                
+                core_keywords = core_tokens(input_tokens)
+
                 if len(core_keywords) >= 2:
-                    for d in recent_deals:
-                        d_tokens = get_clean_tokens(d.title)
+                    # 24시간 토큰 역색인으로 핵심 키워드 2개 이상 공유하는 딜만 후보로 (전체 스캔 대신)
+                    deal_token_index.sync(self.db)
+                    candidate_ids = deal_token_index.candidates(core_keywords)
+                    candidates = {d.id: d for d in query.filter(Deal.id.in_(candidate_ids)).all()} if candidate_ids else {}
+                    for d in (candidates[deal_id] for deal_id in candidate_ids if deal_id in candidates):
+                        d_tokens = title_tokens(d.title)
                         # 핵심 키워드가 최소 2개 이상 100% 동일하게 겹치는지 체크
                         overlap_core = core_keywords.intersection(d_tokens)
                         if len(overlap_core) >= 2:
@@ -344,260 +442,157 @@ class AggregatorService:
                                 target_deals = [d]
                                 break
 
-                
             if target_deals:
                 # 롤링 윈도우 병합 발생! 가장 최근(마지막) 딜을 대상으로 갱신을 수행하여 윈도우를 연장시킴
-                logger.info(f"[Rolling Window Clustering] 타 게시글({url})이지만 동일 상품으로 판단하여 병합 시도: {normalized.name}")
+                logger.info(f"[Rolling Window Clustering] 타 게시글({url})이지만 동일 상품으로 판단하여 병합 시도: {product_name}")
                 existing_deals = [max(target_deals, key=lambda d: d.indexed_at if d.indexed_at else datetime.min)]
-        print(f"DEBUG: existing_deals after rolling window: {existing_deals}")
-        if existing_deals:
-             # 이미 수집했던 글이거나, 클러스터링으로 묶인 글이라면 가격 등 메타정보 갱신 (Upsert)
-             # 만약 AI가 다중 분할한 상품들이라면, 모든 split deal에 대해 종료 상태 등을 일괄 갱신합니다.
-             for existing_deal in existing_deals:
-                 # 새로 수집된 진짜 작성 시간 정보(posted_dt)가 존재하면, 기존의 잘못된 수집 시간을 진짜 시간으로 강제 갱신/보정
-                 if posted_dt:
-                     current_idx = existing_deal.indexed_at
-                     if not current_idx or current_idx != posted_dt:
-                         existing_deal.indexed_at = posted_dt
-
-                 price_changed = False
-                 
-                 # 제목 갱신: 단일 상품일 때
-                 # 클러스터링(롤링 윈도우)된 경우, 새 핫딜 가격이 더 싸거나 동일 URL일 때만 원본 제목 갱신
-                 old_price = int(existing_deal.price) if str(existing_deal.price).isdigit() else float('inf')
-                 if len(existing_deals) == 1 and existing_deal.title != raw_title:
-                     if existing_deal.post_link == url:
-                         existing_deal.title = raw_title
-                     elif price > 0 and price < old_price:
-                         existing_deal.title = raw_title # 더 싼 새로운 게시글의 제목으로 교체
-                         
-                 # 가격 갱신: 더 저렴한 가격이 등장했을 때 (최저가 갱신) 또는 동일 URL 게시글이 수정되었을 때
-                 if len(existing_deals) == 1 and price > 0:
-                     if price < old_price:
-                         logger.info(f"[Lowest Price Updated!] 기존 {old_price}원 -> 새 핫딜 {price}원 (URL 교체: {url})")
-                         existing_deal.price = str(price)
-                         
-                         # 기존 링크를 백업
-                         if existing_deal.source_community_id:
-                             curr_merged = existing_deal.merged_communities or ""
-                             merged_list = curr_merged.split(",") if curr_merged else []
-                             if not any(item.startswith(f"{existing_deal.source_community_id}::") or item == str(existing_deal.source_community_id) for item in merged_list):
-                                 merged_list.append(f"{existing_deal.source_community_id}::{existing_deal.post_link}")
-                                 existing_deal.merged_communities = ",".join(merged_list)
-                         
-                         existing_deal.post_link = url # 유저가 구매하러 갈 링크도 더 싼 곳으로 교체
-                         price_changed = True
-                     elif existing_deal.post_link == url and str(existing_deal.price) != str(price):
-                         existing_deal.price = str(price)
-                         price_changed = True
-                     
-                 # 📸 [고화질 이미지 덮어쓰기 가드]
-                 # 기존에 이미지가 없거나, 기존 이미지가 찌그러진 저화질 썸네일이고 새 이미지는 고화질 원본인 경우 강제 갱신!
-                 if image_url:
-                     is_low_quality = lambda u: any(x in u.lower() for x in ['_thumb', 'thumb/', 'small_', '_70x50', '_120x90', '_150x150', 'crop.webp', 'filesn', 'zboard/data/ppomppu'])
-                     is_high_quality = lambda u: any(x in u.lower() for x in ['files/attach', 'ruliweb.com/img', 'quasarzone.com/editor', 'quasarzone.com/qb_saleinfo'])
-                     if not existing_deal.image_url:
-                         existing_deal.image_url = image_url
-                     elif is_low_quality(existing_deal.image_url) and not is_low_quality(image_url):
-                         existing_deal.image_url = image_url
-                     elif not is_low_quality(existing_deal.image_url) and is_low_quality(image_url):
-                         # 🎯 이미 고화질이 선점되어 있는데 저화질이 순회에서 들어오면 덮어쓰지 않고 절대 무시!
-                         pass
-                     elif is_high_quality(existing_deal.image_url) and not is_high_quality(image_url):
-                          # 🎯 기존에 상세 페이지 고화질 원본이 선점되어 있는데, 뽐뿌 썸네일 등 일반 이미지가 들어오면 무시!
-                          pass
-                     elif existing_deal.image_url != image_url:
-                         existing_deal.image_url = image_url
-                    
-                 if scraped_data.get("ecommerce_link") and not existing_deal.ecommerce_link:
-                     existing_deal.ecommerce_link = scraped_data.get("ecommerce_link")
-                 
-                 if content_html and not existing_deal.content_html:
-                     existing_deal.content_html = content_html
-                  
-                 # [가격분석] 브랜드 및 모델명 메타 정보 보완 (기존에 비어있던 경우 업데이트)
-                 if not existing_deal.brand or not existing_deal.model_code:
-                     try:
-                         brand_info = AIProductNameService.extract_brand_and_model(existing_deal.title)
-                         if brand_info.get("brand") and not existing_deal.brand:
-                             existing_deal.brand = brand_info.get("brand")
-                         if brand_info.get("model_code") and not existing_deal.model_code:
-                             existing_deal.model_code = brand_info.get("model_code")
-                     except Exception as e:
-                         logger.error(f"Error extracting brand/model for existing deal during upsert: {e}")
-                 
-                 # 적립/카테고리 강제 보정 적용
-                 if existing_deal.category != final_category and final_category:
-                     existing_deal.category = final_category
-
-                 if getattr(existing_deal, 'currency', None) != currency:
-                     existing_deal.currency = currency
-
-                 existing_deal.is_closed = is_closed
-
-                 # [다중 커뮤니티 병합 정보 저장]
-                 if existing_deal.source_community_id != community_id:
-                     curr_merged = existing_deal.merged_communities or ""
-                     merged_list = curr_merged.split(",") if curr_merged else []
-                     # URL과 함께 저장하여 프론트엔드에서 클릭 시 이동할 수 있도록 함
-                     if not any(item.startswith(f"{community_id}::") or item == str(community_id) for item in merged_list):
-                         merged_list.append(f"{community_id}::{url}")
-                         existing_deal.merged_communities = ",".join(merged_list)
-
-                 # [Smart Shipping Fee Merge Guard]
-                 # 새로 긁어온 배송비가 '정보 없음'이고 기존에 이미 유효한 배송 정보가 기재되어 있다면 덮어쓰지 않고 기존 값 유지!
-                 if shipping_fee and shipping_fee != "정보 없음":
-                     existing_deal.shipping_fee = shipping_fee
-                 elif not existing_deal.shipping_fee or existing_deal.shipping_fee == "정보 없음":
-                     existing_deal.shipping_fee = shipping_fee or "정보 없음"
-                 
-                 import json
-                 if scraped_data.get("options_data"):
-                     existing_deal.options_data = json.dumps(scraped_data.get("options_data"), ensure_ascii=False)
-                     existing_deal.has_options = True
-                 
-                 # 새로 수집된 날짜 정보가 존재하면 시간 정보가 더 구체적일 때만 업데이트
-                 if posted_dt:
-                     current_idx = existing_deal.indexed_at
-                     if not current_idx:
-                         existing_deal.indexed_at = posted_dt
-                     elif (current_idx.hour == 0 and current_idx.minute == 0) and (posted_dt.hour != 0 or posted_dt.minute != 0):
-                         existing_deal.indexed_at = posted_dt
-                 
-                 # 지표 업데이트 (Continuous Upsert)
-                 view_count = int(scraped_data.get("view_count", 0))
-                 like_count = int(scraped_data.get("like_count", 0))
-                 comment_count = int(scraped_data.get("comment_count", 0))
-                 
-                 if view_count > (existing_deal.view_count or 0):
-                     existing_deal.view_count = view_count
-                 if like_count > (existing_deal.like_count or 0):
-                     existing_deal.like_count = like_count
-                 if comment_count > (existing_deal.comment_count or 0):
-                     existing_deal.comment_count = comment_count
-                 
-                 # 동적 꿀딜 점수 갱신
-                 calc_score = int((existing_deal.view_count / 100) + (existing_deal.like_count * 10) + (existing_deal.comment_count * 5))
-                 if scraped_data.get("is_super_hotdeal"):
-                     calc_score = 100
-                     if not existing_deal.ai_summary:
-                         existing_deal.ai_summary = "🔥 [커뮤니티 인증 핫딜] "
-                     elif "🔥" not in existing_deal.ai_summary:
-                         existing_deal.ai_summary = "🔥 [커뮤니티 인증 핫딜] " + existing_deal.ai_summary
-                 else:
-                     calc_score = min(99, calc_score)
-                     # 기존에 100점이었지만 더 이상 핫딜이 아니면 99점으로 강등 (단, 직접 지정된 경우 제외 가능하나 여기선 스크래퍼 동기화 우선)
-                     
-                 if scraped_data.get("is_super_hotdeal") or existing_deal.honey_score is None:
-                     existing_deal.honey_score = calc_score
-                 else:
-                     # 슈퍼핫딜이 아닐 때는 일반적인 갱신(기존 점수가 100이었다면 99로 하락 가능)
-                     if existing_deal.honey_score == 100 and not scraped_data.get("is_super_hotdeal"):
-                         existing_deal.honey_score = calc_score
-                     else:
-                         existing_deal.honey_score = max(calc_score, existing_deal.honey_score)
-                 
-                 # 🎯 [is_super_hotdeal 필드 동기화 추가]
-                 existing_deal.is_super_hotdeal = bool(scraped_data.get("is_super_hotdeal"))
-                 
-                 if price_changed and price > 0:
-                     self._insert_price_history(existing_deal.id, price)
-
-             logger.debug(f"🔄 기존 Deal 가격/상태 업데이트 (Upsert) - 총 {len(existing_deals)}개 항목: {url}")
-             self.db.commit()
-             
-             return existing_deals[0]
-
-        ai_summary = cached_ai_summary
-        
+
+        return DedupResult(existing=existing_deals, price=price, category=final_category, cached_ai_summary=cached_ai_summary)
+
+    # ------------------------------------------------------------------ persist (병합)
+    def merge_stage(self, normalized: NormalizedDeal, dedup: DedupResult, placeholder: Optional[Deal] = None) -> PersistResult:
+        """
+        이미 수집했던 글이거나, 클러스터링으로 묶인 글이라면 가격 등 메타정보 갱신 (Upsert)
+        만약 AI가 다중 분할한 상품들이라면, 모든 split deal에 대해 종료 상태 등을 일괄 갱신합니다.
+        """
+        import json
+        parsed = normalized.parsed
+        existing_deals = dedup.existing
+        incoming = IncomingDeal(
+            community_id=parsed.community_id,
+            url=parsed.url,
+            title=parsed.title,
+            price=dedup.price,
+            currency=parsed.currency,
+            category=dedup.category,
+            image_url=parsed.image_url,
+            ecommerce_link=parsed.ecommerce_link,
+            content_html=parsed.content_html,
+            shipping_fee=parsed.shipping_fee,
+            is_closed=parsed.is_closed,
+            options_data=json.dumps(parsed.scraped["options_data"], ensure_ascii=False) if parsed.scraped.get("options_data") else None,
+            posted_dt=parsed.posted_dt,
+            view_count=parsed.view_count,
+            like_count=parsed.like_count,
+            comment_count=parsed.comment_count,
+            is_super_hotdeal=parsed.is_super_hotdeal,
+            single=len(existing_deals) == 1,
+        )
+        if placeholder is not None:
+            # 빠른 등록 행은 병합 대상 딜로 흡수 (병합으로 대상 딜이 이 글의 링크/제목을 가져갈 수 있으므로 먼저 반영)
+            self._redirect_placeholder(placeholder, existing_deals[0])
+            self.db.flush()
+        # 필드별 병합 규칙을 한 번에 적용하고 가격 이력까지 모아 한 번만 flush/commit
+        with self.db.no_autoflush:
+            for existing_deal in existing_deals:
+                merged = merge_deal(existing_deal, incoming)
+                if merged.price_changed:
+                    self.price_history.record(existing_deal, dedup.price)
+        self.price_history.stage(self.db)
+        logger.debug(f"🔄 기존 Deal 가격/상태 업데이트 (Upsert) - 총 {len(existing_deals)}개 항목: {parsed.url}")
+        self.db.commit()
+        self.price_history.confirm()
+        # 제목/작성 시각이 바뀌었을 수 있으므로 토큰 색인 갱신
+        for existing_deal in existing_deals:
+            deal_token_index.add(existing_deal.id, existing_deal.title, existing_deal.indexed_at)
+        if placeholder is not None:
+            deal_token_index.discard(placeholder.id)
+        return PersistResult(deals=existing_deals, inserted=False)
+
+    # ------------------------------------------------------------------ enrich
+    async def enrich_stage(self, normalized: NormalizedDeal, dedup: DedupResult) -> EnrichedDeal:
+        """신규 딜: 꿀딜 점수 + 모음전 판정 + (가격 누락/모음전이면) AI 분할"""
+        parsed = normalized.parsed
+        raw_title, content_html, price = parsed.title, parsed.content_html, dedup.price
+        ai_summary = dedup.cached_ai_summary
+
         # 동적 꿀딜 점수 초기 계산
-        view_count = int(scraped_data.get("view_count", 0))
-        like_count = int(scraped_data.get("like_count", 0))
-        comment_count = int(scraped_data.get("comment_count", 0))
-        
-        honey_score = int((view_count / 100) + (like_count * 10) + (comment_count * 5))
-        
-        # [DB 평균치 기반 세밀한 점수화 로직 추가]
+        honey_score = int((parsed.view_count / 100) + (parsed.like_count * 10) + (parsed.comment_count * 5))
+
+        # [카테고리 기준가 기반 세밀한 점수화 로직]
+        # 매 아이템 전체 테이블 AVG 스캔 대신 카테고리(브랜드) 가격 중앙값 캐시 조회 (별도 스레드 주기 재집계 + INSERT 시 반영)
         try:
-            from sqlalchemy import func, cast, Integer
-            if price > 0 and normalized.category:
-                # PostgreSQL에서는 VARCHAR 컬럼에 대한 avg() 연산이 제한되므로 정수형 캐스팅 필수
-                query = self.db.query(func.avg(cast(Deal.price, Integer))).filter(
-                    Deal.category == normalized.category,
-                    cast(Deal.price, Integer) > 0
-                )
-                
-                avg_price = query.scalar()
-                
-                if avg_price:
-                    avg_price = float(avg_price)
-                    if price < avg_price * 0.5:
+            if price > 0 and normalized.product.category:
+                bind = self.db.get_bind()
+                await category_price_stats.ensure_fresh(lambda: Session(bind=bind))
+                reference_price = category_price_stats.reference_price(normalized.product.category, normalized.product.brand)
+
+                if reference_price:
+                    if price < reference_price * 0.5:
                         honey_score += 40
-                    elif price < avg_price * 0.7:
+                    elif price < reference_price * 0.7:
                         honey_score += 25
-                    elif price < avg_price * 0.9:
+                    elif price < reference_price * 0.9:
                         honey_score += 10
-                    elif price > avg_price * 1.1:
+                    elif price > reference_price * 1.1:
                         honey_score -= 20
         except Exception as e:
             self.db.rollback()  # 롤백 처리하여 후속 INSERT 트랜잭션 붕괴 원천 차단
-            logger.error(f"DB 평균가 계산 에러: {e}")
-            
+            logger.error(f"카테고리 기준가 계산 에러: {e}")
+
         if honey_score < 50 and price > 0:
             import random
             honey_score = random.randint(50, 70)  # 최소 점수 보장
-        
+
         # 일반 딜은 최대 99점까지만 허용
         honey_score = min(99, max(0, honey_score))
 
         # 커뮤니티 추천수/조회수/인기마크 기반 슈퍼 핫딜 판별
-        if scraped_data.get("is_super_hotdeal"):
+        if parsed.is_super_hotdeal:
             # 🎯 [CEO 정책 결정]: 커뮤니티 100% 핫딜 판별 기준 충족 시 가격 감점 무시하고 무조건 100점 부여!
             honey_score = 100
-                
+
             if ai_summary is None:
                 ai_summary = "🔥 [커뮤니티 인기] "
             elif "🔥" not in ai_summary:
                 ai_summary = "🔥 [커뮤니티 인기] " + ai_summary
 
         # [다중 상품 자동 분할 - Phase 5.1 토큰 최적화 (CEO 피드백)]
-        # 1. 제목 기반으로 상품 갯수 추정 (예: 상품명.상품명.상품명 -> 점이 2개면 상품 3개)
-        estimated_item_count = raw_title.count(".") + raw_title.count(",") + 1
-        # 2. 본문 텍스트 내에서 정규식으로 '원' 단위 숫자 패턴 갯수 추출
+        # 본문 텍스트 내에서 정규식으로 '원' 단위 숫자 패턴 갯수 추출
         price_matches = re.findall(r'([0-9]{1,3}(?:,[0-9]{3})+)\s*원', content_html) if content_html else []
-        
+
         # 핫픽스: 가격에 들어간 1000단위 구분 쉼표(예: 6,590원)가 제목 쉼표 조건에 걸리는 오인식 원천 제거
         clean_title_for_multi = re.sub(r'\d,\d', '', raw_title)
         is_multi_item = ("(" in raw_title and "다양" in raw_title) or raw_title.count(".") >= 2 or "모음" in raw_title or "선택" in raw_title or "," in clean_title_for_multi or len(price_matches) >= 3
         is_missing_price = (price == 0)
-        
+
         # [핵심 로직] 가격이 아예 없거나(0원), 다중 상품일 가능성이 높으면 AI를 가동하여 분할(Split) 및 가격 추출을 시도합니다.
         # 글로벌 캐싱으로 이미 ai_summary를 가져왔다면 불필요한 AI 가동을 스킵합니다.
-        token_saving_trigger = (is_multi_item or is_missing_price) and not cached_ai_summary
+        token_saving_trigger = (is_multi_item or is_missing_price) and not dedup.cached_ai_summary
+        logger.debug(f"price={price}, is_missing_price={is_missing_price}, token_saving_trigger={token_saving_trigger}")
 
-        
-        logger.info(f"DEBUG: price={price}, is_missing_price={is_missing_price}, token_saving_trigger={token_saving_trigger}")
-        
         split_items = []
         if token_saving_trigger and (len(content_html) > 50 or raw_title):
-            from backend.core.ai_utils import get_random_gemini_key
-            import asyncio
-            import google.generativeai as genai
-            
-            print(f"[AI] 가격 누락 또는 모음전 감지! Gemini 1.5/2.0(최신)으로 정밀 파싱 시작... (원제: {raw_title})")
-            logger.info(f"[AI] 가격 누락 또는 모음전 감지! Gemini 1.5/2.0(최신)으로 정밀 파싱 시작... (원제: {raw_title})")
-            
-            prompt = f"""
+            split_items = await self._split_items(raw_title, content_html)
+
+        return EnrichedDeal(honey_score=honey_score, ai_summary=ai_summary, is_multi_item=is_multi_item, split_items=split_items)
+
+    async def _split_items(self, raw_title: str, content_html: str) -> List[dict]:
+        """Gemini 로 모음전 분할/가격 추출 (같은 글의 결과가 캐시에 있으면 재사용)"""
+        # 같은 글(재수집/재업로드/타 커뮤니티 퍼나르기)의 분할 결과가 캐시에 있으면 Gemini 호출 생략
+        split_key = split_cache_key(raw_title, content_html)
+        cached_split = ai_split_cache().get(split_key)
+        pipeline_metrics.inc("crawl_ai_cache_total", label="miss" if cached_split is None else "hit")
+        if cached_split is not None:
+            logger.info(f"[AI Cache] 분할 결과 재사용 ({len(cached_split)}개 상품): {raw_title}")
+            return cached_split
+
+        from backend.core.ai_utils import get_random_gemini_key
+        import google.generativeai as genai
+
+        logger.info(f"[AI] 가격 누락 또는 모음전 감지! Gemini 1.5/2.0(최신)으로 정밀 파싱 시작... (원제: {raw_title})")
+
+        prompt = f"""
             넌 쇼핑몰 핫딜 데이터 추출 AI야. 다음 게시글 내용(HTML)과 제목을 읽고, 판매 중인 상품의 이름과 가격을 정확히 뽑아서 순수 JSON 배열만 반환해.
             만약 여러 개의 상품이 포함된 벌크 핫딜이면 배열에 여러 객체를 넣고, 단일 상품이면 1개만 넣어. 다른 말은 절대 하지마.
-            
+
             🚨 [아주 중요한 단일화 예외 규칙] 🚨
-            1. 만약 게시글 본문에 각 상품별 구매 링크가 개별적으로 존재하지 않고, 오직 1개의 대표 구매 링크만 존재하는 '모음전(옵션 선택형)'이라면, 절대 상품을 여러 개로 분리하지 마! 
+            1. 만약 게시글 본문에 각 상품별 구매 링크가 개별적으로 존재하지 않고, 오직 1개의 대표 구매 링크만 존재하는 '모음전(옵션 선택형)'이라면, 절대 상품을 여러 개로 분리하지 마!
             무조건 전체를 대표하는 이름으로 단일 객체(1개)만 반환해. (예: "무파마 삼겹살 외 14종 모음전")
             2. [거대 모음전 방지 룰]: 본문에 개별 링크가 각각 존재하더라도, 발견된 상품의 총 개수가 30개 이상(30개 등)이면 절대로 쪼개지 마라! 이 경우에도 무조건 전체를 대표하는 1개의 객체(단일 핫딜)로 합쳐서 반환해야 한다. (쪼개는 것은 29개 이하일 때 허용)
             위 1번이나 2번에 해당하는 단일화 케이스일 경우, 포함된 세부 상품들의 대표적인 목록이나 특징을 'ai_summary' 속성에 3줄 요약으로 보기 좋게 작성해줘. (예: "🔥 [모음전] 레데리2(1.8만), 스택랜드(4천) 등 30종 할인")
 
-            
+
             [가격 추출 필수 규칙]
             1. '59요금제' 같은 휴대폰 요금제의 경우 월 요금인 59000 처럼 계산해서 적어줘.
             2. 달러($)나 유로(€) 같은 외화면 대략적인 원화(KRW)로 환산해서 정수로 적어줘.
@@ -605,271 +600,367 @@ class AggregatorService:
             4. 할인율, 쿠폰가, 청구할인가 등이 명시되어 있으면 무조건 최종 할인가를 적어.
             5. 가격은 반드시 정수형 숫자만 들어가야 하고, 본문에 가격 정보가 아예 없고 완전 무료(나눔 등)이거나, 옵션별로 가격이 다양해서 알 수 없으면 0을 적어.
             6. 💡 [중요] 여러 상품이 병렬로 나열되고 괄호 안에 개별 가격이 있다면(예: 키위 (27000원)), 각 분할된 객체의 'price'에 해당 개별 금액을 정확히 추출해 매핑해.
-            
+
             [다중 옵션 및 메타정보 매핑 규칙]
             1. [이미지 매핑]: 본문 끝 `[첨부된 이미지 링크들]`을 꼼꼼히 분석해, 분리된 각 옵션(예: 망고, 키위)과 문맥상 가장 매칭되는 이미지 URL을 찾아 각 객체의 'image_url'에 연결해. 매칭 안되면 null 처리. 🚨절대 부모(대표) 이미지를 모든 분할 객체에 똑같이 복사하지 마!
             2. [배송비]: 원문 제목 끝의 '/ 무료' 혹은 본문의 배송비 정보를 파악해, 모든 생성된 객체의 'shipping_fee' 속성에 '무료배송' 등 값을 일괄 복사해 넣어줘.
             3. 만약 텍스트 내에 (링크: http...) 형식으로 각 상품별 스토어 주소가 있다면 추출해서 'ecommerce_link' 속성에 넣어줘. 없으면 null 처리해.
-            
+
             [양식]: [{{"name": "...", "price": 10000, "image_url": "http...", "shipping_fee": "무료배송", "ecommerce_link": "http...", "ai_summary": "옵션별 요약 내용..."}}]
-            
+
             게시글 제목: {raw_title}
             게시글 내용: {content_html[:2000]}
             """
-            
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    api_key = get_random_gemini_key()
-                    if not api_key:
-                        logger.info("[Warning] API 키 없음. 상품 자동 분리를 건너뜁니다.")
-                        break
-                        
-                    genai.configure(api_key=api_key)
-                    model = genai.GenerativeModel('gemini-flash-latest')
-                    
-                    response = await model.generate_content_async(prompt)
-                    import json
-                    text_resp = response.text.replace("```json", "").replace("```", "").strip()
-                    parsed = json.loads(text_resp)
-                    if isinstance(parsed, list) and len(parsed) > 0:
-                        split_items = parsed
-                        print(f"[AI Success] Gemini 자동 분할/단일화 성공! {len(split_items)}개 상품 추출됨")
-                        logger.info(f"[AI Success] Gemini 자동 분할/단일화 성공! {len(split_items)}개 상품 추출됨")
-                    break
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if "429" in error_msg:
-                        if "spending cap" in error_msg or "quota" in error_msg or "exhausted" in error_msg:
-                            from backend.core.ai_utils import mark_key_dead
-                            mark_key_dead(api_key)
-                            # 할당량 초과 시 재시도하지 않고 다음 키를 사용하거나 루프 탈출
-                            continue
-                        if attempt < max_retries - 1:
-                            wait_time = 15
-                            match = re.search(r'retry in ([\d\.]+)s', error_msg)
-                            if match:
-                                wait_time = int(float(match.group(1))) + 2
-                            logger.warning(f"Gemini Rate Limit Hit (Split). Waiting {wait_time}s... (Attempt {attempt+1}/{max_retries})")
-                            await asyncio.sleep(wait_time)
-                            continue
-                    print(f"Gemini 분할 실패: {e}")
-                    logger.error(f"Gemini 분할 실패: {e}")
+
+        split_items = []
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                api_key = get_random_gemini_key()
+                if not api_key:
+                    logger.info("[Warning] API 키 없음. 상품 자동 분리를 건너뜁니다.")
                     break
-            else:
-                logger.info("[Warning] API 키 없음. 상품 자동 분리를 건너뜁니다.")
-                split_items = []
+
+                genai.configure(api_key=api_key)
+                model = genai.GenerativeModel('gemini-flash-latest')
+
+                with pipeline_metrics.timer("crawl_ai_seconds"):
+                    response = await model.generate_content_async(prompt)
+                import json
+                text_resp = response.text.replace("```json", "").replace("```", "").strip()
+                parsed = json.loads(text_resp)
+                if isinstance(parsed, list):
+                    ai_split_cache().put(split_key, parsed)
+                if isinstance(parsed, list) and len(parsed) > 0:
+                    split_items = parsed
+                    logger.info(f"[AI Success] Gemini 자동 분할/단일화 성공! {len(split_items)}개 상품 추출됨")
+                break
+            except Exception as e:
+                error_msg = str(e).lower()
+                if "429" in error_msg:
+                    if "spending cap" in error_msg or "quota" in error_msg or "exhausted" in error_msg:
+                        from backend.core.ai_utils import mark_key_dead
+                        mark_key_dead(api_key)
+                        # 할당량 초과 시 재시도하지 않고 다음 키를 사용하거나 루프 탈출
+                        continue
+                    if attempt < max_retries - 1:
+                        wait_time = 15
+                        match = re.search(r'retry in ([\d\.]+)s', error_msg)
+                        if match:
+                            wait_time = int(float(match.group(1))) + 2
+                        logger.warning(f"Gemini Rate Limit Hit (Split). Waiting {wait_time}s... (Attempt {attempt+1}/{max_retries})")
+                        await asyncio.sleep(wait_time)
+                        continue
+                logger.error(f"Gemini 분할 실패: {e}")
+                break
+        else:
+            logger.info("[Warning] API 키 없음. 상품 자동 분리를 건너뜁니다.")
+            split_items = []
+        return split_items
+
+    # ------------------------------------------------------------------ persist (신규)
+    def insert_stage(self, normalized: NormalizedDeal, dedup: DedupResult, enriched: EnrichedDeal,
+                     placeholder: Optional[Deal] = None) -> PersistResult:
+        """신규 딜 INSERT (AI 분할 결과가 있으면 상품별로, 없으면 단일 등록)"""
+        if enriched.split_items:
+            deals = self._insert_split_items(normalized, dedup, enriched, placeholder)
+        else:
+            deal = self._insert_single(normalized, dedup, enriched, placeholder)
+            deals = [deal] if deal is not None else []
+        return PersistResult(deals=deals, inserted=True)
+
+    def _commit_new_deal(self, new_deal: Deal, price: int):
+        self.db.add(new_deal)
+        # 가격 이력은 딜 INSERT 와 같은 commit 으로
+        self.price_history.record(new_deal, price)
+        self.price_history.stage(self.db)
+        self.db.commit()
+        self.price_history.confirm()
+        self.db.refresh(new_deal)
+        deal_token_index.add(new_deal.id, new_deal.title, new_deal.indexed_at)
+        category_price_stats.add(new_deal.category, new_deal.price, new_deal.brand)
+
+    def _insert_split_items(self, normalized: NormalizedDeal, dedup: DedupResult, enriched: EnrichedDeal,
+                            placeholder: Optional[Deal]) -> List[Deal]:
+        parsed = normalized.parsed
+        raw_title, content_html, split_items = parsed.title, parsed.content_html, enriched.split_items
         inserted_deals = []
-        deals_to_push = []
-        
-        if split_items:
-            for idx, item in enumerate(split_items):
-                # 가격 파싱 에러 방어 (LLM이 "1.1만" 같은 문자열을 반환할 경우)
-                try:
-                    raw_price = str(item.get("price", "0")).replace(",", "").replace("원", "").strip()
-                    if "만" in raw_price:
-                        num_part = raw_price.replace("만", "").strip()
-                        item_price = int(float(num_part) * 10000)
-                    else:
-                        item_price = int(float(raw_price)) if raw_price.replace(".", "").isdigit() else 0
-                except Exception:
-                    item_price = 0
-                    
-                # 고유 식별을 위해 파생 상품명 조합 (모음전 단일화일 경우 raw_title 포맷 유지)
-                if len(split_items) == 1:
-                    derived_title = f"{raw_title.split(']')[0] + ']' if ']' in raw_title else ''} {item.get('name', raw_title)}"
+        for idx, item in enumerate(split_items):
+            # 가격 파싱 에러 방어 (LLM이 "1.1만" 같은 문자열을 반환할 경우)
+            try:
+                raw_price = str(item.get("price", "0")).replace(",", "").replace("원", "").strip()
+                if "만" in raw_price:
+                    num_part = raw_price.replace("만", "").strip()
+                    item_price = int(float(num_part) * 10000)
                 else:
-                    derived_title = f"{raw_title.split(']')[0] + ']' if ']' in raw_title else ''} {item.get('name', '')}"
-                
-                item_ecommerce_link = item.get("ecommerce_link") or scraped_data.get("ecommerce_link")
-                
-                # ai_summary가 있으면 사용, 없으면 디폴트 문자열
-                default_summary = f"✅ {item_price:,}원! AI가 자동 분리해낸 핫딜입니다.\n✅ 분할된 옵션 상품으로 정확한 내용은 본문을 참고하세요.\n✅ 세부 스펙은 상품 페이지를 확인해주세요."
-                final_ai_summary = item.get("ai_summary") or default_summary
-                if honey_score >= 100 and "🔥" not in final_ai_summary:
-                    final_ai_summary = "🔥 [커뮤니티 인증 핫딜] " + final_ai_summary
-                
-                try:
-                    # 본문 내 첨부된 이미지 추출 (Gemini가 빈 문자열 반환 시 대비)
-                    extracted_img = ""
-                    if content_html:
-                        img_matches = re.findall(r'https?://[^\s,"\'<>]+?\.(?:jpg|jpeg|png|gif|webp|bmp)', content_html, re.IGNORECASE)
-                        if img_matches:
-                            # 인덱스에 맞춰 이미지 매핑 시도, 없으면 첫 번째 이미지
-                            extracted_img = img_matches[idx] if idx < len(img_matches) else img_matches[0]
-
-                            
-                    # 브랜드 및 모델명 메타 정보 추출
-                    brand_info = {"brand": "", "model_code": ""}
-                    try:
-                        brand_info = AIProductNameService.extract_brand_and_model(derived_title)
-                    except Exception as e:
-                        logger.error(f"Error extracting brand/model for split deal: {e}")
-
-                    new_deal = Deal(
-                        source_community_id=community_id,
-                        title=derived_title[:255],
-                        price=str(item_price) if item_price else "0",
-                        currency=currency,
-                        post_link=url,
-                        ecommerce_link=item_ecommerce_link or url,
-                        shop_name=shop_name,
-                        shipping_fee=item.get("shipping_fee") or shipping_fee,
-                        is_closed=is_closed,
-                        category=final_category,
-                        base_product_name=item.get("name", normalized.name),
-                        image_url=item.get("image_url") or extracted_img or (image_url if idx == 0 else ""), # 💡 [CEO 피드백 변형: 다중 이미지 추출 시도 후 안드로이드 처리]
-                        ai_summary=final_ai_summary,
-                        content_html=content_html,
-                        honey_score=honey_score,
-                        view_count=view_count,
-                        like_count=like_count,
-                        comment_count=comment_count,
-                        brand=brand_info.get("brand"),
-                        model_code=brand_info.get("model_code"),
-                        indexed_at=posted_dt if posted_dt else func.now()
-                    )
-                    self.db.add(new_deal)
-                    self.db.commit()
-                    self.db.refresh(new_deal)
-                    if item_price > 0: self._insert_price_history(new_deal.id, item_price)
-                    inserted_deals.append(new_deal)
-                    deals_to_push.append({
-                        "id": new_deal.id,
-                        "title": new_deal.title,
-                        "price": new_deal.price,
-                        "shop_name": new_deal.shop_name,
-                        "post_link": new_deal.post_link
-                    })
-                except Exception as e:
-                    self.db.rollback()
-                    logger.error(f"Error inserting split item '{derived_title}': {e}")
-        else:
-            # 단일 등록 (기존 로직)
-            print("DEBUG: Entered else block (단일 등록)")
+                    item_price = int(float(raw_price)) if raw_price.replace(".", "").isdigit() else 0
+            except Exception:
+                item_price = 0
+
+            # 고유 식별을 위해 파생 상품명 조합 (모음전 단일화일 경우 raw_title 포맷 유지)
+            if len(split_items) == 1:
+                derived_title = f"{raw_title.split(']')[0] + ']' if ']' in raw_title else ''} {item.get('name', raw_title)}"
+            else:
+                derived_title = f"{raw_title.split(']')[0] + ']' if ']' in raw_title else ''} {item.get('name', '')}"
+
+            item_ecommerce_link = item.get("ecommerce_link") or parsed.ecommerce_link
+
+            # ai_summary가 있으면 사용, 없으면 디폴트 문자열
+            default_summary = f"✅ {item_price:,}원! AI가 자동 분리해낸 핫딜입니다.\n✅ 분할된 옵션 상품으로 정확한 내용은 본문을 참고하세요.\n✅ 세부 스펙은 상품 페이지를 확인해주세요."
+            final_ai_summary = item.get("ai_summary") or default_summary
+            if enriched.honey_score >= 100 and "🔥" not in final_ai_summary:
+                final_ai_summary = "🔥 [커뮤니티 인증 핫딜] " + final_ai_summary
+
             try:
-                import json
-                options_data_str = None
-                has_options = False
-                if scraped_data.get("options_data"):
-                    options_data_str = json.dumps(scraped_data.get("options_data"), ensure_ascii=False)
-                    has_options = True
-                
-                print(f"DEBUG options_data_str: {options_data_str}")
+                # 본문 내 첨부된 이미지 추출 (Gemini가 빈 문자열 반환 시 대비)
+                extracted_img = ""
+                if content_html:
+                    img_matches = re.findall(r'https?://[^\s,"\'<>]+?\.(?:jpg|jpeg|png|gif|webp|bmp)', content_html, re.IGNORECASE)
+                    if img_matches:
+                        # 인덱스에 맞춰 이미지 매핑 시도, 없으면 첫 번째 이미지
+                        extracted_img = img_matches[idx] if idx < len(img_matches) else img_matches[0]
 
                 # 브랜드 및 모델명 메타 정보 추출
                 brand_info = {"brand": "", "model_code": ""}
                 try:
-                    brand_info = AIProductNameService.extract_brand_and_model(raw_title)
+                    brand_info = AIProductNameService.extract_brand_and_model(derived_title)
                 except Exception as e:
-                    logger.error(f"Error extracting brand/model for single deal: {e}")
-
-                # [대표님 초정밀 안전 장치]: 쪼개지지 않는 모음전이거나, 단일 등록인 모음전(is_multi_item)인 경우,
-                # 아웃링크를 이상한 디코딩 주소로 억지 매핑하지 않고, 뽐뿌 상세 원본글 주소(url)로 강제 고정하여 복원성을 100% 사수한다!
-                # 🎯 단, 유효한 외부 쇼핑몰 아웃링크가 확보되었다면(뽐뿌 도메인이 아닌 외부 주소) 그 외부 주소를 사수한다!
-                single_ecommerce_link = scraped_data.get("ecommerce_link") or url
-                if is_multi_item:
-                    if not single_ecommerce_link or 'ppomppu.co.kr' in single_ecommerce_link:
-                        single_ecommerce_link = url
-
-                new_deal = Deal(
-                    source_community_id=community_id,
-                    title=raw_title,
-                    price=str(final_price) if final_price else "0",
-                    currency=currency,
-                    post_link=url,
-                    ecommerce_link=single_ecommerce_link,
-                    shop_name=shop_name,
-                    shipping_fee=shipping_fee,
-
-                    is_closed=is_closed,
-                    is_super_hotdeal=bool(scraped_data.get("is_super_hotdeal")),
-                    category=final_category,
-                    base_product_name=normalized.name,
-                    image_url=image_url,
-                    ai_summary=ai_summary or ("📦 [모음전] 여러 상품이 포함된 핫딜입니다. 상세페이지에서 확인하세요." if is_multi_item else None),
+                    logger.error(f"Error extracting brand/model for split deal: {e}")
+
+                new_deal = self._new_or_placeholder(
+                    placeholder if idx == 0 else None,
+                    source_community_id=parsed.community_id,
+                    title=derived_title[:255],
+                    price=str(item_price) if item_price else "0",
+                    currency=parsed.currency,
+                    post_link=parsed.url,
+                    ecommerce_link=item_ecommerce_link or parsed.url,
+                    shop_name=parsed.shop_name,
+                    shipping_fee=item.get("shipping_fee") or parsed.shipping_fee,
+                    is_closed=parsed.is_closed,
+                    category=dedup.category,
+                    base_product_name=item.get("name", normalized.product.name),
+                    image_url=item.get("image_url") or extracted_img or (parsed.image_url if idx == 0 else ""), # 💡 [CEO 피드백 변형: 다중 이미지 추출 시도 후 안드로이드 처리]
+                    ai_summary=final_ai_summary,
                     content_html=content_html,
-                    honey_score=honey_score,
-                    view_count=view_count,
-                    like_count=like_count,
-                    comment_count=comment_count,
-                    options_data=options_data_str,
-                    has_options=has_options,
+                    honey_score=enriched.honey_score,
+                    view_count=parsed.view_count,
+                    like_count=parsed.like_count,
+                    comment_count=parsed.comment_count,
                     brand=brand_info.get("brand"),
                     model_code=brand_info.get("model_code"),
-                    indexed_at=posted_dt if posted_dt else func.now()
+                    indexed_at=parsed.posted_dt if parsed.posted_dt else func.now()
                 )
-                self.db.add(new_deal)
-                self.db.commit()
-                self.db.refresh(new_deal)
-                if final_price > 0: self._insert_price_history(new_deal.id, final_price)
+                self._commit_new_deal(new_deal, item_price)
+                inserted_deals.append(new_deal)
             except Exception as e:
-                print(f"DEBUG: Exception inside else block: {e}")
                 self.db.rollback()
-                logger.error(f"Error inserting deal '{raw_title}': {e}")
-                return None
-            
-            inserted_deals.append(new_deal)
-            deals_to_push.append({
-                "id": new_deal.id,
-                "title": new_deal.title,
-                "price": new_deal.price,
-                "shop_name": new_deal.shop_name,
-                "post_link": new_deal.post_link
-            })
-            
-        # [Epic 3] 신규 인서트된 모든 딜(AI 분할 딜 포함)에 대해 푸시 알림 비동기 격발
-        if deals_to_push:
-            import asyncio
-            from concurrent.futures import ThreadPoolExecutor
-            from backend.services.notification_service import NotificationService
-            
-            if not hasattr(self.__class__, '_push_executor'):
-                self.__class__._push_executor = ThreadPoolExecutor(max_workers=5)
-            
-            def trigger_push_task(deal_id, title, price, shop_name, post_link):
-                from backend.database.session import SessionLocal
-                db_session = SessionLocal()
-                try:
-                    price_val = 0
-                    try:
-                        price_val = int(price) if str(price).isdigit() else 0
-                    except Exception:
-                        pass
-                    NotificationService.process_new_deal(
-                        deal_id=deal_id,
-                        title=title,
-                        price=price_val,
-                        site_name=shop_name or "HotDeal",
-                        deal_url=post_link,
-                        db=db_session
-                    )
-                except Exception as ex:
-                    logger.error(f"Push dispatch error in executor: {ex}")
-                finally:
-                    db_session.close()
-
-            loop = asyncio.get_event_loop()
-            for d_info in deals_to_push:
-                loop.run_in_executor(
-                    self.__class__._push_executor, 
-                    trigger_push_task, 
-                    d_info["id"], 
-                    d_info["title"], 
-                    d_info["price"], 
-                    d_info["shop_name"], 
-                    d_info["post_link"]
-                )
+                self.price_history.discard()
+                logger.error(f"Error inserting split item '{derived_title}': {e}")
+        return inserted_deals
+
+    def _insert_single(self, normalized: NormalizedDeal, dedup: DedupResult, enriched: EnrichedDeal,
+                       placeholder: Optional[Deal]) -> Optional[Deal]:
+        # 단일 등록 (기존 로직)
+        parsed = normalized.parsed
+        raw_title, url = parsed.title, parsed.url
+        try:
+            import json
+            options_data_str = None
+            has_options = False
+            if parsed.scraped.get("options_data"):
+                options_data_str = json.dumps(parsed.scraped.get("options_data"), ensure_ascii=False)
+                has_options = True
+
+            # 브랜드 및 모델명 메타 정보 추출
+            brand_info = {"brand": "", "model_code": ""}
+            try:
+                brand_info = AIProductNameService.extract_brand_and_model(raw_title)
+            except Exception as e:
+                logger.error(f"Error extracting brand/model for single deal: {e}")
+
+            # [대표님 초정밀 안전 장치]: 쪼개지지 않는 모음전이거나, 단일 등록인 모음전(is_multi_item)인 경우,
+            # 아웃링크를 이상한 디코딩 주소로 억지 매핑하지 않고, 뽐뿌 상세 원본글 주소(url)로 강제 고정하여 복원성을 100% 사수한다!
+            # 🎯 단, 유효한 외부 쇼핑몰 아웃링크가 확보되었다면(뽐뿌 도메인이 아닌 외부 주소) 그 외부 주소를 사수한다!
+            single_ecommerce_link = parsed.ecommerce_link or url
+            if enriched.is_multi_item:
+                if not single_ecommerce_link or 'ppomppu.co.kr' in single_ecommerce_link:
+                    single_ecommerce_link = url
+
+            new_deal = self._new_or_placeholder(
+                placeholder,
+                source_community_id=parsed.community_id,
+                title=raw_title,
+                price=str(dedup.price) if dedup.price else "0",
+                currency=parsed.currency,
+                post_link=url,
+                ecommerce_link=single_ecommerce_link,
+                shop_name=parsed.shop_name,
+                shipping_fee=parsed.shipping_fee,
+                is_closed=parsed.is_closed,
+                is_super_hotdeal=parsed.is_super_hotdeal,
+                category=dedup.category,
+                base_product_name=normalized.product.name,
+                image_url=parsed.image_url,
+                ai_summary=enriched.ai_summary or ("📦 [모음전] 여러 상품이 포함된 핫딜입니다. 상세페이지에서 확인하세요." if enriched.is_multi_item else None),
+                content_html=parsed.content_html,
+                honey_score=enriched.honey_score,
+                view_count=parsed.view_count,
+                like_count=parsed.like_count,
+                comment_count=parsed.comment_count,
+                options_data=options_data_str,
+                has_options=has_options,
+                brand=brand_info.get("brand"),
+                model_code=brand_info.get("model_code"),
+                indexed_at=parsed.posted_dt if parsed.posted_dt else func.now()
+            )
+            self._commit_new_deal(new_deal, dedup.price)
+        except Exception as e:
+            self.db.rollback()
+            self.price_history.discard()
+            logger.error(f"Error inserting deal '{raw_title}': {e}")
+            return None
+        return new_deal
 
-        logger.debug(f"[Merge Complete] Deal analysis and DB merge completed: {len(inserted_deals)} inserted")
-        return inserted_deals[0] if inserted_deals else None
+    # ------------------------------------------------------------------ notify
+    def notify_stage(self, result: PersistResult):
+        """[Epic 3] 신규 인서트된 모든 딜(AI 분할 딜 포함)은 푸시 발송 큐에 등록 (발송은 스케줄러의 푸시 디스패처 담당)"""
+        if not result.inserted or not result.deals:
+            return
+        from backend.scheduler.push_queue import push_queue
 
-    def _insert_price_history(self, deal_id: int, price: int):
-        """특정 Deal의 가격 변동(골든타임)을 추적합니다."""
-        history = PriceHistory(
-            deal_id=deal_id,
-            price=str(price)
+        for deal in result.deals:
+            try:
+                push_queue().enqueue(deal.id, deal.title, deal.price, deal.shop_name, deal.post_link)
+            except Exception as ex:
+                logger.error(f"Push enqueue error for deal {deal.id}: {ex}")
+
+    def _new_or_placeholder(self, placeholder: Optional[Deal], **fields) -> Deal:
+        """신규 딜 행 생성 (빠른 등록 행이 있으면 그 행에 채워 넣고, 작성 시각을 모르면 기존 등록 시각 유지)"""
+        if placeholder is None:
+            return Deal(**fields)
+        if not isinstance(fields.get("indexed_at"), datetime):
+            fields.pop("indexed_at", None)
+        for key, value in fields.items():
+            setattr(placeholder, key, value)
+        return placeholder
+
+    def _redirect_placeholder(self, placeholder: Deal, survivor: Deal):
+        """
+        다른 딜로 흡수된 빠른 등록 행 → 삭제하지 않고 종료된 리다이렉트 행으로 남김 (이미 피드에 노출된 행)
+        - 사용자 반응(DealReaction)과 가격 이력은 흡수한 딜로 이전
+        - post_link 에 리다이렉트 표시를 붙여 (링크, 제목) 유니크 충돌과 이후 재수집의 오병합 방지
+        """
+        self.db.query(DealReaction).filter(DealReaction.deal_id == placeholder.id).update(
+            {DealReaction.deal_id: survivor.id}, synchronize_session=False
         )
-        self.db.add(history)
-        self.db.commit()
-        logger.info(f"[Price History] 최저가 역사 기록! Deal ID {deal_id} -> {price:,}원")
+        self.db.query(PriceHistory).filter(PriceHistory.deal_id == placeholder.id).update(
+            {PriceHistory.deal_id: survivor.id}, synchronize_session=False
+        )
+        placeholder.is_closed = True
+        if MERGED_REDIRECT_MARK not in placeholder.post_link:
+            placeholder.post_link = f"{placeholder.post_link}{MERGED_REDIRECT_MARK}{survivor.id}"
+
+    def insert_listing(self, community_id: int, scraped_data: dict) -> Optional[Deal]:
+        """
+        ⚡ 빠른 등록: 목록 행 정보만으로 최소 딜을 즉시 INSERT (상세/이미지/정규화/AI 는 보강 큐에서 나중에 채움)
+        - 제목 정규식 가격, 배송비, 작성 시각, 추천/댓글 기반 점수만 사용 (네트워크/AI 호출 없음)
+        - 스팸이거나 같은 글(동일 링크, 24시간 내 동일 제목)이 이미 있으면 None → 호출 측은 일반 경로로 처리
+        """
+        raw_title = scraped_data.get("title", "")
+        url = scraped_data.get("url", "")
+        if not raw_title or not url:
+            return None
+
+        price, currency, free_shipping = extract_title_price(raw_title)
+        provided_price = scraped_data.get("price") or 0
+        if price == 0 and provided_price > 0:
+            price = provided_price
+            currency = scraped_data.get("currency") or currency
+        price = sanitize_price(price, currency)
+        if is_spam_title(raw_title, price):
+            return None
+
+        from datetime import timedelta
+        duplicate = self.db.query(Deal.id).filter(
+            (Deal.post_link == url)
+            | ((Deal.source_community_id == community_id) & (Deal.title == raw_title)
+               & (Deal.indexed_at >= datetime.utcnow() - timedelta(hours=24)))
+        ).first()
+        if duplicate:
+            return None
+
+        posted_dt = parse_posted_at(scraped_data.get("posted_at"))
+
+        view_count = int(scraped_data.get("view_count", 0))
+        like_count = int(scraped_data.get("like_count", 0))
+        comment_count = int(scraped_data.get("comment_count", 0))
+        is_super_hotdeal = bool(scraped_data.get("is_super_hotdeal"))
+        honey_score = 100 if is_super_hotdeal else min(99, int((view_count / 100) + (like_count * 10) + (comment_count * 5)))
+
+        deal = Deal(
+            source_community_id=community_id,
+            title=raw_title,
+            price=str(price) if price else "0",
+            currency=currency,
+            post_link=url,
+            ecommerce_link=scraped_data.get("ecommerce_link") or url,
+            shop_name=scraped_data.get("shop_name", ""),
+            shipping_fee=normalize_shipping_fee("무료배송" if free_shipping else (scraped_data.get("shipping_fee") or "정보 없음"), raw_title),
+            is_closed=bool(scraped_data.get("is_closed")) or "종료" in raw_title or "마감" in raw_title or "품절" in raw_title,
+            is_super_hotdeal=is_super_hotdeal,
+            category=scraped_data.get("category") or "기타",
+            image_url=scraped_data.get("image_url", ""),
+            ai_summary="🔥 [커뮤니티 인기] " if is_super_hotdeal else None,
+            honey_score=honey_score,
+            view_count=view_count,
+            like_count=like_count,
+            comment_count=comment_count,
+            indexed_at=posted_dt if posted_dt else func.now(),
+        )
+        try:
+            self.db.add(deal)
+            self.db.commit()
+            self.db.refresh(deal)
+            deal_token_index.add(deal.id, deal.title, deal.indexed_at)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error fast-inserting deal '{raw_title}': {e}")
+            return None
+        return deal
+
+    @staticmethod
+    def apply_detail(db: Session, deal_id: int, scraped_data: dict) -> Optional[Deal]:
+        """
+        보강 1단계: 상세 페이지 정보(본문, 아웃링크, 고화질 이미지, 배송비, 작성 시각)를 빠른 등록 행에 바로 반영
+        (정규화/AI/병합은 2단계 process_scraped_deal(placeholder=...) 에서)
+        """
+        deal = db.get(Deal, deal_id)
+        if deal is None:
+            return None
+        if scraped_data.get("image_url"):
+            deal.image_url = scraped_data["image_url"]
+        if scraped_data.get("ecommerce_link") and deal.ecommerce_link in (None, "", deal.post_link):
+            deal.ecommerce_link = scraped_data["ecommerce_link"]
+        if scraped_data.get("content_html"):
+            deal.content_html = scraped_data["content_html"]
+        if scraped_data.get("shipping_fee") and deal.shipping_fee in (None, "", "정보 없음"):
+            deal.shipping_fee = normalize_shipping_fee(scraped_data["shipping_fee"], deal.title)
+        if scraped_data.get("is_closed"):
+            deal.is_closed = True
+        if str(deal.price) in ("", "0") and (scraped_data.get("price") or 0) > 0:
+            currency = scraped_data.get("currency") or deal.currency or "KRW"
+            price = sanitize_price(int(scraped_data["price"]), currency)
+            if price:
+                deal.price, deal.currency = str(price), currency
+        posted_dt = parse_posted_at(scraped_data.get("posted_at"))
+        if posted_dt and deal.indexed_at is not None:
+            if deal.indexed_at.hour == 0 and deal.indexed_at.minute == 0 and (posted_dt.hour or posted_dt.minute):
+                deal.indexed_at = posted_dt
+        try:
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error applying detail to deal {deal_id}: {e}")
+            raise
+        return deal
@@ -0,0 +1,107 @@
+"""
+🧠 모음전/가격 누락 글 AI 분할 결과 캐시 (SQLite, 프로세스 간 공유)
+
+- 기존: 모음전·가격 누락 글은 재수집/재업로드/타 커뮤니티 퍼나르기마다 본문 전체를 Gemini 에 다시 보냄
+  (중복 방지는 2일 내 같은 쇼핑몰 링크의 ai_summary 재사용뿐) → 가장 무거운 아이템에서 토큰과 429 대기가 반복
+- 키: 정규화한 (제목, 본문 텍스트, 링크 집합) 의 SHA-256
+  · 제목 앞 [쇼핑몰] 태그, 대소문자, 공백/기호 차이와 링크 순서·트래킹 파라미터는 무시
+- 값: 파싱된 옵션 목록(JSON 배열) 그대로. 빈 배열(AI 가 상품을 못 찾음)도 저장하여 같은 글로 다시 묻지 않음
+- TTL_SECONDS 가 지난 결과는 재사용하지 않음 (가격/구성 변경 반영)
+- 캐시 장애는 수집을 막지 않음 (조회 실패 = 미스, 저장 실패 = 무시)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from typing import List, Optional
+
+from backend.core.sqlite_store import SqliteStore
+
+logger = logging.getLogger(__name__)
+
+AI_CACHE_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "ai_split_cache.db")
+
+TTL_SECONDS = 7 * 24 * 3600
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_URL_RE = re.compile(r'https?://[^\s"\'<>)]+')
+_LEADING_BRACKETS_RE = re.compile(r'^(?:\s*\[[^\]]*\])+')
+_NON_WORD_RE = re.compile(r'[^0-9a-z가-힣]+')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ai_split_results (
+    key TEXT PRIMARY KEY,
+    items TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ai_split_results_created ON ai_split_results(created_at);
+"""
+
+
+def _words(text: str) -> str:
+    return " ".join(_NON_WORD_RE.sub(" ", text.lower()).split())
+
+
+def split_cache_key(title: str, content_html: str) -> str:
+    """(제목, 본문 텍스트, 링크 집합) 정규화 해시"""
+    from backend.core.url_utils import normalize_url
+
+    content_html = content_html or ""
+    links = sorted({normalize_url(link) for link in _URL_RE.findall(content_html)})
+    text = _URL_RE.sub(" ", _TAG_RE.sub(" ", content_html))
+    payload = "\x1f".join([_words(_LEADING_BRACKETS_RE.sub("", title or "")), _words(text), *links])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AiSplitCache(SqliteStore):
+    """글 키 → AI 분할 결과 (TTL 안에서만 재사용)"""
+
+    schema = _SCHEMA
+
+    def __init__(self, path: str = AI_CACHE_DB_PATH, ttl_seconds: float = TTL_SECONDS):
+        super().__init__(path)
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str, now: Optional[float] = None) -> Optional[List[dict]]:
+        """유효한 캐시 결과 (없거나 만료면 None)"""
+        now = time.time() if now is None else now
+        try:
+            row = self.conn.execute(
+                "UPDATE ai_split_results SET hits = hits + 1 WHERE key = ? AND created_at >= ? RETURNING items",
+                (key, now - self.ttl_seconds),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"[AI Cache] 조회 실패 (미스로 처리): {e}")
+            return None
+        return json.loads(row["items"]) if row else None
+
+    def put(self, key: str, items: List[dict], now: Optional[float] = None):
+        try:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO ai_split_results (key, items, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(items, ensure_ascii=False, default=str), time.time() if now is None else now),
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"[AI Cache] 저장 실패: {e}")
+
+    def prune(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        cursor = self.conn.execute("DELETE FROM ai_split_results WHERE created_at < ?", (now - self.ttl_seconds,))
+        return cursor.rowcount
+
+
+_default_cache: Optional[AiSplitCache] = None
+
+
+def ai_split_cache() -> AiSplitCache:
+    """프로세스별 기본 캐시"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = AiSplitCache()
+        _default_cache.prune()
+    return _default_cache
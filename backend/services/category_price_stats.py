@@ -0,0 +1,164 @@
+"""
+📊 카테고리(브랜드) 가격 통계 캐시 (꿀딜 점수 기준가)
+
+- 기존: 딜 1건마다 SELECT AVG(CAST(price AS INTEGER)) ... WHERE category = ? 로 테이블 전체를 캐스팅 스캔
+- 캐시: 카테고리별(표본이 충분하면 카테고리+브랜드별) 가격 분포를 로그 구간 히스토그램으로 유지
+  · 신규 딜 INSERT 시 add() 로 즉시 반영, REFRESH_SECONDS 마다 DB 에서 한 번 다시 집계 (다른 프로세스 반영/가격 변경 보정)
+  · 재집계(전체 deals 스캔)는 별도 스레드에서 전용 세션으로 → 수집 워커의 이벤트 루프를 막지 않음
+  · 평균은 한두 건의 고가 모음전/오기입에 끌려가므로 점수 기준가는 중앙값 사용 (분위수 조회 지원)
+- 프로세스 전역 1개 (스케줄러 프로세스의 모든 AggregatorService 가 공유)
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+REFRESH_SECONDS = 3600
+# 히스토그램 구간 폭 (가격 2% 단위 → 분위수 오차 ±1%)
+BIN_RATIO = 1.02
+# 브랜드별 통계는 이 표본 수 이상일 때만 카테고리 통계 대신 사용
+MIN_BRAND_SAMPLES = 5
+
+_LOG_RATIO = math.log(BIN_RATIO)
+
+
+def _bin(price: float) -> int:
+    return int(math.floor(math.log(price) / _LOG_RATIO))
+
+
+def _bin_center(index: int) -> float:
+    return BIN_RATIO ** (index + 0.5)
+
+
+class PriceHistogram:
+    """가격 분포 (정확한 평균 + 근사 분위수)"""
+
+    __slots__ = ("count", "total", "bins", "_sorted")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.bins: Dict[int, int] = defaultdict(int)
+        self._sorted = None
+
+    def add(self, price: float):
+        self.count += 1
+        self.total += price
+        self.bins[_bin(price)] += 1
+        self._sorted = None
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self.bins.items())
+        target = q * self.count
+        seen = 0
+        for index, n in self._sorted:
+            seen += n
+            if seen >= target:
+                return _bin_center(index)
+        return _bin_center(self._sorted[-1][0])
+
+
+def parse_price(value) -> int:
+    """Deal.price(문자열) → 정수 (숫자가 아니면 0, 기존 CAST 조건과 동일하게 양수만 유효)"""
+    text = str(value or "")
+    return int(text) if text.isdigit() else 0
+
+
+class CategoryPriceStats:
+    def __init__(self, refresh_seconds: float = REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self.categories: Dict[str, PriceHistogram] = {}
+        self.brands: Dict[Tuple[str, str], PriceHistogram] = {}
+        self.refreshed_at: Optional[float] = None
+        self._refreshing = False
+        self._task: Optional[asyncio.Future] = None
+
+    def add(self, category: Optional[str], price, brand: Optional[str] = None):
+        price = parse_price(price)
+        if not category or price <= 0:
+            return
+        self.categories.setdefault(category, PriceHistogram()).add(price)
+        if brand:
+            self.brands.setdefault((category, brand), PriceHistogram()).add(price)
+
+    def refresh(self, db, now: Optional[float] = None):
+        """DB 전체 재집계 (카테고리/브랜드/가격 세 컬럼만 읽고 캐스팅은 파이썬에서)"""
+        from backend.database.models import Deal
+
+        rows = db.query(Deal.category, Deal.brand, Deal.price).filter(Deal.category.isnot(None)).all()
+        # 새 분포를 따로 만든 뒤 한 번에 교체 (재집계 중에도 기존 통계 조회 가능)
+        fresh = CategoryPriceStats(self.refresh_seconds)
+        for category, brand, price in rows:
+            fresh.add(category, price, brand)
+        self.categories, self.brands = fresh.categories, fresh.brands
+        self.refreshed_at = time.time() if now is None else now
+        logger.info(f"📊 [PriceStats] 카테고리 가격 통계 재집계: {len(self.categories)}개 카테고리, {len(rows)}건")
+
+    def is_fresh(self, now: float) -> bool:
+        return self.refreshed_at is not None and now - self.refreshed_at < self.refresh_seconds
+
+    def _refresh_with(self, session_factory: Callable, now: float):
+        """워커 스레드에서 실행 (실패하면 기존 통계 유지, 다음 호출에서 재시도)"""
+        db = session_factory()
+        try:
+            self.refresh(db, now)
+        except Exception as e:
+            logger.warning(f"⚠️ [PriceStats] 카테고리 가격 통계 재집계 실패: {e}")
+        finally:
+            db.close()
+            self._refreshing = False
+
+    async def ensure_fresh(self, session_factory: Callable, now: Optional[float] = None):
+        """
+        오래됐으면 asyncio.to_thread 로 재집계 (session_factory: 스레드 전용 세션 생성)
+        - 최초 적재만 기다리고, 이후 주기 재집계 동안에는 기존 통계(+ add() 로 반영된 신규 딜)로 계속 점수 계산
+        """
+        now = time.time() if now is None else now
+        if self._refreshing or self.is_fresh(now):
+            return
+        self._refreshing = True
+        refresh = asyncio.to_thread(self._refresh_with, session_factory, now)
+        if self.refreshed_at is None:
+            await refresh
+        else:
+            self._task = asyncio.ensure_future(refresh)
+
+    def histogram(self, category: str, brand: Optional[str] = None) -> Optional[PriceHistogram]:
+        if brand:
+            by_brand = self.brands.get((category, brand))
+            if by_brand is not None and by_brand.count >= MIN_BRAND_SAMPLES:
+                return by_brand
+        return self.categories.get(category)
+
+    def reference_price(self, category: str, brand: Optional[str] = None) -> Optional[float]:
+        """점수 기준가: 브랜드(표본 충분 시) 또는 카테고리 가격 중앙값"""
+        histogram = self.histogram(category, brand)
+        return histogram.quantile(0.5) if histogram is not None else None
+
+    def summary(self, category: str, brand: Optional[str] = None) -> Optional[dict]:
+        histogram = self.histogram(category, brand)
+        if histogram is None:
+            return None
+        return {
+            "count": histogram.count,
+            "mean": round(histogram.mean),
+            "p25": round(histogram.quantile(0.25)),
+            "p50": round(histogram.quantile(0.5)),
+            "p75": round(histogram.quantile(0.75)),
+        }
+
+
+# 스케줄러 프로세스 전역 캐시 (모든 AggregatorService 인스턴스가 공유)
+category_price_stats = CategoryPriceStats()
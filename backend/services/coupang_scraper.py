@@ -6,7 +6,6 @@ import logging
 import os
 import re
 import asyncio
-import aiohttp
 from typing import Optional
 from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor
@@ -18,6 +17,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium_stealth import stealth
 
+from core.http_transport import http_transport
 from services.product_scraper_interface import ProductScraperInterface
 
 class CoupangAPIClient(ProductScraperInterface):
@@ -72,35 +72,34 @@ class CoupangWebScraper(ProductScraperInterface):
                 'Cache-Control': 'max-age=0',
                 'Referer': 'https://www.coupang.com/'
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=15) as response:
-                    if response.status != 200:
-                        logging.error(f"[COUPANG_SCRAPER] HTTP 에러: {response.status}")
-                        return None
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    selectors = [
-                        'h1.prod-buy-header__title', '.prod-buy-header__title',
-                        'h2.prod-buy-header__title', '.product-title h2',
-                        '.product-title', '#productTitle', 'h1[class*="title"]',
-                        'div[class*="prod-buy"] h1', 'div[class*="prod-buy"] h2'
-                    ]
-                    product_name = None
-                    for selector in selectors:
-                        element = soup.select_one(selector)
-                        if element:
-                            product_name = element.get_text(strip=True)
-                            if product_name:
-                                logging.info(f"[COUPANG_SCRAPER] 선택자 '{selector}'로 찾음")
-                                break
+            response = await http_transport.get(url, headers=headers, timeout=15.0, tag="coupang")
+            if response.status_code != 200:
+                logging.error(f"[COUPANG_SCRAPER] HTTP 에러: {response.status_code}")
+                return None
+            html = response.text
+            soup = BeautifulSoup(html, 'html.parser')
+            selectors = [
+                'h1.prod-buy-header__title', '.prod-buy-header__title',
+                'h2.prod-buy-header__title', '.product-title h2',
+                '.product-title', '#productTitle', 'h1[class*="title"]',
+                'div[class*="prod-buy"] h1', 'div[class*="prod-buy"] h2'
+            ]
+            product_name = None
+            for selector in selectors:
+                element = soup.select_one(selector)
+                if element:
+                    product_name = element.get_text(strip=True)
                     if product_name:
-                        product_name = re.sub(r'\s+', ' ', product_name).strip()
-                        product_name = re.sub(r'[\n\r\t]', '', product_name)
-                        logging.info(f"[COUPANG_SCRAPER] 성공: {product_name}")
-                        return product_name
-                    else:
-                        logging.warning(f"[COUPANG_SCRAPER] 상품명을 찾을 수 없음")
-                        return None
+                        logging.info(f"[COUPANG_SCRAPER] 선택자 '{selector}'로 찾음")
+                        break
+            if product_name:
+                product_name = re.sub(r'\s+', ' ', product_name).strip()
+                product_name = re.sub(r'[\n\r\t]', '', product_name)
+                logging.info(f"[COUPANG_SCRAPER] 성공: {product_name}")
+                return product_name
+            else:
+                logging.warning(f"[COUPANG_SCRAPER] 상품명을 찾을 수 없음")
+                return None
         except Exception as e:
             logging.error(f"[COUPANG_SCRAPER] 에러: {str(e)}", exc_info=True)
             return None
@@ -112,23 +111,22 @@ class CoupangWebScraper(ProductScraperInterface):
                 'Accept': 'text/html,application/xhtml+xml',
                 'Accept-Language': 'ko-KR,ko;q=0.9'
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=15) as response:
-                    if response.status != 200:
-                        return None
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    name_elem = soup.select_one('.prod-buy-header__title')
-                    name = name_elem.get_text(strip=True) if name_elem else None
-                    price_elem = soup.select_one('.total-price strong')
-                    price_text = price_elem.get_text(strip=True) if price_elem else "0"
-                    price = int(re.sub(r'[^0-9]', '', price_text))
-                    img_elem = soup.select_one('.prod-image__detail img')
-                    image_url = img_elem.get('src') if img_elem else None
-                    return {
-                        'name': name, 'price': price, 'brand': None,
-                        'model': None, 'image_url': image_url
-                    }
+            response = await http_transport.get(url, headers=headers, timeout=15.0, tag="coupang")
+            if response.status_code != 200:
+                return None
+            html = response.text
+            soup = BeautifulSoup(html, 'html.parser')
+            name_elem = soup.select_one('.prod-buy-header__title')
+            name = name_elem.get_text(strip=True) if name_elem else None
+            price_elem = soup.select_one('.total-price strong')
+            price_text = price_elem.get_text(strip=True) if price_elem else "0"
+            price = int(re.sub(r'[^0-9]', '', price_text))
+            img_elem = soup.select_one('.prod-image__detail img')
+            image_url = img_elem.get('src') if img_elem else None
+            return {
+                'name': name, 'price': price, 'brand': None,
+                'model': None, 'image_url': image_url
+            }
         except Exception as e:
             logging.error(f"[COUPANG_SCRAPER] get_product_info 에러: {str(e)}", exc_info=True)
             return None
@@ -0,0 +1,135 @@
+"""
+🗂️ 롤링 윈도우(24시간) 딜 제목 토큰 역색인 (토큰 교차 매칭 가드용)
+
+- 기존: 링크/상품명 매칭이 실패할 때마다 최근 24시간 딜 전체를 query.all() 로 읽어 제목을 매번 다시 토큰화
+  → 하루 수집량에 비례하는 비용이 아이템마다 발생 (바쁜 날 집계기의 최대 비용)
+- 색인: 토큰 → 딜 ID 집합. 핵심 키워드 2개 이상을 공유하는 딜만 후보로 뽑고, 후보만 DB 에서 읽어 최종 확인
+- 프로세스 전역 1개 (스케줄러 프로세스의 모든 AggregatorService 가 공유)
+  · 첫 사용 시 최근 24시간 딜로 채우고, 이후에는 마지막으로 본 ID 이후의 딜만 가져와 이어 붙임
+    (워커 풀의 다른 프로세스가 넣은 딜도 다음 매칭 때 반영)
+  · 삽입/제목·시각 갱신 시 add(), 삭제 시 discard(), 24시간이 지난 딜은 만료 힙으로 자동 제거
+- 후보는 DB 의 현재 제목으로 다시 검증하므로 색인이 잠시 뒤처져도 잘못 병합하지 않음
+"""
+
+import heapq
+import re
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+WINDOW_SECONDS = 24 * 3600
+# 후보가 되려면 공유해야 하는 핵심 키워드 수 (기존 가드와 동일)
+MIN_CORE_OVERLAP = 2
+# 이어 붙일 때 마지막 ID 보다 이만큼 앞부터 다시 읽음 (다른 프로세스에서 늦게 커밋된 낮은 ID 보정, 재추가는 무해)
+SYNC_ID_OVERLAP = 50
+
+_CLEAN_RE = re.compile(r'[^a-zA-Z0-9가-힣\s]')
+_CORE_RE = re.compile(r'[0-9]+[wWdD]?|[a-zA-Z]{4,}')
+_STOPWORDS = frozenset({"to", "and", "or", "for", "pcs"})
+
+
+def title_tokens(text: str) -> FrozenSet[str]:
+    """영어, 숫자, 한글 위주로 토큰화하여 한-영 교차 매칭 지원 (2글자 이상, 불용어 제외)"""
+    cleaned = _CLEAN_RE.sub(' ', (text or "").lower())
+    return frozenset(token for token in cleaned.split() if len(token) >= 2 and token not in _STOPWORDS)
+
+
+def core_tokens(tokens: FrozenSet[str]) -> Set[str]:
+    """핵심 키워드: 브랜드/숫자 스펙 (예: toocki, 100w, ugreen)"""
+    return {token for token in tokens if _CORE_RE.search(token)}
+
+
+def _epoch(value) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class DealTokenIndex:
+    def __init__(self, window_seconds: float = WINDOW_SECONDS):
+        self.window_seconds = window_seconds
+        self.tokens: Dict[int, FrozenSet[str]] = {}
+        self.indexed_at: Dict[int, float] = {}
+        self.postings: Dict[str, Set[int]] = defaultdict(set)
+        # (만료 기준 시각, 딜 ID). 시각이 갱신된 딜의 이전 항목은 꺼낼 때 무시
+        self._expiry: List[Tuple[float, int]] = []
+        self.max_id = 0
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    # ------------------------------------------------------------ maintenance
+    def add(self, deal_id: int, title: str, indexed_at=None, now: Optional[float] = None):
+        """삽입 또는 제목/시각 갱신 반영 (indexed_at 을 알 수 없으면 지금 기준)"""
+        stamp = _epoch(indexed_at)
+        if stamp is None:
+            stamp = datetime.now(timezone.utc).timestamp() if now is None else now
+        tokens = title_tokens(title)
+        previous = self.tokens.get(deal_id)
+        if previous != tokens:
+            if previous is not None:
+                self._unlink(deal_id, previous)
+            self.tokens[deal_id] = tokens
+            for token in tokens:
+                self.postings[token].add(deal_id)
+        if self.indexed_at.get(deal_id) != stamp:
+            self.indexed_at[deal_id] = stamp
+            heapq.heappush(self._expiry, (stamp, deal_id))
+
+    def discard(self, deal_id: int):
+        tokens = self.tokens.pop(deal_id, None)
+        self.indexed_at.pop(deal_id, None)
+        if tokens is not None:
+            self._unlink(deal_id, tokens)
+
+    def _unlink(self, deal_id: int, tokens: FrozenSet[str]):
+        for token in tokens:
+            ids = self.postings.get(token)
+            if ids is not None:
+                ids.discard(deal_id)
+                if not ids:
+                    del self.postings[token]
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """윈도우(24시간)를 벗어난 딜 제거. 제거한 수 반환"""
+        cutoff = (datetime.now(timezone.utc).timestamp() if now is None else now) - self.window_seconds
+        removed = 0
+        while self._expiry and self._expiry[0][0] < cutoff:
+            stamp, deal_id = heapq.heappop(self._expiry)
+            if self.indexed_at.get(deal_id) == stamp:
+                self.discard(deal_id)
+                removed += 1
+        return removed
+
+    def sync(self, db, now: Optional[float] = None):
+        """마지막으로 본 ID 이후 딜만 DB 에서 이어 붙임 (첫 호출은 최근 24시간 전체)"""
+        from backend.database.models import Deal
+
+        now = datetime.now(timezone.utc).timestamp() if now is None else now
+        cutoff = datetime.fromtimestamp(now - self.window_seconds, timezone.utc).replace(tzinfo=None)
+        rows = db.query(Deal.id, Deal.title, Deal.indexed_at).filter(
+            Deal.indexed_at >= cutoff, Deal.id > self.max_id - SYNC_ID_OVERLAP
+        ).all()
+        for deal_id, title, indexed_at in rows:
+            self.add(deal_id, title, indexed_at, now=now)
+            self.max_id = max(self.max_id, deal_id)
+        self.expire(now)
+
+    # ------------------------------------------------------------ lookup
+    def candidates(self, core: Set[str], min_overlap: int = MIN_CORE_OVERLAP) -> List[int]:
+        """핵심 키워드를 min_overlap 개 이상 공유하는 딜 ID (ID 오름차순 = 기존 전체 스캔 순서)"""
+        counts: Dict[int, int] = defaultdict(int)
+        for token in core:
+            for deal_id in self.postings.get(token, ()):
+                counts[deal_id] += 1
+        return sorted(deal_id for deal_id, count in counts.items() if count >= min_overlap)
+
+
+# 스케줄러 프로세스 전역 색인 (모든 AggregatorService 인스턴스가 공유)
+deal_token_index = DealTokenIndex()
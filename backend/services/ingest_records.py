@@ -0,0 +1,77 @@
+"""
+🧱 수집 글 처리 파이프라인 단계 간 전달 레코드
+
+parse → normalize → dedup → enrich → persist → notify
+- 각 단계는 앞 단계의 레코드만 입력으로 받음 (AggregatorService.*_stage)
+- parse/normalize 는 DB 쓰기가 없어 여러 글을 동시에 돌릴 수 있고, dedup 이후는 세션 하나로 순서대로 처리
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from backend.services.normalizer.base import NormalizedProduct
+
+
+@dataclass
+class ParsedDeal:
+    """parse: 제목/스크래퍼 값에서 가격·통화·배송비·작성 시각 확정 (스팸이면 레코드 없음)"""
+    community_id: int
+    community_name: str
+    scraped: Dict[str, Any]
+    title: str
+    url: str
+    shop_name: str
+    image_url: Optional[str]
+    content_html: str
+    ecommerce_link: Optional[str]
+    price: int
+    currency: str
+    shipping_fee: str
+    is_closed: bool
+    posted_dt: Optional[datetime]
+    view_count: int = 0
+    like_count: int = 0
+    comment_count: int = 0
+    is_super_hotdeal: bool = False
+
+
+@dataclass
+class NormalizedDeal:
+    """normalize: 상품명/브랜드/카테고리 정규화 + 적립/이벤트 카테고리 보정"""
+    parsed: ParsedDeal
+    product: NormalizedProduct
+    category: str
+
+
+@dataclass
+class DedupResult:
+    """dedup: 병합 대상 기존 딜 + 쇼핑몰 링크 글로벌 캐시로 보정한 가격/카테고리"""
+    existing: List[Any]
+    price: int
+    category: str
+    cached_ai_summary: Optional[str] = None
+
+    @property
+    def is_new(self) -> bool:
+        return not self.existing
+
+
+@dataclass
+class EnrichedDeal:
+    """enrich (신규 딜만): 꿀딜 점수, 요약, 모음전 판정, AI 분할 결과"""
+    honey_score: int
+    ai_summary: Optional[str]
+    is_multi_item: bool
+    split_items: List[dict] = field(default_factory=list)
+
+
+@dataclass
+class PersistResult:
+    """persist: 병합(갱신)된 기존 딜 또는 새로 INSERT 된 딜들"""
+    deals: List[Any]
+    inserted: bool
+
+    @property
+    def primary(self):
+        return self.deals[0] if self.deals else None
@@ -0,0 +1,290 @@
+"""
+🧩 기존 딜 병합(Upsert) 정책: 필드별 규칙 테이블
+
+- 이미 수집된 딜(동일 글 재수집 / 롤링 윈도우 클러스터링)에 새 수집 결과를 덮어쓰는 규칙을 한곳에 모음
+  · 최저가 우선 (더 싼 글이 나오면 가격·제목·구매 링크 교체, 기존 링크는 merged_communities 로 백업)
+  · 더 좋은 이미지 우선 (저화질 썸네일 < 일반 < 상세 페이지 원본)
+  · 종료 상태는 OR (한 번 종료/품절로 확인된 딜은 재수집으로 되살리지 않음)
+  · 조회/추천/댓글 수와 꿀딜 점수는 최대값 유지 (커뮤니티 인증 핫딜 해제 시에만 강등)
+- merge_deal() 이 규칙을 테이블 순서대로 한 번씩 적용하고 바뀐 필드 목록을 돌려줌
+  → 호출 측은 autoflush 없이 적용한 뒤 한 번만 commit
+- 규칙 순서가 의미를 가짐: 제목 규칙은 가격 규칙이 가격을 바꾸기 전의 기존 가격으로 판단
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from backend.services.ai_product_name_service import AIProductNameService
+
+logger = logging.getLogger(__name__)
+
+NO_SHIPPING_INFO = "정보 없음"
+HOT_SUMMARY_PREFIX = "🔥 [커뮤니티 인증 핫딜] "
+
+# 이미지 화질 판별 (저화질 패턴이 고화질 패턴보다 우선)
+_LOW_QUALITY_IMAGE_RE = re.compile(
+    r"_thumb|thumb/|small_|_70x50|_120x90|_150x150|crop\.webp|filesn|zboard/data/ppomppu", re.IGNORECASE
+)
+_HIGH_QUALITY_IMAGE_RE = re.compile(
+    r"files/attach|ruliweb\.com/img|quasarzone\.com/editor|quasarzone\.com/qb_saleinfo", re.IGNORECASE
+)
+
+
+def image_rank(url: str) -> int:
+    """0: 저화질 썸네일, 1: 일반, 2: 상세 페이지 고화질 원본"""
+    if _LOW_QUALITY_IMAGE_RE.search(url):
+        return 0
+    if _HIGH_QUALITY_IMAGE_RE.search(url):
+        return 2
+    return 1
+
+
+@dataclass
+class IncomingDeal:
+    """기존 딜에 병합할 이번 수집 결과 (process_scraped_deal 에서 정규화/가격 판정까지 끝난 값)"""
+    community_id: int
+    url: str
+    title: str
+    price: int
+    currency: str = "KRW"
+    category: Optional[str] = None
+    image_url: str = ""
+    ecommerce_link: Optional[str] = None
+    content_html: str = ""
+    shipping_fee: Optional[str] = None
+    is_closed: bool = False
+    options_data: Optional[str] = None  # JSON 직렬화 완료 문자열
+    posted_dt: Optional[datetime] = None
+    view_count: int = 0
+    like_count: int = 0
+    comment_count: int = 0
+    is_super_hotdeal: bool = False
+    # 병합 대상이 1건일 때만 제목/가격을 교체 (AI 분할 딜 묶음에는 종료 상태 등만 일괄 반영)
+    single: bool = True
+
+
+@dataclass
+class MergeResult:
+    changed: List[str] = field(default_factory=list)
+
+    @property
+    def price_changed(self) -> bool:
+        return "price" in self.changed
+
+
+def _current_price(deal) -> float:
+    return int(deal.price) if str(deal.price).isdigit() else float("inf")
+
+
+def _append_merged(deal, community_id: int, link: str) -> bool:
+    """merged_communities 에 '커뮤니티ID::링크' 추가 (같은 커뮤니티가 이미 있으면 무시)"""
+    merged = deal.merged_communities.split(",") if deal.merged_communities else []
+    if any(entry.startswith(f"{community_id}::") or entry == str(community_id) for entry in merged):
+        return False
+    merged.append(f"{community_id}::{link}")
+    deal.merged_communities = ",".join(merged)
+    return True
+
+
+# ------------------------------------------------------------------ rules
+def _posted_time(deal, incoming: IncomingDeal) -> bool:
+    # 새로 수집된 진짜 작성 시각이 있으면 기존의 잘못된 수집 시각을 보정
+    if incoming.posted_dt and deal.indexed_at != incoming.posted_dt:
+        deal.indexed_at = incoming.posted_dt
+        return True
+    return False
+
+
+def _title(deal, incoming: IncomingDeal) -> bool:
+    # 동일 글의 제목 수정, 또는 더 싼 새 글(클러스터링)의 제목으로 교체
+    if not incoming.single or deal.title == incoming.title:
+        return False
+    if deal.post_link == incoming.url or 0 < incoming.price < _current_price(deal):
+        deal.title = incoming.title
+        return True
+    return False
+
+
+def _lowest_price(deal, incoming: IncomingDeal) -> bool:
+    if not incoming.single or incoming.price <= 0:
+        return False
+    if incoming.price < _current_price(deal):
+        logger.info(f"[Lowest Price Updated!] 기존 {deal.price}원 -> 새 핫딜 {incoming.price}원 (URL 교체: {incoming.url})")
+        deal.price = str(incoming.price)
+        # 기존 구매 링크는 백업 후 더 싼 곳으로 교체
+        if deal.source_community_id:
+            _append_merged(deal, deal.source_community_id, deal.post_link)
+        deal.post_link = incoming.url
+        return True
+    if deal.post_link == incoming.url and str(deal.price) != str(incoming.price):
+        deal.price = str(incoming.price)
+        return True
+    return False
+
+
+def _better_image(deal, incoming: IncomingDeal) -> bool:
+    # 고화질이 선점되어 있으면 저화질/일반 이미지로 덮어쓰지 않음
+    new = incoming.image_url
+    if not new or deal.image_url == new:
+        return False
+    if not deal.image_url or image_rank(new) >= image_rank(deal.image_url):
+        deal.image_url = new
+        return True
+    return False
+
+
+def _fill_if_empty(attr: str, source: str) -> Callable:
+    def rule(deal, incoming: IncomingDeal) -> bool:
+        value = getattr(incoming, source)
+        if value and not getattr(deal, attr):
+            setattr(deal, attr, value)
+            return True
+        return False
+    return rule
+
+
+def _brand_model(deal, incoming: IncomingDeal) -> bool:
+    # [가격분석] 비어 있던 브랜드/모델명 보완
+    if deal.brand and deal.model_code:
+        return False
+    try:
+        info = AIProductNameService.extract_brand_and_model(deal.title)
+    except Exception as e:
+        logger.error(f"Error extracting brand/model for existing deal during upsert: {e}")
+        return False
+    changed = False
+    if info.get("brand") and not deal.brand:
+        deal.brand = info["brand"]
+        changed = True
+    if info.get("model_code") and not deal.model_code:
+        deal.model_code = info["model_code"]
+        changed = True
+    return changed
+
+
+def _category(deal, incoming: IncomingDeal) -> bool:
+    if incoming.category and deal.category != incoming.category:
+        deal.category = incoming.category
+        return True
+    return False
+
+
+def _currency(deal, incoming: IncomingDeal) -> bool:
+    if getattr(deal, "currency", None) != incoming.currency:
+        deal.currency = incoming.currency
+        return True
+    return False
+
+
+def _closed(deal, incoming: IncomingDeal) -> bool:
+    if incoming.is_closed and not deal.is_closed:
+        deal.is_closed = True
+        return True
+    return False
+
+
+def _merged_community(deal, incoming: IncomingDeal) -> bool:
+    # 다른 커뮤니티 글이 병합되면 링크와 함께 기록 (프론트엔드에서 클릭 이동)
+    if deal.source_community_id == incoming.community_id:
+        return False
+    return _append_merged(deal, incoming.community_id, incoming.url)
+
+
+def _shipping_fee(deal, incoming: IncomingDeal) -> bool:
+    # 새 값이 '정보 없음'이면 기존 유효 배송 정보 유지
+    fee = incoming.shipping_fee
+    if fee and fee != NO_SHIPPING_INFO:
+        value = fee
+    elif not deal.shipping_fee or deal.shipping_fee == NO_SHIPPING_INFO:
+        value = fee or NO_SHIPPING_INFO
+    else:
+        return False
+    if deal.shipping_fee != value:
+        deal.shipping_fee = value
+        return True
+    return False
+
+
+def _options(deal, incoming: IncomingDeal) -> bool:
+    if incoming.options_data and (deal.options_data != incoming.options_data or not deal.has_options):
+        deal.options_data = incoming.options_data
+        deal.has_options = True
+        return True
+    return False
+
+
+def _max_counter(attr: str) -> Callable:
+    def rule(deal, incoming: IncomingDeal) -> bool:
+        value = getattr(incoming, attr)
+        if value > (getattr(deal, attr) or 0):
+            setattr(deal, attr, value)
+            return True
+        return False
+    return rule
+
+
+def _honey_score(deal, incoming: IncomingDeal) -> bool:
+    # 반응 지표 기반 점수는 최대값 유지. 인증 핫딜은 100점, 인증이 풀린 100점 딜만 재계산 점수로 강등
+    score = int(((deal.view_count or 0) / 100) + ((deal.like_count or 0) * 10) + ((deal.comment_count or 0) * 5))
+    if incoming.is_super_hotdeal:
+        score = 100
+        if not deal.ai_summary:
+            deal.ai_summary = HOT_SUMMARY_PREFIX
+        elif "🔥" not in deal.ai_summary:
+            deal.ai_summary = HOT_SUMMARY_PREFIX + deal.ai_summary
+    else:
+        score = min(99, score)
+        if deal.honey_score is not None and deal.honey_score != 100:
+            score = max(score, deal.honey_score)
+    if deal.honey_score != score:
+        deal.honey_score = score
+        return True
+    return False
+
+
+def _super_hotdeal(deal, incoming: IncomingDeal) -> bool:
+    if bool(deal.is_super_hotdeal) != incoming.is_super_hotdeal:
+        deal.is_super_hotdeal = incoming.is_super_hotdeal
+        return True
+    return False
+
+
+# (필드, 규칙) — 위에서부터 순서대로 적용
+MERGE_RULES: Tuple[Tuple[str, Callable], ...] = (
+    ("indexed_at", _posted_time),
+    ("title", _title),
+    ("price", _lowest_price),
+    ("image_url", _better_image),
+    ("ecommerce_link", _fill_if_empty("ecommerce_link", "ecommerce_link")),
+    ("content_html", _fill_if_empty("content_html", "content_html")),
+    ("brand", _brand_model),
+    ("category", _category),
+    ("currency", _currency),
+    ("is_closed", _closed),
+    ("merged_communities", _merged_community),
+    ("shipping_fee", _shipping_fee),
+    ("options_data", _options),
+    ("view_count", _max_counter("view_count")),
+    ("like_count", _max_counter("like_count")),
+    ("comment_count", _max_counter("comment_count")),
+    ("honey_score", _honey_score),
+    ("is_super_hotdeal", _super_hotdeal),
+)
+
+
+# 반응 지표만 바뀐 재수집(쓰기 지연 버퍼 flush)에 적용하는 규칙
+REACTION_RULES: Tuple[Tuple[str, Callable], ...] = tuple(
+    (name, rule) for name, rule in MERGE_RULES if name in ("view_count", "like_count", "comment_count", "honey_score")
+)
+
+
+def merge_deal(deal, incoming: IncomingDeal, rules: Tuple[Tuple[str, Callable], ...] = MERGE_RULES) -> MergeResult:
+    """규칙 테이블을 한 번씩 적용 (DB 접근 없음, flush/commit 은 호출 측)"""
+    result = MergeResult()
+    for name, rule in rules:
+        if rule(deal, incoming):
+            result.changed.append(name)
+    return result
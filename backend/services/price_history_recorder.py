@@ -0,0 +1,112 @@
+"""
+📉 딜 가격 이력(PriceHistory) 기록기 — 작업 단위 버퍼 + 변경분만 기록
+
+- 기존: 새 최저가를 볼 때마다 PriceHistory 1행 add + commit (딜 INSERT/UPSERT commit 과 별도)
+  → 딥 스캔/백필 때 이력 쓰기와 commit 수가 수집 건수만큼 늘어남
+- record() 는 버퍼에만 담고, stage() 가 작업 단위(딜 1건 병합/등록)의 commit 직전에 세션에 한 번에 올림
+  · 신규 딜(아직 ID 없음)은 relationship 으로 붙여 딜 INSERT 와 같은 flush 에서 기록
+- 변경분만: 마지막으로 기록된 가격과 같으면 건너뜀 (프로세스 캐시, 없으면 DB 에서 딜 묶음당 1회 조회)
+- 샘플링: PRICE_HISTORY_SAMPLE_SECONDS > 0 이면 딜당 그 간격 안에서는 더 낮은 가격만 기록 (기본 0 = 끔)
+- commit 성공 후 confirm(), 실패 시 discard() 로 캐시 오염 방지
+"""
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+
+from backend.database.models import PriceHistory
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_SECONDS = float(os.getenv("PRICE_HISTORY_SAMPLE_SECONDS", "0"))
+# 딜별 마지막 기록 (가격, 시각) 캐시 크기 (LRU)
+LAST_POINT_CACHE_SIZE = 20000
+
+# deal_id → (가격 문자열, 기록 시각). 프로세스 전역 (스케줄러 프로세스의 모든 AggregatorService 가 공유)
+_last_points: "OrderedDict[int, Tuple[str, float]]" = OrderedDict()
+
+
+def _remember(deal_id: int, price: str, recorded_at: float):
+    _last_points[deal_id] = (price, recorded_at)
+    _last_points.move_to_end(deal_id)
+    while len(_last_points) > LAST_POINT_CACHE_SIZE:
+        _last_points.popitem(last=False)
+
+
+def _load_last_points(db, deal_ids: Iterable[int]) -> Dict[int, Tuple[str, float]]:
+    """캐시에 없는 딜들의 마지막 기록을 한 번의 쿼리로 조회"""
+    deal_ids = [deal_id for deal_id in deal_ids if deal_id not in _last_points]
+    if deal_ids:
+        latest = db.query(func.max(PriceHistory.id)).filter(PriceHistory.deal_id.in_(deal_ids)).group_by(PriceHistory.deal_id)
+        rows = db.query(PriceHistory.deal_id, PriceHistory.price, PriceHistory.checked_at).filter(PriceHistory.id.in_(latest)).all()
+        for deal_id, price, checked_at in rows:
+            _remember(deal_id, str(price), checked_at.timestamp() if checked_at else 0.0)
+    return _last_points
+
+
+class PriceHistoryRecorder:
+    """AggregatorService 인스턴스마다 1개 (작업 단위마다 record → stage → commit → confirm)"""
+
+    def __init__(self, sample_seconds: float = SAMPLE_SECONDS):
+        self.sample_seconds = sample_seconds
+        self._pending: "OrderedDict[int, Tuple[object, str]]" = OrderedDict()
+        self._staged: List[Tuple[object, str, float]] = []
+
+    def record(self, deal, price: int):
+        """가격 포인트 버퍼링 (같은 작업 단위 안에서 같은 딜은 마지막 값만)"""
+        if price <= 0:
+            return
+        self._pending[id(deal)] = (deal, str(price))
+
+    def _should_write(self, deal_id: Optional[int], price: str, now: float) -> bool:
+        if deal_id is None:
+            return True
+        last = _last_points.get(deal_id)
+        if last is None:
+            return True
+        last_price, recorded_at = last
+        if last_price == price:
+            return False
+        if self.sample_seconds and now - recorded_at < self.sample_seconds:
+            # 샘플 간격 안에서는 더 낮은 가격(새 최저가)만 기록
+            return last_price.isdigit() and int(price) < int(last_price)
+        return True
+
+    def stage(self, db, now: Optional[float] = None) -> int:
+        """버퍼의 포인트를 세션에 올림 (commit 은 호출 측). 올린 행 수 반환"""
+        now = time.time() if now is None else now
+        # 이전 작업 단위가 commit 실패로 confirm 되지 않았다면 그 기록은 버림
+        self._staged = []
+        pending, self._pending = list(self._pending.values()), OrderedDict()
+        known_ids = [deal.id for deal, _ in pending if deal.id is not None]
+        if known_ids:
+            _load_last_points(db, known_ids)
+        staged = 0
+        for deal, price in pending:
+            if not self._should_write(deal.id, price, now):
+                continue
+            if deal.id is not None:
+                db.add(PriceHistory(deal_id=deal.id, price=price))
+            else:
+                # 신규 딜은 딜 INSERT 와 같은 flush 에서 (ID 확정 후 자동 연결)
+                deal.price_history.append(PriceHistory(price=price))
+            self._staged.append((deal, price, now))
+            staged += 1
+        return staged
+
+    def confirm(self):
+        """commit 성공 후: 기록한 가격을 마지막 값 캐시에 반영"""
+        for deal, price, recorded_at in self._staged:
+            if deal.id is not None:
+                _remember(deal.id, price, recorded_at)
+                logger.info(f"[Price History] 최저가 역사 기록! Deal ID {deal.id} -> {int(price):,}원")
+        self._staged = []
+
+    def discard(self):
+        """rollback 시: 버퍼/대기 기록 폐기"""
+        self._pending = OrderedDict()
+        self._staged = []
@@ -0,0 +1,60 @@
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.database.models import Base, Community
+from backend.services import aggregator_service
+from backend.services.aggregator_service import AggregatorService
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        session.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+        session.commit()
+    return factory
+
+
+def test_normalizer_is_built_once_per_process(monkeypatch):
+    built = []
+
+    class FakeNormalizer:
+        def __init__(self):
+            built.append(self)
+
+    monkeypatch.setattr(aggregator_service, "LlmNormalizer", FakeNormalizer)
+    monkeypatch.setattr(aggregator_service, "_shared_normalizer", None)
+
+    first, second = AggregatorService(), AggregatorService()
+    assert len(built) == 1
+    assert first.normalizer is second.normalizer is built[0]
+
+
+def test_bind_swaps_session_and_community_name_is_cached(session_factory, monkeypatch):
+    monkeypatch.setattr(aggregator_service, "_community_names", {})
+    aggregator = AggregatorService(normalizer=object())
+
+    first = session_factory()
+    assert aggregator.bind(first).db is first
+    assert aggregator_service.community_name_for(first, 1) == "ppomppu"
+    # 없는 ID 는 캐시하지 않음
+    assert aggregator_service.community_name_for(first, 2) == ""
+    first.close()
+
+    # 이름이 캐시되어 다음 작업 단위에서는 커뮤니티를 다시 조회하지 않음
+    second = session_factory()
+    second.query(Community).filter(Community.id == 1).delete()
+    second.commit()
+    assert aggregator.bind(second).db is second
+    assert aggregator_service.community_name_for(second, 1) == "ppomppu"
+    assert 2 not in aggregator_service._community_names
+    second.close()
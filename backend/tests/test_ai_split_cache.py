@@ -0,0 +1,88 @@
+import asyncio
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.core import ai_utils
+from backend.core.metrics import MetricsRegistry
+from backend.database.models import Base, Community, Deal
+from backend.scheduler import push_queue as push_queue_module
+from backend.scheduler.push_queue import PushQueue
+from backend.services import ai_split_cache as ai_split_cache_module
+from backend.services import aggregator_service
+from backend.services.ai_split_cache import AiSplitCache, split_cache_key
+from backend.services.deal_token_index import DealTokenIndex
+from backend.services.normalizer.base import NormalizedProduct
+
+CONTENT = '<p>망고 1kg 12,900원</p><p>키위 2kg 15,900원</p><a href="https://smartstore.naver.com/a/1?utm_source=x">링크</a>'
+
+
+class StubNormalizer:
+    async def normalize(self, title, scraped_category=None):
+        return NormalizedProduct(name=title.split("]")[-1].strip(), category=scraped_category or "식품", raw_title=title)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = AiSplitCache(str(tmp_path / "ai_split_cache.db"), ttl_seconds=3600)
+    yield c
+    c.close()
+
+
+def test_key_ignores_shop_tag_case_markup_and_link_order():
+    links = '<a href="http://a.com/1"></a> <a href="https://b.com/2"></a>'
+    swapped = '<a href="https://b.com/2"></a><a href="https://a.com/1"></a>'
+    base = split_cache_key("[스마트스토어] 과일 모음전 (12,900원/무료)", "<b>망고,  키위</b>" + links)
+    assert base == split_cache_key("[네이버] 과일 모음전 (12,900원 / 무료)", "망고 키위" + swapped)
+    assert base != split_cache_key("[네이버] 과일 모음전 (13,900원/무료)", "망고 키위" + links)
+    assert base != split_cache_key("[네이버] 과일 모음전 (12,900원/무료)", "망고 키위" + links + " https://c.com/3")
+
+
+def test_get_returns_fresh_entries_only(cache):
+    cache.put("k", [{"name": "망고", "price": 12900}], now=0)
+    cache.put("empty", [], now=0)
+    assert cache.get("k", now=10) == [{"name": "망고", "price": 12900}]
+    # 빈 결과도 캐시 히트 (None 과 구분)
+    assert cache.get("empty", now=10) == []
+    assert cache.get("k", now=3601) is None
+    assert cache.prune(now=3601) == 2
+
+
+def test_aggregator_reuses_cached_split_without_gemini(cache, tmp_path, monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+    db.commit()
+    push = PushQueue(str(tmp_path / "push_queue.db"))
+    monkeypatch.setattr(push_queue_module, "_default_queue", push)
+    monkeypatch.setattr(ai_split_cache_module, "_default_cache", cache)
+    monkeypatch.setattr(aggregator_service, "ai_split_cache", lambda: cache)
+    monkeypatch.setattr(aggregator_service, "_community_names", {})
+    monkeypatch.setattr(aggregator_service, "deal_token_index", DealTokenIndex())
+    monkeypatch.setattr(aggregator_service, "pipeline_metrics", MetricsRegistry(str(tmp_path / "metrics.db")))
+
+    def no_gemini():
+        raise AssertionError("캐시 히트 시 Gemini 를 호출하면 안 됨")
+
+    # _split_items 는 호출 시점에 ai_utils 에서 키를 가져옴 (정규화기는 스텁이라 키를 쓰지 않음)
+    monkeypatch.setattr(ai_utils, "get_random_gemini_key", no_gemini)
+    title = "[스마트스토어] 망고, 키위 과일 모음전"
+    cache.put(split_cache_key(title, CONTENT), [
+        {"name": "망고 1kg", "price": 12900, "shipping_fee": "무료배송"},
+        {"name": "키위 2kg", "price": 15900, "shipping_fee": "무료배송"},
+    ])
+
+    asyncio.run(aggregator_service.AggregatorService(db, normalizer=StubNormalizer()).process_scraped_deal(
+        1, {"title": title, "url": "https://x/1", "content_html": CONTENT}
+    ))
+
+    assert sorted(deal.price for deal in db.query(Deal)) == ["12900", "15900"]
+    push.close()
+    db.close()
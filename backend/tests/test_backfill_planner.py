@@ -0,0 +1,89 @@
+import os
+import sys
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.scheduler.backfill_planner import (
+    FAILURE_COOLDOWN_SECONDS,
+    BackfillPlanner,
+    posted_epoch,
+)
+from backend.scheduler.crawl_planner import CrawlOutcome, CrawlProfile
+
+PROFILES = [CrawlProfile("ppomppu"), CrawlProfile("ruliweb"), CrawlProfile("clien", backfill_cap=2)]
+GAP_START = 1_000_000.0
+NOW = GAP_START + 10 * 3600
+
+
+def make_planner(tmp_path, budget=60.0):
+    planner = BackfillPlanner(budget, path=str(tmp_path / "backfill.json"))
+    assert planner.start(GAP_START, 10.0, PROFILES)
+    return planner
+
+
+def test_start_applies_depth_caps_and_is_idempotent(tmp_path):
+    planner = make_planner(tmp_path)
+
+    assert {name: state.max_pages for name, state in planner.states.items()} == {"ppomppu": 15, "ruliweb": 15, "clien": 2}
+    # 진행 중에 공백이 다시 감지되어도 처음부터 다시 시작하지 않음
+    planner.states["ppomppu"].next_page = 8
+    assert not planner.start(GAP_START, 12.0, PROFILES)
+    assert planner.states["ppomppu"].next_page == 8
+
+
+def test_token_bucket_spreads_pages_across_ticks(tmp_path):
+    planner = make_planner(tmp_path, budget=180.0)  # 분당 3페이지
+    names = ["ppomppu", "ruliweb", "clien"]
+
+    first = planner.next_chunks(NOW, names)
+    assert first == {"ppomppu": (2, 3)}
+    # 같은 틱에 다시 불러도 예산이 없으면 추가 요청 없음 (재시작 직후 일괄 폭주 방지)
+    assert planner.next_chunks(NOW, names) == {}
+    # 1분 뒤 예산 충전 → 가장 오래 쉰 커뮤니티 차례
+    assert planner.next_chunks(NOW + 60, ["ruliweb", "clien"]) == {"ruliweb": (2, 3)}
+    assert planner.next_chunks(NOW + 120, ["ppomppu", "ruliweb", "clien"]) == {"clien": (2, 1)}
+
+
+def test_resume_from_checkpoint_and_finish_at_watermark(tmp_path):
+    planner = make_planner(tmp_path, budget=600.0)
+    planner.next_chunks(NOW, ["ppomppu"])
+    planner.record("ppomppu", CrawlOutcome(new_posts=30, pages=3, last_page=4, oldest_post_at=GAP_START + 3600), now=NOW)
+
+    # 재시작: 체크포인트에서 멈춘 페이지와 워터마크 복원
+    resumed = BackfillPlanner(600.0, path=planner.path)
+    state = resumed.states["ppomppu"]
+    assert (state.next_page, state.pages_done, state.oldest_reached) == (5, 3, GAP_START + 3600)
+    assert resumed.next_chunks(NOW + 60, ["ppomppu"]) == {"ppomppu": (5, 3)}
+
+    resumed.record("ppomppu", CrawlOutcome(new_posts=5, pages=3, last_page=7, oldest_post_at=GAP_START - 60), now=NOW + 60)
+    assert resumed.states["ppomppu"].done and resumed.states["ppomppu"].reason == "공백 시작 시각 도달"
+    assert resumed.next_chunks(NOW + 600, ["ppomppu"]) == {}
+
+
+def test_reached_known_list_end_and_failure_cooldown(tmp_path):
+    planner = make_planner(tmp_path, budget=600.0)
+    planner.record("ppomppu", CrawlOutcome(new_posts=0, pages=3, last_page=4, reached_known=True), now=NOW)
+    planner.record("clien", CrawlOutcome(new_posts=2, pages=1, last_page=2, list_ended=True), now=NOW)
+    assert planner.states["ppomppu"].done and planner.states["clien"].done
+
+    planner.record("ruliweb", CrawlOutcome(new_posts=0, pages=3, failed=True), now=NOW)
+    assert planner.next_chunks(NOW + 60, ["ruliweb"]) == {}
+    assert planner.next_chunks(NOW + FAILURE_COOLDOWN_SECONDS + 1, ["ruliweb"]) == {"ruliweb": (2, 3)}
+    assert not planner.states["ruliweb"].done
+
+
+def test_start_page_shifts_with_arrivals_while_resting(tmp_path):
+    planner = make_planner(tmp_path, budget=600.0)
+    planner.next_chunks(NOW, ["ppomppu"])
+    planner.record("ppomppu", CrawlOutcome(new_posts=10, pages=3, last_page=4), now=NOW)
+
+    # 10분 쉬는 동안 분당 5개 글 → 50개 = 20개씩 2페이지 밀림
+    chunks = planner.next_chunks(NOW + 600, ["ppomppu"], arrival_per_minute={"ppomppu": 5.0}, rows_per_page={"ppomppu": 20})
+    assert chunks == {"ppomppu": (7, 3)}
+
+
+def test_posted_epoch_parses_iso():
+    assert posted_epoch("1970-01-01T00:01:00") == 60.0
+    assert posted_epoch("1970-01-01T09:01:00+09:00") == 60.0
+    assert posted_epoch("어제") is None and posted_epoch(None) is None
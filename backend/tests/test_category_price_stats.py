@@ -0,0 +1,112 @@
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.database.models import Base, Community, Deal
+from backend.services.category_price_stats import CategoryPriceStats, PriceHistogram
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _deal(n, category, price, brand=None):
+    return Deal(
+        source_community_id=1, title=f"딜 {n}",
+        post_link=f"https://ppomppu.co.kr/{n}", category=category, price=price, brand=brand,
+    )
+
+
+def test_histogram_quantiles_within_bin_error():
+    histogram = PriceHistogram()
+    for price in range(1000, 101000, 1000):
+        histogram.add(price)
+    assert histogram.mean == pytest.approx(50500)
+    assert histogram.quantile(0.5) == pytest.approx(50000, rel=0.02)
+    assert histogram.quantile(0.25) == pytest.approx(25000, rel=0.02)
+    # 평균과 달리 중앙값은 극단적인 고가 하나에 끌려가지 않음
+    histogram.add(50_000_000)
+    assert histogram.quantile(0.5) == pytest.approx(51000, rel=0.02)
+
+
+def test_refresh_reads_db_and_skips_invalid_prices(db):
+    db.add_all([_deal(1, "디지털", "10000"), _deal(2, "디지털", "30000"), _deal(3, "디지털", "20000"),
+                _deal(4, "디지털", "0"), _deal(5, "디지털", "가격미상"), _deal(6, "식품", "5000")])
+    db.commit()
+
+    stats = CategoryPriceStats()
+    stats.refresh(db, now=0)
+    assert stats.categories["디지털"].count == 3
+    assert stats.reference_price("디지털") == pytest.approx(20000, rel=0.02)
+    assert stats.summary("식품")["count"] == 1
+    assert stats.reference_price("없는카테고리") is None
+
+
+def test_brand_reference_needs_enough_samples():
+    stats = CategoryPriceStats()
+    for price in (10000, 12000, 14000, 16000):
+        stats.add("디지털", price, brand="애플")
+    for price in (1000, 2000, 3000):
+        stats.add("디지털", price)
+
+    # 브랜드 표본 4건 → 카테고리 중앙값
+    assert stats.reference_price("디지털", "애플") == pytest.approx(10000, rel=0.02)
+    stats.add("디지털", 18000, brand="애플")
+    assert stats.reference_price("디지털", "애플") == pytest.approx(14000, rel=0.02)
+
+
+def test_ensure_fresh_rebuilds_off_the_event_loop(tmp_path):
+    # 스레드 전용 세션이 같은 DB 를 보도록 파일 DB 사용
+    engine = create_engine(f"sqlite:///{tmp_path / 'deals.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    db.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+    db.add(_deal(1, "디지털", "10000"))
+    db.commit()
+
+    stats = CategoryPriceStats(refresh_seconds=3600)
+    refresh_threads = []
+    refresh = stats.refresh
+
+    def tracked_refresh(session, now=None):
+        refresh_threads.append(threading.get_ident())
+        refresh(session, now)
+
+    stats.refresh = tracked_refresh
+
+    async def scenario():
+        # 최초 적재는 기다림
+        await stats.ensure_fresh(factory, now=0)
+        assert stats.reference_price("디지털") == pytest.approx(10000, rel=0.02)
+
+        db.add_all([_deal(2, "디지털", "30000"), _deal(3, "디지털", "50000")])
+        db.commit()
+        await stats.ensure_fresh(factory, now=1800)
+        assert len(refresh_threads) == 1
+
+        # 주기 재집계는 백그라운드: 바로 반환하고 끝날 때까지 기존 통계로 응답
+        await stats.ensure_fresh(factory, now=3600)
+        assert stats.categories["디지털"].count == 1
+        await stats._task
+        assert stats.categories["디지털"].count == 3
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+    assert len(refresh_threads) == 2 and loop_thread not in refresh_threads
+    db.close()
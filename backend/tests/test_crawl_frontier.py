@@ -0,0 +1,126 @@
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.scheduler.crawl_frontier import (
+    HOT_WINDOW_SECONDS,
+    PRUNE_AFTER_SECONDS,
+    REFRESH_WINDOW_SECONDS,
+    STABLE_COOLDOWN_SECONDS,
+    CrawlFrontier,
+)
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc).timestamp()
+
+
+def row(url, **extra):
+    return {"url": url, "title": "딜", "price": "10,000원", "like_count": 1, **extra}
+
+
+class FakeLookup:
+    """deal_lookup.existing_deal_snapshots 대역 (호출 횟수/조회 URL 기록)"""
+
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+        self.calls = []
+
+    def __call__(self, urls):
+        self.calls.append(sorted(urls))
+        return {url: self.snapshots[url] for url in urls if url in self.snapshots}
+
+
+def snapshot(deal_id, age_seconds, refreshed_ago=None):
+    indexed_at = datetime.fromtimestamp(NOW - age_seconds, tz=timezone.utc).replace(tzinfo=None)
+    reaction = None
+    if refreshed_ago is not None:
+        reaction = datetime.fromtimestamp(NOW - refreshed_ago, tz=timezone.utc).replace(tzinfo=None)
+    return {"id": deal_id, "indexed_at": indexed_at, "has_content": True,
+            "is_super_hotdeal": False, "reaction_updated_at": reaction}
+
+
+def test_admit_applies_legacy_time_guards_without_repeat_lookups(tmp_path):
+    frontier = CrawlFrontier("ppomppu", str(tmp_path))
+    lookup = FakeLookup({
+        "https://x/hot": snapshot(1, HOT_WINDOW_SECONDS - 60, refreshed_ago=60),
+        "https://x/stable": snapshot(2, 5 * 3600, refreshed_ago=60),
+        "https://x/due": snapshot(3, 5 * 3600, refreshed_ago=STABLE_COOLDOWN_SECONDS + 60),
+        "https://x/old": snapshot(4, REFRESH_WINDOW_SECONDS + 60),
+    })
+    items = [row(f"https://x/{name}") for name in ("hot", "stable", "due", "old", "new")]
+
+    admitted, known = frontier.admit(items, lookup, NOW, cycle_started=NOW)
+
+    assert [item["url"] for item in admitted] == ["https://x/hot", "https://x/due", "https://x/new"]
+    assert known == 4
+    assert len(lookup.calls) == 1
+
+    # 같은 사이클에 다시 보이면 전부 중복 처리, DB 조회 없음
+    admitted, known = frontier.admit([row("https://x/new"), row("https://x/hot")], lookup, NOW + 1, cycle_started=NOW)
+    assert admitted == [] and known == 2
+    assert len(lookup.calls) == 1
+
+
+def test_changed_row_is_refreshed_during_cooldown(tmp_path):
+    frontier = CrawlFrontier("clien", str(tmp_path))
+    lookup = FakeLookup({})
+    first = row("https://x/1")
+    frontier.admit([first], lookup, NOW, cycle_started=NOW)
+    frontier.mark_refreshed("https://x/1", first, NOW)
+    entry = frontier.get("https://x/1")
+    assert entry.is_known and entry.indexed_at == NOW
+
+    # 3시간 이후 쿨다운 중: 목록 내용이 같으면 스킵, 핫딜마크가 붙으면 즉시 갱신
+    later = NOW + HOT_WINDOW_SECONDS + 60
+    entry.last_refresh, entry.next_due = later - 60, later - 60 + STABLE_COOLDOWN_SECONDS
+    admitted, _ = frontier.admit([row("https://x/1")], lookup, later, cycle_started=later)
+    assert admitted == []
+    admitted, _ = frontier.admit([row("https://x/1", is_super_hotdeal=True)], lookup, later + 1, cycle_started=later + 1)
+    assert len(admitted) == 1
+    assert lookup.calls == [["https://x/1"]]
+
+
+def test_checkpoint_round_trip_and_prune(tmp_path):
+    frontier = CrawlFrontier("ruliweb", str(tmp_path))
+    lookup = FakeLookup({"https://x/known": snapshot(7, 600, refreshed_ago=120)})
+    frontier.admit([row("https://x/known"), row("https://x/stale")], lookup, NOW - PRUNE_AFTER_SECONDS - 10, cycle_started=0)
+    frontier.admit([row("https://x/known")], lookup, NOW, cycle_started=NOW)
+    frontier.checkpoint(NOW)
+
+    with open(tmp_path / "ruliweb.json", encoding="utf-8") as f:
+        assert set(json.load(f)["entries"]) == {"https://x/known"}
+
+    restored = CrawlFrontier("ruliweb", str(tmp_path)).load()
+    entry = restored.get("https://x/known")
+    assert entry.deal_id == 7 and entry.has_content and entry.is_known
+    assert restored.get("https://x/stale") is None
+    assert not os.path.exists(tmp_path / "ruliweb.json.tmp")
+
+
+def test_corrupt_checkpoint_starts_empty(tmp_path):
+    (tmp_path / "fmkorea.json").write_text("{broken", encoding="utf-8")
+    assert CrawlFrontier("fmkorea", str(tmp_path)).load().entries == {}
+
+
+def test_reactions_only_detects_counter_changes_and_reads_old_checkpoints(tmp_path):
+    frontier = CrawlFrontier("ppomppu", str(tmp_path))
+    first = row("https://x/1", view_count=10)
+    frontier.mark_refreshed("https://x/1", first, NOW, deal_id=3)
+    entry = frontier.get("https://x/1")
+
+    assert entry.deal_id == 3
+    assert entry.reactions_only(row("https://x/1", view_count=50, like_count=4, comment_count=2))
+    # 핫딜 승격/종료/가격 변경은 전체 경로
+    assert not entry.reactions_only(row("https://x/1", is_super_hotdeal=True))
+    assert not entry.reactions_only(row("https://x/1", is_closed=True))
+    assert not entry.reactions_only(row("https://x/1", price="9,000원"))
+
+    # 핵심 해시가 없는 이전 체크포인트 행은 첫 갱신까지 전체 경로
+    (tmp_path / "clien.json").write_text(json.dumps({
+        "version": 1, "entries": {"https://x/2": [NOW, NOW, NOW, "abc", NOW, 5, True, False]},
+    }), encoding="utf-8")
+    legacy = CrawlFrontier("clien", str(tmp_path)).load().get("https://x/2")
+    assert legacy.deal_id == 5 and not legacy.reactions_only(row("https://x/2"))
@@ -0,0 +1,113 @@
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.scheduler.crawl_planner import (
+    LEGACY_INTERVAL_MINUTES,
+    MAX_INTERVAL_MINUTES,
+    MIN_INTERVAL_MINUTES,
+    AdaptiveCrawlScheduler,
+    CrawlOutcome,
+    CrawlProfile,
+)
+
+KST = timezone(timedelta(hours=9))
+PROFILES = [CrawlProfile("ppomppu"), CrawlProfile("clien", max_pages=2, rows_per_page=30)]
+
+
+def simulate(planner: AdaptiveCrawlScheduler, start: datetime, minutes: int, rates: dict, hot_rates: dict = None):
+    """분 단위 틱으로 due → record 를 돌리며 커뮤니티별 (분당 유입률) 만큼 신규 글을 발생시킴"""
+    hot_rates = hot_rates or {}
+    last = {name: start for name in planner.states}
+    for minute in range(minutes):
+        now = start + timedelta(minutes=minute)
+        for name, pages in planner.due(now).items():
+            elapsed = (now - last[name]).total_seconds() / 60.0
+            last[name] = now
+            planner.record(name, CrawlOutcome(
+                new_posts=round(rates[name] * elapsed),
+                hot_promotions=round(hot_rates.get(name, 0.0) * elapsed),
+                pages=pages,
+            ), now)
+
+
+def test_warmup_follows_legacy_schedule():
+    planner = AdaptiveCrawlScheduler(PROFILES)
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=KST)
+
+    assert planner.due(now) == {"ppomppu": 1, "clien": 1}
+    # 수집 중인 커뮤니티는 다시 내보내지 않음
+    assert planner.due(now) == {}
+
+    planner.record("ppomppu", CrawlOutcome(new_posts=5), now)
+    state = planner.states["ppomppu"]
+    assert state.plan.interval_minutes == LEGACY_INTERVAL_MINUTES
+    assert state.plan.pages == 1 and state.plan.reason == "warmup"
+    assert state.next_due_at == now + timedelta(minutes=LEGACY_INTERVAL_MINUTES)
+
+
+def test_busy_board_polled_more_often_than_quiet_board():
+    planner = AdaptiveCrawlScheduler(PROFILES)
+    start = datetime(2026, 10, 19, 12, 0, tzinfo=KST)
+    simulate(planner, start, 120, rates={"ppomppu": 1.5, "clien": 0.05})
+
+    ppomppu, clien = planner.states["ppomppu"], planner.states["clien"]
+    assert ppomppu.plan.interval_minutes < LEGACY_INTERVAL_MINUTES
+    assert ppomppu.plan.interval_minutes >= MIN_INTERVAL_MINUTES
+    assert clien.plan.interval_minutes == MAX_INTERVAL_MINUTES
+    assert ppomppu.arrival_rate > clien.arrival_rate
+    assert planner.planned_pages_per_hour() <= planner.budget_pages_per_hour + 1e-6
+
+    snapshot = planner.snapshot()
+    assert set(snapshot) == {"ppomppu", "clien"}
+    assert snapshot["ppomppu"]["arrival_per_hour"] > snapshot["clien"]["arrival_per_hour"]
+
+
+def test_hourly_profile_slows_quiet_hours():
+    planner = AdaptiveCrawlScheduler(PROFILES)
+    start = datetime(2026, 10, 19, 11, 0, tzinfo=KST)
+    simulate(planner, start, 120, rates={"ppomppu": 1.0, "clien": 0.6})
+    busy_interval = planner.states["clien"].plan.interval_minutes
+
+    night = datetime(2026, 10, 20, 3, 0, tzinfo=KST)
+    for state in planner.states.values():
+        state.next_due_at = None
+    simulate(planner, night, 120, rates={"ppomppu": 1.0, "clien": 0.02})
+
+    assert planner.states["clien"].plan.interval_minutes > busy_interval
+    assert 3 in planner.states["clien"].hourly_arrival and 11 in planner.states["clien"].hourly_arrival
+
+
+def test_hot_promotions_trigger_deep_scan():
+    planner = AdaptiveCrawlScheduler([CrawlProfile("ppomppu")])
+    start = datetime(2026, 10, 19, 20, 0, tzinfo=KST)
+    simulate(planner, start, 60, rates={"ppomppu": 0.3}, hot_rates={"ppomppu": 0.2})
+
+    plan = planner.states["ppomppu"].plan
+    assert plan.pages == 3 and "심층" in plan.reason
+
+
+def test_budget_caps_total_request_rate():
+    profiles = [CrawlProfile(f"board{i}") for i in range(4)]
+    planner = AdaptiveCrawlScheduler(profiles, budget_pages_per_hour=60)
+    start = datetime(2026, 10, 19, 12, 0, tzinfo=KST)
+    simulate(planner, start, 180, rates={p.name: 3.0 for p in profiles})
+
+    assert planner.planned_pages_per_hour() <= 60 + 1e-6
+    assert all(s.plan.interval_minutes > MIN_INTERVAL_MINUTES for s in planner.states.values())
+
+
+def test_failures_back_off():
+    planner = AdaptiveCrawlScheduler([CrawlProfile("fmkorea", extra_requests=1)])
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=KST)
+    planner.due(now)
+    planner.record("fmkorea", CrawlOutcome(new_posts=0, failed=True), now)
+    first = planner.states["fmkorea"].plan.interval_minutes
+    planner.record("fmkorea", CrawlOutcome(new_posts=0, failed=True), now)
+
+    assert first == LEGACY_INTERVAL_MINUTES * 2
+    assert planner.states["fmkorea"].plan.interval_minutes == min(MAX_INTERVAL_MINUTES, first * 2)
+    assert planner.states["fmkorea"].plan.pages == 1
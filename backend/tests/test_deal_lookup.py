@@ -0,0 +1,67 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.database.models import Base, Community, Deal, DealReaction
+from backend.scheduler.deal_lookup import existing_deal_snapshots
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: session.statements.append(statement))
+    yield session
+    session.close()
+
+
+def seed(db):
+    db.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+    now = datetime(2026, 10, 19, 3, 0)
+    db.add_all([
+        Deal(id=1, source_community_id=1, title="a", post_link="https://x/1", indexed_at=now,
+             content_html="<p>본문</p>", is_super_hotdeal=True, ecommerce_link="https://shop/1"),
+        Deal(id=2, source_community_id=1, title="b", post_link="https://x/2", indexed_at=now - timedelta(hours=30)),
+        DealReaction(id=1, deal_id=1, last_updated=now + timedelta(minutes=5)),
+        DealReaction(id=2, deal_id=1, last_updated=now + timedelta(minutes=50)),
+    ])
+    db.commit()
+    db.statements.clear()
+    return now
+
+
+def test_snapshots_by_post_link_use_single_query(db):
+    now = seed(db)
+
+    found = existing_deal_snapshots(db, Deal.post_link, ["https://x/1", "https://x/2", "https://x/3"])
+
+    assert len(db.statements) == 1
+    assert found["https://x/1"] == {
+        "id": 1,
+        "indexed_at": now,
+        "has_content": True,
+        "is_super_hotdeal": True,
+        "reaction_updated_at": now + timedelta(minutes=5),
+    }
+    second = found["https://x/2"]
+    assert second["id"] == 2 and not second["has_content"] and second["reaction_updated_at"] is None
+    assert "https://x/3" not in found
+
+
+def test_snapshots_by_ecommerce_link_with_time_window(db):
+    now = seed(db)
+
+    found = existing_deal_snapshots(db, Deal.ecommerce_link, ["https://shop/1"], Deal.indexed_at >= now - timedelta(hours=24))
+    assert found["https://shop/1"]["id"] == 1
+    assert existing_deal_snapshots(db, Deal.ecommerce_link, ["https://shop/1"], Deal.indexed_at > now) == {}
+    assert existing_deal_snapshots(db, Deal.post_link, []) == {}
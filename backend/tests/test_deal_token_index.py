@@ -0,0 +1,101 @@
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.database.models import Base, Community, Deal
+from backend.services import aggregator_service
+from backend.services.deal_token_index import DealTokenIndex, core_tokens, title_tokens
+
+NOW = datetime(2026, 10, 19, 12, 0)
+NOW_TS = NOW.replace(tzinfo=timezone.utc).timestamp()
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_tokenizer_matches_legacy_guard():
+    tokens = title_tokens("[알리] Toocki 100W C to C 케이블 3pcs (5,900원/무료)")
+    assert tokens == {"알리", "toocki", "100w", "케이블", "3pcs", "900원", "무료"}
+    assert core_tokens(tokens) == {"toocki", "100w", "3pcs", "900원"}
+
+
+def test_candidates_need_two_shared_core_tokens_and_follow_updates():
+    index = DealTokenIndex()
+    index.add(1, "Toocki 100W C to C 3개", NOW)
+    index.add(2, "Toocki 65W 충전기", NOW)
+    index.add(3, "Ugreen 100W 충전기", NOW)
+
+    core = core_tokens(title_tokens("Toocki C to C 100W 3pcs"))
+    assert index.candidates(core) == [1]
+
+    # 제목이 바뀌면 이전 토큰 색인에서 빠짐
+    index.add(1, "Baseus 30W 보조배터리", NOW)
+    assert index.candidates(core) == []
+    index.discard(3)
+    assert "ugreen" not in index.postings and len(index) == 2
+
+
+def test_entries_expire_after_window_even_when_refreshed():
+    index = DealTokenIndex(window_seconds=3600)
+    index.add(1, "Toocki 100W", NOW - timedelta(minutes=50))
+    index.add(2, "Toocki 100W", NOW - timedelta(minutes=70))
+    # 작성 시각 보정으로 더 최근이 된 딜은 이전 만료 항목이 있어도 유지
+    index.add(2, "Toocki 100W", NOW - timedelta(minutes=10))
+    index.add(3, "Toocki 100W", NOW - timedelta(minutes=90))
+
+    assert index.expire(NOW_TS) == 1
+    assert sorted(index.tokens) == [1, 2]
+    assert index.expire(NOW_TS + 3600) == 2 and len(index) == 0
+
+
+def test_sync_loads_window_then_only_new_ids(db):
+    db.add_all([
+        Deal(id=1, source_community_id=1, title="Toocki 100W A", post_link="https://x/1", indexed_at=NOW - timedelta(hours=30)),
+        Deal(id=2, source_community_id=1, title="Toocki 100W B", post_link="https://x/2", indexed_at=NOW - timedelta(hours=2)),
+    ])
+    db.commit()
+    index = DealTokenIndex()
+    index.sync(db, now=NOW_TS)
+    assert sorted(index.tokens) == [2] and index.max_id == 2
+
+    # 다른 프로세스가 넣은 딜도 다음 sync 에서 반영
+    db.add(Deal(id=3, source_community_id=1, title="Toocki 100W C", post_link="https://x/3", indexed_at=NOW))
+    db.commit()
+    index.sync(db, now=NOW_TS)
+    assert sorted(index.tokens) == [2, 3]
+
+
+def test_aggregator_token_merge_uses_index(db, monkeypatch):
+    index = DealTokenIndex()
+    monkeypatch.setattr(aggregator_service, "deal_token_index", index)
+    db.add_all([
+        Deal(id=1, source_community_id=1, title="Toocki 100W C to C 케이블 3개", price="5900", post_link="https://x/1",
+             indexed_at=datetime.utcnow()),
+        Deal(id=2, source_community_id=1, title="Anker 20W 충전기", price="9900", post_link="https://x/2",
+             indexed_at=datetime.utcnow()),
+    ])
+    db.commit()
+
+    deal = asyncio.run(aggregator_service.AggregatorService(db).process_scraped_deal(
+        1, {"title": "Toocki C to C 100W 케이블 3pcs", "url": "https://x/9", "like_count": 1}
+    ))
+
+    assert deal.id == 1
+    assert db.query(Deal).count() == 2
+    assert index.candidates({"toocki", "100w"}) == [1]
@@ -0,0 +1,200 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.core.http_transport import http_transport
+from backend.database.models import Base, Community, Deal
+from backend.scheduler.deal_validator import (
+    DealValidator,
+    DeletionScanner,
+    HostRateLimiter,
+    ValidationLog,
+    apply_validation,
+    prioritize,
+    run_validation,
+)
+
+FILLER = b"<p>" + b"x" * 4096 + b"</p>"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    chunks_sent = {}
+
+    def do_GET(self):
+        if self.path == "/gone":
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.path == "/deleted":
+            # EUC-KR 페이지: 삭제 문구 이후 대용량 본문은 받지 않아야 함
+            head = "<html><head><meta charset=euc-kr><title>뽐뿌</title></head><body>삭제된 게시글입니다".encode("euc-kr")
+            parts = [head] + [FILLER] * 200
+        elif self.path == "/closed-title":
+            parts = ["<html><head><title>[종료] 특가 딜</title></head>".encode("utf-8")] + [FILLER] * 5
+        else:
+            parts = ["<html><head><title>특가 딜</title></head><body>".encode("utf-8")] + [FILLER] * 5
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(sum(len(p) for p in parts)))
+        self.end_headers()
+        _Handler.chunks_sent[self.path] = 0
+        try:
+            for part in parts:
+                self.wfile.write(part)
+                self.wfile.flush()
+                _Handler.chunks_sent[self.path] += 1
+                time.sleep(0.001)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_scanner_matches_signatures_across_chunks():
+    scanner = DeletionScanner("https://www.ppomppu.co.kr/zboard/view.php?no=1")
+    assert not scanner.feed("<html><head><title>뽐뿌 - 특가</title></head><body>삭제된 게")
+    assert scanner.title == "뽐뿌 - 특가"
+    assert scanner.feed("시글입니다")
+
+    quasar = DeletionScanner("https://quasarzone.com/bbs/qb_saleinfo/views/1")
+    assert not quasar.feed("<script>history.back();")
+    assert quasar.feed("var x; location.href = redirect;</script>")
+
+    closed = DeletionScanner("https://bbasak.com/1")
+    assert closed.feed("<title>[품절] &lt;특가&gt;</title>")
+
+
+def test_prioritize_by_urgency_score_and_age():
+    now = datetime(2026, 10, 19, 12, 0)
+    now_ts = 1_000_000.0
+    candidates = [
+        (1, now - timedelta(hours=1), 10),    # 20분 주기, 30분 전 검증 → 1.5
+        (2, now - timedelta(hours=30), 90),   # 고득점 3시간/2 주기, 2시간 전 검증 → 1.33
+        (3, now - timedelta(hours=2), 0),     # 20분 주기, 5분 전 검증 → 아직 차례 아님
+        (4, now - timedelta(hours=50), 0),    # 미검증 → 최우선
+        (5, now - timedelta(hours=10), 80),   # 미검증, 고득점 → 4 보다 먼저
+    ]
+    last_checked = {1: now_ts - 1800, 2: now_ts - 7200, 3: now_ts - 300}
+
+    assert prioritize(candidates, last_checked, now, now_ts) == [5, 4, 1, 2]
+    assert prioritize(candidates, last_checked, now, now_ts, limit=2) == [5, 4]
+
+
+def test_host_limiter_spaces_requests_per_host():
+    limiter = HostRateLimiter(concurrency=2, min_interval=0.05)
+    starts = {"a": [], "b": []}
+
+    async def hit(host):
+        async with limiter.slot(host):
+            starts[host].append(time.monotonic())
+
+    async def main():
+        await asyncio.gather(*(hit("a") for _ in range(4)), *(hit("b") for _ in range(2)))
+
+    asyncio.run(main())
+    a = sorted(starts["a"])
+    assert all(later - earlier >= 0.04 for earlier, later in zip(a, a[1:]))
+    # 다른 호스트는 서로 기다리지 않음
+    assert abs(min(starts["b"]) - min(a)) < 0.04
+
+
+def test_check_deal_streams_and_stops_early(base_url):
+    validator = DealValidator()
+    _Handler.chunks_sent.clear()
+
+    async def main():
+        try:
+            validator.begin_run(HostRateLimiter(concurrency=4, min_interval=0.0))
+            merged = f"2::{base_url}/gone,3::{base_url}/alive,4::{base_url}/closed-title"
+            first = await validator.check_deal(7, f"{base_url}/deleted", merged)
+            alive = await validator.check_url(f"{base_url}/alive")
+            return first, alive
+        finally:
+            await http_transport.aclose()
+
+    (repr_deleted, deleted_subs), alive = asyncio.run(main())
+
+    assert repr_deleted is True
+    assert deleted_subs == {f"2::{base_url}/gone", f"4::{base_url}/closed-title"}
+    assert alive is False
+    assert 7 in validator.last_checked
+    # 같은 실행 내 동일 URL 은 재요청하지 않음
+    assert set(_Handler.chunks_sent) == {"/deleted", "/alive", "/closed-title"}
+    assert _Handler.chunks_sent["/deleted"] < 200
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"),
+        Community(id=2, name="clien", base_url="https://clien.net"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_apply_validation_heals_or_closes(db):
+    sub_time = datetime(2026, 10, 19, 1, 0)
+    db.add_all([
+        Deal(id=1, source_community_id=1, title="a", post_link="https://p/1",
+             merged_communities="2::https://c/1, 2::https://c/2"),
+        Deal(id=2, source_community_id=2, title="sub", post_link="https://c/2", indexed_at=sub_time),
+        Deal(id=3, source_community_id=1, title="b", post_link="https://p/3", merged_communities="2::https://c/3"),
+    ])
+    db.commit()
+    healed, closing = db.get(Deal, 1), db.get(Deal, 3)
+
+    assert apply_validation(db, healed, True, {"2::https://c/1"}) is False
+    assert (healed.post_link, healed.source_community_id, healed.merged_communities) == ("https://c/2", 2, None)
+    assert healed.indexed_at == sub_time and not healed.is_closed
+
+    assert apply_validation(db, closing, True, {"2::https://c/3"}) is True
+    assert closing.is_closed and closing.merged_communities is None
+
+
+def test_last_checked_survives_across_worker_processes(db, tmp_path):
+    """검증 잡이 다른 프로세스(다른 검증기 인스턴스)에서 돌아도 방금 검증한 딜은 다시 고르지 않음"""
+    now = datetime.utcnow()
+    db.add_all([
+        Deal(id=11, source_community_id=1, title="a", post_link="https://p/11", indexed_at=now - timedelta(hours=1)),
+        Deal(id=12, source_community_id=1, title="b", post_link="https://p/12", indexed_at=now - timedelta(hours=2)),
+    ])
+    db.commit()
+
+    class StubValidator(DealValidator):
+        async def check_deal(self, deal_id, post_link, merged_communities):
+            self.last_checked[deal_id] = time.time()
+            return False, set()
+
+    log = ValidationLog(str(tmp_path / "deal_validation.db"))
+    assert asyncio.run(run_validation(db, StubValidator(), now=now, log=log)) == (2, 0)
+    assert set(log.load()) == {11, 12}
+    # 새 프로세스의 검증기: 재검증 주기(20분)가 지나지 않았으므로 대상 없음
+    assert asyncio.run(run_validation(db, StubValidator(), now=now, log=ValidationLog(log.path))) == (0, 0)
+    assert log.prune(now=time.time() + 4 * 24 * 3600) == 2
+    log.close()
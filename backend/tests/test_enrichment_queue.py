@@ -0,0 +1,215 @@
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.database.models import Base, Community, Deal, DealReaction, PriceHistory
+from backend.scheduler.crawl_frontier import CrawlFrontier
+from backend.scheduler.enrichment_queue import (
+    DETAIL,
+    ENRICH,
+    MAX_ATTEMPTS,
+    RETRY_BASE_SECONDS,
+    EnrichmentQueue,
+)
+from backend.services.aggregator_service import MERGED_REDIRECT_MARK, AggregatorService, parse_posted_at
+
+NOW = 1_800_000_000.0
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = EnrichmentQueue(str(tmp_path / "enrich.db"))
+    yield queue
+    queue.close()
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_one_active_job_per_deal_and_priority_order(queue):
+    assert queue.enqueue(1, "ppomppu", 1, {"url": "https://x/1", "page": 2}) is not None
+    assert queue.enqueue(1, "ppomppu", 1, {"url": "https://x/1"}) is None
+    queue.enqueue(2, "clien", 2, {"url": "https://x/2", "page": 1, "like_count": 3})
+    queue.enqueue(3, "ruliweb", 3, {"url": "https://x/3", "page": 3, "is_super_hotdeal": True})
+
+    # 인증 핫딜 → 앞 페이지 → 뒤 페이지
+    assert [job.deal_id for job in queue.claim(DETAIL, 10)] == [3, 2, 1]
+    assert queue.claim(DETAIL, 10) == []
+
+
+def test_detail_then_enrich_then_done(queue):
+    job_id = queue.enqueue(1, "ppomppu", 1, {"url": "https://x/1"})
+    job = queue.claim(DETAIL, 1)[0]
+    queue.advance(job.id, ENRICH, {**job.item, "content_html": "<p>본문</p>"})
+
+    assert queue.claim(DETAIL, 1) == []
+    enrich = queue.claim(ENRICH, 1)[0]
+    assert (enrich.id, enrich.item["content_html"]) == (job_id, "<p>본문</p>")
+    queue.complete(enrich.id)
+    assert queue.counts() == {"enrich:done": 1}
+    # 완료된 딜은 다시 등록 가능
+    assert queue.enqueue(1, "ppomppu", 1, {"url": "https://x/1"}) is not None
+
+
+def test_retry_backs_off_then_fails(queue):
+    queue.enqueue(1, "ppomppu", 1, {"url": "https://x/1"})
+    now = NOW
+    for attempt in range(MAX_ATTEMPTS - 1):
+        job = queue.claim(DETAIL, 1, now=now)[0]
+        assert queue.retry(job.id, "timeout", now=now)
+        assert queue.claim(DETAIL, 1, now=now) == []
+        now += RETRY_BASE_SECONDS * 2 ** attempt
+
+    job = queue.claim(DETAIL, 1, now=now)[0]
+    assert not queue.retry(job.id, "timeout", now=now)
+    assert queue.counts() == {"detail:failed": 1}
+
+
+def test_stale_running_jobs_are_requeued(queue):
+    queue.enqueue(1, "ppomppu", 1, {"url": "https://x/1"})
+    queue.claim(DETAIL, 1, now=NOW)
+    assert queue.requeue_stale(timeout=600, now=NOW + 60) == 0
+    assert queue.requeue_stale(timeout=600, now=NOW + 601) == 1
+    assert [job.deal_id for job in queue.claim(DETAIL, 1, now=NOW + 601)] == [1]
+
+
+def test_insert_listing_minimal_row_and_duplicates(db):
+    item = {
+        "title": "[쿠팡] 무선 마우스 (12,900원/무료)",
+        "url": "https://x/1",
+        "like_count": 2,
+        "posted_at": "2026-10-19T03:10:00",
+    }
+    service = AggregatorService(db)
+    deal = service.insert_listing(1, dict(item))
+
+    assert (deal.price, deal.shipping_fee, deal.ecommerce_link) == ("12900", "무료배송", "https://x/1")
+    assert deal.ai_summary is None and deal.honey_score == 20
+    # 같은 글/같은 제목, 스팸은 빠른 등록하지 않음 (일반 경로에서 병합/필터)
+    assert service.insert_listing(1, dict(item)) is None
+    assert service.insert_listing(1, {**item, "url": "https://x/2"}) is None
+    assert service.insert_listing(1, {"title": "구매 후기 질문드립니다", "url": "https://x/3"}) is None
+    assert db.query(Deal).count() == 1
+
+
+def test_apply_detail_patches_fast_row(db):
+    deal = AggregatorService(db).insert_listing(1, {"title": "키보드 가격 문의", "url": "https://x/1",
+                                                    "posted_at": "2026-10-19T00:00:00"})
+    AggregatorService.apply_detail(db, deal.id, {
+        "image_url": "https://img/hq.jpg",
+        "ecommerce_link": "https://shop/1",
+        "content_html": "<p>본문</p>",
+        "price": 45000,
+        "posted_at": "2026-10-19T03:10:00",
+    })
+
+    db.refresh(deal)
+    assert (deal.image_url, deal.ecommerce_link, deal.content_html) == ("https://img/hq.jpg", "https://shop/1", "<p>본문</p>")
+    assert deal.price == "45000"
+    assert deal.indexed_at.replace(tzinfo=None) == datetime(2026, 10, 19, 3, 10)
+
+
+def test_fast_path_and_detail_share_posted_at_parsing(db):
+    service = AggregatorService(db)
+    fast = service.insert_listing(1, {"title": "키보드 특가 문의", "url": "https://x/1", "posted_at": "2026-10-19T03:10:00Z"})
+    assert fast.indexed_at.replace(tzinfo=None) == parse_posted_at("2026-10-19T03:10:00Z").replace(tzinfo=None)
+
+    # 읽을 수 없는 작성 시각은 무시 (빠른 등록은 등록 시각, 상세 반영은 기존 값 유지)
+    broken = service.insert_listing(1, {"title": "마우스 특가 문의", "url": "https://x/2", "posted_at": "어제"})
+    assert broken is not None and broken.indexed_at is not None
+    assert AggregatorService.apply_detail(db, fast.id, {"posted_at": "어제"}).indexed_at == fast.indexed_at
+
+
+def test_placeholder_is_absorbed_when_merged(db):
+    # 같은 커뮤니티에 24시간 내 같은 제목으로 다시 올라온 글 → 기존 딜로 병합
+    # 빠른 등록 행은 삭제하지 않고 종료된 리다이렉트로 남기고, 사용자 반응/가격 이력은 흡수한 딜로 이전
+    db.add_all([
+        Deal(id=1, source_community_id=1, title="무선 마우스 12,900원", price="12900", post_link="https://x/1",
+             ecommerce_link="https://shop/1", indexed_at=datetime.utcnow()),
+        Deal(id=2, source_community_id=1, title="무선 마우스 12,900원", price="12900", post_link="https://x/2",
+             ecommerce_link="https://x/2", indexed_at=datetime.utcnow()),
+        DealReaction(deal_id=2, positive_reactions=3),
+        PriceHistory(deal_id=2, price="12900"),
+    ])
+    db.commit()
+    placeholder = db.get(Deal, 2)
+
+    deal = asyncio.run(AggregatorService(db).process_scraped_deal(
+        1, {"title": "무선 마우스 12,900원", "url": "https://x/2", "like_count": 5}, placeholder=placeholder
+    ))
+
+    assert deal.id == 1 and deal.like_count == 5
+    redirect = db.get(Deal, 2)
+    assert redirect.is_closed and redirect.post_link == f"https://x/2{MERGED_REDIRECT_MARK}1"
+    assert [row.deal_id for row in db.query(DealReaction).all()] == [1]
+    assert {row.deal_id for row in db.query(PriceHistory).all()} == {1}
+
+    # 같은 글 재수집은 리다이렉트 행이 아니라 흡수한 딜로 병합
+    again = asyncio.run(AggregatorService(db).process_scraped_deal(
+        1, {"title": "무선 마우스 12,900원", "url": "https://x/2", "like_count": 9}
+    ))
+    assert again.id == 1 and again.like_count == 9 and db.query(Deal).count() == 2
+
+
+def test_enrich_stage_repoints_frontier_to_surviving_deal(db, queue, monkeypatch, tmp_path):
+    from backend.database import session as session_module
+    from backend.scheduler import enrichment_queue
+
+    db.add(Deal(id=1, source_community_id=1, title="무선 마우스 12,900원", price="12900", post_link="https://x/1",
+                ecommerce_link="https://shop/1", indexed_at=datetime.utcnow()))
+    db.commit()
+    item = {"title": "무선 마우스 12,900원", "url": "https://x/2", "like_count": 5}
+    placeholder = AggregatorService(db).insert_listing(1, {**item, "title": "무선 마우스 특가 12,900원"})
+    frontier = CrawlFrontier("ppomppu", directory=str(tmp_path))
+    frontier.mark_refreshed("https://x/2", item, NOW, placeholder.id)
+    monkeypatch.setattr(enrichment_queue, "get_frontier", lambda community: frontier)
+    monkeypatch.setattr(session_module, "SessionLocal", sessionmaker(bind=db.get_bind()))
+
+    queue.enqueue(placeholder.id, "ppomppu", 1, item, stage=ENRICH)
+    [job] = queue.claim(ENRICH, 1)
+    asyncio.run(enrichment_queue._enrich_stage(queue, job, AggregatorService()))
+
+    assert frontier.get("https://x/2").deal_id == 1
+    assert queue.counts() == {f"{ENRICH}:done": 1}
+
+
+def test_run_enrichment_reuses_aggregators_across_jobs(queue, monkeypatch):
+    from backend.scheduler import enrichment_queue
+    from backend.services import aggregator_service
+
+    built, used = [], []
+
+    class FakeAggregator:
+        def __init__(self):
+            built.append(self)
+
+    async def fake_enrich(queue, job, aggregator):
+        used.append(aggregator)
+        queue.complete(job.id)
+
+    monkeypatch.setattr(aggregator_service, "AggregatorService", FakeAggregator)
+    monkeypatch.setattr(enrichment_queue, "_enrich_stage", fake_enrich)
+    for deal_id in range(1, 8):
+        queue.enqueue(deal_id, "ppomppu", 1, {"url": f"https://x/{deal_id}"}, stage=ENRICH)
+
+    stats = asyncio.run(enrichment_queue.run_enrichment({}, queue))
+
+    # 잡마다 새로 만들지 않고 동시 처리 한도만큼만 만들어 돌려 씀
+    assert stats[ENRICH] == 7 and len(used) == 7
+    assert len(built) == enrichment_queue.ENRICH_CONCURRENCY and set(used) <= set(built)
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.core.http_transport import HttpStatusError, HttpTransport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = {}
+
+    def do_GET(self):
+        count = _Handler.hits.get(self.path, 0) + 1
+        _Handler.hits[self.path] = count
+        if self.path == "/flaky" and count < 3:
+            status, body = 503, b"busy"
+        elif self.path == "/missing":
+            status, body = 404, b"nope"
+        else:
+            status, body = 200, b"<html><head><title>ok</title></head></html>"
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def reset_hits():
+    _Handler.hits.clear()
+
+
+def run(transport: HttpTransport, coro_factory):
+    async def main():
+        try:
+            return await coro_factory()
+        finally:
+            await transport.aclose()
+    return asyncio.run(main())
+
+
+def test_retries_5xx_and_reports_single_event(base_url):
+    transport = HttpTransport()
+    events = []
+    transport.add_listener(events.append)
+
+    resp = run(transport, lambda: transport.get(f"{base_url}/flaky", retries=3, backoff=0.01, tag="test"))
+
+    assert resp.status_code == 200
+    assert _Handler.hits["/flaky"] == 3
+    assert len(events) == 1
+    event = events[0]
+    assert (event.status, event.attempts, event.tag, event.host) == (200, 3, "test", "127.0.0.1")
+    stats = transport.host_stats["127.0.0.1"]
+    assert (stats.requests, stats.retries, stats.errors) == (1, 2, 0)
+
+
+def test_no_retry_by_default_and_raise_for_status(base_url):
+    transport = HttpTransport()
+
+    resp = run(transport, lambda: transport.get(f"{base_url}/flaky"))
+    assert resp.status_code == 503 and _Handler.hits["/flaky"] == 1
+
+    with pytest.raises(HttpStatusError) as exc_info:
+        run(transport, lambda: transport.get(f"{base_url}/missing", raise_for_status=True))
+    assert exc_info.value.status_code == 404
+    assert transport.host_stats["127.0.0.1"].errors == 2
+
+
+def test_session_shared_within_loop_and_listener_errors_ignored(base_url):
+    transport = HttpTransport()
+    transport.add_listener(lambda event: 1 / 0)
+
+    async def two_requests():
+        first = transport.session()
+        await asyncio.gather(transport.get(f"{base_url}/a"), transport.get(f"{base_url}/b"))
+        return first is transport.session()
+
+    assert run(transport, two_requests)
+    assert transport.host_stats["127.0.0.1"].requests == 2
+
+
+def test_stream_reads_chunks(base_url):
+    transport = HttpTransport()
+
+    async def read_stream():
+        async with transport.stream("GET", f"{base_url}/page") as response:
+            chunks = [chunk async for chunk in response.aiter_content()]
+        return b"".join(chunks)
+
+    assert b"<title>ok</title>" in run(transport, read_stream)
+    assert transport.host_stats["127.0.0.1"].requests == 1
@@ -0,0 +1,77 @@
+import asyncio
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.core.metrics import MetricsRegistry
+from backend.database.models import Base, Community, Deal
+from backend.scheduler import push_queue as push_queue_module
+from backend.scheduler.push_queue import PushQueue
+from backend.services import aggregator_service, price_history_recorder
+from backend.services.aggregator_service import AggregatorService, correct_category
+from backend.services.category_price_stats import CategoryPriceStats
+from backend.services.deal_token_index import DealTokenIndex
+from backend.services.normalizer.base import NormalizedProduct
+
+
+class FakeNormalizer:
+    async def normalize(self, title, scraped_category=None):
+        return NormalizedProduct(name=title.split("]")[-1].strip()[:20], category=scraped_category or "식품", raw_title=title)
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    # 프로세스 전역 캐시/큐는 테스트마다 새로
+    monkeypatch.setattr(price_history_recorder, "_last_points", price_history_recorder.OrderedDict())
+    monkeypatch.setattr(aggregator_service, "_community_names", {})
+    monkeypatch.setattr(aggregator_service, "deal_token_index", DealTokenIndex())
+    monkeypatch.setattr(aggregator_service, "category_price_stats", CategoryPriceStats())
+    monkeypatch.setattr(aggregator_service, "pipeline_metrics", MetricsRegistry(str(tmp_path / "metrics.db")))
+    monkeypatch.setattr(push_queue_module, "_default_queue", PushQueue(str(tmp_path / "push.db")))
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+    session.commit()
+    yield AggregatorService(session, normalizer=FakeNormalizer())
+    session.close()
+
+
+def test_parse_stage_fixes_price_and_shipping_and_filters_spam(service):
+    parsed = asyncio.run(service.parse_stage(1, {"title": "[쿠팡] 삼다수 2L 12개 (9,900원/무료)", "url": "https://x/1"}))
+    assert (parsed.community_name, parsed.price, parsed.currency, parsed.shipping_fee) == ("ppomppu", 9900, "KRW", "무료배송")
+
+    spam = {"title": "[공지] 게시판 이용 안내", "url": "https://x/2"}
+    assert asyncio.run(service.parse_stage(1, spam)) is None
+    assert asyncio.run(service.process_scraped_deal(1, spam)) is None
+    assert service.db.query(Deal).count() == 0
+
+
+def test_event_and_point_category_correction_only_for_configured_communities():
+    assert correct_category("생활", "[이벤트] 선착순 추첨 이벤트", 0, 8) == "이벤트"
+    assert correct_category("생활", "토스 앱테크 적립", 10, 10) == "적립"
+    assert correct_category("생활", "[이벤트] 선착순 추첨 이벤트", 0, 1) == "생활"
+
+
+def test_stages_merge_recrawls_and_record_stage_timings(service):
+    items = [
+        {"title": "[쿠팡] 삼다수 2L 12개 (9,900원/무료)", "url": "https://x/1"},
+        {"title": "[지마켓] 햇반 210g 24개 (19,900원/무료)", "url": "https://x/2"},
+        # 재수집: 앞 글의 INSERT 가 보여야 병합됨
+        {"title": "[쿠팡] 삼다수 2L 12개 (9,900원/무료)", "url": "https://x/1", "like_count": 7},
+    ]
+    first, second, merged = [asyncio.run(service.process_scraped_deal(1, item)) for item in items]
+
+    assert merged.id == first.id and merged.like_count == 7
+    assert second.id != first.id and service.db.query(Deal).count() == 2
+    assert push_queue_module.push_queue().depth() == 2
+
+    histograms = aggregator_service.pipeline_metrics.histograms
+    counts = {label: hist.count for (name, _, label), hist in histograms.items() if name == "ingest_stage_seconds"}
+    assert counts == {"parse": 3, "normalize": 3, "dedup": 3, "enrich": 2, "persist": 3, "notify": 2}
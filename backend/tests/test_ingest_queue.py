@@ -0,0 +1,71 @@
+import asyncio
+import os
+import sys
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.scheduler import shutdown
+from backend.scheduler.ingest_queue import MAX_PENDING_AGE, IngestQueue
+
+NOW = 1_800_000_000.0
+
+
+def test_pending_items_survive_restart_once_per_url(tmp_path):
+    path = str(tmp_path / "ingest.db")
+    queue = IngestQueue(path)
+    first = queue.put("ppomppu", {"url": "https://x/1", "page": 1}, now=NOW)
+    second = queue.put("ppomppu", {"url": "https://x/2", "page": 1}, now=NOW)
+    assert queue.put("ppomppu", {"url": "https://x/1", "page": 2}, now=NOW) is None
+    assert queue.put("clien", {"url": "https://x/1"}, now=NOW) is not None
+    queue.ack(first, now=NOW + 1)
+    queue.close()
+
+    # 재시작: ack 되지 않은 아이템만 등록 순으로 재개
+    resumed = IngestQueue(path)
+    assert resumed.pending("ppomppu", now=NOW + 60) == [(second, {"url": "https://x/2", "page": 1})]
+    assert resumed.counts() == {"ppomppu": 1, "clien": 1}
+    # 처리가 끝난 URL 은 다음 사이클에 다시 등록 가능, 실패 ack 도 종료로 취급
+    assert resumed.put("ppomppu", {"url": "https://x/1"}, now=NOW + 60) is not None
+    resumed.ack(second, error="ValueError: boom", now=NOW + 61)
+    assert [item["url"] for _, item in resumed.pending("ppomppu", now=NOW + 62)] == ["https://x/1"]
+
+
+def test_expired_items_are_not_resumed_and_pruned(tmp_path):
+    queue = IngestQueue(str(tmp_path / "ingest.db"))
+    queue.put("ppomppu", {"url": "https://x/1"}, now=NOW)
+
+    assert queue.pending("ppomppu", now=NOW + MAX_PENDING_AGE + 1) == []
+    assert queue.prune(now=NOW + MAX_PENDING_AGE + 1) == 0
+    assert queue.prune(now=NOW + 2 * MAX_PENDING_AGE) == 1
+
+
+def test_wait_tasks_finishes_in_flight_then_cancels_stragglers():
+    finished = []
+
+    async def work(seconds, name):
+        await asyncio.sleep(seconds)
+        finished.append(name)
+
+    async def main():
+        asyncio.ensure_future(work(0.01, "fast"))
+        asyncio.ensure_future(work(10, "slow"))
+        return await shutdown.wait_tasks(timeout=0.2)
+
+    assert asyncio.run(main()) == 1
+    assert finished == ["fast"]
+
+
+def test_drain_flag_and_hooks():
+    calls = []
+    hook = calls.append
+    try:
+        shutdown.request_drain("test")
+        shutdown.register_drain_hook(hook)
+        shutdown.register_drain_hook(hook)
+        shutdown.run_drain_hooks(timeout=3.0)
+        assert shutdown.draining() and calls == [3.0]
+    finally:
+        shutdown.reset()
+        shutdown._drain_hooks.remove(hook)
+    assert not shutdown.draining()
@@ -0,0 +1,140 @@
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.database.models import Base, Community, Deal, PriceHistory
+from backend.services import price_history_recorder
+from backend.services.aggregator_service import AggregatorService
+from backend.services.merge_policy import IncomingDeal, image_rank, merge_deal
+
+THUMB = "https://cdn.ppomppu.co.kr/zboard/data/ppomppu/small_1.jpg"
+NORMAL = "https://shop.example.com/p/1.jpg"
+ORIGINAL = "https://bbs.ruliweb.com/img/1.jpg"
+
+
+def known_deal(**fields):
+    values = dict(
+        id=1, source_community_id=1, title="[쿠팡] 삼다수 2L 12개 (9,900원/무료)", price="9900",
+        post_link="https://x/1", image_url=NORMAL, category="식품", currency="KRW", is_closed=False,
+        shipping_fee="무료배송", view_count=100, like_count=2, comment_count=1, honey_score=30,
+        is_super_hotdeal=False, brand="삼다수", model_code="2L", has_options=False,
+    )
+    values.update(fields)
+    return Deal(**values)
+
+
+def incoming(**fields):
+    values = dict(community_id=1, url="https://x/1", title="[쿠팡] 삼다수 2L 12개 (9,900원/무료)", price=9900,
+                  category="식품", shipping_fee="무료배송")
+    values.update(fields)
+    return IncomingDeal(**values)
+
+
+def test_rescrape_of_unchanged_deal_changes_nothing():
+    deal = known_deal()
+    assert merge_deal(deal, incoming()).changed == []
+
+
+def test_lowest_price_wins_and_backs_up_previous_link():
+    deal = known_deal()
+    result = merge_deal(deal, incoming(community_id=2, url="https://y/7", title="삼다수 12개 특가", price=8900))
+
+    assert result.price_changed and {"title", "price", "merged_communities"} <= set(result.changed)
+    assert (deal.price, deal.post_link, deal.title) == ("8900", "https://y/7", "삼다수 12개 특가")
+    assert deal.merged_communities == "1::https://x/1,2::https://y/7"
+
+    # 더 비싼 글은 가격/제목을 바꾸지 않음
+    result = merge_deal(deal, incoming(community_id=3, url="https://z/1", title="삼다수 비싼 글", price=12000))
+    assert not result.price_changed and deal.title == "삼다수 12개 특가"
+
+
+@pytest.mark.parametrize("current,new,expected", [
+    ("", THUMB, THUMB),
+    (THUMB, NORMAL, NORMAL),
+    (NORMAL, THUMB, NORMAL),
+    (ORIGINAL, NORMAL, ORIGINAL),
+    (NORMAL, ORIGINAL, ORIGINAL),
+    (NORMAL, "https://shop.example.com/p/2.jpg", "https://shop.example.com/p/2.jpg"),
+])
+def test_better_image_wins(current, new, expected):
+    deal = known_deal(image_url=current)
+    merge_deal(deal, incoming(image_url=new))
+    assert deal.image_url == expected
+    assert [image_rank(u) for u in (THUMB, NORMAL, ORIGINAL)] == [0, 1, 2]
+
+
+def test_closed_state_is_sticky_and_counters_only_grow():
+    deal = known_deal()
+    merge_deal(deal, incoming(is_closed=True, view_count=50, like_count=5))
+    assert deal.is_closed and (deal.view_count, deal.like_count) == (100, 5)
+    merge_deal(deal, incoming(is_closed=False))
+    assert deal.is_closed
+
+
+def test_honey_score_keeps_max_and_demotes_lost_hot_badge():
+    deal = known_deal(honey_score=70, ai_summary="요약")
+    merge_deal(deal, incoming(like_count=3))
+    assert deal.honey_score == 70
+
+    merge_deal(deal, incoming(is_super_hotdeal=True))
+    assert (deal.honey_score, deal.is_super_hotdeal) == (100, True)
+    assert deal.ai_summary == "🔥 [커뮤니티 인증 핫딜] 요약"
+
+    merge_deal(deal, incoming())
+    assert (deal.honey_score, deal.is_super_hotdeal) == (36, False)
+
+
+def test_unknown_shipping_fee_keeps_existing_value():
+    deal = known_deal()
+    merge_deal(deal, incoming(shipping_fee="정보 없음"))
+    assert deal.shipping_fee == "무료배송"
+    merge_deal(deal, incoming(shipping_fee="3,000원"))
+    assert deal.shipping_fee == "3,000원"
+
+
+@pytest.fixture
+def db(monkeypatch):
+    # 가격 이력 마지막 값 캐시는 프로세스 전역 (테스트마다 새 DB 이므로 비움)
+    monkeypatch.setattr(price_history_recorder, "_last_points", price_history_recorder.OrderedDict())
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+    session.add(known_deal(indexed_at=datetime.utcnow()))
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_upsert_commits_once_with_price_history(db):
+    statements = []
+    from sqlalchemy import event
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    item = {"title": "[쿠팡] 삼다수 2L 12개 (8,900원/무료)", "url": "https://x/1", "like_count": 9}
+    deal = asyncio.run(AggregatorService(db).process_scraped_deal(1, item))
+
+    assert (deal.id, deal.price, deal.like_count) == (1, "8900", 9)
+    assert [h.price for h in db.query(PriceHistory)] == ["8900"]
+    writes = [s for s in statements if s.lstrip().upper().startswith(("UPDATE", "INSERT"))]
+    assert len(writes) == 2  # 딜 UPDATE 1회 + 가격 이력 INSERT 1회 (같은 flush)
+
+
+def test_upsert_known_deal_throughput(benchmark, db):
+    """수집 사이클마다 가장 많이 일어나는 연산: 이미 아는 딜의 재수집 병합"""
+    service = AggregatorService(db)
+    item = {"title": "[쿠팡] 삼다수 2L 12개 (9,900원/무료)", "url": "https://x/1", "like_count": 2, "view_count": 100}
+    loop = asyncio.new_event_loop()
+    try:
+        deal = benchmark(lambda: loop.run_until_complete(service.process_scraped_deal(1, dict(item))))
+    finally:
+        loop.close()
+    assert deal.id == 1 and db.query(Deal).count() == 1
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.scrapers.og_image import OgImageCache, extract_og_image, header_charset, stream_og_image
+
+HEAD = (
+    '<html><head><meta charset="utf-8">'
+    '<meta name="twitter:image" content="https://img.shop.com/tw.jpg">'
+    '<meta content="//img.shop.com/og.jpg" property="og:image">'
+    '</head><body>'
+)
+
+
+class FakeStreamResponse:
+    def __init__(self, chunks, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._chunks = chunks
+        self.consumed = 0
+        self.quit_now = asyncio.Event()
+
+    async def aiter_content(self):
+        for chunk in self._chunks:
+            self.consumed += 1
+            yield chunk
+
+
+class FakeClient:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        self.calls += 1
+        yield self.response
+
+
+def test_extract_prefers_og_image_and_fixes_scheme():
+    assert extract_og_image(HEAD) == "https://img.shop.com/og.jpg"
+
+
+def test_extract_falls_back_to_twitter_and_itemprop():
+    assert extract_og_image('<head><meta name="twitter:image" content="https://a/t.png"></head>') == "https://a/t.png"
+    assert extract_og_image('<head><meta itemprop="image" content="https://a/i.png"></head>') == "https://a/i.png"
+    assert extract_og_image('<head><title>x</title></head><body><meta property="og:image" content="https://a/late.png">') is None
+
+
+def test_stream_stops_after_head():
+    body_chunks = [b"<p>" + b"x" * 4096 + b"</p>" for _ in range(50)]
+    response = FakeStreamResponse([HEAD[:40].encode(), HEAD[40:].encode()] + body_chunks)
+    result = asyncio.run(stream_og_image(FakeClient(response), "https://shop.com/p/1"))
+    assert result == "https://img.shop.com/og.jpg"
+    assert response.consumed == 2
+    assert response.quit_now.is_set()
+
+
+def test_stream_respects_byte_cap():
+    chunks = [b"<head><script>" + b"a" * 1024 for _ in range(100)]
+    response = FakeStreamResponse(chunks)
+    result = asyncio.run(stream_og_image(FakeClient(response), "https://shop.com/p/1", max_bytes=4096))
+    assert result is None
+    assert response.consumed <= 4
+
+
+def test_stream_decodes_euc_kr_from_header_or_meta():
+    og_url = "https://img.shop.co.kr/상품/대표.jpg"
+    page = (f'<html><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr">'
+            f'<meta property="og:image" content="{og_url}"></head><body>').encode("euc-kr")
+
+    # Content-Type 헤더의 charset 우선
+    response = FakeStreamResponse([page[:70], page[70:]], headers={"Content-Type": "text/html; charset=EUC-KR"})
+    assert asyncio.run(stream_og_image(FakeClient(response), "https://shop.co.kr/p/1")) == og_url
+
+    # 헤더에 없으면 <meta> 선언으로 (청크가 한글 중간에서 끊겨도 됨)
+    split = page.index("상품".encode("euc-kr")) + 1
+    response = FakeStreamResponse([page[:split], page[split:]])
+    assert asyncio.run(stream_og_image(FakeClient(response), "https://shop.co.kr/p/1")) == og_url
+    assert header_charset("text/html") is None and header_charset("text/html; charset=ks_c_5601-1987") == "cp949"
+
+
+def test_cache_shares_results_and_expires():
+    cache = OgImageCache(ttl=60, negative_ttl=0)
+    calls = []
+
+    async def fetcher(url):
+        calls.append(url)
+        await asyncio.sleep(0)
+        return "https://img/1.jpg" if "p/1" in url else None
+
+    async def scenario():
+        first = await asyncio.gather(*[cache.get_or_fetch("https://shop.com/p/1#frag", fetcher) for _ in range(5)])
+        again = await cache.get_or_fetch("https://shop.com/p/1", fetcher)
+        await cache.get_or_fetch("https://shop.com/p/2", fetcher)
+        await cache.get_or_fetch("https://shop.com/p/2", fetcher)
+        return first, again
+
+    first, again = asyncio.run(scenario())
+    assert first == ["https://img/1.jpg"] * 5
+    assert again == "https://img/1.jpg"
+    # p/1 은 1회만, 음수 TTL(0초)인 p/2 실패 결과는 매번 재조회
+    assert calls.count("https://shop.com/p/1#frag") == 1
+    assert calls.count("https://shop.com/p/2") == 2
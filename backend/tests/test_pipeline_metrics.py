@@ -0,0 +1,97 @@
+import asyncio
+import os
+import sys
+
+from sqlalchemy import create_engine, text
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.core.http_transport import RequestEvent
+from backend.core.metrics import STALE_RUN_SECONDS, MetricsRegistry, MetricsStore
+
+NOW = 1_800_000_000.0
+
+
+def test_community_scope_labels_concurrent_tasks(tmp_path):
+    registry = MetricsRegistry(str(tmp_path / "metrics.db"))
+
+    async def crawl(community, fetches):
+        with registry.community_scope(community):
+            for elapsed in fetches:
+                await asyncio.sleep(0)
+                registry.on_http_request(RequestEvent("GET", "https://x", "x", 200, elapsed, 1))
+            registry.on_http_request(RequestEvent("GET", "https://x", "x", 430, 0.1, 1))
+            registry.inc("crawl_deals_total", 2, label="new")
+
+    async def main():
+        await asyncio.gather(crawl("ppomppu", [0.2, 0.4]), crawl("clien", [3.0]))
+
+    asyncio.run(main())
+
+    assert registry.histograms[("crawl_fetch_seconds", "ppomppu", "")].count == 3
+    assert registry.histograms[("crawl_fetch_seconds", "clien", "")].count == 2
+    assert registry.counters[("crawl_blocks_total", "clien", "430")] == 1
+    assert registry.counters[("crawl_deals_total", "ppomppu", "new")] == 2
+
+
+def test_flush_from_several_processes_adds_up(tmp_path):
+    path = str(tmp_path / "metrics.db")
+    # 워커 프로세스 두 개가 각자 레지스트리로 같은 저장소에 기록
+    first, second = MetricsRegistry(path), MetricsRegistry(path)
+    first.observe("crawl_parse_seconds", 0.2, community="ppomppu")
+    first.inc("crawl_deals_total", 3, community="ppomppu", label="new")
+    second.observe("crawl_parse_seconds", 0.4, community="ppomppu")
+    second.inc("crawl_deals_total", 2, community="ppomppu", label="new")
+    first.flush(now=NOW)
+    second.flush(now=NOW + 30)
+    first.flush(now=NOW + 40)  # 빈 flush 는 아무것도 쓰지 않음
+
+    summary = MetricsStore(path).summary(3600, now=NOW + 60)
+    assert summary["ppomppu"]["crawl_parse_seconds"] == {"count": 2, "total": 0.6, "avg": 0.3}
+    assert summary["ppomppu"]["crawl_deals_total:new"]["total"] == 5
+    assert first.counters == {} and first.histograms == {}
+
+
+def test_prometheus_export_is_cumulative(tmp_path):
+    registry = MetricsRegistry(str(tmp_path / "metrics.db"))
+    for value in (0.03, 0.3, 0.3, 100.0):
+        registry.observe("crawl_fetch_seconds", value, community="clien")
+    registry.inc("crawl_deals_total", 4, community="clien", label="skipped")
+    registry.flush(now=NOW)
+    registry.observe("crawl_fetch_seconds", 0.3, community="clien")
+    registry.flush(now=NOW + 3 * 24 * 3600)  # 1분 버킷은 보관 기간이 지나도 누적 합계는 유지
+
+    lines = registry.store.render_prometheus().splitlines()
+    assert "# TYPE crawl_fetch_seconds histogram" in lines
+    assert 'crawl_fetch_seconds_bucket{community="clien",le="0.05"} 1' in lines
+    assert 'crawl_fetch_seconds_bucket{community="clien",le="0.5"} 4' in lines
+    assert 'crawl_fetch_seconds_bucket{community="clien",le="60.0"} 4' in lines
+    assert 'crawl_fetch_seconds_bucket{community="clien",le="+Inf"} 5' in lines
+    assert 'crawl_fetch_seconds_count{community="clien"} 5' in lines
+    assert 'crawl_deals_total{community="clien",kind="skipped"} 4' in lines
+    assert registry.store.summary(3600, now=NOW + 3 * 24 * 3600)["clien"]["crawl_fetch_seconds"]["count"] == 1
+
+
+def test_run_status_and_stale_detection(tmp_path):
+    store = MetricsStore(str(tmp_path / "metrics.db"))
+    store.run_started("ppomppu", "뽐뿌", now=NOW)
+    store.run_finished("ppomppu", "success", 7, 12, now=NOW + 42)
+    store.run_started("clien", "클리앙", now=NOW)
+
+    runs = {run["community"]: run for run in store.runs(now=NOW + 60)}
+    assert (runs["ppomppu"]["status"], runs["ppomppu"]["new_count"], runs["ppomppu"]["duration"]) == ("success", 7, 42)
+    assert runs["clien"]["status"] == "running"
+    assert {run["community"]: run["status"] for run in store.runs(now=NOW + STALE_RUN_SECONDS + 1)}["clien"] == "stale"
+
+
+def test_sqlalchemy_query_time_is_collected(tmp_path):
+    registry = MetricsRegistry(str(tmp_path / "metrics.db"))
+    engine = create_engine("sqlite://")
+    registry.instrument_engine(engine)
+
+    with registry.community_scope("ruliweb"), engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+
+    assert registry.histograms[("crawl_db_seconds", "ruliweb", "")].count == 2
@@ -0,0 +1,61 @@
+import os
+import sys
+
+import pytest
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.core.price_extractor import extract_title_price, format_price, parse_amount, parse_shipping_fee
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "prices", "title_prices.tsv")
+
+
+def load_golden():
+    cases = []
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#") or not line.strip():
+                continue
+            title, price, currency, free_shipping = line.rstrip("\n").split("\t")
+            cases.append((title, int(price), currency, free_shipping == "1"))
+    return cases
+
+
+GOLDEN = load_golden()
+
+
+def test_golden_title_prices():
+    mismatches = [(title, tuple(extract_title_price(title)), expected)
+                  for title, *expected in GOLDEN if tuple(extract_title_price(title)) != tuple(expected)]
+    assert not mismatches
+    assert len(GOLDEN) > 300
+
+
+@pytest.mark.parametrize("title,expected", [
+    ("[쿠팡] 삼다수 2L 12개 (9,900원/무료)", (9900, "KRW", True)),
+    ("[shop.simon] golf shoes($19.5/free)", (1950, "USD", True)),
+    ("(19,900원/fs)", (19900, "KRW", True)),
+    ("에어팟 3.5만", (35000, "KRW", False)),
+    # 할인/적립 금액은 가격이 아님
+    ("1만원 할인 쿠폰 5,000원 적립", (0, "KRW", False)),
+    ("+3,000원 추가", (0, "KRW", False)),
+    ("아마존 SSD $84.57", (8457, "USD", False)),
+    ("독일 직구 12.5유로", (1250, "EUR", False)),
+])
+def test_title_price_rules(title, expected):
+    assert extract_title_price(title) == expected
+
+
+def test_stored_price_helpers_round_trip():
+    assert [parse_amount(v) for v in ("15,900원", 8900, "https://x/products/123", "12,000,000", None)] == [15900, 8900, 0, 0, 0]
+    assert [parse_shipping_fee(v) for v in ("무료배송", "3,000원", "", None)] == [0, 3000, 0, 0]
+    assert [format_price(*args) for args in (("1299", "USD"), (500, "EUR"), ("15900", "KRW"), (15900, None))] == \
+        ["$12.99", "€5.00", "15,900원", "15,900원"]
+
+
+def test_title_price_throughput(benchmark):
+    """수집 사이클마다 모든 글 제목에 적용되는 연산 (골든 코퍼스 1회분)"""
+    titles = [title for title, *_ in GOLDEN]
+    results = benchmark(lambda: [extract_title_price(title) for title in titles])
+    assert len(results) == len(titles)
@@ -0,0 +1,94 @@
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.database.models import Base, Community, Deal, PriceHistory
+from backend.services import price_history_recorder
+from backend.services.price_history_recorder import PriceHistoryRecorder
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(price_history_recorder, "_last_points", price_history_recorder.OrderedDict())
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+    session.add(Deal(id=1, source_community_id=1, title="딜", post_link="https://x/1", price="9900"))
+    session.add(PriceHistory(deal_id=1, price="9900"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def prices(db, deal_id=1):
+    return [h.price for h in db.query(PriceHistory).filter(PriceHistory.deal_id == deal_id).order_by(PriceHistory.id)]
+
+
+def unit_of_work(db, recorder, deal, price, now):
+    recorder.record(deal, price)
+    staged = recorder.stage(db, now=now)
+    db.commit()
+    recorder.confirm()
+    return staged
+
+
+def test_only_changes_are_recorded_and_last_value_comes_from_db(db):
+    recorder = PriceHistoryRecorder()
+    deal = db.get(Deal, 1)
+
+    # 마지막 기록(9900)과 같은 가격은 건너뜀 (첫 확인은 DB 조회)
+    assert unit_of_work(db, recorder, deal, 9900, now=100) == 0
+    assert unit_of_work(db, recorder, deal, 8900, now=200) == 1
+    assert unit_of_work(db, recorder, deal, 8900, now=300) == 0
+    assert prices(db) == ["9900", "8900"]
+
+
+def test_buffer_keeps_last_point_per_deal_and_new_deal_shares_insert_commit(db):
+    recorder = PriceHistoryRecorder()
+    deal = db.get(Deal, 1)
+    recorder.record(deal, 9500)
+    recorder.record(deal, 9000)
+    new_deal = Deal(source_community_id=1, title="새 딜", post_link="https://x/2", price="5000")
+    db.add(new_deal)
+    recorder.record(new_deal, 5000)
+
+    commits = []
+    event.listen(db, "after_commit", lambda session: commits.append(1))
+    assert recorder.stage(db, now=100) == 2
+    db.commit()
+    recorder.confirm()
+
+    assert len(commits) == 1
+    assert prices(db) == ["9900", "9000"]
+    assert prices(db, new_deal.id) == ["5000"]
+    assert price_history_recorder._last_points[new_deal.id][0] == "5000"
+
+
+def test_sampling_only_lets_new_lows_through_inside_the_window(db):
+    recorder = PriceHistoryRecorder(sample_seconds=600)
+    deal = db.get(Deal, 1)
+    unit_of_work(db, recorder, deal, 9000, now=1000)
+
+    assert unit_of_work(db, recorder, deal, 9500, now=1100) == 0
+    assert unit_of_work(db, recorder, deal, 8500, now=1200) == 1
+    assert unit_of_work(db, recorder, deal, 9500, now=1900) == 1
+    assert prices(db) == ["9900", "9000", "8500", "9500"]
+
+
+def test_discard_after_rollback_does_not_poison_cache(db):
+    recorder = PriceHistoryRecorder()
+    deal = db.get(Deal, 1)
+    recorder.record(deal, 7000)
+    recorder.stage(db, now=100)
+    db.rollback()
+    recorder.discard()
+
+    assert price_history_recorder._last_points[1][0] == "9900"
+    assert unit_of_work(db, recorder, db.get(Deal, 1), 7000, now=200) == 1
@@ -0,0 +1,90 @@
+import asyncio
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.database.models import Base, Community, Deal
+from backend.scheduler import push_queue as push_queue_module
+from backend.scheduler import shutdown
+from backend.scheduler.push_queue import DONE, FAILED, MAX_ATTEMPTS, QUEUED, PushQueue, run_push_dispatch
+from backend.services import aggregator_service
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = PushQueue(str(tmp_path / "push_queue.db"))
+    yield q
+    q.close()
+
+
+def test_enqueue_is_unique_per_active_deal(queue):
+    assert queue.enqueue(1, "딜", "5900", None, "https://x/1") is not None
+    assert queue.enqueue(1, "딜", "5900", None, "https://x/1") is None
+
+    job, = queue.claim()
+    assert (job.deal_id, job.price, job.site_name) == (1, 5900, "HotDeal")
+    queue.complete(job.id)
+    # 발송이 끝난 딜은 다시 등록 가능 (예: 재수집으로 새로 INSERT 된 분할 딜)
+    assert queue.enqueue(1, "딜", "가격미상", "쿠팡", "https://x/1") is not None
+    assert queue.claim()[0].price == 0
+
+
+def test_retry_backs_off_then_gives_up(queue):
+    queue.enqueue(1, "딜", 1000, "쿠팡", "https://x/1", now=0)
+    for attempt in range(MAX_ATTEMPTS):
+        job, = queue.claim(now=10 ** 6 * (attempt + 1))
+        retried = queue.retry(job.id, "boom", now=10 ** 6 * (attempt + 1))
+        assert retried == (attempt < MAX_ATTEMPTS - 1)
+        # 백오프 동안은 다시 꺼내지 않음
+        assert queue.claim(now=10 ** 6 * (attempt + 1) + 1) == []
+    assert queue.counts() == {FAILED: 1}
+
+
+def test_dispatch_sends_in_batches_and_retries_failures(queue):
+    for deal_id in range(1, 46):
+        queue.enqueue(deal_id, f"딜 {deal_id}", 1000, "쿠팡", f"https://x/{deal_id}")
+    batches = []
+
+    def deliver(jobs):
+        batches.append(len(jobs))
+        return ["HTTPError: 500" if job.deal_id == 7 else None for job in jobs]
+
+    stats = asyncio.run(run_push_dispatch(queue, deliver=deliver))
+
+    assert batches == [20, 20, 5]
+    assert stats == {"sent": 44, "retry": 1, "failed": 0}
+    assert queue.counts() == {DONE: 44, QUEUED: 1}
+
+
+def test_dispatch_leaves_queue_untouched_while_draining(queue):
+    queue.enqueue(1, "딜", 1000, "쿠팡", "https://x/1")
+    shutdown.request_drain("test")
+    try:
+        stats = asyncio.run(run_push_dispatch(queue, deliver=lambda jobs: [None] * len(jobs)))
+    finally:
+        shutdown.reset()
+    assert stats["sent"] == 0 and queue.counts() == {QUEUED: 1}
+
+
+def test_new_deal_is_enqueued_instead_of_pushed_inline(queue, monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+    db.commit()
+    monkeypatch.setattr(push_queue_module, "_default_queue", queue)
+
+    deal = asyncio.run(aggregator_service.AggregatorService(db).process_scraped_deal(
+        1, {"title": "[쿠팡] 삼다수 2L 12개 (9,900원/무료)", "url": "https://x/9", "shop_name": "쿠팡"}
+    ))
+
+    assert db.query(Deal).count() == 1
+    job, = queue.claim()
+    assert (job.deal_id, job.price, job.deal_url) == (deal.id, 9900, "https://x/9")
+    db.close()
@@ -0,0 +1,83 @@
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.database.models import Base, Community, Deal
+from backend.scheduler.reaction_buffer import ReactionBuffer
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Community(id=1, name="ppomppu", base_url="https://ppomppu.co.kr"))
+    session.add_all([
+        Deal(id=1, source_community_id=1, title="딜 1", post_link="https://x/1", price="9900",
+             view_count=100, like_count=2, comment_count=1, honey_score=60),
+        # 같은 글에서 AI 분할된 딜 2개
+        Deal(id=2, source_community_id=1, title="분할 A", post_link="https://x/2", price="5000", view_count=10),
+        Deal(id=3, source_community_id=1, title="분할 B", post_link="https://x/2", price="7000", view_count=10),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_flush_coalesces_and_writes_in_one_select_and_commit(db):
+    buffer = ReactionBuffer(now=0)
+    buffer.add(1, {"url": "https://x/1", "view_count": 300, "like_count": 9})
+    buffer.add(1, {"url": "https://x/1", "view_count": 250, "like_count": 7, "comment_count": 4})
+    buffer.add(2, {"url": "https://x/2", "view_count": 80})
+    assert len(buffer) == 2
+
+    selects, commits = [], []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda *args: selects.append(1) if args[2].lstrip().upper().startswith("SELECT") else None)
+    event.listen(db, "after_commit", lambda session: commits.append(1))
+    assert buffer.flush(db, now=1) == 3
+    assert (len(selects), len(commits), len(buffer)) == (1, 1, 0)
+
+    deal = db.get(Deal, 1)
+    # 카운터는 최대값, 꿀딜 점수는 병합 정책과 같은 규칙으로 재계산 (일반 딜 상한 99)
+    assert (deal.view_count, deal.like_count, deal.comment_count, deal.honey_score) == (300, 9, 4, 99)
+    assert [d.view_count for d in db.query(Deal).filter(Deal.post_link == "https://x/2")] == [80, 80]
+
+
+def test_due_by_time_or_size(db):
+    buffer = ReactionBuffer(flush_seconds=5, max_pending=2, now=100)
+    assert not buffer.due(now=200)
+    buffer.add(1, {"url": "https://x/1", "like_count": 3})
+    assert not buffer.due(now=104) and buffer.due(now=105)
+    buffer.add(2, {"url": "https://x/2"})
+    assert buffer.due(now=101)
+    buffer.flush(db, now=101)
+    assert not buffer.due(now=200)
+
+
+def test_on_flushed_only_after_successful_flush(db, monkeypatch):
+    flushed = []
+    buffer = ReactionBuffer(now=0, on_flushed=flushed.extend)
+    first = {"url": "https://x/1", "like_count": 5}
+    buffer.add(1, first)
+
+    # 반영 실패: 버퍼는 비우되 프런티어 갱신 콜백은 호출하지 않음 (다음 재수집이 다시 반영)
+    def broken_commit():
+        raise RuntimeError("database is locked")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(db, "commit", broken_commit)
+        assert buffer.flush(db, now=1) == 0
+    assert flushed == [] and len(buffer) == 0
+
+    second = {"url": "https://x/2", "view_count": 50}
+    buffer.add(1, first)
+    buffer.add(2, second)
+    assert buffer.flush(db, now=2) == 3
+    assert flushed == [first, second]
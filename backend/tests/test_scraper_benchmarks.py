@@ -0,0 +1,107 @@
+import asyncio
+import os
+import sys
+import tracemalloc
+
+import pytest
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.scrapers.replay import FixtureStore, ReplayMiss, ReplayTransport, load_scraper_class
+
+# 녹화본이 있는 스크래퍼만 대상 (녹화: python backend/scripts/record_scraper_fixtures.py <key>)
+LIST_CASES = [(key, url) for key in FixtureStore.available() for url in FixtureStore.for_scraper(key).urls("list")]
+DETAIL_CASES = [(key, url) for key in FixtureStore.available() for url in FixtureStore.for_scraper(key).urls("detail")]
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def make_replay_scraper(key: str):
+    store = FixtureStore.for_scraper(key)
+    scraper = load_scraper_class(key)(community_id=0)
+    scraper.transport = ReplayTransport(store)
+    return scraper, store
+
+
+def measure_allocations(loop, coro_factory) -> dict:
+    """1회 실행 동안의 메모리 할당 피크(KB)와 할당 블록 수"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = loop.run_until_complete(coro_factory())
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    del result
+    return {"alloc_peak_kb": round(peak / 1024, 1), "alloc_blocks": blocks}
+
+
+@pytest.mark.skipif(not LIST_CASES, reason="녹화된 리스트 페이지 없음")
+@pytest.mark.parametrize("key,url", LIST_CASES)
+def test_parse_list_throughput(benchmark, loop, key, url):
+    scraper, store = make_replay_scraper(key)
+    html = store.html(url)
+
+    # 워밍업 겸 정상 파싱 확인 (펨코 인기글 목록 등 부가 요청도 녹화본으로만 응답)
+    rows = loop.run_until_complete(scraper.parse_list(html))
+    assert rows, f"[{key}] 녹화된 리스트에서 행이 추출되지 않았습니다: {url}"
+    assert all(row.get("title") and row.get("url") for row in rows)
+
+    benchmark.extra_info.update(measure_allocations(loop, lambda: scraper.parse_list(html)))
+    result = benchmark(lambda: loop.run_until_complete(scraper.parse_list(html)))
+
+    benchmark.extra_info["rows"] = len(result)
+    if benchmark.stats:  # --benchmark-disable 실행 시에는 통계 없음
+        benchmark.extra_info["rows_per_sec"] = round(len(result) / benchmark.stats.stats.mean, 1)
+
+
+@pytest.mark.skipif(not DETAIL_CASES, reason="녹화된 상세 페이지 없음")
+@pytest.mark.parametrize("key,url", DETAIL_CASES)
+def test_get_detail_throughput(benchmark, loop, key, url):
+    scraper, _ = make_replay_scraper(key)
+
+    detail = loop.run_until_complete(scraper.get_detail(url))
+    assert detail is not None
+
+    benchmark.extra_info.update(measure_allocations(loop, lambda: scraper.get_detail(url)))
+    benchmark(lambda: loop.run_until_complete(scraper.get_detail(url)))
+
+    if benchmark.stats:
+        benchmark.extra_info["rows_per_sec"] = round(1 / benchmark.stats.stats.mean, 1)
+
+
+@pytest.mark.skipif(not LIST_CASES, reason="녹화된 리스트 페이지 없음")
+def test_replay_transport_blocks_unrecorded_urls(loop):
+    key, url = LIST_CASES[0]
+    scraper, store = make_replay_scraper(key)
+
+    assert loop.run_until_complete(scraper.fetch_html(url)) == store.html(url)
+    with pytest.raises(ReplayMiss):
+        loop.run_until_complete(scraper.fetch_html(url + "&page=999"))
+    assert scraper.client is None
+
+
+def test_bbasak_link_resolution_goes_through_replay_transport(tmp_path, loop):
+    # 빠삭 link.php 중계 링크 추적도 스크래퍼 transport 를 경유 → 재생 중 네트워크로 새지 않음
+    store = FixtureStore(str(tmp_path / "bbasak_domestic"), "bbasak_domestic")
+    detail_url = "https://bbasak.com/bbs/board.php?bo_table=bbasak1&wr_id=1"
+    link = "https://bbasak.com/bbs/link.php?bo_table=bbasak1&wr_id=1&no=1"
+    store.put("detail", detail_url, f'<div id="board_view"><img src="https://img.example.com/p1.jpg">'
+                                    f'<a href="{link}">구매 링크</a></div>')
+    store.redirects[link] = "https://shop.example.com/products/1"
+    scraper = load_scraper_class("bbasak_domestic")(community_id=0)
+    scraper.transport = ReplayTransport(store)
+
+    detail = loop.run_until_complete(scraper.get_detail(detail_url))
+
+    assert detail["ecommerce_link"] == "https://shop.example.com/products/1"
+    assert scraper.transport.requests == [detail_url] and scraper.client is None
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import sys
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.scrapers.base_scraper import AsyncBaseScraper
+from backend.scrapers.clien_scraper import ClienScraper
+from backend.scrapers.spec import ScraperSpec, SpecEngine, apply_direct_buy_heuristic, extract_title_price
+
+CLIEN_HTML = '''
+<div class="list_item notice"><span class="list_subject"><a href="/service/board/jirum/1">공지</a></span></div>
+<div class="list_item"><div class="list_img"><img src="/img/noimage.png"></div>
+  <span class="list_subject"><a href="/service/board/jirum/18800001?od=T31&po=0">[네이버] 햇반 24개 19,900원</a></span>
+  <span class="icon_info">품절</span><div class="list_symph">12</div><div class="list_hit">1,024</div>
+  <span class="timestamp" title="2026-10-18 21:11:03">21:11</span></div>
+<div class="list_item"><span class="label_ad">AD</span><span class="list_subject"><a href="/ad">광고</a></span></div>
+<div class="list_item"><div class="list_img"><img src="//img.clien.net/a.jpg"></div>
+  <a data-role="list-title-text" href="/service/board/jirum/18800002" style="text-decoration: line-through">행사 딜</a></div>
+'''
+
+
+class DummyScraper(AsyncBaseScraper):
+    spec = ScraperSpec(
+        base_url="https://example.com",
+        row_selector="li.row",
+        title_selectors=("a.title",),
+        comment_selector="em.cmt",
+        comment_in_title=True,
+        title_price=True,
+        foreign_currency=True,
+        hot_selector="img.hot",
+        category_from_title=True,
+        point_category=True,
+    )
+
+    def __init__(self):
+        super().__init__("더미")
+
+    def finish_row(self, row, title_el, item):
+        if "스킵" in item["title"]:
+            return None
+        item["like_count"] = 7
+        return item
+
+    async def get_detail(self, url):
+        return None
+
+
+def test_title_price_rules():
+    assert extract_title_price("[쿠팡] 생수 15,900원") == (15900, "KRW")
+    assert extract_title_price("에어팟 3만원") == (30000, "KRW")
+    assert extract_title_price("아마존 SSD $84.57", foreign_currency=True) == (8457, "USD")
+    assert extract_title_price("유로 특가 €5", foreign_currency=True) == (500, "EUR")
+    # 해외 게시판이 아니면 $ 표기는 무시
+    assert extract_title_price("SSD $84.57 (12,000원)") == (12000, "KRW")
+    assert extract_title_price("SKT 59요금제", mobile_plan=True) == (59000, "KRW")
+    assert apply_direct_buy_heuristic("알리 직구 케이블", 3000, "KRW") == (300000, "USD")
+    assert apply_direct_buy_heuristic("쿠팡 케이블", 3000, "KRW") == (3000, "KRW")
+
+
+def test_clien_spec_extracts_rows_without_hooks():
+    deals = asyncio.run(ClienScraper(community_id=0).parse_list(CLIEN_HTML))
+
+    assert [d["url"] for d in deals] == [
+        "https://www.clien.net/service/board/jirum/18800001",
+        "https://www.clien.net/service/board/jirum/18800002",
+    ]
+    first, second = deals
+    assert first["category"] == "네이버"
+    assert first["is_closed"] and first["is_super_hotdeal"]
+    assert (first["like_count"], first["view_count"]) == (12, 1024)
+    assert first["image_url"] == ""
+    assert first["posted_at"] == "2026-10-18T12:11:03Z"
+    assert second["is_closed"] and not second["is_super_hotdeal"]
+    assert second["image_url"] == "https://img.clien.net/a.jpg"
+
+
+def test_engine_hooks_comment_badge_and_heuristic():
+    html = '''<ul>
+      <li class="row"><img class="hot"><a class="title" href="/1">[알리] 직구 충전기 3,000원 <em class="cmt">[4]</em></a></li>
+      <li class="row"><a class="title" href="/2">출석 포인트 적립</a></li>
+      <li class="row"><a class="title" href="/3">스킵 대상</a></li>
+      <li class="row"><a class="title" href="javascript:void(0)">자바스크립트</a></li>
+    </ul>'''
+    deals = asyncio.run(DummyScraper().parse_list(html))
+
+    assert [d["url"] for d in deals] == ["https://example.com/1", "https://example.com/2"]
+    charger, point = deals
+    assert charger["title"] == "[알리] 직구 충전기 3,000원"
+    assert charger["comment_count"] == 4
+    assert (charger["price"], charger["currency"]) == (300000, "USD")
+    assert charger["is_super_hotdeal"] and charger["like_count"] == 7
+    assert point["category"] == "적립" and not point["is_super_hotdeal"]
+
+
+def test_engine_is_shared_per_spec():
+    assert SpecEngine.for_spec(ClienScraper.spec) is SpecEngine.for_spec(ClienScraper.spec)
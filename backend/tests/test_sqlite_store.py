@@ -0,0 +1,62 @@
+import os
+import sys
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.core.sqlite_store import DONE, FAILED, QUEUED, RetryingJobTable
+
+
+class Chores(RetryingJobTable):
+    schema = """
+    CREATE TABLE IF NOT EXISTS chores (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT NOT NULL,
+        rank INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        available_at REAL NOT NULL,
+        claimed_at REAL,
+        finished_at REAL,
+        error TEXT
+    );
+    """
+    table = "chores"
+    max_attempts = 2
+    retry_base_seconds = 10
+    stale_seconds = 60
+    history_seconds = 100
+
+    def add(self, kind: str, rank: int, now: float = 0):
+        self.conn.execute("INSERT INTO chores (kind, rank, status, available_at) VALUES (?, ?, ?, ?)",
+                          (kind, rank, QUEUED, now))
+
+    def statuses(self):
+        return [row["status"] for row in self.conn.execute("SELECT status FROM chores ORDER BY id")]
+
+
+def test_claim_filters_orders_and_retries_with_backoff(tmp_path):
+    table = Chores(str(tmp_path / "chores.db"))
+    table.add("a", 3)
+    table.add("b", 1)
+    table.add("a", 2)
+
+    claimed = table._claim_rows(2, now=1, where="AND kind = ?", params=("a",), order_by="rank, id")
+    # RETURNING 순서는 보장되지 않으므로 호출 측에서 정렬
+    first, second = (row["id"] for row in sorted(claimed, key=lambda row: row["rank"]))
+    assert (first, second) == (3, 1)
+
+    table.complete(first, now=1)
+    # 1회차 실패 → 10초 뒤 재시도, 2회차 실패 → failed
+    assert table.retry(second, "boom", now=1)
+    assert table._claim_rows(5, now=10, where="AND kind = ?", params=("a",)) == []
+    assert [row["id"] for row in table._claim_rows(5, now=11, where="AND kind = ?", params=("a",))] == [second]
+    assert not table.retry(second, "boom", now=11)
+    assert table.statuses() == [FAILED, QUEUED, DONE]
+
+    table._claim_rows(5, now=20)
+    assert table.requeue_stale(now=79) == 0 and table.requeue_stale(now=81) == 1
+    assert table.statuses() == [FAILED, QUEUED, DONE]
+    assert table.prune(now=110) == 1 and table.prune(now=112) == 1
+    assert table.statuses() == [QUEUED]
+    table.close()
@@ -0,0 +1,66 @@
+import os
+import random
+import sys
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.core import metrics as metrics_module
+from backend.core.metrics import MetricsRegistry
+from backend.scheduler.stagger import StaggerPlan, phase_occupancy, phase_slot
+
+NOW = 1_800_000_000.0  # 60 의 배수 → 틱 구간 시작
+
+
+def test_assign_balances_expected_load_across_slots():
+    plan = StaggerPlan(slots=3, window_seconds=60)
+    weights = {"ppomppu": 60, "fmkorea": 40, "ruliweb": 30, "clien": 20, "quasarzone": 10}
+
+    assignments = plan.assign(weights)
+
+    assert assignments == {"ppomppu": 0, "fmkorea": 1, "ruliweb": 2, "clien": 2, "quasarzone": 1}
+    assert plan.slot_load == [60, 50, 50]
+    assert plan.assign(dict(weights)) == assignments  # 부하가 같으면 배정도 그대로
+
+
+def test_delay_stays_inside_assigned_slot_and_burst_mode_is_immediate():
+    plan = StaggerPlan(slots=6, window_seconds=60, jitter=0.8, rng=random.Random(7))
+    plan.assign({name: 1.0 for name in ("a", "b", "c", "d", "e", "f", "g")})
+
+    for _ in range(50):
+        for name, delay in plan.delays(plan.assignments).items():
+            slot = plan.assignments[name]
+            assert slot * 10 <= delay <= slot * 10 + 8
+    assert set(plan.assignments.values()) == set(range(6))
+
+    burst = StaggerPlan(slots=6, mode="burst")
+    burst.assign({"a": 1.0, "b": 2.0})
+    assert burst.delays(["a", "b"]) == {"a": 0.0, "b": 0.0}
+
+
+def test_phase_occupancy_folds_runs_onto_the_window():
+    assert phase_slot(NOW + 25, 60, 6) == 2
+    assert phase_occupancy(NOW + 5, NOW + 22, 60, 6) == {0: 5.0, 1: 10.0, 2: 2.0}
+    # 틱 경계를 넘는 실행은 다음 구간의 앞 슬롯에 겹쳐 더해짐
+    assert phase_occupancy(NOW + 55, NOW + 75, 60, 6) == {5: 5.0, 0: 10.0, 1: 5.0}
+
+
+def test_admin_ingest_load_reports_slot_distribution(tmp_path, monkeypatch):
+    from backend.routers.admin import ingest_load
+    from backend.scheduler.stagger import STAGGER_SLOTS
+
+    registry = MetricsRegistry(str(tmp_path / "metrics.db"))
+    registry.inc("crawl_phase_starts_total", 3, community="ppomppu", label="0")
+    registry.inc("crawl_phase_busy_seconds", 12.0, community="ppomppu", label="0")
+    registry.inc("crawl_phase_starts_total", 1, community="clien", label="1")
+    registry.inc("crawl_phase_busy_seconds", 4.0, community="clien", label="1")
+    registry.flush()
+    monkeypatch.setattr(metrics_module, "pipeline_metrics", registry)
+
+    load = ingest_load(60)
+
+    first, second = load["buckets"][:2]
+    assert (first["starts"], first["busy_seconds"], first["communities"]) == (3, 12.0, {"ppomppu": 3})
+    assert (second["starts"], second["busy_seconds"]) == (1, 4.0)
+    assert len(load["buckets"]) == STAGGER_SLOTS
+    assert load["peak_to_mean"] == round(12.0 / (16.0 / STAGGER_SLOTS), 2)
@@ -0,0 +1,203 @@
+import os
+import random
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import pytest
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.scrapers.time_parser import KST, batch_clock, parse_time_str
+
+
+def legacy_parse_time_str(time_str: str, now_kst: datetime) -> Optional[str]:
+    """기존 AsyncBaseScraper.parse_time_str 원본 (기준 시각 주입만 추가) — 퍼즈 테스트의 정답지"""
+
+    if not time_str: return None
+    time_str = time_str.strip()
+    kst = timezone(timedelta(hours=9))
+    posted_dt_kst = None
+
+    try:
+        # 분 전, 시간 전, 방금 전 등의 상대 시간 처리
+        if '분 전' in time_str or '분전' in time_str:
+            match = re.search(r'(\d+)\s*분', time_str)
+            if match:
+                posted_dt_kst = now_kst - timedelta(minutes=int(match.group(1)))
+        elif '시간 전' in time_str or '시간전' in time_str:
+            match = re.search(r'(\d+)\s*시간', time_str)
+            if match:
+                posted_dt_kst = now_kst - timedelta(hours=int(match.group(1)))
+        elif '방금' in time_str:
+            posted_dt_kst = now_kst
+        elif ':' in time_str and not ('/' in time_str or '-' in time_str or '.' in time_str):
+            # 14:20 or 14:20:10
+            parts = time_str.split(':')
+            if len(parts) >= 2:
+                h, m = int(parts[0]), int(parts[1])
+                s = int(parts[2]) if len(parts) > 2 else 0
+                posted_dt_kst = now_kst.replace(hour=h, minute=m, second=s, microsecond=0)
+                # 만약 미래 시간이면 작년/어제로 간주
+                if posted_dt_kst > now_kst + timedelta(hours=1):
+                    posted_dt_kst -= timedelta(days=1)
+        else:
+            # 2024.04.28 or 24/04/28 12:34:56 (세 개의 날짜 세그먼트)
+            date_match_3 = re.search(r'(\d{2,4})[/.-](\d{1,2})[/.-](\d{1,2})(?:\s+(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?', time_str)
+            # 06.02 or 06/02 12:34:56 (두 개의 날짜 세그먼트, 연도 생략)
+            date_match_2 = re.search(r'(?<!\d)(\d{1,2})[/.-](\d{1,2})(?:\s+(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?', time_str)
+
+            if date_match_3:
+                y_str = date_match_3.group(1)
+                y = int(y_str)
+                if y < 100: y += 2000
+                # 혹시 파싱 오류로 2012년 등이 되면 2024년으로 자동 교정 (안전망)
+                if y < 2020: y = now_kst.year
+
+                month, d = int(date_match_3.group(2)), int(date_match_3.group(3))
+                h = int(date_match_3.group(4)) if date_match_3.group(4) else 0
+                m_val = int(date_match_3.group(5)) if date_match_3.group(5) else 0
+                s_val = int(date_match_3.group(6)) if date_match_3.group(6) else 0
+
+                if 1 <= month <= 12 and 1 <= d <= 31:
+                    try:
+                        posted_dt_kst = datetime(y, month, d, h, m_val, s_val, tzinfo=kst)
+                        if posted_dt_kst and posted_dt_kst > now_kst + timedelta(hours=1):
+                            posted_dt_kst = posted_dt_kst.replace(year=posted_dt_kst.year - 1)
+                    except ValueError:
+                        pass
+            elif date_match_2:
+                y = now_kst.year
+                month, d = int(date_match_2.group(1)), int(date_match_2.group(2))
+                h = int(date_match_2.group(3)) if date_match_2.group(3) else 0
+                m_val = int(date_match_2.group(4)) if date_match_2.group(4) else 0
+                s_val = int(date_match_2.group(5)) if date_match_2.group(5) else 0
+
+                if 1 <= month <= 12 and 1 <= d <= 31:
+                    try:
+                        posted_dt_kst = datetime(y, month, d, h, m_val, s_val, tzinfo=kst)
+                        if posted_dt_kst and posted_dt_kst > now_kst + timedelta(hours=1):
+                            posted_dt_kst = posted_dt_kst.replace(year=posted_dt_kst.year - 1)
+                    except ValueError:
+                        pass
+            else:
+                # 한국어 날짜 형식 지원: "6월 1일" 또는 "2024년 6월 1일 15:30"
+                kor_date_match = re.search(r'(?:(\d{2,4})년\s*)?(\d{1,2})월\s*(\d{1,2})일(?:\s+(\d{1,2})[:시]\s*(\d{1,2})(?:분)?)?', time_str)
+                if kor_date_match:
+                    y_str = kor_date_match.group(1)
+                    if y_str:
+                        y = int(y_str)
+                        if y < 100: y += 2000
+                    else:
+                        y = now_kst.year
+
+                    month = int(kor_date_match.group(2))
+                    d = int(kor_date_match.group(3))
+                    h = int(kor_date_match.group(4)) if kor_date_match.group(4) else 0
+                    m_val = int(kor_date_match.group(5)) if kor_date_match.group(5) else 0
+                    s_val = 0
+
+                    if 1 <= month <= 12 and 1 <= d <= 31:
+                        try:
+                            posted_dt_kst = datetime(y, month, d, h, m_val, s_val, tzinfo=kst)
+                            if posted_dt_kst and posted_dt_kst > now_kst + timedelta(hours=1):
+                                posted_dt_kst = posted_dt_kst.replace(year=posted_dt_kst.year - 1)
+                        except ValueError:
+                            pass
+
+        if posted_dt_kst:
+            utc_dt = posted_dt_kst.astimezone(timezone.utc)
+            # Android가 완벽히 파싱할 수 있도록 Z 부착
+            return utc_dt.replace(tzinfo=None).isoformat(timespec='seconds') + "Z"
+    except Exception as e:
+        pass
+
+    return None
+
+
+# 기준 시각: 자정/연말/윤년 경계를 모두 포함
+NOW_CASES = [
+    datetime(2026, 10, 19, 14, 30, 15, 123456, tzinfo=KST),
+    datetime(2026, 1, 1, 0, 20, 0, tzinfo=KST),
+    datetime(2028, 2, 29, 23, 50, 0, tzinfo=KST),
+    datetime(2027, 3, 1, 0, 30, 0, tzinfo=KST),
+]
+
+SAMPLES = [
+    "", "   ", "방금", "방금 전", "3분 전", "15분전", "2시간 전", "1 시간전", "분 전",
+    "14:20", "14:20:10", "00:00", "23:59:59", "24:00", "7:5", "a:b", "14:20:10:99",
+    "2026.10.18", "26/10/18 12:34:56", "2024-02-29", "2019.04.28", "2026-10-19 22:19", "2026-10-20 15:00",
+    "10-17", "10/17 09:00", "02.29", "13.01", "06.31", "1.5.2026",
+    "6월 1일", "2024년 6월 1일 15:30", "26년 12월 31일 23시 59분", "10월 20일",
+    "조회 1,234", "11 - 0", "2026.10.18 (토)", "18:00 KST", "  2026-10-18 09:00:00  ",
+]
+
+
+def random_time_str(rng: random.Random) -> str:
+    """실제 게시판 표기를 흉내낸 형식 + 범위 밖 값/잡음을 섞은 랜덤 입력"""
+    num = lambda lo, hi: str(rng.randint(lo, hi)).zfill(rng.choice([1, 2]))
+    sep = rng.choice(["-", ".", "/"])
+    forms = [
+        lambda: f"{rng.randint(0, 500)}{rng.choice([' 분 전', '분 전', '분전', ' 시간 전', '시간전'])}",
+        lambda: f"{num(0, 26)}:{num(0, 61)}" + (f":{num(0, 61)}" if rng.random() < 0.5 else ""),
+        lambda: f"{rng.choice([num(10, 30), str(rng.randint(2010, 2030))])}{sep}{num(0, 13)}{sep}{num(0, 32)}"
+                + (f" {num(0, 24)}:{num(0, 60)}" if rng.random() < 0.5 else ""),
+        lambda: f"{num(0, 13)}{sep}{num(0, 32)}" + (f" {num(0, 24)}:{num(0, 60)}:{num(0, 60)}" if rng.random() < 0.3 else ""),
+        lambda: (f"{rng.randint(10, 2030)}년 " if rng.random() < 0.5 else "")
+                + f"{num(0, 13)}월 {num(0, 32)}일" + (f" {num(0, 24)}시 {num(0, 60)}분" if rng.random() < 0.5 else ""),
+        lambda: rng.choice(SAMPLES),
+    ]
+    text = rng.choice(forms)()
+    if rng.random() < 0.15:
+        text = rng.choice(["  ", "작성 ", "(", ""]) + text + rng.choice(["  ", " 수정됨", ")", ""])
+    return text
+
+
+@pytest.mark.parametrize("now", NOW_CASES, ids=lambda d: d.strftime("%Y%m%d%H%M"))
+def test_known_formats_match_legacy(now):
+    for sample in SAMPLES:
+        assert parse_time_str(sample, now=now) == legacy_parse_time_str(sample, now), sample
+
+
+@pytest.mark.parametrize("now", NOW_CASES, ids=lambda d: d.strftime("%Y%m%d%H%M"))
+def test_fuzz_against_legacy(now):
+    rng = random.Random(now.toordinal())
+    for _ in range(3000):
+        sample = random_time_str(rng)
+        assert parse_time_str(sample, now=now) == legacy_parse_time_str(sample, now), sample
+
+
+def test_batch_clock_pins_relative_times():
+    now = NOW_CASES[0]
+    with batch_clock(now):
+        first = parse_time_str("5분 전")
+        second = parse_time_str("5분 전")
+        clock = parse_time_str("14:00")
+    assert first == second == legacy_parse_time_str("5분 전", now)
+    assert clock == "2026-10-19T05:00:00Z"
+    # 배치 밖에서는 매 호출 실제 현재 시각 기준
+    assert parse_time_str("방금") is not None
+
+
+TIME_BATCH = [random_time_str(random.Random(7)) for _ in range(200)] + ["3분 전", "14:20", "10-17", "2026.10.18"] * 50
+
+
+def test_parse_time_str_legacy_benchmark(benchmark):
+    benchmark.group = "parse_time_str"
+    benchmark(lambda: [legacy_parse_time_str(s, datetime.now(KST)) for s in TIME_BATCH])
+
+
+def test_parse_time_str_fast_benchmark(benchmark):
+    benchmark.group = "parse_time_str"
+    benchmark(lambda: [parse_time_str(s) for s in TIME_BATCH])
+
+
+def test_parse_time_str_batch_benchmark(benchmark):
+    def run():
+        with batch_clock():
+            return [parse_time_str(s) for s in TIME_BATCH]
+
+    benchmark.group = "parse_time_str"
+    benchmark(run)
@@ -0,0 +1,195 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# 모듈 경로 설정 (backend 패키지 임포트용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.scheduler import worker_pool as pool_module
+from backend.scheduler.job_queue import DONE, LOST, RUNNING, TIMEOUT, JobQueue
+from backend.scheduler.worker_pool import WorkerPool
+
+HANDLERS = {
+    "echo": "backend.tests.test_worker_pool:echo_job",
+    "slow": "backend.tests.test_worker_pool:slow_job",
+    "stuck": "backend.tests.test_worker_pool:stuck_job",
+}
+
+
+# ---------------------------------------------------------------- 워커 프로세스에서 실행되는 잡
+async def echo_job(value):
+    return {"value": value, "pid": os.getpid()}
+
+
+async def slow_job(seconds):
+    await asyncio.sleep(seconds)
+
+
+async def stuck_job(seconds):
+    time.sleep(seconds)  # 이벤트 루프를 막아 asyncio 취소가 듣지 않는 잡
+
+
+# ---------------------------------------------------------------- 큐 단위 테스트
+def test_dedupe_claim_and_collect(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.db"))
+    first = queue.enqueue("scrape_community", {"community": "ppomppu"}, timeout=60, dedupe_key="scrape:ppomppu")
+    assert queue.enqueue("scrape_community", {"community": "ppomppu"}, timeout=60, dedupe_key="scrape:ppomppu") is None
+    other = queue.enqueue("scrape_community", {"community": "clien"}, timeout=60, dedupe_key="scrape:clien")
+
+    job = queue.claim("w0.1")
+    assert (job.id, job.status, job.args) == (first, RUNNING, {"community": "ppomppu"})
+    # 실행 중에도 같은 키는 등록 불가
+    assert queue.enqueue("scrape_community", {}, timeout=60, dedupe_key="scrape:ppomppu") is None
+
+    queue.finish(job.id, DONE, result={"collected": 3})
+    assert [(j.id, j.result) for j in queue.collect()] == [(first, {"collected": 3})]
+    assert queue.collect() == []
+    # 종료 후에는 다시 등록 가능
+    assert queue.enqueue("scrape_community", {}, timeout=60, dedupe_key="scrape:ppomppu") is not None
+    assert queue.claim("w1.2").id == other
+
+
+def test_stale_heartbeat_and_dead_worker_jobs(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.db"))
+    queue.enqueue("a", timeout=60)
+    queue.enqueue("b", timeout=1)
+    a, b = queue.claim("w0.1"), queue.claim("w1.1")
+
+    now = time.time()
+    assert [job.id for job in queue.overdue(grace=0, now=now + 5)] == [b.id]
+    assert queue.reap_stale(heartbeat_timeout=60, now=now + 30) == []
+    queue.heartbeat([a.id], "w0.1", now=now + 30)
+    assert queue.reap_stale(heartbeat_timeout=60, now=now + 61) == [b.id]
+    assert queue.fail_worker_jobs("w0.1", LOST, "worker exited") == [a.id]
+    # 이미 lost 처리된 잡은 늦게 도착한 결과로 덮어쓰지 않음
+    queue.finish(a.id, DONE, result=1)
+    assert {job.id: job.status for job in queue.collect()} == {a.id: LOST, b.id: LOST}
+
+
+# ---------------------------------------------------------------- 워커 프로세스 통합 테스트
+def wait_for_results(pool: WorkerPool, count: int, deadline: float = 30.0):
+    results = {}
+    started = time.time()
+    while len(results) < count and time.time() - started < deadline:
+        for job in pool.supervise():
+            results[job.id] = job
+        time.sleep(0.1)
+    return results
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = WorkerPool(HANDLERS, workers=1, slots=2, db_path=str(tmp_path / "jobs.db"))
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+def test_worker_process_runs_jobs_with_timeouts(pool):
+    echo = pool.enqueue("echo", timeout=30, dedupe_key="echo", value="핫딜")
+    slow = pool.enqueue("slow", timeout=0.2, dedupe_key="slow", seconds=10)
+    assert pool.enqueue("echo", timeout=30, dedupe_key="echo", value="dup") is None
+
+    results = wait_for_results(pool, 2)
+
+    assert results[echo].status == DONE and results[echo].result["value"] == "핫딜"
+    assert results[echo].result["pid"] != os.getpid()
+    assert results[slow].status == TIMEOUT
+
+
+def test_unresponsive_worker_is_killed_and_replaced(pool, monkeypatch):
+    monkeypatch.setattr(pool_module, "HARD_KILL_GRACE", 0.2)
+    (first_worker, _), = pool.processes.values()
+    stuck = pool.enqueue("stuck", timeout=0.2, dedupe_key="stuck", seconds=30)
+
+    results = wait_for_results(pool, 1)
+
+    assert results[stuck].status == TIMEOUT and results[stuck].error == "killed after timeout"
+    (new_worker, process), = pool.processes.values()
+    assert new_worker != first_worker and process.is_alive()
+    echo = pool.enqueue("echo", timeout=30, value=1)
+    assert wait_for_results(pool, 1)[echo].status == DONE
+
+
+def test_sigterm_drains_running_jobs(tmp_path):
+    pool = WorkerPool(HANDLERS, workers=1, slots=2, db_path=str(tmp_path / "jobs.db"))
+    pool.start()
+    slow = pool.enqueue("slow", timeout=30, seconds=1.5)
+    queue = JobQueue(pool.db_path)
+    started = time.time()
+    while queue.counts().get(RUNNING) != 1 and time.time() - started < 30:
+        time.sleep(0.1)
+    queued = pool.enqueue("echo", timeout=30, value=1)
+
+    # 배포 시 SIGTERM: 진행 중 잡은 끝까지 실행, 대기 잡은 다음 디스패처가 실행하도록 남김
+    pool.shutdown(timeout=15)
+
+    assert {job.id: job.status for job in queue.collect()} == {slow: DONE}
+    assert queue.claim("w0.2").id == queued
+
+
+# ---------------------------------------------------------------- 디스패처 (APScheduler → 잡 큐)
+def start_test_dispatcher(tmp_path, monkeypatch, planned):
+    """워커 프로세스 없이 디스패처만 띄움 (잡 큐는 tmp_path, 수집 계획은 planned 고정)"""
+    from backend.scheduler import main
+
+    monkeypatch.setattr(pool_module, "WorkerPool",
+                        lambda handlers, workers, on_result: WorkerPool(handlers, workers=workers, on_result=on_result,
+                                                                        db_path=str(tmp_path / "jobs.db")))
+    monkeypatch.setattr(WorkerPool, "start", lambda self: None)
+    monkeypatch.setattr(main, "plan_pipeline_cycle", lambda: (planned, {}, "test"))
+    monkeypatch.setattr(main, "worker_pool", None)
+    for name in planned:
+        monkeypatch.setattr(main.crawl_planner.states[name], "in_flight", True)
+    return main, main.start_dispatcher(workers=1)
+
+
+def test_dispatcher_tick_enqueues_scrape_jobs_on_the_event_loop(tmp_path, monkeypatch):
+    async def scenario():
+        main, scheduler = start_test_dispatcher(tmp_path, monkeypatch, {"ppomppu": 2, "clien": 1})
+        monkeypatch.setattr(main.stagger_plan, "mode", "burst")
+        try:
+            # 첫 틱은 next_run_time=now → 루프가 한 번 돌면 실행
+            for _ in range(50):
+                await asyncio.sleep(0.05)
+                if JobQueue(str(tmp_path / "jobs.db")).counts().get("queued") == 2:
+                    break
+        finally:
+            scheduler.shutdown(wait=False)
+        return main
+
+    main = asyncio.run(scenario())
+
+    queue = JobQueue(str(tmp_path / "jobs.db"))
+    jobs = [queue.claim("w0.1"), queue.claim("w0.1")]
+    assert sorted((job.name, job.args["community"], job.args["pages"]) for job in jobs) == [
+        ("scrape_community", "clien", 1), ("scrape_community", "ppomppu", 2),
+    ]
+    # 등록된 커뮤니티는 결과가 돌아올 때까지 in_flight 유지
+    assert main.crawl_planner.states["ppomppu"].in_flight and main.crawl_planner.states["clien"].in_flight
+
+
+def test_dispatcher_staggers_enqueue_by_slot(tmp_path, monkeypatch):
+    async def scenario():
+        main, scheduler = start_test_dispatcher(tmp_path, monkeypatch, {"ppomppu": 2, "clien": 1})
+        # 슬롯 0.2초: ppomppu 는 0~0.16초, clien 은 0.6~0.76초 사이에 등록
+        monkeypatch.setattr(main.stagger_plan, "mode", "stagger")
+        monkeypatch.setattr(main.stagger_plan, "window_seconds", 1.2)
+        monkeypatch.setattr(main.stagger_plan, "assignments", {"ppomppu": 0, "clien": 3})
+        queue = JobQueue(str(tmp_path / "jobs.db"))
+        try:
+            await asyncio.sleep(0.4)
+            early = queue.counts().get("queued", 0)
+            await asyncio.sleep(0.8)
+            late = queue.counts().get("queued", 0)
+        finally:
+            scheduler.shutdown(wait=False)
+        return early, late, queue
+
+    early, late, queue = asyncio.run(scenario())
+
+    assert (early, late) == (1, 2)
+    assert queue.claim("w0.1").args["community"] == "ppomppu"